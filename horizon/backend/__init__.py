@@ -1,72 +1,24 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import TYPE_CHECKING, Type
-
-from fastapi import FastAPI, HTTPException
-from fastapi.exceptions import RequestValidationError
-from sqlalchemy.ext.asyncio import AsyncSession, async_engine_from_config
-
-import horizon
-from horizon.backend.api.handlers import (
-    application_exception_handler,
-    http_exception_handler,
-    service_exception_handler,
-    unknown_exception_handler,
-    validation_exception_handler,
-)
-from horizon.backend.api.router import api_router
-from horizon.backend.db.factory import create_session_factory
-from horizon.backend.middlewares import apply_middlewares
-from horizon.backend.settings import Settings
-from horizon.commons.exceptions import ApplicationError, ServiceError
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from horizon.backend.providers.auth.base import AuthProvider
-
-
-def application_factory(settings: Settings) -> FastAPI:
-    application = FastAPI(
-        title="Horizon",
-        description="Horizon is an application that implements simple HWM Store",
-        version=horizon.__version__,
-        debug=settings.server.debug,
-        # will be set up by middlewares
-        openapi_url=None,
-        docs_url=None,
-        redoc_url=None,
-    )
-
-    application.state.settings = settings
-    application.include_router(api_router)
-
-    application.add_exception_handler(ServiceError, service_exception_handler)  # type: ignore[arg-type]
-    application.add_exception_handler(ApplicationError, application_exception_handler)  # type: ignore[arg-type]
-    application.add_exception_handler(
-        RequestValidationError,
-        validation_exception_handler,  # type: ignore[arg-type]
-    )
-    application.add_exception_handler(HTTPException, http_exception_handler)  # type: ignore[arg-type]
-    application.add_exception_handler(Exception, unknown_exception_handler)
-
-    engine = async_engine_from_config(settings.database.dict(), prefix="")
-    session_factory = create_session_factory(engine)
+    from horizon.backend.main import application_factory, get_application
 
-    application.dependency_overrides.update(
-        {
-            Settings: lambda: settings,
-            AsyncSession: session_factory,  # type: ignore[dict-item]
-        },
-    )
+__all__ = [
+    "application_factory",
+    "get_application",
+]
 
-    # get AuthProvider class from settings, and perform setup
-    auth_class: Type[AuthProvider] = settings.auth.provider  # type: ignore[assignment]
-    auth_class.setup(application)
 
-    apply_middlewares(application, settings)
-    return application
+def __getattr__(name: str):
+    # application is imported only on demand, so scripts and migrations which import
+    # e.g. horizon.backend.settings do not import all routers, middlewares and auth providers
+    if name in __all__:
+        from horizon.backend import main
 
+        return getattr(main, name)
 
-def get_application():
-    settings = Settings()
-    return application_factory(settings=settings)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
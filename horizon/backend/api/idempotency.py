@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Callable, Coroutine
+
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+from typing_extensions import Annotated
+
+from horizon.backend.db.models import User  # noqa: TC001
+from horizon.backend.services import current_user
+
+if TYPE_CHECKING:
+    from horizon.backend.db.models import IdempotencyKey
+    from horizon.backend.services.idempotency import IdempotencyKeyService
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+
+class _IdempotentReplay(Exception):  # noqa: N818
+    """Raised instead of executing request which response is already stored"""
+
+    def __init__(self, stored: IdempotencyKey) -> None:
+        self.stored = stored
+
+
+async def get_request_hash(request: Request, user: User) -> bytes:
+    """Request fingerprint.
+
+    Credentials are not included, so request can be retried after refreshing access token.
+    """
+    body = await request.body()
+    result = hashlib.sha256()
+    for part in (
+        str(user.id).encode(),
+        request.method.encode(),
+        request.url.path.encode(),
+        request.url.query.encode(),
+        body,
+    ):
+        result.update(len(part).to_bytes(8, "big"))
+        result.update(part)
+    return result.digest()
+
+
+def replay_response(stored: IdempotencyKey) -> Response:
+    return Response(
+        content=stored.response_body,
+        status_code=stored.status_code,  # type: ignore[arg-type]
+        media_type=stored.content_type,
+        headers={IDEMPOTENT_REPLAYED_HEADER: "true"},
+    )
+
+
+async def reserve_idempotency_key(request: Request, user: Annotated[User, Depends(current_user)]) -> None:
+    """Reserve ``Idempotency-Key`` of authenticated user before executing the request.
+
+    If response is already stored, request is not executed again.
+    """
+    key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+    service: IdempotencyKeyService | None = getattr(request.app.state, "idempotency", None)
+    if not key or not service:
+        return
+
+    stored = await service.reserve(user.id, key, await get_request_hash(request, user))
+    if stored:
+        raise _IdempotentReplay(stored)
+    request.state.idempotency_key = (user.id, key)
+
+
+class IdempotentAPIRoute(APIRoute):
+    """Route class which replays stored response for write requests with ``Idempotency-Key`` header.
+
+    Only successful responses are stored. If request failed, nothing was committed,
+    so it is safe to execute it again.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        methods = kwargs.get("methods") or ()
+        dependencies = list(kwargs.get("dependencies") or ())
+        # key is reserved after user is authenticated, but before executing the endpoint.
+        # route is copied by include_router together with its dependencies, so add it only once
+        reserved = any(dependency.dependency is reserve_idempotency_key for dependency in dependencies)
+        if not reserved and WRITE_METHODS.intersection(method.upper() for method in methods):
+            kwargs["dependencies"] = [*dependencies, Depends(reserve_idempotency_key)]
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                response = await original_route_handler(request)
+            except _IdempotentReplay as e:
+                return replay_response(e.stored)
+            except BaseException:
+                user_key = getattr(request.state, "idempotency_key", None)
+                if user_key:
+                    await asyncio.shield(request.app.state.idempotency.release(*user_key))
+                raise
+
+            user_key = getattr(request.state, "idempotency_key", None)
+            if not user_key:
+                return response
+
+            service: IdempotencyKeyService = request.app.state.idempotency
+            user_id, key = user_key
+
+            body = getattr(response, "body", None)
+            if body is None or response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                await service.release(user_id, key)
+            else:
+                await service.save(user_id, key, response.status_code, response.headers.get("content-type"), body)
+            return response
+
+        return route_handler
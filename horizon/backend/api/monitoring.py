@@ -1,7 +1,8 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
+from http import HTTPStatus
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
 
 from horizon.commons.schemas import PingResponse
 
@@ -11,3 +12,10 @@ router = APIRouter(tags=["Monitoring"], prefix="/monitoring")
 @router.get("/ping", summary="Check if server is alive")
 async def ping() -> PingResponse:
     return PingResponse()
+
+
+@router.get("/ready", summary="Check if server is ready to accept requests")
+async def ready(request: Request) -> PingResponse:
+    if not request.app.state.ready:
+        raise HTTPException(status_code=HTTPStatus.SERVICE_UNAVAILABLE, detail="Server is not ready yet")
+    return PingResponse()
@@ -1,8 +1,11 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
 
-from fastapi import APIRouter, Depends
-from fastapi.security import OAuth2PasswordRequestForm
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Form
+from fastapi._compat import get_missing_field_error
+from fastapi.exceptions import RequestValidationError
 from typing_extensions import Annotated
 
 from horizon.backend.dependencies.stub import Stub
@@ -14,21 +17,58 @@ from horizon.commons.schemas.v1 import AuthTokenResponseV1
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
+class OAuth2TokenRequestForm:
+    """Same as :obj:`fastapi.security.OAuth2PasswordRequestForm`, but also supports ``grant_type=refresh_token``.
+
+    ``username`` and ``password`` are required only for ``grant_type=password`` (default),
+    and ``refresh_token`` is required only for ``grant_type=refresh_token``.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        grant_type: Annotated[Optional[str], Form(pattern="^(password|refresh_token)$")] = None,
+        username: Annotated[Optional[str], Form()] = None,
+        password: Annotated[Optional[str], Form()] = None,
+        refresh_token: Annotated[Optional[str], Form()] = None,
+        scope: Annotated[str, Form()] = "",
+        client_id: Annotated[Optional[str], Form()] = None,
+        client_secret: Annotated[Optional[str], Form()] = None,
+    ):
+        required = {"refresh_token": refresh_token}
+        if grant_type != "refresh_token":
+            required = {"username": username, "password": password}
+
+        errors = [get_missing_field_error(("body", field)) for field, value in required.items() if value is None]
+        if errors:
+            raise RequestValidationError(errors)
+
+        self.grant_type = grant_type
+        self.username = username
+        self.password = password
+        self.refresh_token = refresh_token
+        self.scopes = scope.split()
+        self.client_id = client_id
+        self.client_secret = client_secret
+
+
 @router.post(
     "/token",
     summary="Get access token",
     responses=get_error_responses(include={NotAuthorizedSchema, InvalidRequestSchema}),
 )
 async def login(
-    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    form_data: Annotated[OAuth2TokenRequestForm, Depends()],
     auth_provider: Annotated[AuthProvider, Depends(Stub(AuthProvider))],
 ) -> AuthTokenResponseV1:
-    token = await auth_provider.get_token(
-        grant_type=form_data.grant_type,
-        login=form_data.username,
-        password=form_data.password,
-        scopes=form_data.scopes,
-        client_id=form_data.client_id,
-        client_secret=form_data.client_secret,
-    )
+    if form_data.grant_type == "refresh_token":
+        token = await auth_provider.refresh_access_token(form_data.refresh_token)  # type: ignore[arg-type]
+    else:
+        token = await auth_provider.get_token(
+            grant_type=form_data.grant_type,
+            login=form_data.username,
+            password=form_data.password,
+            scopes=form_data.scopes,
+            client_id=form_data.client_id,
+            client_secret=form_data.client_secret,
+        )
     return AuthTokenResponseV1.parse_obj(token)
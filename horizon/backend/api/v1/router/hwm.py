@@ -2,12 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from typing_extensions import Annotated
 
+from horizon.backend.api.idempotency import IdempotentAPIRoute
 from horizon.backend.db.models import NamespaceUserRoleInt, User
 from horizon.backend.services import UnitOfWork, current_user
 from horizon.commons.errors import get_error_responses
+from horizon.commons.exceptions import BadRequestError
 from horizon.commons.schemas.v1 import (
     HWMBulkCopyRequestV1,
     HWMBulkDeleteRequestV1,
@@ -15,11 +17,17 @@ from horizon.commons.schemas.v1 import (
     HWMListResponseV1,
     HWMPaginateQueryV1,
     HWMResponseV1,
+    HWMSearchQueryV1,
     HWMUpdateRequestV1,
     PageResponseV1,
 )
 
-router = APIRouter(prefix="/hwm", tags=["HWM"], responses=get_error_responses())
+router = APIRouter(
+    prefix="/hwm",
+    tags=["HWM"],
+    responses=get_error_responses(),
+    route_class=IdempotentAPIRoute,
+)
 
 
 @router.get(
@@ -35,6 +43,23 @@ async def paginate_hwm(
     return PageResponseV1[HWMResponseV1].from_pagination(pagination)
 
 
+@router.get(
+    "/search",
+    summary="Search HWM by name",
+    dependencies=[Depends(current_user)],
+)
+async def search_hwm(
+    search_args: Annotated[HWMSearchQueryV1, Depends()],
+    unit_of_work: Annotated[UnitOfWork, Depends()],
+) -> PageResponseV1[HWMResponseV1]:
+    if not search_args.name_contains and not search_args.name_prefix:
+        msg = "At least one of 'name_contains', 'name_prefix' should be set"
+        raise BadRequestError(msg)
+
+    pagination = await unit_of_work.hwm.paginate(**search_args.dict())
+    return PageResponseV1[HWMResponseV1].from_pagination(pagination)
+
+
 @router.get(
     "/{hwm_id}",
     summary="Get HWM",
@@ -42,9 +67,18 @@ async def paginate_hwm(
 )
 async def get_hwm(
     hwm_id: int,
+    request: Request,
+    response: Response,
     unit_of_work: Annotated[UnitOfWork, Depends()],
 ) -> HWMResponseV1:
     hwm = await unit_of_work.hwm.get(hwm_id)
+
+    # changed_at is updated on every HWM change, so client can revalidate cached response
+    etag = f'W/"{hwm.id}-{hwm.changed_at.timestamp()}"'
+    if etag in request.headers.get("If-None-Match", "").split(", "):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})  # type: ignore[return-value]
+
+    response.headers["ETag"] = etag
     return HWMResponseV1.from_orm(hwm)
 
 
@@ -60,7 +94,7 @@ async def create_hwm(
 ) -> HWMResponseV1:
     async with unit_of_work:
         await unit_of_work.namespace.check_user_permission(
-            user_id=user.id,
+            user=user,
             required_role=NamespaceUserRoleInt.DEVELOPER,
             namespace_id=data.namespace_id,
         )
@@ -88,7 +122,7 @@ async def update_hwm(
     async with unit_of_work:
         hwm = await unit_of_work.hwm.get(hwm_id)
         await unit_of_work.namespace.check_user_permission(
-            user_id=user.id,
+            user=user,
             required_role=NamespaceUserRoleInt.DEVELOPER,
             namespace_id=hwm.namespace_id,
         )
@@ -120,7 +154,7 @@ async def delete_hwm(
     async with unit_of_work:
         hwm = await unit_of_work.hwm.get(hwm_id)
         await unit_of_work.namespace.check_user_permission(
-            user_id=user.id,
+            user=user,
             required_role=NamespaceUserRoleInt.MAINTAINER,
             namespace_id=hwm.namespace_id,
         )
@@ -143,7 +177,7 @@ async def bulk_delete_hwm(
 ) -> None:
     async with unit_of_work:
         await unit_of_work.namespace.check_user_permission(
-            user_id=user.id,
+            user=user,
             required_role=NamespaceUserRoleInt.MAINTAINER,
             namespace_id=changes.namespace_id,
         )
@@ -169,7 +203,7 @@ async def copy_hwms(
 ) -> HWMListResponseV1:
     async with unit_of_work:
         await unit_of_work.namespace.check_user_permission(
-            user_id=user.id,
+            user=user,
             namespace_id=copy_request.target_namespace_id,
             required_role=NamespaceUserRoleInt.DEVELOPER,
         )
@@ -2,9 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing_extensions import Annotated
 
+from horizon.backend.api.idempotency import IdempotentAPIRoute
 from horizon.backend.db.models import NamespaceUserRoleInt, User
 from horizon.backend.services import UnitOfWork, current_user
 from horizon.commons.errors import get_error_responses
@@ -13,6 +16,8 @@ from horizon.commons.schemas.v1 import (
     NamespaceCreateRequestV1,
     NamespacePaginateQueryV1,
     NamespaceResponseV1,
+    NamespaceStatsListResponseV1,
+    NamespaceStatsResponseV1,
     NamespaceUpdateRequestV1,
     NamespaceUserRole,
     PageResponseV1,
@@ -21,33 +26,74 @@ from horizon.commons.schemas.v1 import (
     PermissionsUpdateRequestV1,
 )
 
-router = APIRouter(prefix="/namespaces", tags=["Namespace"], responses=get_error_responses())
+router = APIRouter(
+    prefix="/namespaces",
+    tags=["Namespace"],
+    responses=get_error_responses(),
+    route_class=IdempotentAPIRoute,
+)
+
+
+async def _fill_stats(unit_of_work: UnitOfWork, namespaces: List[NamespaceResponseV1]) -> None:
+    stats = await unit_of_work.namespace_stats.get_many([namespace.id for namespace in namespaces])
+    for namespace in namespaces:
+        if namespace.id in stats:
+            namespace.stats = NamespaceStatsResponseV1.from_orm(stats[namespace.id])
 
 
+# `stats` field is not returned unless it was explicitly requested
 @router.get(
     "/",
     summary="Paginage namespaces",
     dependencies=[Depends(current_user)],
+    response_model_exclude_unset=True,
 )
 async def paginate_namespaces(
     pagination_args: Annotated[NamespacePaginateQueryV1, Depends()],
     unit_of_work: Annotated[UnitOfWork, Depends()],
 ) -> PageResponseV1[NamespaceResponseV1]:
-    pagination = await unit_of_work.namespace.paginate(**pagination_args.dict())
-    return PageResponseV1[NamespaceResponseV1].from_pagination(pagination)
+    pagination = await unit_of_work.namespace.paginate(**pagination_args.dict(exclude={"with_stats"}))
+    response = PageResponseV1[NamespaceResponseV1].from_pagination(pagination)
+    if pagination_args.with_stats:
+        await _fill_stats(unit_of_work, response.items)
+    return response
+
+
+@router.get(
+    "/stats",
+    summary="Get statistics of multiple namespaces",
+    dependencies=[Depends(current_user)],
+)
+async def get_namespaces_stats(
+    unit_of_work: Annotated[UnitOfWork, Depends()],
+    namespace_ids: Annotated[List[int], Query(description="Namespace ids. Missing namespaces are skipped")],
+) -> NamespaceStatsListResponseV1:
+    stats = await unit_of_work.namespace_stats.get_many(namespace_ids)
+    return NamespaceStatsListResponseV1(
+        stats=[
+            NamespaceStatsResponseV1.from_orm(stats[namespace_id])
+            for namespace_id in dict.fromkeys(namespace_ids)
+            if namespace_id in stats
+        ],
+    )
 
 
 @router.get(
     "/{namespace_id}",
     summary="Get namespace",
     dependencies=[Depends(current_user)],
+    response_model_exclude_unset=True,
 )
 async def get_namespace(
     namespace_id: int,
     unit_of_work: Annotated[UnitOfWork, Depends()],
+    with_stats: Annotated[bool, Query(description="Include namespace statistics into response")] = False,  # noqa: FBT002
 ) -> NamespaceResponseV1:
     namespace = await unit_of_work.namespace.get(namespace_id)
-    return NamespaceResponseV1.from_orm(namespace)
+    response = NamespaceResponseV1.from_orm(namespace)
+    if with_stats:
+        await _fill_stats(unit_of_work, [response])
+    return response
 
 
 @router.post(
@@ -81,7 +127,7 @@ async def update_namespace(
 ) -> NamespaceResponseV1:
     async with unit_of_work:
         await unit_of_work.namespace.check_user_permission(
-            user_id=user.id,
+            user=user,
             namespace_id=namespace_id,
             required_role=NamespaceUserRoleInt.OWNER,
         )
@@ -112,12 +158,12 @@ async def delete_namespace(
 ) -> None:
     async with unit_of_work:
         await unit_of_work.namespace.check_user_permission(
-            user_id=user.id,
+            user=user,
             namespace_id=namespace_id,
             required_role=NamespaceUserRoleInt.OWNER,
         )
-        hwm_records = await unit_of_work.hwm.paginate(namespace_id=namespace_id, page=1, page_size=1)
-        if hwm_records.total_count:
+        stats = await unit_of_work.namespace_stats.get(namespace_id)
+        if stats.hwm_count:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete namespace because it has related HWM records.",
@@ -138,7 +184,7 @@ async def get_namespace_permissions(
 ) -> PermissionsResponseV1:
     async with unit_of_work:
         await unit_of_work.namespace.check_user_permission(
-            user_id=user.id,
+            user=user,
             namespace_id=namespace_id,
             required_role=NamespaceUserRoleInt.OWNER,
         )
@@ -165,7 +211,7 @@ async def update_namespace_permissions(
 ) -> PermissionsResponseV1:
     async with unit_of_work:
         await unit_of_work.namespace.check_user_permission(
-            user_id=user.id,
+            user=user,
             namespace_id=namespace_id,
             required_role=NamespaceUserRoleInt.OWNER,
         )
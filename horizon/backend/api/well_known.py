@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from typing_extensions import Annotated
+
+from horizon.backend.dependencies import Stub
+from horizon.backend.utils.jwt import JWTKeys
+
+router = APIRouter(tags=["Auth"], prefix="/.well-known")
+
+
+@router.get("/jwks.json", summary="Get public keys used for validating access tokens")
+async def jwks(
+    jwt_keys: Annotated[Optional[JWTKeys], Depends(Stub(JWTKeys))],
+) -> JSONResponse:
+    # keys are rotated rarely, so clients (e.g. API gateways) can cache the response
+    if jwt_keys is None:
+        return JSONResponse({"keys": []})
+    return JSONResponse(
+        jwt_keys.get_jwks(),
+        headers={"Cache-Control": f"public, max-age={jwt_keys.jwks_max_age}"},
+    )
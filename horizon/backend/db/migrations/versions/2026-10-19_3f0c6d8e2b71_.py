@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+"""Add trigram indexes on HWM and namespace names
+
+Revision ID: 3f0c6d8e2b71
+Revises: af4a851ee7cf
+Create Date: 2026-10-19 11:20:04.381520
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f0c6d8e2b71"
+down_revision = "af4a851ee7cf"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        "ix__hwm__name_trgm",
+        "hwm",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix__namespace__name_trgm",
+        "namespace",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix__namespace__name_trgm", table_name="namespace")
+    op.drop_index("ix__hwm__name_trgm", table_name="hwm")
+    # extension is not dropped, it could be used by other applications
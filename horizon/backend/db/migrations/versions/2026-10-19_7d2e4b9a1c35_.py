@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+"""Add namespace_stats and namespace_stats_delta tables
+
+Revision ID: 7d2e4b9a1c35
+Revises: 3f0c6d8e2b71
+Create Date: 2026-10-19 09:55:52.487964
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d2e4b9a1c35"
+down_revision = "3f0c6d8e2b71"
+branch_labels = None
+depends_on = None
+
+# Statement-level triggers with transition tables, so bulk operations produce only one delta row per namespace.
+# Triggers on HWM tables do not update namespace_stats row, because all writers of the same namespace would wait
+# for the lock of this row until the end of their transactions. Instead, triggers append rows to namespace_stats_delta,
+# which are periodically folded into namespace_stats by backend, see NamespaceStatsRepository.fold_deltas.
+# Deltas are not added for deleted namespaces, otherwise cascade delete of namespace will fail on foreign key check.
+FUNCTIONS = {
+    "namespace_stats_on_namespace_insert": """
+        INSERT INTO namespace_stats (namespace_id)
+        SELECT id FROM new_rows
+        ON CONFLICT (namespace_id) DO NOTHING;
+    """,
+    "namespace_stats_on_hwm_insert": """
+        INSERT INTO namespace_stats_delta (namespace_id, hwm_count, last_changed_at)
+        SELECT namespace_id, count(*), max(changed_at)
+        FROM new_rows
+        WHERE namespace_id IN (SELECT id FROM namespace)
+        GROUP BY namespace_id;
+    """,
+    "namespace_stats_on_hwm_update": """
+        INSERT INTO namespace_stats_delta (namespace_id, last_changed_at)
+        SELECT namespace_id, max(changed_at)
+        FROM new_rows
+        WHERE namespace_id IN (SELECT id FROM namespace)
+        GROUP BY namespace_id;
+    """,
+    "namespace_stats_on_hwm_delete": """
+        INSERT INTO namespace_stats_delta (namespace_id, hwm_count)
+        SELECT namespace_id, -count(*)
+        FROM old_rows
+        WHERE namespace_id IN (SELECT id FROM namespace)
+        GROUP BY namespace_id;
+    """,
+    "namespace_stats_on_hwm_history_insert": """
+        INSERT INTO namespace_stats_delta (namespace_id, history_count)
+        SELECT namespace_id, count(*)
+        FROM new_rows
+        WHERE namespace_id IN (SELECT id FROM namespace)
+        GROUP BY namespace_id;
+    """,
+    "namespace_stats_on_hwm_history_delete": """
+        INSERT INTO namespace_stats_delta (namespace_id, history_count)
+        SELECT namespace_id, -count(*)
+        FROM old_rows
+        WHERE namespace_id IN (SELECT id FROM namespace)
+        GROUP BY namespace_id;
+    """,
+}
+
+# trigger name -> (table, event, transition table, function)
+TRIGGERS = {
+    "namespace_stats_namespace_insert": ("namespace", "INSERT", "NEW", "namespace_stats_on_namespace_insert"),
+    "namespace_stats_hwm_insert": ("hwm", "INSERT", "NEW", "namespace_stats_on_hwm_insert"),
+    "namespace_stats_hwm_update": ("hwm", "UPDATE", "NEW", "namespace_stats_on_hwm_update"),
+    "namespace_stats_hwm_delete": ("hwm", "DELETE", "OLD", "namespace_stats_on_hwm_delete"),
+    "namespace_stats_hwm_history_insert": ("hwm_history", "INSERT", "NEW", "namespace_stats_on_hwm_history_insert"),
+    "namespace_stats_hwm_history_delete": ("hwm_history", "DELETE", "OLD", "namespace_stats_on_hwm_history_delete"),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "namespace_stats",
+        sa.Column("namespace_id", sa.BigInteger(), nullable=False),
+        sa.Column("hwm_count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("history_count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("last_changed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["namespace_id"],
+            ["namespace.id"],
+            name=op.f("fk__namespace_stats__namespace_id__namespace"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("namespace_id", name=op.f("pk__namespace_stats")),
+    )
+    op.create_table(
+        "namespace_stats_delta",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("namespace_id", sa.BigInteger(), nullable=False),
+        sa.Column("hwm_count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("history_count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("last_changed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["namespace_id"],
+            ["namespace.id"],
+            name=op.f("fk__namespace_stats_delta__namespace_id__namespace"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__namespace_stats_delta")),
+    )
+    op.create_index(
+        op.f("ix__namespace_stats_delta__namespace_id"),
+        "namespace_stats_delta",
+        ["namespace_id"],
+        unique=False,
+    )
+
+    for function_name, body in FUNCTIONS.items():
+        op.execute(
+            f"""
+            CREATE FUNCTION {function_name}() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                {body}
+                RETURN NULL;
+            END;
+            $$
+            """,
+        )
+
+    # lock tables to avoid missing changes made between backfill and trigger creation
+    op.execute("LOCK TABLE namespace, hwm, hwm_history IN SHARE ROW EXCLUSIVE MODE")
+    for trigger_name, (table, event, transition, function_name) in TRIGGERS.items():
+        op.execute(
+            f"""
+            CREATE TRIGGER {trigger_name}
+            AFTER {event} ON {table}
+            REFERENCING {transition} TABLE AS {transition.lower()}_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function_name}()
+            """,
+        )
+
+    op.execute(
+        """
+        INSERT INTO namespace_stats (namespace_id, hwm_count, history_count, last_changed_at)
+        SELECT
+            namespace.id,
+            COALESCE(hwm_stats.hwm_count, 0),
+            COALESCE(history_stats.history_count, 0),
+            hwm_stats.last_changed_at
+        FROM namespace
+        LEFT JOIN (
+            SELECT namespace_id, count(*) AS hwm_count, max(changed_at) AS last_changed_at
+            FROM hwm
+            GROUP BY namespace_id
+        ) AS hwm_stats ON hwm_stats.namespace_id = namespace.id
+        LEFT JOIN (
+            SELECT namespace_id, count(*) AS history_count
+            FROM hwm_history
+            GROUP BY namespace_id
+        ) AS history_stats ON history_stats.namespace_id = namespace.id
+        """,
+    )
+
+
+def downgrade() -> None:
+    for trigger_name, (table, *_) in TRIGGERS.items():
+        op.execute(f"DROP TRIGGER {trigger_name} ON {table}")
+
+    for function_name in FUNCTIONS:
+        op.execute(f"DROP FUNCTION {function_name}()")
+
+    op.drop_index(op.f("ix__namespace_stats_delta__namespace_id"), table_name="namespace_stats_delta")
+    op.drop_table("namespace_stats_delta")
+    op.drop_table("namespace_stats")
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+"""Add refresh_token table
+
+Revision ID: 9c4a7e21d6f0
+Revises: 5b8e1f3c9a27
+Create Date: 2026-10-19 14:12:37.518204
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c4a7e21d6f0"
+down_revision = "5b8e1f3c9a27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "refresh_token",
+        sa.Column("token_hash", sa.LargeBinary(length=32), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("family_id", sa.Uuid(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+            name=op.f("fk__refresh_token__user_id__user"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("token_hash", name=op.f("pk__refresh_token")),
+    )
+    op.create_index(op.f("ix__refresh_token__family_id"), "refresh_token", ["family_id"], unique=False)
+    op.create_index(op.f("ix__refresh_token__user_id"), "refresh_token", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix__refresh_token__user_id"), table_name="refresh_token")
+    op.drop_index(op.f("ix__refresh_token__family_id"), table_name="refresh_token")
+    op.drop_table("refresh_token")
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+"""Add api_key table
+
+Revision ID: a3d5f7c9e1b2
+Revises: e6b1f8a43c92
+Create Date: 2026-10-19 17:41:09.627315
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "a3d5f7c9e1b2"
+down_revision = "e6b1f8a43c92"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "api_key",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("name", sa.String(length=256), nullable=False),
+        sa.Column("key_hash", sa.LargeBinary(length=32), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("namespace_ids", postgresql.ARRAY(sa.BigInteger()), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+            name=op.f("fk__api_key__user_id__user"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__api_key")),
+        sa.UniqueConstraint("key_hash", name=op.f("uq__api_key__key_hash")),
+        sa.UniqueConstraint("name", name=op.f("uq__api_key__name")),
+    )
+    op.create_index(op.f("ix__api_key__user_id"), "api_key", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix__api_key__user_id"), table_name="api_key")
+    op.drop_table("api_key")
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+"""Use JSONB for HWM value
+
+Revision ID: af4a851ee7cf
+Revises: ec64f7b42221
+Create Date: 2026-10-19 09:46:51.672137
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "af4a851ee7cf"
+down_revision = "ec64f7b42221"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "hwm",
+        "value",
+        existing_type=postgresql.JSON(astext_type=sa.Text()),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="value::jsonb",
+    )
+    op.alter_column(
+        "hwm_history",
+        "value",
+        existing_type=postgresql.JSON(astext_type=sa.Text()),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="value::jsonb",
+    )
+
+    op.create_index(op.f("ix__hwm__namespace_id_type"), "hwm", ["namespace_id", "type"], unique=False)
+    op.create_index(op.f("ix__hwm__namespace_id_changed_at"), "hwm", ["namespace_id", "changed_at"], unique=False)
+    op.create_index(op.f("ix__hwm__entity"), "hwm", ["entity"], unique=False, postgresql_using="hash")
+    op.create_index(
+        op.f("ix__hwm__value"),
+        "hwm",
+        ["value"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"value": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix__hwm__value"), table_name="hwm")
+    op.drop_index(op.f("ix__hwm__entity"), table_name="hwm")
+    op.drop_index(op.f("ix__hwm__namespace_id_changed_at"), table_name="hwm")
+    op.drop_index(op.f("ix__hwm__namespace_id_type"), table_name="hwm")
+
+    op.alter_column(
+        "hwm_history",
+        "value",
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="value::json",
+    )
+    op.alter_column(
+        "hwm",
+        "value",
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="value::json",
+    )
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+"""Add user.auth_version column
+
+Revision ID: e6b1f8a43c92
+Revises: 9c4a7e21d6f0
+Create Date: 2026-10-19 15:41:09.267315
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e6b1f8a43c92"
+down_revision = "9c4a7e21d6f0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("user", sa.Column("auth_version", sa.Integer(), server_default=sa.text("0"), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("user", "auth_version")
@@ -1,22 +1,31 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
+from horizon.backend.db.models.api_key import APIKey
 from horizon.backend.db.models.base import Base
 from horizon.backend.db.models.credentials_cache import CredentialsCache
 from horizon.backend.db.models.hwm import HWM
 from horizon.backend.db.models.hwm_history import HWMHistory
+from horizon.backend.db.models.idempotency_key import IdempotencyKey
 from horizon.backend.db.models.namespace import Namespace, NamespaceUserRoleInt
 from horizon.backend.db.models.namespace_history import NamespaceHistory
+from horizon.backend.db.models.namespace_stats import NamespaceStats, NamespaceStatsDelta
 from horizon.backend.db.models.namespace_user import NamespaceUser
+from horizon.backend.db.models.refresh_token import RefreshToken
 from horizon.backend.db.models.user import User
 
 __all__ = [
     "HWM",
+    "APIKey",
     "Base",
     "CredentialsCache",
     "HWMHistory",
+    "IdempotencyKey",
     "Namespace",
     "NamespaceHistory",
+    "NamespaceStats",
+    "NamespaceStatsDelta",
     "NamespaceUser",
     "NamespaceUserRoleInt",
+    "RefreshToken",
     "User",
 ]
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from sqlalchemy import MetaData, inspect
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy_utils import generic_repr  # type: ignore[import-untyped]
 
 convention = {
     "all_column_names": lambda constraint, table: "_".join(
@@ -20,10 +19,18 @@ convention = {
 horizon_metadata = MetaData(naming_convention=convention)  # type: ignore[arg-type]
 
 
-@generic_repr
 class Base(DeclarativeBase):
     metadata = horizon_metadata
 
+    def __repr__(self) -> str:
+        # same output as sqlalchemy_utils.generic_repr, but without importing all its dependencies
+        state = inspect(self)
+        fields = []
+        for key in state.mapper.columns.keys():  # noqa: SIM118
+            value = "<not loaded>" if key in state.unloaded else repr(state.attrs[key].loaded_value)
+            fields.append(f"{key}={value}")
+        return f"{self.__class__.__name__}({', '.join(fields)})"
+
     def to_dict(self, exclude: set[str] | None = None):
         exclude = exclude or set()
         return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs if c.key not in exclude}
@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import Optional
 
-from sqlalchemy import JSON, BigInteger, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import BigInteger, ForeignKey, Index, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from horizon.backend.db.mixins.changed_by import ChangedByMixin
@@ -12,7 +13,17 @@ from horizon.backend.db.models.namespace import Namespace
 
 class HWM(Base, ChangedByMixin):
     __tablename__ = "hwm"
-    __table_args__ = (UniqueConstraint("namespace_id", "name", name="hwm_name_unique_per_namespace"),)
+    __table_args__ = (
+        UniqueConstraint("namespace_id", "name", name="hwm_name_unique_per_namespace"),
+        Index(None, "namespace_id", "type"),
+        Index(None, "namespace_id", "changed_at"),
+        # entity can be arbitrary long, so B-tree cannot be used here
+        Index(None, "entity", postgresql_using="hash"),
+        # used by value filters. value can be a large list of files, so B-tree cannot be used here too
+        Index(None, "value", postgresql_using="gin", postgresql_ops={"value": "jsonb_path_ops"}),
+        # used by name_contains and name_prefix filters, requires pg_trgm extension
+        Index("ix__hwm__name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
 
@@ -27,6 +38,6 @@ class HWM(Base, ChangedByMixin):
     name: Mapped[str] = mapped_column(String(2048), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text(), nullable=False, default="")
     type: Mapped[str] = mapped_column(String(64), nullable=False)
-    value: Mapped[str] = mapped_column(JSON(), nullable=False)
+    value: Mapped[str] = mapped_column(JSONB(), nullable=False)
     entity: Mapped[Optional[str]] = mapped_column(Text(), nullable=True)
     expression: Mapped[Optional[str]] = mapped_column(Text(), nullable=True)
@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import Optional
 
-from sqlalchemy import JSON, BigInteger, ForeignKey, String, Text
+from sqlalchemy import BigInteger, ForeignKey, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from horizon.backend.db.mixins.changed_by import ChangedByMixin
@@ -25,7 +26,7 @@ class HWMHistory(Base, ChangedByMixin):
     name: Mapped[str] = mapped_column(String(2048), nullable=False)
     description: Mapped[str] = mapped_column(Text(), nullable=False)
     type: Mapped[str] = mapped_column(String(64), nullable=False)
-    value: Mapped[str] = mapped_column(JSON(), nullable=False)
+    value: Mapped[str] = mapped_column(JSONB(), nullable=False)
     entity: Mapped[Optional[str]] = mapped_column(Text(), nullable=True)
     expression: Mapped[Optional[str]] = mapped_column(Text(), nullable=True)
     action: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, LargeBinary, SmallInteger, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from horizon.backend.db.models.base import Base
+
+
+class IdempotencyKey(Base):
+    """Response of write request sent with ``Idempotency-Key`` header.
+
+    Keys are unique per user, so different users cannot see each other's keys.
+    Row with empty ``status_code`` means that request is still being processed.
+    """
+
+    __tablename__ = "idempotency_key"
+
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # sha256 of user id, method, path, query and body
+    request_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
+    status_code: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
+    content_type: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    response_body: Mapped[Optional[bytes]] = mapped_column(LargeBinary(), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from enum import IntEnum
 
-from sqlalchemy import BigInteger, ForeignKey, String, Text
+from sqlalchemy import BigInteger, ForeignKey, Index, String, Text
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,6 +20,10 @@ class NamespaceUserRoleInt(IntEnum):
 
 class Namespace(Base, ChangedByMixin):
     __tablename__ = "namespace"
+    __table_args__ = (
+        # used by name_contains and name_prefix filters, requires pg_trgm extension
+        Index("ix__namespace__name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     name: Mapped[str] = mapped_column(
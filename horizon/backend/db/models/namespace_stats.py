@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from horizon.backend.db.models.base import Base
+
+
+class NamespaceStats(Base):
+    """Aggregated namespace statistics.
+
+    Row is created by database trigger on ``namespace`` table, and then updated by folding :obj:`NamespaceStatsDelta`
+    rows, see migration ``7d2e4b9a1c35``.
+    """
+
+    __tablename__ = "namespace_stats"
+
+    namespace_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("namespace.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    hwm_count: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+    history_count: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+    last_changed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class NamespaceStatsDelta(Base):
+    """Change of namespace statistics, not yet folded into :obj:`NamespaceStats`.
+
+    Rows are appended by database triggers on ``hwm`` and ``hwm_history`` tables,
+    so concurrent writers of the same namespace do not wait for each other.
+    """
+
+    __tablename__ = "namespace_stats_delta"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    namespace_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("namespace.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+    hwm_count: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+    history_count: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+    last_changed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
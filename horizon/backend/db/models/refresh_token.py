@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, LargeBinary, Uuid, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from horizon.backend.db.models.base import Base
+
+
+class RefreshToken(Base):
+    """Refresh token issued to a user.
+
+    Token itself is not stored, only its sha256 hash. Each token can be used only once,
+    after that it is replaced by a new token of the same ``family_id``.
+    """
+
+    __tablename__ = "refresh_token"
+
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # all tokens issued by exchanging one refresh token for another, starting from login
+    family_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # token was used or revoked
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
-from sqlalchemy import BigInteger, Boolean, String
+from typing import TYPE_CHECKING, FrozenSet, Optional
+
+from sqlalchemy import BigInteger, Boolean, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from horizon.backend.db.mixins.timestamp import TimestampMixin
@@ -19,3 +21,12 @@ class User(Base, TimestampMixin):
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # increased to revoke all access tokens issued before, e.g. after changing is_admin
+    auth_version: Mapped[int] = mapped_column(Integer, default=0, server_default=text("0"), nullable=False)
+
+    # not stored in database. namespaces which can be changed using API key user is authenticated with,
+    # None means no restrictions
+    if TYPE_CHECKING:
+        namespace_scope: Optional[FrozenSet[int]]
+    else:
+        namespace_scope = None
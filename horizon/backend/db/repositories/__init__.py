@@ -1,17 +1,25 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
+from horizon.backend.db.repositories.api_key import APIKeyRepository
 from horizon.backend.db.repositories.credentials_cache import CredentialsCacheRepository
 from horizon.backend.db.repositories.hwm import HWMRepository
 from horizon.backend.db.repositories.hwm_history import HWMHistoryRepository
+from horizon.backend.db.repositories.idempotency_key import IdempotencyKeyRepository
 from horizon.backend.db.repositories.namespace import NamespaceRepository
 from horizon.backend.db.repositories.namespace_history import NamespaceHistoryRepository
+from horizon.backend.db.repositories.namespace_stats import NamespaceStatsRepository
+from horizon.backend.db.repositories.refresh_token import RefreshTokenRepository
 from horizon.backend.db.repositories.user import UserRepository
 
 __all__ = [
+    "APIKeyRepository",
     "CredentialsCacheRepository",
     "HWMHistoryRepository",
     "HWMRepository",
+    "IdempotencyKeyRepository",
     "NamespaceHistoryRepository",
     "NamespaceRepository",
+    "NamespaceStatsRepository",
+    "RefreshTokenRepository",
     "UserRepository",
 ]
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from horizon.backend.db.models import APIKey, User
+from horizon.backend.db.repositories.base import Repository
+from horizon.commons.exceptions.entity import EntityAlreadyExistsError
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+class APIKeyRepository(Repository[APIKey]):
+    async def get_with_user(self, key_hash: bytes) -> Optional[Tuple[APIKey, User]]:
+        query = select(APIKey, User).join(User, User.id == APIKey.user_id).where(APIKey.key_hash == key_hash)
+        result = await self._session.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    async def list_with_users(self) -> List[Tuple[APIKey, User]]:
+        query = select(APIKey, User).join(User, User.id == APIKey.user_id).order_by(APIKey.name)
+        result = await self._session.execute(query)
+        return [(api_key, user) for api_key, user in result.all()]
+
+    async def create(
+        self,
+        name: str,
+        key_hash: bytes,
+        user_id: int,
+        namespace_ids: Optional[List[int]],
+        expires_at: Optional[datetime],
+    ) -> APIKey:
+        try:
+            result = await self._create(
+                data={
+                    "name": name,
+                    "key_hash": key_hash,
+                    "user_id": user_id,
+                    "namespace_ids": namespace_ids,
+                    "expires_at": expires_at,
+                },
+            )
+            await self._session.flush()
+        except IntegrityError as e:
+            raise EntityAlreadyExistsError("APIKey", "name", name) from e
+        else:
+            return result
+
+    async def delete_by_name(self, name: str) -> bool:
+        result = await self._session.execute(delete(APIKey).where(APIKey.name == name).returning(APIKey.id))
+        return result.scalar_one_or_none() is not None
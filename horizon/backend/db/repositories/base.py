@@ -16,6 +16,10 @@ from horizon.commons.dto.pagination import Pagination
 Model = TypeVar("Model", bound=Base)
 
 
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class Repository(ABC, Generic[Model]):
     def __init__(
         self,
@@ -102,6 +106,28 @@ class Repository(ABC, Generic[Model]):
             page_size=page_size,
         )
 
+    def _search_by_name(
+        self,
+        column: SQLColumnExpression[str],
+        name_contains: str | None = None,
+        name_prefix: str | None = None,
+    ) -> tuple[list[SQLColumnExpression], list[SQLColumnExpression]]:
+        """Get filters and sorting for case-insensitive name search.
+
+        ILIKE is served by ``gin_trgm_ops`` index, results are ranked by trigram similarity.
+        """
+        where: list[SQLColumnExpression] = []
+        order_by: list[SQLColumnExpression] = []
+        if name_prefix:
+            where.append(column.ilike(_escape_like(name_prefix) + "%"))
+        if name_contains:
+            where.append(column.ilike("%" + _escape_like(name_contains) + "%"))
+
+        search = name_contains or name_prefix
+        if search:
+            order_by.append(func.similarity(column, search).desc())
+        return where, order_by
+
     async def _count(
         self,
         where: list[SQLColumnExpression] | None = None,
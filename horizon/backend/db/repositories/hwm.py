@@ -3,11 +3,14 @@
 
 from __future__ import annotations
 
+import json
 import re
 from collections.abc import Sequence
-from typing import List
+from datetime import datetime
+from typing import Any, List
 
-from sqlalchemy import SQLColumnExpression, delete, select
+from sqlalchemy import SQLColumnExpression, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import IntegrityError
 
 from horizon.backend.db.models import HWM, HWMHistory, User
@@ -19,23 +22,96 @@ from horizon.commons.exceptions.entity import (
 )
 
 
+def _parse_value(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _get_value_filters(  # noqa: PLR0913
+    value: str | None,
+    value_gt: str | None,
+    value_gte: str | None,
+    value_lt: str | None,
+    value_lte: str | None,
+    value_contains: str | None,
+) -> list[SQLColumnExpression]:
+    where: list[SQLColumnExpression] = []
+    if value is not None:
+        expected = literal(_parse_value(value), JSONB)
+        # containment check can use GIN index, and equality check removes false positives like [1, 2] @> 1
+        where.extend([HWM.value.contains(expected), HWM.value == expected])
+
+    if value_contains is not None:
+        where.append(HWM.value.contains(literal(_parse_value(value_contains), JSONB)))
+
+    for raw_value, operator in [
+        (value_gt, HWM.value.__gt__),
+        (value_gte, HWM.value.__ge__),
+        (value_lt, HWM.value.__lt__),
+        (value_lte, HWM.value.__le__),
+    ]:
+        if raw_value is None:
+            continue
+        expected = literal(_parse_value(raw_value), JSONB)
+        # JSONB values of different types are also comparable, e.g. any array is greater than any number
+        where.extend([func.jsonb_typeof(HWM.value) == func.jsonb_typeof(expected), operator(expected)])
+
+    return where
+
+
 class HWMRepository(Repository[HWM]):
-    async def paginate(
+    async def paginate(  # noqa: PLR0913
         self,
-        namespace_id: int,
+        namespace_id: int | None,
         page: int,
         page_size: int,
         name: str | None = None,
+        name_contains: str | None = None,
+        name_prefix: str | None = None,
+        type: str | None = None,  # noqa: A002
+        entity: str | None = None,
+        changed_by: str | None = None,
+        changed_since: datetime | None = None,
+        changed_until: datetime | None = None,
+        value: str | None = None,
+        value_gt: str | None = None,
+        value_gte: str | None = None,
+        value_lt: str | None = None,
+        value_lte: str | None = None,
+        value_contains: str | None = None,
     ) -> Pagination[HWM]:
-        where: list[SQLColumnExpression] = [
-            HWM.namespace_id == namespace_id,
-        ]
+        where, order_by = self._search_by_name(HWM.name, name_contains=name_contains, name_prefix=name_prefix)
+        if namespace_id is not None:
+            where.append(HWM.namespace_id == namespace_id)
         if name:
             where.append(HWM.name == name)
+        if type:
+            where.append(HWM.type == type)
+        if entity:
+            where.append(HWM.entity == entity)
+        if changed_by:
+            where.append(HWM.changed_by_user_id.in_(select(User.id).where(User.username == changed_by)))
+        if changed_since:
+            where.append(HWM.changed_at >= changed_since)
+        if changed_until:
+            where.append(HWM.changed_at < changed_until)
+
+        where.extend(
+            _get_value_filters(
+                value=value,
+                value_gt=value_gt,
+                value_gte=value_gte,
+                value_lt=value_lt,
+                value_lte=value_lte,
+                value_contains=value_contains,
+            ),
+        )
 
         return await self._paginate(
             where=where,
-            order_by=[HWM.name],
+            order_by=[*order_by, HWM.name, HWM.id],
             page=page,
             page_size=page_size,
         )
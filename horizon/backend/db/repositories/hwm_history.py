@@ -3,12 +3,28 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from horizon.backend.db.models import HWMHistory
 from horizon.backend.db.repositories.base import Repository
 from horizon.commons.dto import Pagination
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from horizon.backend.services.history_writer import HWMHistoryWriter
+
 
 class HWMHistoryRepository(Repository[HWMHistory]):
+    def __init__(
+        self,
+        session: AsyncSession,
+        writer: HWMHistoryWriter | None = None,
+    ) -> None:
+        super().__init__(session=session)
+        self._writer = writer
+        self._pending: list[HWMHistory] = []
+
     async def paginate(
         self,
         hwm_id: int,
@@ -26,19 +42,38 @@ class HWMHistoryRepository(Repository[HWMHistory]):
 
     async def create(self, hwm_id: int, data: dict) -> HWMHistory:
         action = data.get("action", "Created")
+        row = {
+            **data,
+            "hwm_id": hwm_id,
+            "action": action,
+        }
 
-        result = await self._create(
-            data={
-                **data,
-                "hwm_id": hwm_id,
-                "action": action,
-            },
-        )
+        if self._writer:
+            # record will be saved by writer right before transaction is committed, id is set only after that
+            history = HWMHistory(**row)
+            self._pending.append(history)
+            return history
+
+        result = await self._create(data=row)
         await self._session.flush()
         return result
 
     async def bulk_create(self, hwm_data: list[dict]) -> list[HWMHistory]:
         hwm_histories = [HWMHistory(**data) for data in hwm_data]
+        if self._writer:
+            self._pending.extend(hwm_histories)
+            return hwm_histories
+
         self._session.add_all(hwm_histories)
         await self._session.flush()
         return hwm_histories
+
+    async def write_pending(self) -> None:
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        await self._writer.write(self._session, pending)  # type: ignore[union-attr]
+
+    def discard_pending(self) -> None:
+        self._pending.clear()
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from horizon.backend.db.models import IdempotencyKey
+from horizon.backend.db.repositories.base import Repository
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+class IdempotencyKeyRepository(Repository[IdempotencyKey]):
+    async def get(self, user_id: int, key: str) -> IdempotencyKey | None:
+        return await self._get(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+
+    async def reserve(self, user_id: int, key: str, request_hash: bytes, expired_before: datetime) -> bool:
+        """Reserve key for a new request.
+
+        Returns ``False`` if key is already used by another request which is not expired yet.
+        """
+        query = (
+            insert(IdempotencyKey)
+            .values(user_id=user_id, key=key, request_hash=request_hash)
+            .on_conflict_do_update(
+                index_elements=[IdempotencyKey.user_id, IdempotencyKey.key],
+                set_={
+                    "request_hash": request_hash,
+                    "status_code": None,
+                    "content_type": None,
+                    "response_body": None,
+                    "created_at": func.now(),
+                },
+                where=IdempotencyKey.created_at < expired_before,
+            )
+            .returning(IdempotencyKey.key)
+        )
+        result = await self._session.scalar(query)
+        await self._session.flush()
+        return result is not None
+
+    async def save_response(
+        self,
+        user_id: int,
+        key: str,
+        status_code: int,
+        content_type: str | None,
+        response_body: bytes,
+    ) -> None:
+        await self._update(
+            where=[IdempotencyKey.user_id == user_id, IdempotencyKey.key == key],
+            changes={
+                "status_code": status_code,
+                "content_type": content_type,
+                "response_body": response_body,
+            },
+        )
+        await self._session.flush()
+
+    async def release(self, user_id: int, key: str) -> None:
+        """Remove reservation of key, so request could be executed again."""
+        query = delete(IdempotencyKey).where(
+            IdempotencyKey.user_id == user_id,
+            IdempotencyKey.key == key,
+            IdempotencyKey.status_code.is_(None),
+        )
+        await self._session.execute(query)
+        await self._session.flush()
+
+    async def delete_expired(self, expired_before: datetime) -> None:
+        query = delete(IdempotencyKey).where(IdempotencyKey.created_at < expired_before)
+        await self._session.execute(query)
+        await self._session.flush()
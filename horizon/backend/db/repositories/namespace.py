@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from typing import Dict, cast
 
-from sqlalchemy import SQLColumnExpression, delete, select, update
+from sqlalchemy import delete, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 
@@ -30,12 +30,16 @@ class NamespaceRepository(Repository[Namespace]):
         page: int,
         page_size: int,
         name: str | None = None,
+        name_contains: str | None = None,
+        name_prefix: str | None = None,
     ) -> Pagination[Namespace]:
-        where: list[SQLColumnExpression] = [Namespace.name == name] if name else []
+        where, order_by = self._search_by_name(Namespace.name, name_contains=name_contains, name_prefix=name_prefix)
+        if name:
+            where.append(Namespace.name == name)
 
         return await self._paginate(
             where=where,
-            order_by=[Namespace.name],
+            order_by=[*order_by, Namespace.name],
             page=page,
             page_size=page_size,
         )
@@ -60,6 +64,10 @@ class NamespaceRepository(Repository[Namespace]):
         description: str,
         user: User,
     ) -> Namespace:
+        # API key restricted to specific namespaces cannot be used to create new ones
+        if user.namespace_scope is not None:
+            raise PermissionDeniedError(NamespaceUserRoleInt.OWNER.name, NamespaceUserRoleInt.GUEST.name)
+
         try:
             result = await self._create(
                 data={
@@ -109,7 +117,12 @@ class NamespaceRepository(Repository[Namespace]):
         await self._session.flush()
         return namespace
 
-    async def check_user_permission(self, user_id: int, namespace_id: int, required_role: NamespaceUserRoleInt) -> None:
+    async def check_user_permission(self, user: User, namespace_id: int, required_role: NamespaceUserRoleInt) -> None:
+        # API key can be restricted to specific namespaces, even if user has access to other ones
+        if user.namespace_scope is not None and namespace_id not in user.namespace_scope:
+            raise PermissionDeniedError(required_role.name, NamespaceUserRoleInt.GUEST.name)
+
+        user_id = user.id
         # if the user is a SUPERADMIN, they inherently have all permissions
         superadmin_user = await self._session.execute(select(User.is_admin).where(User.id == user_id))
         if superadmin_user.scalar_one_or_none():
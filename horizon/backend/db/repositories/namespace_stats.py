@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import delete, func, select, update
+
+from horizon.backend.db.models import NamespaceStats, NamespaceStatsDelta
+from horizon.backend.db.repositories.base import Repository
+from horizon.commons.exceptions import EntityNotFoundError
+
+# any constant number, used to prevent concurrent folding by multiple backend processes
+FOLD_LOCK_ID = 7_264_960_115
+
+
+class NamespaceStatsRepository(Repository[NamespaceStats]):
+    """Access to namespace statistics. Statistics are changed by database triggers, not by repository."""
+
+    async def get(self, namespace_id: int) -> NamespaceStats:
+        result = await self.get_many([namespace_id])
+        if namespace_id not in result:
+            raise EntityNotFoundError("Namespace", "id", namespace_id)
+        return result[namespace_id]
+
+    async def get_many(self, namespace_ids: Sequence[int]) -> dict[int, NamespaceStats]:
+        if not namespace_ids:
+            return {}
+
+        # deltas which are not folded yet are added to stats
+        query = (
+            select(
+                NamespaceStats.namespace_id,
+                NamespaceStats.hwm_count + func.coalesce(func.sum(NamespaceStatsDelta.hwm_count), 0),
+                NamespaceStats.history_count + func.coalesce(func.sum(NamespaceStatsDelta.history_count), 0),
+                func.greatest(NamespaceStats.last_changed_at, func.max(NamespaceStatsDelta.last_changed_at)),
+            )
+            .outerjoin(NamespaceStatsDelta, NamespaceStatsDelta.namespace_id == NamespaceStats.namespace_id)
+            .where(NamespaceStats.namespace_id.in_(namespace_ids))
+            .group_by(NamespaceStats.namespace_id)
+        )
+        result = await self._session.execute(query)
+        return {
+            namespace_id: NamespaceStats(
+                namespace_id=namespace_id,
+                hwm_count=hwm_count,
+                history_count=history_count,
+                last_changed_at=last_changed_at,
+            )
+            for namespace_id, hwm_count, history_count, last_changed_at in result.all()
+        }
+
+    async def fold_deltas(self) -> int:
+        """Move deltas into stats rows. Returns number of updated stats rows.
+
+        If deltas are already being folded by another backend process, nothing is done.
+        """
+        if not await self._session.scalar(select(func.pg_try_advisory_xact_lock(FOLD_LOCK_ID))):
+            return 0
+
+        # deltas are removed and added to stats by one statement, so readers see either of them, but not both
+        folded = (
+            delete(NamespaceStatsDelta)
+            .returning(
+                NamespaceStatsDelta.namespace_id,
+                NamespaceStatsDelta.hwm_count,
+                NamespaceStatsDelta.history_count,
+                NamespaceStatsDelta.last_changed_at,
+            )
+            .cte("folded")
+        )
+        delta = (
+            select(
+                folded.c.namespace_id,
+                func.sum(folded.c.hwm_count).label("hwm_count"),
+                func.sum(folded.c.history_count).label("history_count"),
+                func.max(folded.c.last_changed_at).label("last_changed_at"),
+            )
+            .group_by(folded.c.namespace_id)
+            .subquery("delta")
+        )
+        query = (
+            update(NamespaceStats)
+            .where(NamespaceStats.namespace_id == delta.c.namespace_id)
+            .values(
+                hwm_count=NamespaceStats.hwm_count + delta.c.hwm_count,
+                history_count=NamespaceStats.history_count + delta.c.history_count,
+                last_changed_at=func.greatest(NamespaceStats.last_changed_at, delta.c.last_changed_at),
+            )
+            .returning(NamespaceStats.namespace_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(query)
+        return len(result.all())
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, func, update
+
+from horizon.backend.db.models import RefreshToken
+from horizon.backend.db.repositories.base import Repository
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
+
+class RefreshTokenRepository(Repository[RefreshToken]):
+    async def get(self, token_hash: bytes) -> RefreshToken | None:
+        return await self._get(RefreshToken.token_hash == token_hash)
+
+    async def create(self, token_hash: bytes, user_id: int, family_id: UUID, expires_at: datetime) -> RefreshToken:
+        result = await self._create(
+            data={
+                "token_hash": token_hash,
+                "user_id": user_id,
+                "family_id": family_id,
+                "expires_at": expires_at,
+            },
+        )
+        await self._session.flush()
+        return result
+
+    async def use(self, token_hash: bytes) -> RefreshToken | None:
+        """Mark token as used.
+
+        Returns ``None`` if token does not exist, is expired, or was already used by another request.
+        """
+        result = await self._update(
+            where=[
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > func.now(),
+            ],
+            changes={"revoked_at": func.now()},
+        )
+        await self._session.flush()
+        return result
+
+    async def revoke_family(self, family_id: UUID) -> None:
+        query = (
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+        )
+        await self._session.execute(query)
+        await self._session.flush()
+
+    async def delete_expired(self, user_id: int) -> None:
+        query = delete(RefreshToken).where(RefreshToken.user_id == user_id, RefreshToken.expires_at < func.now())
+        await self._session.execute(query)
+        await self._session.flush()
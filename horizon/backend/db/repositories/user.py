@@ -1,6 +1,9 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
 
+from typing import List
+
+from sqlalchemy import or_, select
 from sqlalchemy.exc import IntegrityError
 
 from horizon.backend.db.models import User
@@ -21,6 +24,12 @@ class UserRepository(Repository[User]):
             raise EntityNotFoundError("User", "id", user_id)
         return result
 
+    async def list_with_revoked_tokens(self) -> List[User]:
+        """Return disabled users, and users which tokens issued before were revoked"""
+        query = select(User).where(or_(User.is_active.is_(False), User.auth_version > 0))
+        result = await self._session.scalars(query)
+        return list(result.all())
+
     async def get_by_username(self, username: str) -> User:
         user = await self._get(User.username == username)
         if not user:
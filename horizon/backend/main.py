@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from functools import partial
+from typing import TYPE_CHECKING, AsyncGenerator, Type
+
+from fastapi import FastAPI, HTTPException
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_engine_from_config
+
+import horizon
+from horizon.backend.api.handlers import (
+    application_exception_handler,
+    http_exception_handler,
+    service_exception_handler,
+    unknown_exception_handler,
+    validation_exception_handler,
+)
+from horizon.backend.api.router import api_router
+from horizon.backend.db.factory import create_session_factory, sessionmaker
+from horizon.backend.middlewares import apply_middlewares
+from horizon.backend.services.event_loop_monitor import monitor_event_loop_lag
+from horizon.backend.services.history_writer import HWMHistoryWriter
+from horizon.backend.services.idempotency import IdempotencyKeyService
+from horizon.backend.services.namespace_stats import fold_namespace_stats_periodically
+from horizon.backend.services.warmup import warmup_database
+from horizon.backend.settings import Settings
+from horizon.backend.utils.jwt import JWTKeys
+from horizon.commons.exceptions import ApplicationError, ServiceError
+
+if TYPE_CHECKING:
+    from horizon.backend.providers.auth.base import AuthProvider
+
+log = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI, engine: AsyncEngine) -> AsyncGenerator[None, None]:
+    settings: Settings = application.state.settings
+    auth_class: Type[AuthProvider] = settings.auth.provider  # type: ignore[assignment]
+
+    loop_monitor = None
+    monitoring_settings = settings.server.monitoring
+    if monitoring_settings.enabled and monitoring_settings.event_loop_lag_interval:
+        loop_monitor = asyncio.ensure_future(monitor_event_loop_lag(monitoring_settings.event_loop_lag_interval))
+
+    stats_folder = None
+    stats_settings = settings.server.namespace_stats
+    if stats_settings.fold_enabled:
+        stats_folder = asyncio.ensure_future(
+            fold_namespace_stats_periodically(sessionmaker(engine), stats_settings.fold_interval),
+        )
+
+    try:
+        async with auth_class.lifespan(application):
+            if settings.server.warmup.enabled:
+                await warmup_database(engine, settings.server.warmup)
+
+            log.info("Application is ready to accept requests")
+            application.state.ready = True
+            # on shutdown server stops accepting new requests, and waits for in-flight ones before exiting
+            yield
+    finally:
+        application.state.ready = False
+        for task in (loop_monitor, stats_folder):
+            if task is not None:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        await engine.dispose()
+
+
+def application_factory(settings: Settings) -> FastAPI:
+    engine = async_engine_from_config(settings.database.dict(), prefix="")
+    session_factory = create_session_factory(engine)
+
+    application = FastAPI(
+        title="Horizon",
+        description="Horizon is an application that implements simple HWM Store",
+        version=horizon.__version__,
+        debug=settings.server.debug,
+        # will be set up by middlewares
+        openapi_url=None,
+        docs_url=None,
+        redoc_url=None,
+        lifespan=partial(lifespan, engine=engine),
+    )
+
+    application.state.settings = settings
+    application.state.ready = False
+    application.include_router(api_router)
+
+    application.add_exception_handler(ServiceError, service_exception_handler)  # type: ignore[arg-type]
+    application.add_exception_handler(ApplicationError, application_exception_handler)  # type: ignore[arg-type]
+    application.add_exception_handler(
+        RequestValidationError,
+        validation_exception_handler,  # type: ignore[arg-type]
+    )
+    application.add_exception_handler(HTTPException, http_exception_handler)  # type: ignore[arg-type]
+    application.add_exception_handler(Exception, unknown_exception_handler)
+
+    if settings.server.idempotency.enabled:
+        application.state.idempotency = IdempotencyKeyService.from_settings(
+            sessionmaker(engine),
+            settings.server.idempotency,
+        )
+
+    history_writer = None
+    if settings.server.history_writer.enabled:
+        history_writer = HWMHistoryWriter.from_settings(settings.server.history_writer)
+
+    application.dependency_overrides.update(
+        {
+            Settings: lambda: settings,
+            AsyncSession: session_factory,  # type: ignore[dict-item]
+            HWMHistoryWriter: lambda: history_writer,
+            # replaced by auth providers issuing own access tokens
+            JWTKeys: lambda: None,
+        },
+    )
+
+    # get AuthProvider class from settings, and perform setup
+    auth_class: Type[AuthProvider] = settings.auth.provider  # type: ignore[assignment]
+    auth_class.setup(application)
+
+    apply_middlewares(application, settings)
+    return application
+
+
+def get_application():
+    settings = Settings()
+    return application_factory(settings=settings)
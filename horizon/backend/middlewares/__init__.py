@@ -3,6 +3,9 @@
 
 from fastapi import FastAPI
 
+from horizon.backend.middlewares.admission_control import (
+    apply_admission_control_middleware,
+)
 from horizon.backend.middlewares.application_version import (
     apply_application_version_middleware,
 )
@@ -27,6 +30,8 @@ def apply_middlewares(
     if settings.server.logging.setup:
         setup_logging(settings.server.logging.get_log_config_path())
 
+    # should be applied before other middlewares, so rejected requests are still logged and have X-Request-ID header
+    apply_admission_control_middleware(application, settings.server.admission_control)
     apply_cors_middleware(application, settings.server.cors)
     apply_monitoring_metrics_middleware(application, settings.server.monitoring)
     apply_monitoring_stats_middleware(application, settings.server.monitoring)
@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import http
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional
+
+from fastapi import FastAPI
+from prometheus_client import Counter as MetricCounter
+from prometheus_client import Gauge
+from starlette.datastructures import Headers
+
+from horizon.backend.api.handlers import exception_json_response
+from horizon.backend.services.api_key import is_api_key
+from horizon.backend.settings.server.admission_control import (
+    AdmissionControlGroupSettings,
+    AdmissionControlSettings,
+)
+from horizon.commons.errors.base import BaseErrorSchema
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+READ_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+QUEUED_REQUESTS = MetricCounter(
+    "horizon_admission_control_queued_requests",
+    "Number of requests which waited in admission control queue",
+    ["group"],
+)
+REJECTED_REQUESTS = MetricCounter(
+    "horizon_admission_control_rejected_requests",
+    "Number of requests rejected by admission control",
+    ["group", "status"],
+)
+WAITING_REQUESTS = Gauge(
+    "horizon_admission_control_waiting_requests",
+    "Number of requests currently waiting in admission control queue",
+    ["group"],
+)
+
+
+def get_route_group(method: str, path: str) -> str | None:
+    if path.startswith("/v1/auth/"):
+        return "auth"
+    if path.startswith(("/v1/hwm-history/", "/v1/namespace-history/")):
+        return "history"
+    if path.startswith(("/v1/hwm/", "/v1/namespaces/", "/v1/users/")):
+        return "hwm_read" if method in READ_METHODS else "hwm_write"
+    return None
+
+
+def _get_token_subject(token: str) -> str | None:
+    # signature is not validated here, this is done later by AuthProvider.
+    # token with fake claims is rejected right after passing admission control, so it holds a slot for a short time
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+
+    if not isinstance(claims, dict):
+        return None
+
+    # Horizon access tokens contain user id, OIDC access tokens contain subject
+    for claim in ("user_id", "sub"):
+        if claims.get(claim) is not None:
+            return f"{claim}:{claims[claim]}"
+    return None
+
+
+def get_client_identity(scope: Scope) -> str:
+    """Get identity of authenticated user without calling database, or client IP address for anonymous requests.
+
+    Different access tokens of the same user produce the same identity.
+    """
+    scheme, _, token = (Headers(scope=scope).get("Authorization") or "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        if is_api_key(token):
+            # raw key is not stored in memory
+            return "api_key:" + hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+        subject = _get_token_subject(token)
+        if subject:
+            return subject
+
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "")
+
+
+class RequestRejectedError(Exception):
+    def __init__(self, status: http.HTTPStatus):
+        self.status = status
+
+
+@dataclass
+class ConcurrencyLimiter:
+    """Limit number of requests processed simultaneously, globally and per user."""
+
+    name: str
+    settings: AdmissionControlGroupSettings
+    _in_flight: int = 0
+    _in_flight_per_user: Counter = field(default_factory=Counter)
+    _waiting: int = 0
+    _condition: Optional[asyncio.Condition] = None
+
+    async def acquire(self, user: str) -> None:
+        if self._can_enter(user):
+            self._enter(user)
+            return
+
+        if self._waiting >= self.settings.max_queue_size:
+            raise RequestRejectedError(self._get_reject_status(user))
+
+        if self._condition is None:
+            # in Python 3.9 and below Condition should be created within running event loop
+            self._condition = asyncio.Condition()
+
+        self._waiting += 1
+        QUEUED_REQUESTS.labels(group=self.name).inc()
+        WAITING_REQUESTS.labels(group=self.name).inc()
+        try:
+            async with self._condition:
+                await asyncio.wait_for(
+                    self._condition.wait_for(lambda: self._can_enter(user)),
+                    timeout=self.settings.queue_timeout,
+                )
+                self._enter(user)
+        except asyncio.TimeoutError:
+            raise RequestRejectedError(self._get_reject_status(user)) from None
+        finally:
+            self._waiting -= 1
+            WAITING_REQUESTS.labels(group=self.name).dec()
+
+    async def release(self, user: str) -> None:
+        self._in_flight -= 1
+        self._in_flight_per_user[user] -= 1
+        if not self._in_flight_per_user[user]:
+            del self._in_flight_per_user[user]
+
+        if self._condition is not None and self._waiting:
+            async with self._condition:
+                self._condition.notify_all()
+
+    def _enter(self, user: str) -> None:
+        self._in_flight += 1
+        self._in_flight_per_user[user] += 1
+
+    def _user_limit_exceeded(self, user: str) -> bool:
+        limit = self.settings.max_concurrent_per_user
+        return limit is not None and self._in_flight_per_user[user] >= limit
+
+    def _global_limit_exceeded(self) -> bool:
+        limit = self.settings.max_concurrent
+        return limit is not None and self._in_flight >= limit
+
+    def _can_enter(self, user: str) -> bool:
+        return not self._user_limit_exceeded(user) and not self._global_limit_exceeded()
+
+    def _get_reject_status(self, user: str) -> http.HTTPStatus:
+        if self._user_limit_exceeded(user):
+            return http.HTTPStatus.TOO_MANY_REQUESTS
+        return http.HTTPStatus.SERVICE_UNAVAILABLE
+
+
+@dataclass
+class AdmissionControlMiddleware:
+    app: ASGIApp
+    settings: AdmissionControlSettings
+    _limiters: Dict[str, ConcurrencyLimiter] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for name in ("auth", "hwm_read", "hwm_write", "history"):
+            self._limiters[name] = ConcurrencyLimiter(name=name, settings=getattr(self.settings, name))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            # lifespan or other type of request
+            await self.app(scope, receive, send)
+            return
+
+        group = get_route_group(scope["method"], scope["path"])
+        if not group:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self._limiters[group]
+        user = get_client_identity(scope)
+        try:
+            await limiter.acquire(user)
+        except RequestRejectedError as e:
+            REJECTED_REQUESTS.labels(group=group, status=e.status.value).inc()
+            response = self._reject_response(e.status)
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await limiter.release(user)
+
+    def _reject_response(self, status: http.HTTPStatus):
+        if status == http.HTTPStatus.TOO_MANY_REQUESTS:
+            message = "Too many concurrent requests, please try again later"
+        else:
+            message = "Server is overloaded, please try again later"
+
+        content = BaseErrorSchema(
+            code=status.name.lower(),
+            message=message,
+            details=None,
+        )
+        return exception_json_response(
+            status=status.value,
+            content=content,
+            headers={"Retry-After": str(self.settings.retry_after)},
+        )
+
+
+def apply_admission_control_middleware(app: FastAPI, settings: AdmissionControlSettings) -> FastAPI:
+    """Add admission control middleware to the application."""
+    if not settings.enabled:
+        return app
+
+    app.add_middleware(AdmissionControlMiddleware, settings=settings)
+    return app
@@ -10,6 +10,7 @@ from horizon.backend.utils.slug import slugify
 DEFAULT_SKIP_PATHS = {
     "/monitoring/metrics",
     "/monitoring/ping",
+    "/monitoring/ready",
     "/monitoring/stats",
     "/static",
     "/docs",
@@ -39,7 +40,7 @@ def apply_monitoring_metrics_middleware(app: FastAPI, settings: MonitoringSettin
         PrometheusMiddleware,
         app_name=slugify(app.title),
         skip_paths=skip_paths,
-        **settings.dict(exclude={"enabled", "skip_paths"}),
+        **settings.dict(exclude={"enabled", "skip_paths", "event_loop_lag_interval"}),
     )
     app.include_router(router)
     return app
@@ -2,11 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from fastapi import FastAPI
 
 from horizon.backend.db.models import User
+from horizon.commons.exceptions.auth import AuthorizationError
 
 
 class AuthProvider(ABC):
@@ -51,6 +53,33 @@ class AuthProvider(ABC):
         """
         ...
 
+    @classmethod
+    @asynccontextmanager
+    async def lifespan(cls, app: FastAPI) -> AsyncGenerator[None, None]:
+        """
+        This method is called on application startup and shutdown.
+
+        Here you can open connections to external services before accepting requests,
+        and close them after server is stopped. Default implementation does nothing.
+
+        Examples
+        --------
+
+        .. code-block::
+
+            from contextlib import asynccontextmanager
+
+            class MyAwesomeAuthProvider(AuthProvider):
+                @classmethod
+                @asynccontextmanager
+                async def lifespan(cls, app):
+                    client = app.dependency_overrides[MyAwesomeClient]()
+                    await client.open()
+                    yield
+                    await client.close()
+        """
+        yield
+
     @abstractmethod
     async def get_current_user(self, access_token: str) -> User:
         """
@@ -99,3 +128,31 @@ class AuthProvider(ABC):
                 }
         """
         ...
+
+    async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
+        """
+        This method should exchange refresh token for a new access token,
+        without checking user credentials again.
+
+        Default implementation raises :obj:`horizon.commons.exceptions.auth.AuthorizationError`,
+        meaning that provider does not support refresh tokens.
+
+        Parameters
+        ----------
+        refresh_token : str
+            Refresh token returned by previous :obj:`~get_token` or :obj:`~refresh_access_token` call.
+
+        Returns
+        -------
+        Dict:
+            .. code-block:: python
+
+                {
+                    "access_token": "some.jwt.token",
+                    "token_type": "bearer",
+                    "expires_at": 1700000000.0,
+                    "refresh_token": "new_refresh_token",
+                }
+        """
+        msg = "Refresh tokens are not supported"
+        raise AuthorizationError(msg)
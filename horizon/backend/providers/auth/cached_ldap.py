@@ -5,26 +5,55 @@
 AuthProvider using LDAP, but
 """
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from time import time
+from typing import Any, AsyncGenerator, Dict, Optional
 
 from bonsai.asyncio import AIOConnectionPool
 from devtools import pformat
 from fastapi import Depends, FastAPI
-from passlib.ifc import PasswordHash
-from passlib.registry import get_crypt_handler
+from prometheus_client import Counter
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
+from horizon.backend.db.models import User
 from horizon.backend.dependencies import Stub
 from horizon.backend.providers.auth.base import AuthProvider
-from horizon.backend.providers.auth.ldap import LDAPAuthProvider
+from horizon.backend.providers.auth.ldap import LDAPAuthProvider, LDAPLookupCache
 from horizon.backend.services import UnitOfWork
+from horizon.backend.services.api_key import APIKeyService
+from horizon.backend.services.circuit_breaker import CircuitBreaker
+from horizon.backend.services.credentials_cache import (
+    CredentialsMemoryCache,
+    CredentialsRecheckQueue,
+)
+from horizon.backend.services.password_hasher import PasswordHasher
+from horizon.backend.services.refresh_token import RefreshTokenService
+from horizon.backend.services.single_flight import SingleFlight
+from horizon.backend.services.user_claims import UserRevocationList
 from horizon.backend.settings.auth.cached_ldap import CachedLDAPAuthProviderSettings
-from horizon.commons.exceptions import AuthorizationError
+from horizon.backend.utils.jwt import JWTKeys
+from horizon.commons.exceptions import (
+    AuthorizationError,
+    EntityNotFoundError,
+    ServiceError,
+)
 
 log = logging.getLogger(__name__)
 
+GRACE_LOGINS = Counter(
+    "horizon_credentials_cache_grace_logins",
+    "Number of logins accepted using expired credentials cache item, because LDAP was unavailable",
+)
+RECHECKS = Counter(
+    "horizon_credentials_cache_rechecks",
+    "Number of credentials accepted using expired cache item, which were checked in LDAP again",
+    ["result"],
+)
+
 
 class CachedLDAPAuthProvider(LDAPAuthProvider):
     def __init__(
@@ -32,10 +61,30 @@ class CachedLDAPAuthProvider(LDAPAuthProvider):
         auth_settings: Annotated[CachedLDAPAuthProviderSettings, Depends(Stub(CachedLDAPAuthProviderSettings))],
         pool: Annotated[Optional[AIOConnectionPool], Depends(Stub(AIOConnectionPool))],
         unit_of_work: Annotated[UnitOfWork, Depends()],
+        password_hasher: Annotated[PasswordHasher, Depends(Stub(PasswordHasher))],
+        memory_cache: Annotated[CredentialsMemoryCache, Depends(Stub(CredentialsMemoryCache))],
+        single_flight: Annotated[SingleFlight, Depends(Stub(SingleFlight))],
+        lookup_cache: Annotated[LDAPLookupCache, Depends(Stub(LDAPLookupCache))],
+        circuit_breaker: Annotated[CircuitBreaker, Depends(Stub(CircuitBreaker))],
+        recheck_queue: Annotated[CredentialsRecheckQueue, Depends(Stub(CredentialsRecheckQueue))],
+        refresh_tokens: Annotated[RefreshTokenService, Depends(Stub(RefreshTokenService))],
+        revocation_list: Annotated[UserRevocationList, Depends(Stub(UserRevocationList))],
+        api_keys: Annotated[APIKeyService, Depends(Stub(APIKeyService))],
+        jwt_keys: Annotated[JWTKeys, Depends(Stub(JWTKeys))],
     ) -> None:
         self._pool: Optional[AIOConnectionPool] = pool
         self._auth_settings: CachedLDAPAuthProviderSettings = auth_settings
         self._uow: UnitOfWork = unit_of_work
+        self._password_hasher: PasswordHasher = password_hasher
+        self._memory_cache: CredentialsMemoryCache = memory_cache
+        self._single_flight: SingleFlight = single_flight
+        self._lookup_cache: LDAPLookupCache = lookup_cache
+        self._circuit_breaker: CircuitBreaker = circuit_breaker
+        self._recheck_queue: CredentialsRecheckQueue = recheck_queue
+        self._refresh_tokens: RefreshTokenService = refresh_tokens
+        self._revocation_list: UserRevocationList = revocation_list
+        self._api_keys: APIKeyService = api_keys
+        self._jwt_keys: JWTKeys = jwt_keys
 
     @classmethod
     def setup(cls, app: FastAPI) -> FastAPI:
@@ -45,27 +94,104 @@ class CachedLDAPAuthProvider(LDAPAuthProvider):
         app.dependency_overrides[CachedLDAPAuthProviderSettings] = lambda: auth_settings
         pool = cls._create_lookup_pool(auth_settings)
         app.dependency_overrides[AIOConnectionPool] = lambda: pool
+        password_hasher = PasswordHasher.from_settings(auth_settings.cache.password_hash)
+        app.dependency_overrides[PasswordHasher] = lambda: password_hasher
+        memory_cache = CredentialsMemoryCache.from_settings(auth_settings.cache.memory)
+        app.dependency_overrides[CredentialsMemoryCache] = lambda: memory_cache
+        single_flight = SingleFlight(operation="login")
+        app.dependency_overrides[SingleFlight] = lambda: single_flight
+        lookup_cache = LDAPLookupCache.from_settings(auth_settings)
+        app.dependency_overrides[LDAPLookupCache] = lambda: lookup_cache
+        circuit_breaker = cls._create_circuit_breaker(auth_settings)
+        app.dependency_overrides[CircuitBreaker] = lambda: circuit_breaker
+        session_factory = asynccontextmanager(app.dependency_overrides[AsyncSession])
+        refresh_tokens = RefreshTokenService.from_settings(session_factory, auth_settings.refresh_token)
+        app.dependency_overrides[RefreshTokenService] = lambda: refresh_tokens
+        revocation_list = UserRevocationList.from_settings(session_factory, auth_settings.access_token)
+        app.dependency_overrides[UserRevocationList] = lambda: revocation_list
+        api_keys = APIKeyService.from_settings(session_factory, auth_settings.api_key, auth_settings.access_token)
+        app.dependency_overrides[APIKeyService] = lambda: api_keys
+        jwt_keys = JWTKeys.from_settings(auth_settings.access_token)
+        app.dependency_overrides[JWTKeys] = lambda: jwt_keys
+        recheck_queue = CredentialsRecheckQueue()
+        app.dependency_overrides[CredentialsRecheckQueue] = lambda: recheck_queue
         return app
 
-    async def get_token(
-        self,
-        grant_type: Optional[str] = None,
-        login: Optional[str] = None,
-        password: Optional[str] = None,
-        scopes: Optional[List[str]] = None,
-        client_id: Optional[str] = None,
-        client_secret: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        if not login or not password:
-            msg = "Missing auth credentials"
-            raise AuthorizationError(msg)
+    @classmethod
+    @asynccontextmanager
+    async def lifespan(cls, app: FastAPI) -> AsyncGenerator[None, None]:
+        """Open lookup connections on startup, and stop password hashing threads on shutdown"""
+        password_hasher: PasswordHasher = app.dependency_overrides[PasswordHasher]()
+        auth_settings: CachedLDAPAuthProviderSettings = app.dependency_overrides[CachedLDAPAuthProviderSettings]()
+
+        recheck_task = None
+        if auth_settings.cache.grace_seconds:
+            recheck_task = asyncio.ensure_future(
+                cls._recheck_credentials_periodically(app, auth_settings.cache.recheck_interval_seconds),
+            )
+
+        try:
+            async with super().lifespan(app):
+                yield
+        finally:
+            if recheck_task is not None:
+                recheck_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await recheck_task
+            password_hasher.close()
+
+    @classmethod
+    async def _recheck_credentials_periodically(cls, app: FastAPI, interval: float) -> None:
+        """Check credentials accepted during LDAP outage, as soon as LDAP is available again"""
+        recheck_queue: CredentialsRecheckQueue = app.dependency_overrides[CredentialsRecheckQueue]()
+        circuit_breaker: CircuitBreaker = app.dependency_overrides[CircuitBreaker]()
 
+        while True:
+            await asyncio.sleep(interval)
+            if not recheck_queue or circuit_breaker.is_open:
+                continue
+
+            for login, password in recheck_queue.pop_all().items():
+                await cls._recheck_credentials_in_background(app, login, password)
+
+    @classmethod
+    async def _recheck_credentials_in_background(cls, app: FastAPI, login: str, password: str) -> None:
+        # there is no request, so dependencies are resolved manually
+        session_factory = asynccontextmanager(app.dependency_overrides[AsyncSession])
+        try:
+            async with session_factory() as session:
+                provider = cls(
+                    auth_settings=app.dependency_overrides[CachedLDAPAuthProviderSettings](),
+                    pool=app.dependency_overrides[AIOConnectionPool](),
+                    unit_of_work=UnitOfWork(session=session, history_writer=None),
+                    password_hasher=app.dependency_overrides[PasswordHasher](),
+                    memory_cache=app.dependency_overrides[CredentialsMemoryCache](),
+                    single_flight=app.dependency_overrides[SingleFlight](),
+                    lookup_cache=app.dependency_overrides[LDAPLookupCache](),
+                    circuit_breaker=app.dependency_overrides[CircuitBreaker](),
+                    recheck_queue=app.dependency_overrides[CredentialsRecheckQueue](),
+                    refresh_tokens=app.dependency_overrides[RefreshTokenService](),
+                    revocation_list=app.dependency_overrides[UserRevocationList](),
+                    api_keys=app.dependency_overrides[APIKeyService](),
+                    jwt_keys=app.dependency_overrides[JWTKeys](),
+                )
+                await provider._recheck_credentials(login, password)
+        except Exception:
+            log.exception("Failed to recheck credentials of user %r", login)
+
+    async def _get_user_for_credentials(self, login: str, password: str) -> User:
         # firstly check if user credentials already exists in cache
         from_cache = True
         username = await self._resolve_username_from_credentials_cache(login, password)
         if not username:
             from_cache = False
-            username = await self._resolve_username_from_ldap(login, password)
+            try:
+                username = await self._resolve_username_from_ldap(login, password)
+            except ServiceError:
+                username = await self._resolve_username_from_expired_credentials_cache(login, password)
+                if not username:
+                    raise
+                from_cache = True
 
         log.info("Get/create user %r in database", username)
         async with self._uow:
@@ -83,22 +209,17 @@ class CachedLDAPAuthProvider(LDAPAuthProvider):
                 # updating cache without checking user in LDAP means cache item will never expire,
                 # and we will never check if used is valid
                 log.info("Update credentials cache for user id %r", user.id)
-                await self._update_credentials_cache(user_id=user.id, login=login, password=password)
-
-        log.info("Generate access token for user id %r", user.id)
-        access_token, expires_at = self._generate_access_token(user)
-        return {
-            "access_token": access_token,
-            "token_type": "bearer",
-            "expires_at": expires_at,
-        }
+                await self._update_credentials_cache(user=user, login=login, password=password)
 
-    def _get_hasher(self) -> PasswordHash:
-        hash_settings = self._auth_settings.cache.password_hash
-        handler = get_crypt_handler(hash_settings.algorithm)
-        return handler.using(**hash_settings.options)
+        return user
 
     async def _resolve_username_from_credentials_cache(self, login: str, password: str) -> Optional[str]:
+        log.info("Perform lookup in in-memory credentials cache")
+        username = self._memory_cache.get_username(login, password)
+        if username:
+            log.info("Credentials match the in-memory cache")
+            return username
+
         log.info("Perform lookup in credentials cache")
         user_cache = await self._uow.credentials_cache.get_by_login(login)
         if not user_cache:
@@ -111,25 +232,93 @@ class CachedLDAPAuthProvider(LDAPAuthProvider):
             log.info("Cache item expired")
             return None
 
-        hasher = self._get_hasher()
-        if not hasher.verify(password, user_cache.password_hash):
+        if not await self._password_hasher.verify(password, user_cache.password_hash):
             msg = "Wrong credentials"
             raise AuthorizationError(msg)
 
         log.info("Credentials match the cache")
+        # next requests will not touch the database and perform password hash verification until item is expired
+        self._memory_cache.set(
+            login,
+            password,
+            user_id=user_cache.user_id,
+            username=user_cache.user.username,
+            expires_at=expiration_date.timestamp(),
+            persisted_at=user_cache.updated_at.timestamp(),
+        )
         return user_cache.user.username
 
-    async def _update_credentials_cache(self, user_id: int, login: str, password: str) -> None:
-        # this is not a dedicated method of repository because we need hashing settings to generate password hash,
-        # and generating new hash every time is expensive
-        hasher = self._get_hasher()
-        user_cache = await self._uow.credentials_cache.get_by_login(login=login)
+    async def _resolve_username_from_expired_credentials_cache(self, login: str, password: str) -> Optional[str]:
+        grace_seconds = self._auth_settings.cache.grace_seconds
+        if not grace_seconds:
+            return None
+
+        user_cache = await self._uow.credentials_cache.get_by_login(login)
+        if not user_cache:
+            return None
+
+        expire_seconds = self._auth_settings.cache.expire_seconds
+        grace_expiration_date = user_cache.updated_at + timedelta(seconds=expire_seconds + grace_seconds)
+        if grace_expiration_date < datetime.now(tz=timezone.utc):
+            log.info("Cache item expired, and grace period is over")
+            return None
+
+        # password could be changed in LDAP, so mismatch does not mean that credentials are wrong
+        if not await self._password_hasher.verify(password, user_cache.password_hash):
+            return None
+
+        log.warning("LDAP is unavailable, accepting expired credentials cache item of user %r", login)
+        GRACE_LOGINS.inc()
+        # item is not added to in-memory cache, and not updated in database until credentials are checked in LDAP
+        self._recheck_queue.add(login, password)
+        return user_cache.user.username
+
+    async def _recheck_credentials(self, login: str, password: str) -> None:
+        try:
+            username = await self._resolve_username_from_ldap(login, password)
+        except ServiceError:
+            log.info("LDAP is still unavailable, credentials of user %r will be checked later", login)
+            RECHECKS.labels(result="failed").inc()
+            self._recheck_queue.add(login, password)
+            return
+        except (AuthorizationError, EntityNotFoundError):
+            log.warning("Credentials of user %r are not valid anymore, removing them from cache", login)
+            RECHECKS.labels(result="invalid").inc()
+            self._memory_cache.delete(login)
+            async with self._uow:
+                user_cache = await self._uow.credentials_cache.get_by_login(login)
+                if user_cache:
+                    await self._uow.credentials_cache.delete(user_cache.id)
+            return
+
+        log.info("Credentials of user %r are valid, updating cache", login)
+        RECHECKS.labels(result="valid").inc()
+        async with self._uow:
+            user = await self._uow.user.get_or_create(username=username)
+            await self._update_credentials_cache(user=user, login=login, password=password)
 
-        data: Dict[str, Any] = {}
-        if not user_cache or user_cache.user_id != user_id:
-            data["user_id"] = user_id
-        if not user_cache or not hasher.verify(password, user_cache.password_hash):
-            data["password_hash"] = hasher.hash(password)
+    async def _update_credentials_cache(self, user: User, login: str, password: str) -> None:
+        now = time()
+        # concurrent requests with the same credentials should not rewrite the same row again and again
+        persisted_at = self._memory_cache.get_recently_persisted_at(login, password, user.id)
+        if persisted_at is None:
+            # this is not a dedicated method of repository because we need hashing settings to generate password hash.
+            # credentials were just checked in LDAP, so hash is always generated from scratch.
+            # verifying the old hash first costs the same as generating a new one, so it is skipped
+            data: Dict[str, Any] = {
+                "user_id": user.id,
+                "password_hash": await self._password_hasher.hash(password),
+            }
+            await self._uow.credentials_cache.create_or_update(login=login, data=data)
+            persisted_at = now
+        else:
+            log.info("Credentials cache was updated recently, skipping")
 
-        # even if nothing is changed in credentials cache, we do perform an update to sync `updated_at` column
-        await self._uow.credentials_cache.create_or_update(login=login, data=data)
+        self._memory_cache.set(
+            login,
+            password,
+            user_id=user.id,
+            username=user.username,
+            expires_at=now + self._auth_settings.cache.expire_seconds,
+            persisted_at=persisted_at,
+        )
@@ -2,19 +2,28 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from contextlib import asynccontextmanager
 from time import time
 from typing import Any, Dict, List, Optional, Tuple
 
 from devtools import pformat
 from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
 from horizon.backend.db.models import User
 from horizon.backend.dependencies import Stub
 from horizon.backend.providers.auth.base import AuthProvider
 from horizon.backend.services import UnitOfWork
+from horizon.backend.services.api_key import APIKeyService, is_api_key
+from horizon.backend.services.refresh_token import RefreshTokenService
+from horizon.backend.services.user_claims import (
+    UserRevocationList,
+    get_user_claims,
+    get_user_from_claims,
+)
 from horizon.backend.settings.auth.dummy import DummyAuthProviderSettings
-from horizon.backend.utils.jwt import decode_jwt, sign_jwt
+from horizon.backend.utils.jwt import JWTKeys
 from horizon.commons.exceptions.auth import AuthorizationError
 
 log = logging.getLogger(__name__)
@@ -25,9 +34,17 @@ class DummyAuthProvider(AuthProvider):
         self,
         settings: Annotated[DummyAuthProviderSettings, Depends(Stub(DummyAuthProviderSettings))],
         unit_of_work: Annotated[UnitOfWork, Depends()],
+        refresh_tokens: Annotated[RefreshTokenService, Depends(Stub(RefreshTokenService))],
+        revocation_list: Annotated[UserRevocationList, Depends(Stub(UserRevocationList))],
+        api_keys: Annotated[APIKeyService, Depends(Stub(APIKeyService))],
+        jwt_keys: Annotated[JWTKeys, Depends(Stub(JWTKeys))],
     ) -> None:
         self._settings = settings
         self._uow = unit_of_work
+        self._refresh_tokens = refresh_tokens
+        self._revocation_list = revocation_list
+        self._api_keys = api_keys
+        self._jwt_keys = jwt_keys
 
     @classmethod
     def setup(cls, app: FastAPI) -> FastAPI:
@@ -35,6 +52,15 @@ class DummyAuthProvider(AuthProvider):
         log.info("Using %s provider with settings:\n%s", cls.__name__, pformat(settings))
         app.dependency_overrides[AuthProvider] = cls
         app.dependency_overrides[DummyAuthProviderSettings] = lambda: settings
+        session_factory = asynccontextmanager(app.dependency_overrides[AsyncSession])
+        refresh_tokens = RefreshTokenService.from_settings(session_factory, settings.refresh_token)
+        app.dependency_overrides[RefreshTokenService] = lambda: refresh_tokens
+        revocation_list = UserRevocationList.from_settings(session_factory, settings.access_token)
+        app.dependency_overrides[UserRevocationList] = lambda: revocation_list
+        api_keys = APIKeyService.from_settings(session_factory, settings.api_key, settings.access_token)
+        app.dependency_overrides[APIKeyService] = lambda: api_keys
+        jwt_keys = JWTKeys.from_settings(settings.access_token)
+        app.dependency_overrides[JWTKeys] = lambda: jwt_keys
         return app
 
     async def get_current_user(self, access_token: str) -> User:
@@ -42,7 +68,17 @@ class DummyAuthProvider(AuthProvider):
             msg = "Missing auth credentials"
             raise AuthorizationError(msg)
 
-        user_id = self._get_user_id_from_token(access_token)
+        if is_api_key(access_token):
+            return await self._api_keys.authenticate(access_token)
+
+        user_id, payload = self._decode_access_token(access_token)
+        if self._settings.access_token.self_contained:
+            user = get_user_from_claims(user_id, payload)
+            if user:
+                # database is not queried, only in-memory list of revoked tokens is checked
+                await self._revocation_list.check(user)
+                return user
+
         user = await self._uow.user.get_by_id(user_id)
         if not user.is_active:
             msg = f"User {user.username!r} is disabled"
@@ -72,34 +108,48 @@ class DummyAuthProvider(AuthProvider):
             raise AuthorizationError(msg)
 
         log.info("Generate access token for user id %r", user.id)
-        access_token, expires_at = self._generate_access_token(user_id=user.id)
+        access_token, expires_at = self._generate_access_token(user)
+        result: Dict[str, Any] = {
+            "access_token": access_token,
+            "token_type": "bearer",
+            "expires_at": expires_at,
+        }
+
+        refresh_token = await self._refresh_tokens.issue(user)
+        if refresh_token:
+            result["refresh_token"] = refresh_token
+        return result
+
+    async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
+        if not refresh_token:
+            msg = "Missing refresh token"
+            raise AuthorizationError(msg)
+
+        user, new_refresh_token = await self._refresh_tokens.rotate(refresh_token)
+
+        log.info("Generate access token for user id %r", user.id)
+        access_token, expires_at = self._generate_access_token(user)
         return {
             "access_token": access_token,
             "token_type": "bearer",
             "expires_at": expires_at,
+            "refresh_token": new_refresh_token,
         }
 
-    def _generate_access_token(self, user_id: int) -> Tuple[str, float]:
+    def _generate_access_token(self, user: User) -> Tuple[str, float]:
         expires_at = time() + self._settings.access_token.expire_seconds
         payload = {
-            "user_id": user_id,
+            "user_id": user.id,
             "exp": expires_at,
         }
-        access_token = sign_jwt(
-            payload,
-            self._settings.access_token.secret_key.get_secret_value(),
-            self._settings.access_token.security_algorithm,
-        )
-        return access_token, expires_at
-
-    def _get_user_id_from_token(self, token: str) -> int:
+        if self._settings.access_token.self_contained:
+            payload.update(get_user_claims(user))
+        return self._jwt_keys.sign(payload), expires_at
+
+    def _decode_access_token(self, token: str) -> Tuple[int, Dict[str, Any]]:
         try:
-            payload = decode_jwt(
-                token,
-                self._settings.access_token.secret_key.get_secret_value(),
-                self._settings.access_token.security_algorithm,
-            )
-            return int(payload["user_id"])
+            payload = self._jwt_keys.decode(token)
+            return int(payload["user_id"]), payload
         except (KeyError, TypeError, ValueError) as e:
             msg = "Invalid token"
             raise AuthorizationError(msg) from e
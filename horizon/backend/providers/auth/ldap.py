@@ -12,9 +12,10 @@ Similar to:
 used in Apache Airflow
 """
 
+import hashlib
 import logging
 from contextlib import asynccontextmanager
-from time import time
+from time import monotonic, time
 from typing import Any, AsyncContextManager, AsyncGenerator, Dict, List, Optional, Tuple
 
 from bonsai import InvalidDN, LDAPClient
@@ -22,14 +23,26 @@ from bonsai.asyncio import AIOConnectionPool, AIOLDAPConnection
 from bonsai.errors import AuthenticationError, LDAPError
 from devtools import pformat
 from fastapi import Depends, FastAPI
+from prometheus_client import Histogram
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
 from horizon.backend.db.models import User
 from horizon.backend.dependencies import Stub
 from horizon.backend.providers.auth.base import AuthProvider
 from horizon.backend.services import UnitOfWork
+from horizon.backend.services.api_key import APIKeyService, is_api_key
+from horizon.backend.services.circuit_breaker import CircuitBreaker
+from horizon.backend.services.refresh_token import RefreshTokenService
+from horizon.backend.services.single_flight import SingleFlight
+from horizon.backend.services.ttl_cache import TTLCache
+from horizon.backend.services.user_claims import (
+    UserRevocationList,
+    get_user_claims,
+    get_user_from_claims,
+)
 from horizon.backend.settings.auth.ldap import LDAPAuthProviderSettings
-from horizon.backend.utils.jwt import decode_jwt, sign_jwt
+from horizon.backend.utils.jwt import JWTKeys
 from horizon.commons.exceptions import (
     AuthorizationError,
     EntityNotFoundError,
@@ -40,6 +53,24 @@ log = logging.getLogger(__name__)
 
 LDAPUnrecoverableError = (LDAPError, TimeoutError)
 
+LDAP_REQUEST_LATENCY = Histogram(
+    "horizon_ldap_request_seconds",
+    "Time spent on LDAP requests. 'bind' includes opening a new connection and TLS handshake",
+    ["operation"],
+)
+
+
+class LDAPLookupCache(TTLCache[str, Tuple[str, str]]):
+    """Cache of lookup results, ``login`` -> ``(DN, uid)``"""
+
+    @classmethod
+    def from_settings(cls, settings: LDAPAuthProviderSettings) -> "LDAPLookupCache":
+        return cls(
+            name="ldap_lookup",
+            max_size=settings.ldap.lookup.cache.max_size,
+            ttl=settings.ldap.lookup.cache.ttl_seconds,
+        )
+
 
 class LDAPAuthProvider(AuthProvider):
     def __init__(
@@ -47,10 +78,24 @@ class LDAPAuthProvider(AuthProvider):
         auth_settings: Annotated[LDAPAuthProviderSettings, Depends(Stub(LDAPAuthProviderSettings))],
         pool: Annotated[Optional[AIOConnectionPool], Depends(Stub(AIOConnectionPool))],
         unit_of_work: Annotated[UnitOfWork, Depends()],
+        single_flight: Annotated[SingleFlight, Depends(Stub(SingleFlight))],
+        lookup_cache: Annotated[LDAPLookupCache, Depends(Stub(LDAPLookupCache))],
+        circuit_breaker: Annotated[CircuitBreaker, Depends(Stub(CircuitBreaker))],
+        refresh_tokens: Annotated[RefreshTokenService, Depends(Stub(RefreshTokenService))],
+        revocation_list: Annotated[UserRevocationList, Depends(Stub(UserRevocationList))],
+        api_keys: Annotated[APIKeyService, Depends(Stub(APIKeyService))],
+        jwt_keys: Annotated[JWTKeys, Depends(Stub(JWTKeys))],
     ) -> None:
         self._pool: Optional[AIOConnectionPool] = pool
         self._auth_settings: LDAPAuthProviderSettings = auth_settings
         self._uow: UnitOfWork = unit_of_work
+        self._single_flight: SingleFlight = single_flight
+        self._lookup_cache: LDAPLookupCache = lookup_cache
+        self._circuit_breaker: CircuitBreaker = circuit_breaker
+        self._refresh_tokens: RefreshTokenService = refresh_tokens
+        self._revocation_list: UserRevocationList = revocation_list
+        self._api_keys: APIKeyService = api_keys
+        self._jwt_keys: JWTKeys = jwt_keys
 
     @classmethod
     def setup(cls, app: FastAPI) -> FastAPI:
@@ -60,14 +105,78 @@ class LDAPAuthProvider(AuthProvider):
         app.dependency_overrides[LDAPAuthProviderSettings] = lambda: auth_settings
         pool = cls._create_lookup_pool(auth_settings)
         app.dependency_overrides[AIOConnectionPool] = lambda: pool
+        single_flight = SingleFlight(operation="login")
+        app.dependency_overrides[SingleFlight] = lambda: single_flight
+        lookup_cache = LDAPLookupCache.from_settings(auth_settings)
+        app.dependency_overrides[LDAPLookupCache] = lambda: lookup_cache
+        circuit_breaker = cls._create_circuit_breaker(auth_settings)
+        app.dependency_overrides[CircuitBreaker] = lambda: circuit_breaker
+        session_factory = asynccontextmanager(app.dependency_overrides[AsyncSession])
+        refresh_tokens = RefreshTokenService.from_settings(session_factory, auth_settings.refresh_token)
+        app.dependency_overrides[RefreshTokenService] = lambda: refresh_tokens
+        revocation_list = UserRevocationList.from_settings(session_factory, auth_settings.access_token)
+        app.dependency_overrides[UserRevocationList] = lambda: revocation_list
+        api_keys = APIKeyService.from_settings(session_factory, auth_settings.api_key, auth_settings.access_token)
+        app.dependency_overrides[APIKeyService] = lambda: api_keys
+        jwt_keys = JWTKeys.from_settings(auth_settings.access_token)
+        app.dependency_overrides[JWTKeys] = lambda: jwt_keys
         return app
 
+    @classmethod
+    @asynccontextmanager
+    async def lifespan(cls, app: FastAPI) -> AsyncGenerator[None, None]:
+        """Open lookup connections on startup, and close them on shutdown"""
+        # settings of subclasses contain the same LDAP options, so they can be parsed using base class
+        auth_settings = LDAPAuthProviderSettings.parse_obj(app.state.settings.auth.dict(exclude={"provider"}))
+        pool: Optional[AIOConnectionPool] = app.dependency_overrides[AIOConnectionPool]()
+
+        if auth_settings.ldap.lookup.enabled:
+            await cls._open_lookup_connections(auth_settings, pool)
+
+        try:
+            yield
+        finally:
+            if pool is not None and not pool.closed:
+                log.debug("Closing lookup pool")
+                await pool.close()
+
+    @classmethod
+    async def _open_lookup_connections(
+        cls,
+        settings: LDAPAuthProviderSettings,
+        pool: Optional[AIOConnectionPool],
+    ) -> None:
+        try:
+            if pool is not None:
+                log.debug("Opening lookup pool")
+                await pool.open()
+            else:
+                log.debug("Checking LDAP connection")
+                client = cls._get_lookup_client(settings)
+                connection = await client.connect(is_async=True, timeout=settings.ldap.timeout_seconds)
+                connection.close()
+        except LDAPUnrecoverableError as e:
+            if settings.ldap.lookup.check_on_startup:
+                msg = "Failed to connect to LDAP"
+                raise ServiceError(msg) from e
+            log.warning("Failed to connect to LDAP, connections will be opened on first request", exc_info=True)
+
     async def get_current_user(self, access_token: str) -> User:
         if not access_token:
             msg = "Missing auth credentials"
             raise AuthorizationError(msg)
 
-        user_id = self._get_user_id_from_token(access_token)
+        if is_api_key(access_token):
+            return await self._api_keys.authenticate(access_token)
+
+        user_id, payload = self._decode_access_token(access_token)
+        if self._auth_settings.access_token.self_contained:
+            user = get_user_from_claims(user_id, payload)
+            if user:
+                # database is not queried, only in-memory list of revoked tokens is checked
+                await self._revocation_list.check(user)
+                return user
+
         user = await self._uow.user.get_by_id(user_id)
         if not user.is_active:
             msg = f"User {user.username!r} is disabled"
@@ -87,6 +196,30 @@ class LDAPAuthProvider(AuthProvider):
             msg = "Missing auth credentials"
             raise AuthorizationError(msg)
 
+        # e.g. hundreds of jobs are started at the same time using the same service account.
+        # check credentials only once, and return the same result to all of them
+        key = (login, hashlib.sha256(password.encode("utf-8")).digest())
+        user = await self._single_flight.run(key, lambda: self._get_user_for_credentials(login, password))
+        return await self._issue_tokens(user)
+
+    async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
+        if not refresh_token:
+            msg = "Missing refresh token"
+            raise AuthorizationError(msg)
+
+        # LDAP is not touched, credentials were checked before issuing the first refresh token
+        user, new_refresh_token = await self._refresh_tokens.rotate(refresh_token)
+
+        log.info("Generate access token for user id %r", user.id)
+        access_token, expires_at = self._generate_access_token(user)
+        return {
+            "access_token": access_token,
+            "token_type": "bearer",
+            "expires_at": expires_at,
+            "refresh_token": new_refresh_token,
+        }
+
+    async def _get_user_for_credentials(self, login: str, password: str) -> User:
         # firstly check if user exists in LDAP and credentials are valid
         username = await self._resolve_username_from_ldap(login, password)
 
@@ -102,14 +235,24 @@ class LDAPAuthProvider(AuthProvider):
             msg = f"User {username!r} is disabled"
             raise AuthorizationError(msg)
 
+        return user
+
+    async def _issue_tokens(self, user: User) -> Dict[str, Any]:
         log.info("Generate access token for user id %r", user.id)
         access_token, expires_at = self._generate_access_token(user)
-        return {
+        result: Dict[str, Any] = {
             "access_token": access_token,
             "token_type": "bearer",
             "expires_at": expires_at,
         }
 
+        # refresh token is issued for each request separately, even if credentials were checked once for all of them.
+        # otherwise concurrent clients would get the same refresh token, and only one of them could use it
+        refresh_token = await self._refresh_tokens.issue(user)
+        if refresh_token:
+            result["refresh_token"] = refresh_token
+        return result
+
     @classmethod
     def _get_lookup_client(cls, settings: LDAPAuthProviderSettings) -> LDAPClient:
         """Create client for lookup queries"""
@@ -122,26 +265,28 @@ class LDAPAuthProvider(AuthProvider):
             )
         return client
 
+    @classmethod
+    def _create_circuit_breaker(cls, settings: LDAPAuthProviderSettings) -> CircuitBreaker:
+        circuit_breaker_settings = settings.ldap.circuit_breaker
+        return CircuitBreaker(
+            name="ldap",
+            # 0 means circuit is never opened
+            failure_threshold=circuit_breaker_settings.failure_threshold if circuit_breaker_settings.enabled else 0,
+            reset_timeout=circuit_breaker_settings.reset_timeout_seconds,
+        )
+
     @classmethod
     def _create_lookup_pool(cls, settings: LDAPAuthProviderSettings) -> Optional[AIOConnectionPool]:
-        """Create and check connection pool for lookup queries"""
+        """Create connection pool for lookup queries. Pool is opened by :obj:`~lifespan`"""
         if not settings.ldap.lookup.enabled:
             return None
 
-        client = cls._get_lookup_client(settings)
-        if settings.ldap.lookup.check_on_startup:
-            try:
-                client.connect(timeout=settings.ldap.timeout_seconds)
-            except LDAPError as e:
-                msg = "Failed to connect to LDAP"
-                raise ServiceError(msg) from e
-
         if not settings.ldap.lookup.pool.enabled:
             return None
 
         log.debug("Lookup enabled, creating connection pool")
         return AIOConnectionPool(
-            client,
+            cls._get_lookup_client(settings),
             minconn=settings.ldap.lookup.pool.initial,
             maxconn=settings.ldap.lookup.pool.max,
             timeout=settings.ldap.timeout_seconds,
@@ -175,25 +320,37 @@ class LDAPAuthProvider(AuthProvider):
             raise ServiceError(msg) from e
 
     async def _resolve_username_from_ldap(self, login: str, password: str) -> str:
-        log.info("Resolve user %r in LDAP", login)
-        username = login
-
-        if self._auth_settings.ldap.lookup.enabled:
-            log.info("Perform lookup in LDAP")
-            dn, username = await self._lookup_user(login)
-        else:
-            dn = self._auth_settings.ldap.bind_dn_template.format(
-                login=login,
-                base_dn=self._auth_settings.ldap.base_dn,
-                uid_attribute=self._auth_settings.ldap.uid_attribute,
-            )
+        # if LDAP is not responding, fail immediately instead of waiting for timeout on every request
+        with self._circuit_breaker.protect():
+            log.info("Resolve user %r in LDAP", login)
+            username = login
+
+            if self._auth_settings.ldap.lookup.enabled:
+                log.info("Perform lookup in LDAP")
+                dn, username = await self._lookup_user(login)
+            else:
+                dn = self._auth_settings.ldap.bind_dn_template.format(
+                    login=login,
+                    base_dn=self._auth_settings.ldap.base_dn,
+                    uid_attribute=self._auth_settings.ldap.uid_attribute,
+                )
 
-        log.info("Check user credentials %r in LDAP", dn)
-        await self._login(dn, password)
+            log.info("Check user credentials %r in LDAP", dn)
+            try:
+                await self._login(dn, password)
+            except AuthorizationError:
+                # DN could be changed since lookup result was cached
+                self._lookup_cache.delete(login)
+                raise
 
-        return username
+            return username
 
     async def _lookup_user(self, login: str) -> Tuple[str, str]:
+        cached = self._lookup_cache.get(login)
+        if cached:
+            log.debug("Using cached lookup result")
+            return cached
+
         # Reference implementations:
         # https://github.com/dpgaspar/Flask-AppBuilder/blob/2c5763371b81cd679d88b9971ba5d1fc4d71d54b/flask_appbuilder/security/manager.py#L902
         # https://github.com/jupyterhub/ldapauthenticator/blob/main/ldapauthenticator/ldapauthenticator.py
@@ -207,15 +364,19 @@ class LDAPAuthProvider(AuthProvider):
         log.debug("Base DN: %r", base_dn)
         log.debug("Scope: %r", scope)
 
-        async with self._get_lookup_connection() as connection:
-            results = await connection.search(
-                base=base_dn,
-                scope=scope,
-                filter_exp=query,
-                attrlist=["*"],
-                sizelimit=1,
-                timeout=self._auth_settings.ldap.timeout_seconds,
-            )
+        started_at = monotonic()
+        try:
+            async with self._get_lookup_connection() as connection:
+                results = await connection.search(
+                    base=base_dn,
+                    scope=scope,
+                    filter_exp=query,
+                    attrlist=["*"],
+                    sizelimit=1,
+                    timeout=self._auth_settings.ldap.timeout_seconds,
+                )
+        finally:
+            LDAP_REQUEST_LATENCY.labels(operation="search").observe(monotonic() - started_at)
 
         if not results:
             raise EntityNotFoundError("User", "username", login)
@@ -224,21 +385,26 @@ class LDAPAuthProvider(AuthProvider):
         log.debug("Found entry:\n%s", pformat(entry))
         dn = str(entry["dn"])
         uid = entry[self._auth_settings.ldap.uid_attribute][0]
+        self._lookup_cache.set(login, (dn, uid))
         return dn, uid
 
     async def _login(self, login: str, password: str):
         client = LDAPClient(str(self._auth_settings.ldap.url))
         client.set_credentials(self._auth_settings.ldap.auth_mechanism, login, password)
+        started_at = monotonic()
         try:
-            connection = client.connect(is_async=True, timeout=self._auth_settings.ldap.timeout_seconds)
-            async with connection:
-                await connection.whoami()
+            # connection is opened using user credentials, so successful bind already means credentials are valid.
+            # calling whoami() after that only adds one more round trip
+            connection = await client.connect(is_async=True, timeout=self._auth_settings.ldap.timeout_seconds)
+            connection.close()
         except (AuthenticationError, InvalidDN) as e:
             msg = "Wrong credentials"
             raise AuthorizationError(msg) from e
         except LDAPUnrecoverableError as e:
             msg = "Failed to connect to LDAP"
             raise ServiceError(msg) from e
+        finally:
+            LDAP_REQUEST_LATENCY.labels(operation="bind").observe(monotonic() - started_at)
 
     def _generate_access_token(self, user: User) -> Tuple[str, float]:
         expires_at = time() + self._auth_settings.access_token.expire_seconds
@@ -246,21 +412,14 @@ class LDAPAuthProvider(AuthProvider):
             "user_id": user.id,
             "exp": expires_at,
         }
-        access_token = sign_jwt(
-            payload,
-            self._auth_settings.access_token.secret_key.get_secret_value(),
-            self._auth_settings.access_token.security_algorithm,
-        )
-        return access_token, expires_at
+        if self._auth_settings.access_token.self_contained:
+            payload.update(get_user_claims(user))
+        return self._jwt_keys.sign(payload), expires_at
 
-    def _get_user_id_from_token(self, token: str) -> int:
+    def _decode_access_token(self, token: str) -> Tuple[int, Dict[str, Any]]:
         try:
-            payload = decode_jwt(
-                token,
-                self._auth_settings.access_token.secret_key.get_secret_value(),
-                self._auth_settings.access_token.security_algorithm,
-            )
-            return int(payload["user_id"])
+            payload = self._jwt_keys.decode(token)
+            return int(payload["user_id"]), payload
         except (KeyError, TypeError, ValueError) as e:
             msg = "Invalid token"
             raise AuthorizationError(msg) from e
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+AuthProvider accepting access tokens issued by OpenID Connect Identity Provider (IdP), like Keycloak.
+
+Tokens are validated locally using public keys of IdP, without calling IdP on each request.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from devtools import pformat
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import Annotated
+
+from horizon.backend.db.models import User
+from horizon.backend.dependencies import Stub
+from horizon.backend.providers.auth.base import AuthProvider
+from horizon.backend.services.oidc import OIDCKeySet, OIDCUserCache
+from horizon.backend.settings.auth.oidc import OIDCAuthProviderSettings
+from horizon.commons.exceptions import AuthorizationError
+
+log = logging.getLogger(__name__)
+
+
+class OIDCAuthProvider(AuthProvider):
+    def __init__(
+        self,
+        auth_settings: Annotated[OIDCAuthProviderSettings, Depends(Stub(OIDCAuthProviderSettings))],
+        key_set: Annotated[OIDCKeySet, Depends(Stub(OIDCKeySet))],
+        user_cache: Annotated[OIDCUserCache, Depends(Stub(OIDCUserCache))],
+    ) -> None:
+        self._auth_settings: OIDCAuthProviderSettings = auth_settings
+        self._key_set: OIDCKeySet = key_set
+        self._user_cache: OIDCUserCache = user_cache
+
+    @classmethod
+    def setup(cls, app: FastAPI) -> FastAPI:
+        auth_settings = OIDCAuthProviderSettings.parse_obj(app.state.settings.auth.dict(exclude={"provider"}))
+        log.info("Using %s provider with settings:\n%s", cls.__name__, pformat(auth_settings))
+        app.dependency_overrides[AuthProvider] = cls
+        app.dependency_overrides[OIDCAuthProviderSettings] = lambda: auth_settings
+        key_set = OIDCKeySet.from_settings(auth_settings.oidc)
+        app.dependency_overrides[OIDCKeySet] = lambda: key_set
+        session_factory = asynccontextmanager(app.dependency_overrides[AsyncSession])
+        user_cache = OIDCUserCache.from_settings(session_factory, auth_settings.user_cache)
+        app.dependency_overrides[OIDCUserCache] = lambda: user_cache
+        return app
+
+    @classmethod
+    @asynccontextmanager
+    async def lifespan(cls, app: FastAPI) -> AsyncGenerator[None, None]:
+        """Fetch IdP public keys on startup, and stop refreshing them on shutdown"""
+        key_set: OIDCKeySet = app.dependency_overrides[OIDCKeySet]()
+        await key_set.open()
+        try:
+            yield
+        finally:
+            await key_set.close()
+
+    async def get_current_user(self, access_token: str) -> User:
+        if not access_token:
+            msg = "Missing auth credentials"
+            raise AuthorizationError(msg)
+
+        # IdP is not called here, token is validated using cached public keys
+        claims = await self._key_set.decode(access_token)
+        username_claim = self._auth_settings.oidc.username_claim
+        username = claims.get(username_claim)
+        if not username or not isinstance(username, str):
+            msg = f"Missing {username_claim!r} claim in token"
+            raise AuthorizationError(msg)
+
+        return await self._user_cache.get_user(username)
+
+    async def get_token(
+        self,
+        grant_type: Optional[str] = None,
+        login: Optional[str] = None,
+        password: Optional[str] = None,
+        scopes: Optional[List[str]] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        msg = "Access token should be obtained from OIDC provider"
+        raise AuthorizationError(msg)
@@ -23,6 +23,9 @@ async def add_admins(session: AsyncSession, usernames: list[str]) -> None:
 
     not_found = set(usernames)
     for user in users:
+        if not user.is_admin:
+            # revoke self-contained access tokens with outdated claims
+            user.auth_version += 1
         user.is_admin = True
         logging.info("    %r", user.username)
         not_found.discard(user.username)
@@ -44,6 +47,8 @@ async def remove_admins(session: AsyncSession, usernames: list[str]) -> None:
     not_found = set(usernames)
     for user in users:
         logging.info("    %r", user.username)
+        if user.is_admin:
+            user.auth_version += 1
         user.is_admin = False
         not_found.discard(user.username)
 
@@ -0,0 +1,149 @@
+#!/bin/env python3
+
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.future import select
+
+from horizon.backend.db.models import Namespace
+from horizon.backend.db.repositories import APIKeyRepository, UserRepository
+from horizon.backend.middlewares import setup_logging
+from horizon.backend.services.api_key import generate_api_key, hash_api_key
+from horizon.backend.settings import Settings
+from horizon.backend.settings.auth.jwt import JWTSettings
+from horizon.commons.exceptions import EntityNotFoundError
+
+
+async def create_api_key(  # noqa: PLR0913
+    session: AsyncSession,
+    secret_key: str,
+    name: str,
+    username: str,
+    namespaces: list[str] | None = None,
+    expire_days: int | None = None,
+) -> str:
+    namespace_ids = None
+    if namespaces:
+        result = await session.execute(select(Namespace.name, Namespace.id).where(Namespace.name.in_(namespaces)))
+        found = dict(result.tuples().all())
+        for namespace in namespaces:
+            if namespace not in found:
+                raise EntityNotFoundError("Namespace", "name", namespace)
+        namespace_ids = sorted(found.values())
+
+    expires_at = None
+    if expire_days:
+        expires_at = datetime.now(tz=timezone.utc) + timedelta(days=expire_days)
+
+    # service account is a regular user, which can be granted roles in namespaces
+    user = await UserRepository(session=session).get_or_create(username)
+    api_key = generate_api_key()
+    await APIKeyRepository(session=session).create(
+        name=name,
+        key_hash=hash_api_key(api_key, secret_key),
+        user_id=user.id,
+        namespace_ids=namespace_ids,
+        expires_at=expires_at,
+    )
+    await session.commit()
+
+    logging.info("Created API key %r for user %r:", name, username)
+    logging.info("    %s", api_key)
+    logging.info("Save it now, it cannot be shown again.")
+    return api_key
+
+
+async def revoke_api_keys(session: AsyncSession, names: list[str]) -> None:
+    logging.info("Revoking API keys:")
+    repository = APIKeyRepository(session=session)
+    not_found = []
+    for name in names:
+        if await repository.delete_by_name(name):
+            logging.info("    %r", name)
+        else:
+            not_found.append(name)
+
+    if not_found:
+        logging.info("Not found:")
+        for name in not_found:
+            logging.info("    %r", name)
+
+    await session.commit()
+    logging.info("Done.")
+
+
+async def list_api_keys(session: AsyncSession) -> None:
+    logging.info("Listing API keys:")
+    for api_key, user in await APIKeyRepository(session=session).list_with_users():
+        expires_at = api_key.expires_at.isoformat() if api_key.expires_at else "never"
+        namespace_ids = api_key.namespace_ids if api_key.namespace_ids is not None else "all"
+        logging.info(
+            "    %r (user: %r, namespace ids: %s, expires at: %s)",
+            api_key.name,
+            user.username,
+            namespace_ids,
+            expires_at,
+        )
+    logging.info("Done.")
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Manage API keys of service accounts.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_create = subparsers.add_parser("create", help="Create API key, and print it")
+    parser_create.add_argument("name", help="Unique name of API key, e.g. name of job using it")
+    parser_create.add_argument("--username", required=True, help="Service account username. Created if missing")
+    parser_create.add_argument(
+        "--namespace",
+        dest="namespaces",
+        action="append",
+        help="Namespace which can be changed using this key. Can be passed multiple times. Default: all namespaces",
+    )
+    parser_create.add_argument("--expire-days", type=int, help="Key expiration time, in days. Default: never")
+
+    parser_revoke = subparsers.add_parser("revoke", help="Revoke API keys")
+    parser_revoke.add_argument("names", nargs="+", help="Names of API keys to revoke")
+
+    subparsers.add_parser("list", help="List all API keys")
+    return parser
+
+
+async def main(args: argparse.Namespace, session: AsyncSession, settings: Settings) -> None:
+    async with session:
+        if args.command == "create":
+            # keys are hashed using the same secret as access tokens
+            auth_settings = settings.auth.dict(exclude={"provider"})
+            access_token = JWTSettings.parse_obj(auth_settings.get("access_token", {}))
+            await create_api_key(
+                session,
+                secret_key=access_token.secret_key.get_secret_value(),
+                name=args.name,
+                username=args.username,
+                namespaces=args.namespaces,
+                expire_days=args.expire_days,
+            )
+        elif args.command == "revoke":
+            await revoke_api_keys(session, args.names)
+        else:
+            await list_api_keys(session)
+
+
+if __name__ == "__main__":
+    settings = Settings()
+    if settings.server.logging.setup:
+        setup_logging(settings.server.logging.get_log_config_path())
+
+    engine = create_async_engine(settings.database.url)
+    SessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
+    parser = create_parser()
+    args = parser.parse_args()
+    session = SessionLocal()
+    asyncio.run(main(args, session, settings))
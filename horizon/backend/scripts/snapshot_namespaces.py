@@ -0,0 +1,385 @@
+#!/bin/env python3
+
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import logging
+import tarfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import horizon
+from horizon.backend.db.models import HWM, HWMHistory, Namespace, NamespaceHistory, NamespaceUser, User
+from horizon.backend.middlewares import setup_logging
+from horizon.backend.settings import Settings
+from horizon.commons.exceptions import EntityAlreadyExistsError, EntityNotFoundError
+
+if TYPE_CHECKING:
+    from asyncpg import Connection  # type: ignore[import-untyped]
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# table -> column used to filter rows by namespace
+NAMESPACE_TABLES: Dict[str, str] = {
+    NamespaceUser.__tablename__: "namespace_id",
+    HWM.__tablename__: "namespace_id",
+}
+HISTORY_TABLES: Dict[str, str] = {
+    HWMHistory.__tablename__: "namespace_id",
+    NamespaceHistory.__tablename__: "namespace_id",
+}
+
+# columns containing user ids, which are remapped by username during restore
+USER_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    NamespaceUser.__tablename__: ("user_id",),
+    HWM.__tablename__: ("changed_by_user_id",),
+    HWMHistory.__tablename__: ("changed_by_user_id",),
+    NamespaceHistory.__tablename__: ("changed_by_user_id", "owner_id"),
+}
+
+
+async def _get_driver_connection(session: AsyncSession) -> Connection:
+    """Get asyncpg connection used by session, to call COPY within the same transaction"""
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection  # type: ignore[return-value]
+
+
+async def _get_table_columns(session: AsyncSession, table: str) -> List[Tuple[str, str]]:
+    """Get list of (column name, column type) in the same order as in the database"""
+    result = await session.execute(
+        text(
+            """
+            SELECT attname, format_type(atttypid, atttypmod)
+            FROM pg_attribute
+            WHERE attrelid = CAST(:table AS regclass)
+              AND attnum > 0
+              AND NOT attisdropped
+            ORDER BY attnum
+            """,
+        ),
+        {"table": f'"{table}"'},
+    )
+    return [(name, type_) for name, type_ in result.all()]
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _add_file(archive: tarfile.TarFile, name: str, content: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    info.mtime = int(time.time())
+    archive.addfile(info, io.BytesIO(content))
+
+
+async def dump_namespaces(
+    session: AsyncSession,
+    names: list[str],
+    output: Path,
+    with_history: bool = False,  # noqa: FBT001, FBT002
+) -> None:
+    logging.info("Dumping namespaces to %r:", str(output))
+    # all tables should be read from the same snapshot, even if some namespace is being changed right now
+    await session.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"))
+
+    result = await session.execute(select(Namespace).where(Namespace.name.in_(names)).order_by(Namespace.name))
+    namespaces = result.scalars().all()
+    not_found = set(names) - {namespace.name for namespace in namespaces}
+    if not_found:
+        raise EntityNotFoundError("Namespace", "name", sorted(not_found))
+
+    tables = dict(NAMESPACE_TABLES)
+    if with_history:
+        tables.update(HISTORY_TABLES)
+
+    table_columns = {table: await _get_table_columns(session, table) for table in tables}
+    namespace_ids = [namespace.id for namespace in namespaces]
+
+    user_ids = {namespace.owner_id for namespace in namespaces}
+    user_ids |= {namespace.changed_by_user_id for namespace in namespaces if namespace.changed_by_user_id}
+    for table, user_columns in USER_COLUMNS.items():
+        if table not in tables:
+            continue
+        for column in user_columns:
+            column_result = await session.execute(
+                text(
+                    f"SELECT DISTINCT {_quote(column)} FROM {_quote(table)} "  # noqa: S608
+                    f"WHERE {_quote(tables[table])} = ANY(:ids) AND {_quote(column)} IS NOT NULL",
+                ),
+                {"ids": namespace_ids},
+            )
+            user_ids.update(column_result.scalars().all())
+
+    users_result = await session.execute(select(User.id, User.username).where(User.id.in_(user_ids)))
+    users = {str(user_id): username for user_id, username in users_result.all()}
+
+    connection = await _get_driver_connection(session)
+    manifest: Dict[str, Any] = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "horizon_version": horizon.__version__,
+        "created_at": datetime.now(tz=timezone.utc).isoformat(),
+        "with_history": with_history,
+        "tables": {table: [list(column) for column in columns] for table, columns in table_columns.items()},
+        "users": users,
+        "namespaces": [],
+    }
+
+    with tarfile.open(output, mode="w:gz", compresslevel=6) as archive:
+        for namespace in namespaces:
+            namespace_info = namespace.to_dict(exclude={"changed_at"})
+            namespace_info["changed_at"] = namespace.changed_at.isoformat()
+            namespace_info["rows"] = {}
+
+            for table, filter_column in tables.items():
+                columns = ", ".join(_quote(column) for column, _ in table_columns[table])
+                chunks: list[bytes] = []
+
+                async def write_chunk(chunk: bytes, chunks: list[bytes] = chunks) -> None:
+                    chunks.append(chunk)
+
+                status = await connection.copy_from_query(
+                    f"SELECT {columns} FROM {_quote(table)} WHERE {_quote(filter_column)} = $1",  # noqa: S608
+                    namespace.id,
+                    output=write_chunk,
+                    format="binary",
+                )
+                rows_count = int(status.split()[-1])
+                namespace_info["rows"][table] = rows_count
+                _add_file(archive, f"{namespace.id}/{table}.bin", b"".join(chunks))
+
+            rows_info = ", ".join(f"{table}: {count}" for table, count in namespace_info["rows"].items())
+            logging.info("    %r (%s)", namespace.name, rows_info)
+            manifest["namespaces"].append(namespace_info)
+
+        _add_file(archive, MANIFEST_NAME, json.dumps(manifest, indent=2).encode("utf-8"))
+
+    logging.info("Done.")
+
+
+async def _map_users(session: AsyncSession, connection: Connection, users: dict[str, str]) -> dict[int, int]:
+    """Create missing users, and fill up temp table ``_snapshot_user`` with (old user id, new user id) values"""
+    if users:
+        await session.execute(
+            pg_insert(User)
+            .values([{"username": username} for username in users.values()])
+            .on_conflict_do_nothing(index_elements=[User.username]),
+        )
+
+    result = await session.execute(select(User.username, User.id).where(User.username.in_(users.values())))
+    new_ids: dict[str, int] = dict(result.tuples().all())
+
+    await session.execute(text("CREATE TEMP TABLE _snapshot_user (old_id bigint, new_id bigint) ON COMMIT DROP"))
+    user_ids = {int(old_id): new_ids[username] for old_id, username in users.items()}
+    await connection.copy_records_to_table("_snapshot_user", records=list(user_ids.items()))
+    return user_ids
+
+
+async def _load_staging_table(
+    session: AsyncSession,
+    connection: Connection,
+    table: str,
+    snapshot_columns: list[tuple[str, str]],
+    content: bytes,
+) -> str:
+    """Load table content from snapshot into temp table using binary COPY. Returns temp table name"""
+    staging = f"_snapshot_{table}"
+    columns_ddl = ", ".join(f"{_quote(name)} {type_}" for name, type_ in snapshot_columns)
+    await session.execute(text(f"CREATE TEMP TABLE {_quote(staging)} ({columns_ddl}) ON COMMIT DROP"))
+    await connection.copy_to_table(
+        staging,
+        source=io.BytesIO(content),
+        columns=[name for name, _ in snapshot_columns],
+        format="binary",
+    )
+    return staging
+
+
+async def _insert_from_staging_table(
+    session: AsyncSession,
+    table: str,
+    staging: str,
+    snapshot_columns: list[tuple[str, str]],
+    overrides: dict[str, str],
+) -> None:
+    """Copy rows from temp table to real table, replacing values of some columns"""
+    snapshot_column_names = {name for name, _ in snapshot_columns}
+    target_columns = [name for name, _ in await _get_table_columns(session, table)]
+
+    insert_columns = []
+    select_expressions = []
+    for column in target_columns:
+        if column in overrides:
+            expression = overrides[column]
+        elif column in USER_COLUMNS.get(table, ()):
+            expression = f"(SELECT new_id FROM _snapshot_user WHERE old_id = source.{_quote(column)})"  # noqa: S608
+        elif column in snapshot_column_names:
+            expression = f"source.{_quote(column)}"
+        else:
+            # column was added after snapshot was created, use default value
+            continue
+        insert_columns.append(_quote(column))
+        select_expressions.append(expression)
+
+    await session.execute(
+        text(
+            f"INSERT INTO {_quote(table)} ({', '.join(insert_columns)}) "  # noqa: S608
+            f"SELECT {', '.join(select_expressions)} FROM {_quote(staging)} AS source",
+        ),
+    )
+    await session.execute(text(f"DROP TABLE {_quote(staging)}"))
+
+
+async def restore_namespaces(
+    session: AsyncSession,
+    input_: Path,
+    renames: dict[str, str] | None = None,
+) -> None:
+    renames = renames or {}
+    logging.info("Restoring namespaces from %r:", str(input_))
+
+    with tarfile.open(input_, mode="r:gz") as archive:
+        manifest = json.loads(archive.extractfile(MANIFEST_NAME).read())  # type: ignore[union-attr]
+        if manifest["format_version"] > SNAPSHOT_FORMAT_VERSION:
+            msg = f"Unsupported snapshot format version {manifest['format_version']}"
+            raise ValueError(msg)
+
+        connection = await _get_driver_connection(session)
+        user_ids = await _map_users(session, connection, manifest["users"])
+
+        for namespace_info in manifest["namespaces"]:
+            old_name = namespace_info["name"]
+            new_name = renames.get(old_name, old_name)
+
+            existing_query = select(func.count()).select_from(Namespace).where(Namespace.name == new_name)
+            if await session.scalar(existing_query):
+                raise EntityAlreadyExistsError("Namespace", "name", new_name)
+
+            owner_id = user_ids[namespace_info["owner_id"]]
+            namespace_id = await session.scalar(
+                pg_insert(Namespace)
+                .values(
+                    name=new_name,
+                    description=namespace_info["description"],
+                    owner_id=owner_id,
+                    changed_at=datetime.fromisoformat(namespace_info["changed_at"]),
+                    changed_by_user_id=user_ids.get(namespace_info["changed_by_user_id"]),
+                )
+                .returning(Namespace.id),
+            )
+
+            # ids are always regenerated, to avoid collisions with existing rows
+            await session.execute(
+                text("CREATE TEMP TABLE _snapshot_hwm_id (old_id bigint, new_id bigint) ON COMMIT DROP"),
+            )
+            for table, snapshot_columns in manifest["tables"].items():
+                content = archive.extractfile(f"{namespace_info['id']}/{table}.bin").read()  # type: ignore[union-attr]
+                staging = await _load_staging_table(session, connection, table, snapshot_columns, content)
+
+                overrides = {"namespace_id": str(int(namespace_id))}  # type: ignore[arg-type]
+                if table == HWM.__tablename__:
+                    await session.execute(
+                        text(
+                            "INSERT INTO _snapshot_hwm_id (old_id, new_id) "  # noqa: S608
+                            f"SELECT id, nextval(pg_get_serial_sequence('hwm', 'id')) FROM {_quote(staging)}",
+                        ),
+                    )
+                    overrides["id"] = "(SELECT new_id FROM _snapshot_hwm_id WHERE old_id = source.id)"
+                elif table in HISTORY_TABLES:
+                    overrides["id"] = f"nextval(pg_get_serial_sequence('{table}', 'id'))"
+                    if table == HWMHistory.__tablename__:
+                        # history of already deleted HWMs keeps original hwm_id
+                        overrides["hwm_id"] = (
+                            "COALESCE("
+                            "(SELECT new_id FROM _snapshot_hwm_id WHERE old_id = source.hwm_id), "
+                            "source.hwm_id"
+                            ")"
+                        )
+
+                await _insert_from_staging_table(session, table, staging, snapshot_columns, overrides)
+
+            await session.execute(text("DROP TABLE _snapshot_hwm_id"))
+            await session.execute(
+                pg_insert(NamespaceHistory).values(
+                    namespace_id=namespace_id,
+                    name=new_name,
+                    description=namespace_info["description"],
+                    owner_id=owner_id,
+                    action=f"Restored from snapshot of {old_name!r} created at {manifest['created_at']}",
+                ),
+            )
+            logging.info("    %r -> %r (id: %r)", old_name, new_name, namespace_id)
+
+    await session.commit()
+    logging.info("Done.")
+
+
+def _parse_rename(value: str) -> tuple[str, str]:
+    old_name, sep, new_name = value.partition("=")
+    if not sep or not old_name or not new_name:
+        msg = f"Expected OLD_NAME=NEW_NAME, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return old_name, new_name
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Dump and restore namespaces.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_dump = subparsers.add_parser("dump", help="Dump namespaces to snapshot file")
+    parser_dump.add_argument("names", nargs="+", help="Names of namespaces to dump")
+    parser_dump.add_argument("-o", "--output", type=Path, required=True, help="Path to snapshot file (.tar.gz)")
+    parser_dump.add_argument(
+        "--with-history",
+        action="store_true",
+        help="Include HWM and namespace history into snapshot",
+    )
+    parser_dump.set_defaults(func=dump_namespaces)
+
+    parser_restore = subparsers.add_parser("restore", help="Restore namespaces from snapshot file")
+    parser_restore.add_argument("input", type=Path, help="Path to snapshot file (.tar.gz)")
+    parser_restore.add_argument(
+        "--rename",
+        type=_parse_rename,
+        action="append",
+        default=[],
+        metavar="OLD_NAME=NEW_NAME",
+        help="Restore namespace under a new name. Can be passed multiple times",
+    )
+    parser_restore.set_defaults(func=restore_namespaces)
+
+    return parser
+
+
+async def main(args: argparse.Namespace, session: AsyncSession) -> None:
+    async with session:
+        if args.command == "dump":
+            await args.func(session, args.names, args.output, args.with_history)
+        else:
+            await args.func(session, args.input, dict(args.rename))
+
+
+if __name__ == "__main__":
+    settings = Settings()
+    if settings.server.logging.setup:
+        setup_logging(settings.server.logging.get_log_config_path())
+
+    engine = create_async_engine(settings.database.url)
+    SessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
+    parser = create_parser()
+    args = parser.parse_args()
+    session = SessionLocal()
+    asyncio.run(main(args, session))
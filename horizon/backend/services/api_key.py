@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+from time import time
+from typing import TYPE_CHECKING, AsyncContextManager, Callable, FrozenSet, NamedTuple, Optional
+
+from horizon.backend.db.models import User
+from horizon.backend.db.repositories import APIKeyRepository
+from horizon.backend.services.ttl_cache import TTLCache
+from horizon.commons.exceptions import AuthorizationError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from horizon.backend.settings.auth.api_key import APIKeySettings
+    from horizon.backend.settings.auth.jwt import JWTSettings
+
+# JWT always starts with "eyJ", so API keys can be distinguished from access tokens
+API_KEY_PREFIX = "hzn_"
+
+
+def generate_api_key() -> str:
+    return API_KEY_PREFIX + secrets.token_urlsafe(32)
+
+
+def is_api_key(token: str) -> bool:
+    return token.startswith(API_KEY_PREFIX)
+
+
+def hash_api_key(api_key: str, secret_key: str) -> bytes:
+    # key is random and long enough, so slow password hash is not required.
+    # HMAC is used instead of plain hash, so keys cannot be checked using only database dump
+    return hmac.new(secret_key.encode("utf-8"), api_key.encode("utf-8"), hashlib.sha256).digest()
+
+
+class _APIKeyItem(NamedTuple):
+    user_id: int
+    username: str
+    is_admin: bool
+    is_active: bool
+    auth_version: int
+    expires_at: Optional[float]
+    namespace_scope: Optional[FrozenSet[int]]
+
+
+class APIKeyService:
+    """Validate API keys of service accounts.
+
+    Validated keys are stored in in-memory cache, so most of requests do not query database.
+    Unknown keys are not cached.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        secret_key: str,
+        cache: Optional[TTLCache[bytes, _APIKeyItem]],
+    ) -> None:
+        self._session_factory = session_factory
+        self._secret_key = secret_key
+        # None means API keys are disabled
+        self._cache = cache
+
+    @classmethod
+    def from_settings(
+        cls,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        settings: APIKeySettings,
+        access_token: JWTSettings,
+    ) -> APIKeyService:
+        cache: Optional[TTLCache[bytes, _APIKeyItem]] = None
+        if settings.enabled:
+            cache = TTLCache(name="api_key", max_size=settings.cache.max_size, ttl=settings.cache.ttl_seconds)
+        return cls(
+            session_factory=session_factory,
+            secret_key=access_token.secret_key.get_secret_value(),
+            cache=cache,
+        )
+
+    async def authenticate(self, api_key: str) -> User:
+        """Return user API key belongs to.
+
+        Raises :obj:`AuthorizationError <horizon.commons.exceptions.AuthorizationError>`
+        if key is unknown or expired, or user is disabled.
+        """
+        if self._cache is None:
+            msg = "API keys are disabled"
+            raise AuthorizationError(msg)
+
+        key_hash = hash_api_key(api_key, self._secret_key)
+        item = self._cache.get(key_hash)
+        if item is None:
+            item = await self._load(key_hash)
+            self._cache.set(key_hash, item)
+
+        if item.expires_at is not None and item.expires_at < time():
+            msg = "API key is expired"
+            raise AuthorizationError(msg)
+
+        if not item.is_active:
+            msg = f"User {item.username!r} is disabled"
+            raise AuthorizationError(msg)
+
+        user = User(
+            id=item.user_id,
+            username=item.username,
+            is_admin=item.is_admin,
+            is_active=item.is_active,
+            auth_version=item.auth_version,
+        )
+        user.namespace_scope = item.namespace_scope
+        return user
+
+    def clear(self) -> None:
+        """Remove all keys from cache"""
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def _load(self, key_hash: bytes) -> _APIKeyItem:
+        async with self._session_factory() as session:
+            result = await APIKeyRepository(session=session).get_with_user(key_hash)
+
+        if result is None:
+            msg = "Invalid API key"
+            raise AuthorizationError(msg)
+
+        api_key, user = result
+        return _APIKeyItem(
+            user_id=user.id,
+            username=user.username,
+            is_admin=user.is_admin,
+            is_active=user.is_active,
+            auth_version=user.auth_version,
+            expires_at=api_key.expires_at.timestamp() if api_key.expires_at else None,
+            namespace_scope=frozenset(api_key.namespace_ids) if api_key.namespace_ids is not None else None,
+        )
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from time import monotonic
+from typing import Iterator, Optional
+
+from prometheus_client import Counter, Gauge
+
+from horizon.commons.exceptions import ServiceError
+
+log = logging.getLogger(__name__)
+
+OPEN = Gauge(
+    "horizon_circuit_breaker_open",
+    "1 if circuit breaker is open, and calls to external service are rejected without trying, 0 otherwise",
+    ["name"],
+)
+REJECTED_CALLS = Counter(
+    "horizon_circuit_breaker_rejected_calls",
+    "Number of calls rejected because circuit breaker is open",
+    ["name"],
+)
+
+
+class CircuitBreaker:
+    """Stop calling external service after ``failure_threshold`` consecutive failures.
+
+    While circuit is open, calls fail immediately with :obj:`ServiceError <horizon.commons.exceptions.ServiceError>`,
+    instead of waiting for connection timeout. After ``reset_timeout`` seconds only one trial call is allowed.
+    If it is successful, circuit is closed again, otherwise it stays open for another ``reset_timeout`` seconds.
+
+    Only :obj:`ServiceError <horizon.commons.exceptions.ServiceError>` is counted as a failure.
+    Other exceptions, like wrong credentials, mean that service is available.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+        OPEN.labels(name=name).set(0)
+
+    @property
+    def is_open(self) -> bool:
+        """``True`` if calls are rejected, and trial call is not allowed yet."""
+        return self._opened_at is not None and monotonic() - self._opened_at < self._reset_timeout
+
+    @contextmanager
+    def protect(self) -> Iterator[None]:
+        trial = False
+        if self._opened_at is not None:
+            if self.is_open or self._trial_in_progress:
+                REJECTED_CALLS.labels(name=self._name).inc()
+                msg = f"Circuit breaker {self._name!r} is open"
+                raise ServiceError(msg)
+            trial = self._trial_in_progress = True
+
+        try:
+            yield
+        except ServiceError:
+            self._record_failure()
+            raise
+        except Exception:
+            self._record_success()
+            raise
+        else:
+            self._record_success()
+        finally:
+            if trial:
+                self._trial_in_progress = False
+
+    def _record_success(self) -> None:
+        if self._opened_at is not None:
+            log.info("Circuit breaker %r is closed", self._name)
+            OPEN.labels(name=self._name).set(0)
+        self._failures = 0
+        self._opened_at = None
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        if not self._failure_threshold or self._failures < self._failure_threshold:
+            return
+
+        if self._opened_at is None:
+            log.warning("Circuit breaker %r is open after %d failures", self._name, self._failures)
+            OPEN.labels(name=self._name).set(1)
+        self._opened_at = monotonic()
@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+from prometheus_client import Counter, Gauge
+
+if TYPE_CHECKING:
+    from horizon.backend.settings.auth.cached_ldap import LDAPCacheMemorySettings
+
+LOOKUPS = Counter(
+    "horizon_credentials_memory_cache_lookups",
+    "Number of lookups in in-memory credentials cache",
+    ["result"],
+)
+SKIPPED_WRITES = Counter(
+    "horizon_credentials_cache_skipped_writes",
+    "Number of credentials cache database updates skipped because row was updated recently",
+)
+PENDING_RECHECKS = Gauge(
+    "horizon_credentials_cache_pending_rechecks",
+    "Number of logins accepted using expired credentials cache while LDAP was unavailable, and not checked in LDAP yet",
+)
+
+
+@dataclass
+class CredentialsMemoryCacheItem:
+    user_id: int
+    username: str
+    password_digest: bytes
+    # timestamps
+    expires_at: float
+    persisted_at: float
+
+
+class CredentialsMemoryCache:
+    """In-memory LRU cache in front of ``credentials_cache`` table.
+
+    Password is stored as HMAC-SHA256 digest with a random key generated on startup,
+    so checking it takes microseconds instead of tens of milliseconds for argon2/bcrypt.
+    Digests are never saved anywhere, and cannot be compared between server processes.
+    """
+
+    def __init__(self, max_size: int, min_update_interval: float) -> None:
+        self._max_size = max_size
+        self._min_update_interval = min_update_interval
+        self._key = secrets.token_bytes(32)
+        self._items: OrderedDict[str, CredentialsMemoryCacheItem] = OrderedDict()
+
+    @classmethod
+    def from_settings(cls, settings: LDAPCacheMemorySettings) -> CredentialsMemoryCache:
+        return cls(max_size=settings.max_size, min_update_interval=settings.min_update_interval)
+
+    def digest(self, password: str) -> bytes:
+        return hmac.new(self._key, password.encode("utf-8"), hashlib.sha256).digest()
+
+    def get_username(self, login: str, password: str) -> Optional[str]:
+        """Return username if credentials match not expired item, or ``None``."""
+        item = self._items.get(login)
+        if not item or item.expires_at < time():
+            LOOKUPS.labels(result="miss").inc()
+            return None
+
+        if not hmac.compare_digest(item.password_digest, self.digest(password)):
+            # password could be changed, let database or LDAP to decide
+            LOOKUPS.labels(result="mismatch").inc()
+            return None
+
+        LOOKUPS.labels(result="hit").inc()
+        self._items.move_to_end(login)
+        return item.username
+
+    def set(  # noqa: PLR0913
+        self,
+        login: str,
+        password: str,
+        user_id: int,
+        username: str,
+        expires_at: float,
+        persisted_at: float,
+    ) -> None:
+        if not self._max_size:
+            return
+
+        self._items[login] = CredentialsMemoryCacheItem(
+            user_id=user_id,
+            username=username,
+            password_digest=self.digest(password),
+            expires_at=expires_at,
+            persisted_at=persisted_at,
+        )
+        self._items.move_to_end(login)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def delete(self, login: str) -> None:
+        self._items.pop(login, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def get_recently_persisted_at(self, login: str, password: str, user_id: int) -> Optional[float]:
+        """If the same credentials were saved to database recently, return time of saving, or ``None``."""
+        item = self._items.get(login)
+        if (
+            item
+            and item.user_id == user_id
+            and time() - item.persisted_at < self._min_update_interval
+            and hmac.compare_digest(item.password_digest, self.digest(password))
+        ):
+            SKIPPED_WRITES.inc()
+            return item.persisted_at
+        return None
+
+
+class CredentialsRecheckQueue:
+    """Credentials accepted using expired ``credentials_cache`` item while LDAP was unavailable.
+
+    They should be checked in LDAP again as soon as it becomes available, so plain passwords are kept
+    in memory of the server process until then. Only the last password of each login is stored.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self._max_size = max_size
+        self._items: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, login: str, password: str) -> None:
+        self._items[login] = password
+        self._items.move_to_end(login)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+        PENDING_RECHECKS.set(len(self._items))
+
+    def pop_all(self) -> Dict[str, str]:
+        items = dict(self._items)
+        self._items.clear()
+        PENDING_RECHECKS.set(0)
+        return items
@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+
+from prometheus_client import Histogram
+
+EVENT_LOOP_LAG = Histogram(
+    "horizon_event_loop_lag_seconds",
+    "Delay between scheduled and actual wake up time of a sleeping task, caused by blocking calls in event loop",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+async def monitor_event_loop_lag(interval: float) -> None:
+    """Periodically measure how long event loop was blocked, until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        wake_up_at = loop.time() + interval
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(loop.time() - wake_up_at, 0))
@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+from time import monotonic
+from typing import TYPE_CHECKING, List
+
+from prometheus_client import Histogram
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from horizon.backend.db.models import HWMHistory
+    from horizon.backend.settings.server import HistoryWriterSettings
+
+BATCH_SIZE = Histogram(
+    "horizon_hwm_history_writer_batch_size",
+    "Number of HWM history records saved by one INSERT statement",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+FLUSH_LATENCY = Histogram(
+    "horizon_hwm_history_writer_flush_seconds",
+    "Time spent on saving a batch of HWM history records",
+)
+
+
+class HWMHistoryWriter:
+    """Saves HWM history records collected by a unit of work in batches.
+
+    Records are not flushed one by one, but saved right before the transaction is committed,
+    using one multi-row ``INSERT`` statement per ``max_batch_size`` records.
+    So history records are committed atomically with HWM changes.
+    """
+
+    def __init__(self, max_batch_size: int) -> None:
+        self._max_batch_size = max_batch_size
+
+    @classmethod
+    def from_settings(cls, settings: HistoryWriterSettings) -> HWMHistoryWriter:
+        return cls(max_batch_size=settings.max_batch_size)
+
+    async def write(self, session: AsyncSession, records: List[HWMHistory]) -> None:
+        """Save history records within current transaction of the session."""
+        for start in range(0, len(records), self._max_batch_size):
+            batch = records[start : start + self._max_batch_size]
+            started_at = monotonic()
+            session.add_all(batch)
+            await session.flush(batch)
+            FLUSH_LATENCY.observe(monotonic() - started_at)
+            BATCH_SIZE.observe(len(batch))
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from time import monotonic
+from typing import TYPE_CHECKING, Optional
+
+from fastapi import HTTPException
+
+from horizon.backend.db.repositories import IdempotencyKeyRepository
+from horizon.commons.exceptions import BadRequestError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from horizon.backend.db.models import IdempotencyKey
+    from horizon.backend.settings.server import IdempotencySettings
+
+MAX_KEY_LENGTH = 255
+POLL_INTERVAL = 0.05
+PURGE_INTERVAL = 60
+
+
+class IdempotencyKeyService:
+    """Store and replay responses of requests with ``Idempotency-Key`` header.
+
+    Each operation is performed in a separate short transaction, so concurrent requests
+    with the same key can see each other's state.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ttl: timedelta,
+        wait_timeout: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self._ttl = ttl
+        self._wait_timeout = wait_timeout
+        self._last_purge: Optional[float] = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        session_factory: async_sessionmaker[AsyncSession],
+        settings: IdempotencySettings,
+    ) -> IdempotencyKeyService:
+        return cls(
+            session_factory=session_factory,
+            ttl=timedelta(seconds=settings.ttl),
+            wait_timeout=settings.wait_timeout,
+        )
+
+    async def reserve(self, user_id: int, key: str, request_hash: bytes) -> IdempotencyKey | None:
+        """Reserve key for a new request.
+
+        If key is already used by the same request, return stored response, waiting for it if necessary.
+        """
+        if len(key) > MAX_KEY_LENGTH:
+            msg = f"Idempotency-Key should be at most {MAX_KEY_LENGTH} characters long"
+            raise BadRequestError(msg)
+
+        await self._purge_expired()
+
+        started_at = monotonic()
+        while True:
+            async with self._session_factory() as session, session.begin():
+                repository = IdempotencyKeyRepository(session=session)
+                expired_before = datetime.now(tz=timezone.utc) - self._ttl
+                if await repository.reserve(user_id, key, request_hash, expired_before=expired_before):
+                    return None
+                existing = await repository.get(user_id, key)
+
+            if existing is None:
+                # removed by concurrent request, try again
+                continue
+
+            if existing.request_hash != request_hash:
+                msg = "Idempotency-Key was already used for a different request"
+                raise BadRequestError(msg)
+
+            if existing.status_code is not None:
+                return existing
+
+            if monotonic() - started_at >= self._wait_timeout:
+                raise HTTPException(
+                    status_code=HTTPStatus.CONFLICT,
+                    detail="Request with the same Idempotency-Key is still being processed",
+                )
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def save(self, user_id: int, key: str, status_code: int, content_type: str | None, body: bytes) -> None:
+        async with self._session_factory() as session, session.begin():
+            repository = IdempotencyKeyRepository(session=session)
+            await repository.save_response(
+                user_id,
+                key,
+                status_code=status_code,
+                content_type=content_type,
+                response_body=body,
+            )
+
+    async def release(self, user_id: int, key: str) -> None:
+        async with self._session_factory() as session, session.begin():
+            repository = IdempotencyKeyRepository(session=session)
+            await repository.release(user_id, key)
+
+    async def _purge_expired(self) -> None:
+        now = monotonic()
+        if self._last_purge is not None and now - self._last_purge < PURGE_INTERVAL:
+            return
+
+        self._last_purge = now
+        async with self._session_factory() as session, session.begin():
+            repository = IdempotencyKeyRepository(session=session)
+            await repository.delete_expired(datetime.now(tz=timezone.utc) - self._ttl)
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from horizon.backend.db.repositories.namespace_stats import NamespaceStatsRepository
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+log = logging.getLogger(__name__)
+
+
+async def fold_namespace_stats(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    """Move namespace stats deltas, produced by HWM changes, into ``namespace_stats`` rows."""
+    async with session_factory() as session, session.begin():
+        updated = await NamespaceStatsRepository(session=session).fold_deltas()
+    log.debug("Folded namespace stats deltas for %d namespaces", updated)
+    return updated
+
+
+async def fold_namespace_stats_periodically(
+    session_factory: async_sessionmaker[AsyncSession],
+    interval: float,
+) -> None:
+    """Periodically fold namespace stats deltas, until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await fold_namespace_stats(session_factory)
+        except Exception:
+            # deltas are kept in the table, and will be folded on next attempt
+            log.exception("Failed to fold namespace stats deltas")
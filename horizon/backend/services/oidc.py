@@ -0,0 +1,238 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from time import monotonic
+from typing import TYPE_CHECKING, AsyncContextManager, Callable, NamedTuple, Optional
+
+import httpx
+from authlib.jose import JsonWebKey, JsonWebToken, JWTClaims, KeySet
+from authlib.jose.errors import DecodeError, JoseError
+from authlib.jose.util import extract_header
+from prometheus_client import Counter
+
+from horizon.backend.db.models import User
+from horizon.backend.db.repositories import UserRepository
+from horizon.backend.services.single_flight import SingleFlight
+from horizon.backend.services.ttl_cache import TTLCache
+from horizon.commons.exceptions import AuthorizationError, ServiceError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from horizon.backend.settings.auth.oidc import OIDCSettings, OIDCUserCacheSettings
+
+log = logging.getLogger(__name__)
+
+JWKS_FETCHES = Counter(
+    "horizon_oidc_jwks_fetches",
+    "Number of JWKS fetches from OIDC IdP",
+    ["result"],
+)
+
+
+class OIDCKeySet:
+    """Public keys (JWKS) of OIDC IdP, used for validating access tokens locally.
+
+    Keys are stored in memory of each server process, and refreshed in background.
+    If token is signed by unknown key, keys are fetched immediately, but not more often than
+    ``min_refresh_interval_seconds``. If IdP is not available, previously fetched keys are used.
+    """
+
+    def __init__(self, settings: OIDCSettings, client: httpx.AsyncClient) -> None:
+        self._settings = settings
+        self._client = client
+        self._single_flight = SingleFlight(operation="jwks")
+        self._jwks_url: Optional[str] = settings.jwks_url
+        self._key_set: Optional[KeySet] = None
+        self._last_fetch_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Future] = None
+
+    @classmethod
+    def from_settings(cls, settings: OIDCSettings) -> OIDCKeySet:
+        return cls(settings=settings, client=httpx.AsyncClient(timeout=settings.timeout_seconds))
+
+    async def open(self) -> None:
+        """Fetch keys, and start refreshing them in background"""
+        try:
+            await self.refresh()
+        except ServiceError:
+            if self._settings.jwks.check_on_startup:
+                raise
+            log.warning("Failed to fetch JWKS, it will be fetched on first request", exc_info=True)
+
+        self._refresh_task = asyncio.ensure_future(self._refresh_periodically())
+
+    async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._refresh_task
+            self._refresh_task = None
+        await self._client.aclose()
+
+    async def refresh(self) -> None:
+        """Fetch keys from IdP. Concurrent calls perform only one request"""
+        await self._single_flight.run("jwks", self._fetch)
+
+    async def decode(self, token: str) -> JWTClaims:
+        """Validate token signature and claims, and return claims.
+
+        Raises :obj:`AuthorizationError <horizon.commons.exceptions.AuthorizationError>` if token is invalid,
+        and :obj:`ServiceError <horizon.commons.exceptions.ServiceError>` if keys were never fetched from IdP.
+        """
+        try:
+            header = extract_header(token.split(".", 1)[0].encode("utf-8"), DecodeError)
+            key_set = await self._get_key_set(header.get("kid"))
+
+            claims_options = {
+                "iss": {"essential": True, "value": self._settings.issuer_url},
+                "exp": {"essential": True},
+            }
+            if self._settings.audience:
+                claims_options["aud"] = {"essential": True, "value": self._settings.audience}
+
+            jwt = JsonWebToken(self._settings.algorithms)
+            claims = jwt.decode(token, key=key_set, claims_options=claims_options)
+            claims.validate(leeway=self._settings.leeway_seconds)
+        except (JoseError, ValueError) as e:
+            msg = "Invalid token"
+            raise AuthorizationError(msg) from e
+        return claims
+
+    async def _get_key_set(self, kid: Optional[str]) -> KeySet:
+        key_is_missing = self._key_set is None or (kid is not None and not self._has_key(kid))
+        # e.g. keys were rotated in IdP. but do not call IdP on every request with fake kid
+        if key_is_missing and self._can_fetch():
+            try:
+                await self.refresh()
+            except ServiceError:
+                if self._key_set is None:
+                    raise
+                log.warning("Failed to fetch JWKS, using previous keys", exc_info=True)
+
+        if self._key_set is None:
+            msg = "JWKS of OIDC provider is not available"
+            raise ServiceError(msg)
+        return self._key_set
+
+    def _can_fetch(self) -> bool:
+        if self._last_fetch_at is None:
+            return True
+        return monotonic() - self._last_fetch_at >= self._settings.jwks.min_refresh_interval_seconds
+
+    def _has_key(self, kid: str) -> bool:
+        return any(key.kid == kid for key in self._key_set.keys)  # type: ignore[union-attr]
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._settings.jwks.refresh_interval_seconds)
+            try:
+                await self.refresh()
+            except ServiceError:
+                log.warning("Failed to fetch JWKS, using previous keys", exc_info=True)
+
+    async def _fetch(self) -> None:
+        self._last_fetch_at = monotonic()
+        try:
+            if self._jwks_url is None:
+                self._jwks_url = await self._discover_jwks_url()
+
+            log.debug("Fetching JWKS from %r", self._jwks_url)
+            response = await self._client.get(self._jwks_url)
+            response.raise_for_status()
+            key_set = JsonWebKey.import_key_set(response.json())
+        except (httpx.HTTPError, JoseError, ValueError, KeyError) as e:
+            JWKS_FETCHES.labels(result="failure").inc()
+            msg = "Failed to fetch JWKS from OIDC provider"
+            raise ServiceError(msg) from e
+
+        JWKS_FETCHES.labels(result="success").inc()
+        log.debug("Fetched keys: %r", [key.kid for key in key_set.keys])
+        self._key_set = key_set
+
+    async def _discover_jwks_url(self) -> str:
+        url = self._settings.issuer_url.rstrip("/") + "/.well-known/openid-configuration"
+        log.debug("Fetching OpenID configuration from %r", url)
+        response = await self._client.get(url)
+        response.raise_for_status()
+        return response.json()["jwks_uri"]
+
+
+class _UserItem(NamedTuple):
+    user_id: int
+    username: str
+    is_admin: bool
+    is_active: bool
+    auth_version: int
+
+
+class OIDCUserCache:
+    """Map username from access token to user in backend database.
+
+    Users are stored in in-memory cache, so most of requests do not query database.
+    Users which are not present in database yet are created on first request.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        cache: TTLCache[str, _UserItem],
+    ) -> None:
+        self._session_factory = session_factory
+        self._cache = cache
+        self._single_flight = SingleFlight(operation="oidc_user")
+
+    @classmethod
+    def from_settings(
+        cls,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        settings: OIDCUserCacheSettings,
+    ) -> OIDCUserCache:
+        return cls(
+            session_factory=session_factory,
+            cache=TTLCache(name="oidc_user", max_size=settings.max_size, ttl=settings.ttl_seconds),
+        )
+
+    async def get_user(self, username: str) -> User:
+        """Return user with specified username, and create it if missing.
+
+        Raises :obj:`AuthorizationError <horizon.commons.exceptions.AuthorizationError>` if user is disabled.
+        """
+        item = self._cache.get(username)
+        if item is None:
+            # concurrent requests of the same new user should not try to create it twice
+            item = await self._single_flight.run(username, lambda: self._load(username))
+            self._cache.set(username, item)
+
+        if not item.is_active:
+            msg = f"User {item.username!r} is disabled"
+            raise AuthorizationError(msg)
+
+        return User(
+            id=item.user_id,
+            username=item.username,
+            is_admin=item.is_admin,
+            is_active=item.is_active,
+            auth_version=item.auth_version,
+        )
+
+    def clear(self) -> None:
+        """Remove all users from cache"""
+        self._cache.clear()
+
+    async def _load(self, username: str) -> _UserItem:
+        log.info("Get/create user %r in database", username)
+        async with self._session_factory() as session:
+            user = await UserRepository(session=session).get_or_create(username=username)
+
+        return _UserItem(
+            user_id=user.id,
+            username=user.username,
+            is_admin=user.is_admin,
+            is_active=user.is_active,
+            auth_version=user.auth_version,
+        )
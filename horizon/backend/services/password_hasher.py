@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Dict, TypeVar
+
+from passlib.registry import get_crypt_handler
+from prometheus_client import Counter, Gauge, Histogram
+
+from horizon.commons.exceptions import ServiceError
+
+if TYPE_CHECKING:
+    from passlib.ifc import PasswordHash
+
+    from horizon.backend.settings.auth.cached_ldap import LDAPCachePasswordHashSettings
+
+T = TypeVar("T")
+
+HASHING_LATENCY = Histogram(
+    "horizon_password_hash_seconds",
+    "Time spent on hashing or verifying password in worker thread",
+    ["operation"],
+)
+WAIT_LATENCY = Histogram(
+    "horizon_password_hash_wait_seconds",
+    "Time password hashing operation waited for a free worker thread",
+    ["operation"],
+)
+PENDING_OPERATIONS = Gauge(
+    "horizon_password_hash_pending_operations",
+    "Number of password hashing operations currently running or waiting for a free worker thread",
+)
+REJECTED_OPERATIONS = Counter(
+    "horizon_password_hash_rejected_operations",
+    "Number of password hashing operations rejected because queue is full",
+    ["operation"],
+)
+
+
+class PasswordHasher:
+    """Hash and verify passwords in a dedicated thread pool, without blocking event loop.
+
+    Algorithms like argon2 or bcrypt are slow by design, each call takes tens of milliseconds.
+    Their implementations release GIL, so hashing in threads does not slow down other requests.
+    Password hash handler is created once, instead of creating it on every call.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        options: Dict[str, Any],
+        max_workers: int,
+        max_queue_size: int,
+    ) -> None:
+        handler = get_crypt_handler(algorithm)
+        self._handler: PasswordHash = handler.using(**options)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="horizon-password-hash")
+        self._max_pending = max_workers + max_queue_size
+        self._pending = 0
+
+    @classmethod
+    def from_settings(cls, settings: LDAPCachePasswordHashSettings) -> PasswordHasher:
+        return cls(
+            algorithm=settings.algorithm,
+            options=settings.options,
+            max_workers=settings.max_workers,
+            max_queue_size=settings.max_queue_size,
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", self._handler.hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run("verify", self._handler.verify, password, password_hash)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, operation: str, func: Callable[..., T], *args) -> T:
+        if self._pending >= self._max_pending:
+            REJECTED_OPERATIONS.labels(operation=operation).inc()
+            msg = "Too many concurrent login requests, please try again later"
+            raise ServiceError(msg)
+
+        self._pending += 1
+        PENDING_OPERATIONS.inc()
+        future = asyncio.wrap_future(self._executor.submit(self._measure, operation, monotonic(), func, *args))
+        # if request is cancelled, thread is still busy. release the slot only after it is finished
+        future.add_done_callback(self._release)
+        return await asyncio.shield(future)
+
+    def _release(self, future: asyncio.Future) -> None:
+        self._pending -= 1
+        PENDING_OPERATIONS.dec()
+
+    @staticmethod
+    def _measure(operation: str, queued_at: float, func: Callable[..., T], *args) -> T:
+        started_at = monotonic()
+        WAIT_LATENCY.labels(operation=operation).observe(started_at - queued_at)
+        try:
+            return func(*args)
+        finally:
+            HASHING_LATENCY.labels(operation=operation).observe(monotonic() - started_at)
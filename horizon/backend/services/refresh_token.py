@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import hashlib
+import logging
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, AsyncContextManager, Callable, Optional, Tuple
+from uuid import UUID, uuid4
+
+from prometheus_client import Counter
+
+from horizon.backend.db.repositories import RefreshTokenRepository, UserRepository
+from horizon.commons.exceptions import AuthorizationError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from horizon.backend.db.models import User
+    from horizon.backend.settings.auth.refresh_token import RefreshTokenSettings
+
+log = logging.getLogger(__name__)
+
+REFRESHES = Counter(
+    "horizon_refresh_token_exchanges",
+    "Number of attempts to exchange refresh token for a new access token",
+    ["result"],
+)
+
+
+def _hash_token(refresh_token: str) -> bytes:
+    # token is random and long enough, so slow password hash is not required
+    return hashlib.sha256(refresh_token.encode("utf-8")).digest()
+
+
+class RefreshTokenService:
+    """Issue and rotate refresh tokens.
+
+    Each refresh token can be exchanged only once, and is replaced by a new one with the same expiration time.
+    If already used token is presented again, it was probably stolen, so all tokens issued
+    after the same login are revoked.
+
+    Each operation is performed in a separate short transaction, independent from request's unit of work.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        expire_seconds: Optional[int],
+    ) -> None:
+        self._session_factory = session_factory
+        self._expire_seconds = expire_seconds
+
+    @classmethod
+    def from_settings(
+        cls,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        settings: RefreshTokenSettings,
+    ) -> RefreshTokenService:
+        return cls(
+            session_factory=session_factory,
+            # None means refresh tokens are disabled
+            expire_seconds=settings.expire_seconds if settings.enabled else None,
+        )
+
+    async def issue(self, user: User) -> Optional[str]:
+        """Issue refresh token for a user which just passed authentication.
+
+        Returns ``None`` if refresh tokens are disabled.
+        """
+        if not self._expire_seconds:
+            return None
+
+        expires_at = datetime.now(tz=timezone.utc) + timedelta(seconds=self._expire_seconds)
+        async with self._session_factory() as session:
+            repository = RefreshTokenRepository(session=session)
+            await repository.delete_expired(user.id)
+            return await self._create(repository, user_id=user.id, family_id=uuid4(), expires_at=expires_at)
+
+    async def rotate(self, refresh_token: str) -> Tuple[User, str]:
+        """Exchange refresh token for a new one, and return user it was issued to."""
+        if not self._expire_seconds:
+            msg = "Refresh tokens are disabled"
+            raise AuthorizationError(msg)
+
+        token_hash = _hash_token(refresh_token)
+        user: Optional[User] = None
+        new_refresh_token = ""
+        async with self._session_factory() as session:
+            repository = RefreshTokenRepository(session=session)
+            item = await repository.use(token_hash)
+            if item is None:
+                await self._revoke_if_reused(repository, token_hash)
+            else:
+                user = await UserRepository(session=session).get_by_id(item.user_id)
+                if user.is_active:
+                    new_refresh_token = await self._create(
+                        repository,
+                        user_id=user.id,
+                        family_id=item.family_id,
+                        expires_at=item.expires_at,
+                    )
+                else:
+                    await repository.revoke_family(item.family_id)
+
+        # revocation should be committed before raising an exception
+        if user is None:
+            msg = "Invalid refresh token"
+            raise AuthorizationError(msg)
+
+        if not user.is_active:
+            REFRESHES.labels(result="invalid").inc()
+            msg = f"User {user.username!r} is disabled"
+            raise AuthorizationError(msg)
+
+        REFRESHES.labels(result="rotated").inc()
+        return user, new_refresh_token
+
+    async def _create(
+        self,
+        repository: RefreshTokenRepository,
+        user_id: int,
+        family_id: UUID,
+        expires_at: datetime,
+    ) -> str:
+        refresh_token = secrets.token_urlsafe(32)
+        await repository.create(
+            token_hash=_hash_token(refresh_token),
+            user_id=user_id,
+            family_id=family_id,
+            expires_at=expires_at,
+        )
+        return refresh_token
+
+    async def _revoke_if_reused(self, repository: RefreshTokenRepository, token_hash: bytes) -> None:
+        item = await repository.get(token_hash)
+        if item is None or item.revoked_at is None or item.expires_at < datetime.now(tz=timezone.utc):
+            # unknown or expired token
+            REFRESHES.labels(result="invalid").inc()
+            return
+
+        log.warning("Refresh token of user id %r was used twice, revoking all tokens of this session", item.user_id)
+        REFRESHES.labels(result="reused").inc()
+        await repository.revoke_family(item.family_id)
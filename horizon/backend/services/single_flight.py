@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from prometheus_client import Counter
+
+T = TypeVar("T")
+
+CALLS = Counter(
+    "horizon_single_flight_calls",
+    "Number of calls performed by single-flight group. "
+    "'executed' calls were actually performed, 'coalesced' ones awaited result of concurrent call with the same key",
+    ["operation", "mode"],
+)
+
+
+class SingleFlight:
+    """Perform only one call for each key at a time, within current process.
+
+    Concurrent calls with the same key do not perform the operation again, but await the result
+    (or exception) of the call which is already in flight. Results are not stored after the call is finished.
+
+    If in-flight call is cancelled, e.g. because client has disconnected, waiting calls are not cancelled,
+    and one of them performs the operation by itself.
+    """
+
+    def __init__(self, operation: str) -> None:
+        self._operation = operation
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            future = self._in_flight.get(key)
+            if future is None:
+                return await self._execute(key, func)
+
+            CALLS.labels(operation=self._operation, mode="coalesced").inc()
+            await asyncio.wait([future])
+            if not future.cancelled():
+                return future.result()
+
+    async def _execute(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        CALLS.labels(operation=self._operation, mode="executed").inc()
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # exception is raised here, do not log it again if there are no waiting calls
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+from collections import OrderedDict
+from time import monotonic
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from prometheus_client import Counter
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+LOOKUPS = Counter(
+    "horizon_ttl_cache_lookups",
+    "Number of lookups in in-memory TTL cache",
+    ["cache", "result"],
+)
+
+
+class TTLCache(Generic[K, V]):
+    """In-memory LRU cache, items are expired ``ttl`` seconds after they were added.
+
+    Cache is local to the server process, and is not shared between them.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl: float) -> None:
+        self._name = name
+        self._max_size = max_size
+        self._ttl = ttl
+        self._items: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        item = self._items.get(key)
+        if item is None or item[0] < monotonic():
+            LOOKUPS.labels(cache=self._name, result="miss").inc()
+            return None
+
+        LOOKUPS.labels(cache=self._name, result="hit").inc()
+        self._items.move_to_end(key)
+        return item[1]
+
+    def set(self, key: K, value: V) -> None:
+        if not self._max_size or not self._ttl:
+            return
+
+        self._items[key] = (monotonic() + self._ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
 
+from typing import Optional
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
@@ -11,20 +13,24 @@ from horizon.backend.db.repositories import (
     HWMRepository,
     NamespaceHistoryRepository,
     NamespaceRepository,
+    NamespaceStatsRepository,
     UserRepository,
 )
 from horizon.backend.dependencies import Stub
+from horizon.backend.services.history_writer import HWMHistoryWriter
 
 
 class UnitOfWork:
     def __init__(
         self,
         session: Annotated[AsyncSession, Depends(Stub(AsyncSession))],
+        history_writer: Annotated[Optional[HWMHistoryWriter], Depends(Stub(HWMHistoryWriter))],
     ):
         self._session = session
         self.namespace = NamespaceRepository(session=session)
-        self.hwm_history = HWMHistoryRepository(session=session)
+        self.hwm_history = HWMHistoryRepository(session=session, writer=history_writer)
         self.namespace_history = NamespaceHistoryRepository(session=session)
+        self.namespace_stats = NamespaceStatsRepository(session=session)
         self.user = UserRepository(session=session)
         self.hwm = HWMRepository(session=session)
         self.credentials_cache = CredentialsCacheRepository(session=session)
@@ -35,5 +41,13 @@ class UnitOfWork:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if exc_type:
             await self._session.rollback()
-        else:
-            await self._session.commit()
+            self.hwm_history.discard_pending()
+            return
+
+        try:
+            # history records are committed in the same transaction as HWM changes
+            await self.hwm_history.write_pending()
+        except BaseException:
+            await self._session.rollback()
+            raise
+        await self._session.commit()
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import monotonic
+from typing import TYPE_CHECKING, Any, AsyncContextManager, Callable, Dict, Optional, Tuple
+
+from prometheus_client import Gauge
+
+from horizon.backend.db.models import User
+from horizon.backend.db.repositories import UserRepository
+from horizon.commons.exceptions import AuthorizationError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from horizon.backend.settings.auth.jwt import JWTSettings
+
+log = logging.getLogger(__name__)
+
+REVOKED_USERS = Gauge(
+    "horizon_revocation_list_users",
+    "Number of users in in-memory list of disabled users and revoked tokens",
+)
+
+
+def get_user_claims(user: User) -> Dict[str, Any]:
+    """Claims added to self-contained access token"""
+    return {
+        "username": user.username,
+        "is_admin": user.is_admin,
+        "auth_version": user.auth_version,
+    }
+
+
+def get_user_from_claims(user_id: int, payload: Dict[str, Any]) -> Optional[User]:
+    """Create ``User`` object from self-contained access token.
+
+    Object is not bound to database session. Returns ``None`` if token does not contain user claims,
+    e.g. it was issued before self-contained tokens were enabled.
+    """
+    username = payload.get("username")
+    is_admin = payload.get("is_admin")
+    auth_version = payload.get("auth_version")
+    if not isinstance(username, str) or not isinstance(is_admin, bool) or not isinstance(auth_version, int):
+        return None
+
+    # token is issued only to active users, disabled ones are checked using UserRevocationList
+    return User(id=user_id, username=username, is_admin=is_admin, is_active=True, auth_version=auth_version)
+
+
+class UserRevocationList:
+    """In-memory list of users which self-contained access tokens should be rejected.
+
+    Contains disabled users, and users with increased ``auth_version``. List is reloaded from database
+    at most once per ``refresh_interval`` seconds, by the first request after interval is passed.
+    Other requests use current list instead of waiting for the reload.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        refresh_interval: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self._refresh_interval = refresh_interval
+        # user_id -> (auth_version, is_active)
+        self._users: Dict[int, Tuple[int, bool]] = {}
+        self._refreshed_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        settings: JWTSettings,
+    ) -> UserRevocationList:
+        return cls(
+            session_factory=session_factory,
+            refresh_interval=settings.revocation_check_interval_seconds,
+        )
+
+    async def check(self, user: User) -> None:
+        """Raise :obj:`AuthorizationError <horizon.commons.exceptions.AuthorizationError>`
+        if user is disabled, or token was issued before ``auth_version`` was increased.
+        """
+        await self._refresh_if_needed()
+
+        item = self._users.get(user.id)
+        if item is None:
+            return
+
+        auth_version, is_active = item
+        if not is_active:
+            msg = f"User {user.username!r} is disabled"
+            raise AuthorizationError(msg)
+
+        if user.auth_version < auth_version:
+            msg = "Token was revoked"
+            raise AuthorizationError(msg)
+
+    def clear(self) -> None:
+        """Force reloading list on next check"""
+        self._users = {}
+        self._refreshed_at = None
+
+    async def _refresh_if_needed(self) -> None:
+        if self._is_fresh():
+            return
+
+        if self._lock is None:
+            # in Python 3.9 and below Lock should be created within running event loop
+            self._lock = asyncio.Lock()
+
+        if self._refreshed_at is not None and self._lock.locked():
+            # list is being reloaded by another request
+            return
+
+        async with self._lock:
+            if self._is_fresh():
+                return
+
+            async with self._session_factory() as session:
+                users = await UserRepository(session=session).list_with_revoked_tokens()
+
+            self._users = {user.id: (user.auth_version, user.is_active) for user in users}
+            self._refreshed_at = monotonic()
+            REVOKED_USERS.set(len(self._users))
+            log.debug("Revocation list reloaded, %d users", len(self._users))
+
+    def _is_fresh(self) -> bool:
+        return self._refreshed_at is not None and monotonic() - self._refreshed_at < self._refresh_interval
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import AsyncExitStack, suppress
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+from horizon.backend.db.factory import sessionmaker
+from horizon.backend.services.uow import UnitOfWork
+from horizon.commons.exceptions import EntityNotFoundError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+    from horizon.backend.settings.server import WarmupSettings
+
+log = logging.getLogger(__name__)
+
+# id which is never used by real rows, so queries return empty result
+MISSING_ID = 0
+PAGE_SIZE = 20
+
+
+async def _open_connections(engine: AsyncEngine, count: int) -> None:
+    async with AsyncExitStack() as stack:
+        # connections are opened in parallel, and returned to the pool only after all of them are ready
+        connections: list[AsyncConnection] = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(count)),
+        )
+        await asyncio.gather(*(connection.execute(text("SELECT 1")) for connection in connections))
+
+
+async def _execute_queries(engine: AsyncEngine) -> None:
+    async with sessionmaker(engine)() as session:
+        uow = UnitOfWork(session=session, history_writer=None)
+        await uow.user.count()
+        await uow.namespace.count()
+        await uow.namespace.paginate(page=1, page_size=PAGE_SIZE)
+        await uow.hwm.paginate(namespace_id=MISSING_ID, page=1, page_size=PAGE_SIZE)
+        await uow.hwm_history.paginate(hwm_id=MISSING_ID, page=1, page_size=PAGE_SIZE)
+        await uow.namespace_history.paginate(namespace_id=MISSING_ID, page=1, page_size=PAGE_SIZE)
+        await uow.namespace_stats.get_many([MISSING_ID])
+        for get in (uow.user.get_by_id, uow.namespace.get, uow.hwm.get):
+            with suppress(EntityNotFoundError):
+                await get(MISSING_ID)
+        await session.rollback()
+
+
+async def warmup_database(engine: AsyncEngine, settings: WarmupSettings) -> None:
+    """Open database connections and fill compiled statements cache before accepting requests."""
+    started_at = perf_counter()
+    if settings.database_connections:
+        await _open_connections(engine, settings.database_connections)
+    if settings.queries:
+        await _execute_queries(engine)
+    log.info("Database warm-up finished in %.3fs", perf_counter() - started_at)
@@ -2,14 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from pydantic import BaseModel, Field
+from pydantic import __version__ as pydantic_version
 
 try:
     from pydantic import ImportString
 except ImportError:
     from pydantic import PyObject as ImportString  # type: ignore[no-redef]
 
-from horizon.backend.providers.auth.dummy import DummyAuthProvider
-
 
 class AuthSettings(BaseModel):
     """Authorization-related settings.
@@ -28,10 +27,15 @@ class AuthSettings(BaseModel):
         HORIZON__AUTH__ACCESS_KEY__SECRET_KEY=secret
     """
 
+    # provider module is imported only then settings object is created,
+    # to avoid importing dependencies of auth providers which are not used
     provider: ImportString = Field(  # type: ignore[assignment]
-        default=DummyAuthProvider,
+        default="horizon.backend.providers.auth.dummy.DummyAuthProvider",
+        validate_default=True,
         description="Full name of auth provider class",
     )
 
     class Config:
         extra = "allow"
+        if pydantic_version < "2":
+            validate_all = True
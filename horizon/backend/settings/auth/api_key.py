@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from pydantic import BaseModel, Field
+
+
+class APIKeyCacheSettings(BaseModel):
+    """Settings of API keys cache.
+
+    Each server process stores API key hash -> user mapping, so most of requests
+    using the same API key do not query backend database.
+
+    .. note::
+
+        If API key is removed, or its user is disabled, this will be detected only after cache item is expired.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__API_KEY__CACHE__TTL_SECONDS=60
+        HORIZON__AUTH__API_KEY__CACHE__MAX_SIZE=10000
+    """
+
+    ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="How long API key is stored in cache, in seconds. ``0`` disables cache",
+    )
+    max_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Max number of API keys stored in cache of each server process. ``0`` disables cache",
+    )
+
+
+class APIKeySettings(BaseModel):
+    """Settings related to API keys.
+
+    API keys are long-lived credentials for service accounts, created using :ref:`manage-api-keys-script`.
+    Key is sent as ``Authorization: Bearer <api_key>`` header instead of access token.
+
+    Keys are stored in database as HMAC of key value, using ``access_token.secret_key``.
+    So changing the secret key invalidates all API keys.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__API_KEY__ENABLED=True
+        HORIZON__AUTH__API_KEY__CACHE__TTL_SECONDS=60
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Set to ``True`` to accept API keys",
+    )
+    cache: APIKeyCacheSettings = Field(
+        default_factory=APIKeyCacheSettings,
+        description="API keys cache settings",
+    )
@@ -25,6 +25,7 @@ class LDAPCachePasswordHashSettings(BaseModel):
 
         HORIZON__AUTH__CACHE__PASSWORD_HASH__ALGORITHM=argon2
         HORIZON__AUTH__CACHE__PASSWORD_HASH__OPTIONS={"time_cost": 2, "memory_cost": 1024, "parallelism": 1}
+        HORIZON__AUTH__CACHE__PASSWORD_HASH__MAX_WORKERS=4
     """
 
     algorithm: str = Field(
@@ -42,6 +43,61 @@ class LDAPCachePasswordHashSettings(BaseModel):
         default={},
         description="Options passed to hashing algorithm",
     )
+    max_workers: int = Field(
+        default=2,
+        ge=1,
+        description=textwrap.dedent(
+            """
+            Number of threads used for hashing and verifying passwords.
+
+            Hashing is performed outside of event loop, so it does not block other requests.
+            Each thread can consume up to ``memory_cost`` of RAM (for ``argon2``).
+            """,
+        ),
+    )
+    max_queue_size: int = Field(
+        default=100,
+        ge=0,
+        description=textwrap.dedent(
+            """
+            Max number of hashing operations waiting for a free thread.
+            If queue is full, login request is rejected with ``503 Service Unavailable``.
+            """,
+        ),
+    )
+
+
+class LDAPCacheMemorySettings(BaseModel):
+    """Settings of in-memory credentials cache, used in front of ``credentials_cache`` table.
+
+    Each server process keeps recently checked credentials in memory, so most of login requests
+    do not query the database and do not perform expensive password hash verification.
+    Item expires at the same time as the database row it was loaded from.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__CACHE__MEMORY__MAX_SIZE=10000
+        HORIZON__AUTH__CACHE__MEMORY__MIN_UPDATE_INTERVAL=60
+    """
+
+    max_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Max number of logins stored in memory of each server process. ``0`` disables in-memory cache",
+    )
+    min_update_interval: float = Field(
+        default=60,
+        ge=0,
+        description=textwrap.dedent(
+            """
+            If the same credentials were saved to ``credentials_cache`` table less than this number of seconds ago,
+            e.g. by concurrent login request, the row is not updated again.
+            """,
+        ),
+    )
 
 
 class LDAPCacheSettings(BaseModel):
@@ -53,6 +109,7 @@ class LDAPCacheSettings(BaseModel):
     .. code-block:: bash
 
         HORIZON__AUTH__CACHE__EXPIRE_SECONDS=3600  # 1 hour
+        HORIZON__AUTH__CACHE__GRACE_SECONDS=86400  # 1 day
     """
 
     expire_seconds: int = Field(
@@ -71,6 +128,28 @@ class LDAPCacheSettings(BaseModel):
         default_factory=LDAPCachePasswordHashSettings,
         description="Password hashing options",
     )
+    memory: LDAPCacheMemorySettings = Field(
+        default_factory=LDAPCacheMemorySettings,
+        description="In-memory cache options",
+    )
+    grace_seconds: int = Field(
+        default=0,
+        ge=0,
+        description=textwrap.dedent(
+            """
+            If LDAP is unavailable, accept expired credentials cache item for this number of seconds after expiration.
+            ``0`` means that expired items are never accepted.
+
+            Credentials accepted this way are checked in LDAP again as soon as it becomes available.
+            If they are not valid anymore, cache item is removed. Already issued access tokens are not revoked.
+            """,
+        ),
+    )
+    recheck_interval_seconds: float = Field(
+        default=30,
+        gt=0,
+        description="How often credentials accepted during ``grace_seconds`` are checked in LDAP again, in seconds",
+    )
 
 
 class CachedLDAPAuthProviderSettings(LDAPAuthProviderSettings):
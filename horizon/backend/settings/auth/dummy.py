@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 from pydantic import BaseModel, Field
 
+from horizon.backend.settings.auth.api_key import APIKeySettings
 from horizon.backend.settings.auth.jwt import JWTSettings
+from horizon.backend.settings.auth.refresh_token import RefreshTokenSettings
 
 
 class DummyAuthProviderSettings(BaseModel):
@@ -18,3 +20,11 @@ class DummyAuthProviderSettings(BaseModel):
     """
 
     access_token: JWTSettings = Field(description="Access-token related settings")
+    refresh_token: RefreshTokenSettings = Field(
+        default_factory=RefreshTokenSettings,
+        description="Refresh-token related settings",
+    )
+    api_key: APIKeySettings = Field(
+        default_factory=APIKeySettings,
+        description="API keys related settings",
+    )
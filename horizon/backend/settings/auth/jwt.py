@@ -1,9 +1,11 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import textwrap
+from typing import Any, Dict, List
 
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, Field, SecretStr, root_validator, validator
 
 
 class JWTSettings(BaseModel):
@@ -16,6 +18,15 @@ class JWTSettings(BaseModel):
 
         HORIZON__AUTH__ACCESS_KEY__SECRET_KEY=somesecret
         HORIZON__AUTH__ACCESS_KEY__EXPIRE_SECONDS=3600  # 1 hour
+        HORIZON__AUTH__ACCESS_KEY__SELF_CONTAINED=True
+
+    Using asymmetric keys, with key rotation:
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__ACCESS_KEY__SECRET_KEY=somesecret
+        HORIZON__AUTH__ACCESS_KEY__SECURITY_ALGORITHM=ES256
+        HORIZON__AUTH__ACCESS_KEY__PRIVATE_KEYS='["/keys/new.pem", "/keys/old.pem"]'
     """
 
     secret_key: SecretStr = Field(
@@ -33,6 +44,9 @@ class JWTSettings(BaseModel):
             """
             Algorithm used for signing JWT tokens.
 
+            ``HS*`` algorithms use ``secret_key``. Asymmetric algorithms (``RS*``, ``PS*``, ``ES*``, ``EdDSA``)
+            use ``private_keys``.
+
             See `authlib <https://docs.authlib.org/en/latest/specs/rfc7518.html>`_
             documentation.
             """,
@@ -42,3 +56,63 @@ class JWTSettings(BaseModel):
         default=10 * 60 * 60,
         description="Token expiration time, in seconds",
     )
+    self_contained: bool = Field(
+        default=False,
+        description=textwrap.dedent(
+            """
+            If ``True``, ``username``, ``is_admin`` and ``auth_version`` of user are embedded into token,
+            and authenticated requests do not load user from database.
+
+            Tokens of disabled users, and tokens issued before user's ``auth_version`` was increased
+            (e.g. admin role was granted or revoked), are rejected using in-memory list
+            which is reloaded from database every ``revocation_check_interval_seconds``.
+            """,
+        ),
+    )
+    revocation_check_interval_seconds: float = Field(
+        default=30,
+        gt=0,
+        description=textwrap.dedent(
+            """
+            How often list of disabled users and revoked tokens is reloaded from database, in seconds.
+
+            Used only if ``self_contained=True``. This is the maximum time token can be used after it was revoked.
+            """,
+        ),
+    )
+    private_keys: List[SecretStr] = Field(
+        default_factory=list,
+        description=textwrap.dedent(
+            """
+            Private keys for signing JWT tokens using asymmetric algorithms, in PEM format.
+            Each item can be either key content, or path to PEM file.
+
+            Tokens are signed using the first key. Tokens signed by any key from the list are accepted,
+            so keys can be rotated without invalidating already issued tokens.
+
+            Public parts of all keys are published at ``/.well-known/jwks.json`` endpoint.
+            """,
+        ),
+    )
+    jwks_max_age_seconds: int = Field(
+        default=5 * 60,
+        ge=0,
+        description="Value of ``Cache-Control: max-age`` header returned by ``/.well-known/jwks.json`` endpoint",
+    )
+
+    @validator("private_keys", pre=True)
+    def _parse_private_keys(cls, value: Any):  # noqa: N805
+        # env variables are passed as strings
+        if isinstance(value, str):
+            if value.lstrip().startswith("["):
+                return json.loads(value)
+            return [value]
+        return value
+
+    @root_validator(skip_on_failure=True)
+    def _check_private_keys(cls, values: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N805
+        security_algorithm = values.get("security_algorithm", "")
+        if not security_algorithm.startswith("HS") and not values.get("private_keys"):
+            msg = f"Algorithm {security_algorithm!r} requires at least one item in 'private_keys'"
+            raise ValueError(msg)
+        return values
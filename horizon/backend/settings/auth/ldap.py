@@ -15,7 +15,9 @@ from pydantic import AnyUrl, BaseModel, Field, SecretStr, validator
 from pydantic import __version__ as pydantic_version
 from typing_extensions import Annotated, Literal
 
+from horizon.backend.settings.auth.api_key import APIKeySettings
 from horizon.backend.settings.auth.jwt import JWTSettings
+from horizon.backend.settings.auth.refresh_token import RefreshTokenSettings
 
 if TYPE_CHECKING:
     LDAPUrl = AnyUrl
@@ -84,6 +86,39 @@ class LDAPConnectionPoolSettings(BaseModel):
     )
 
 
+class LDAPLookupCacheSettings(BaseModel):
+    """Settings of LDAP lookup results cache.
+
+    Each server process stores ``login`` -> ``(DN, uid)`` mapping found by lookup query,
+    so next auth requests for the same login perform only ``bind`` request.
+    User password is always checked in LDAP.
+
+    .. note::
+
+        If user is moved to another DN, or does not match lookup query anymore (e.g. removed from a group),
+        this will be detected only after cache item is expired.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__LDAP__LOOKUP__CACHE__TTL_SECONDS=300
+        HORIZON__AUTH__LDAP__LOOKUP__CACHE__MAX_SIZE=10000
+    """
+
+    ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="How long lookup result is stored in cache, in seconds. ``0`` disables cache",
+    )
+    max_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Max number of logins stored in cache of each server process. ``0`` disables cache",
+    )
+
+
 class LDAPLookupSettings(BaseModel):
     """Settings related to LDAP lookup.
 
@@ -111,6 +146,10 @@ class LDAPLookupSettings(BaseModel):
         default_factory=LDAPConnectionPoolSettings,
         description="LDAP connection pool settings",
     )
+    cache: LDAPLookupCacheSettings = Field(
+        default_factory=LDAPLookupCacheSettings,
+        description="LDAP lookup results cache settings",
+    )
     credentials: Optional[LDAPCredentials] = Field(
         default=None,
         description="Credentials used for connecting to LDAP while performing user lookup",
@@ -149,6 +188,39 @@ class LDAPLookupSettings(BaseModel):
         return LDAPSearchScope(value)
 
 
+class LDAPCircuitBreakerSettings(BaseModel):
+    """Settings of circuit breaker around LDAP requests.
+
+    After ``failure_threshold`` consecutive failed requests (e.g. connection timeouts),
+    auth requests fail immediately with ``503 Service unavailable``, instead of waiting for LDAP timeout.
+    Every ``reset_timeout_seconds`` one request is allowed to check if LDAP is available again.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__LDAP__CIRCUIT_BREAKER__ENABLED=True
+        HORIZON__AUTH__LDAP__CIRCUIT_BREAKER__FAILURE_THRESHOLD=5
+        HORIZON__AUTH__LDAP__CIRCUIT_BREAKER__RESET_TIMEOUT_SECONDS=30
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Set to ``True`` to enable circuit breaker",
+    )
+    failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Number of consecutive failed requests to LDAP, after which circuit is opened",
+    )
+    reset_timeout_seconds: float = Field(
+        default=30,
+        gt=0,
+        description="How long circuit stays open before the next request is allowed to be sent to LDAP, in seconds",
+    )
+
+
 class LDAPSettings(BaseModel):
     """Settings related to LDAP interaction.
 
@@ -204,6 +276,10 @@ class LDAPSettings(BaseModel):
         default_factory=LDAPLookupSettings,
         description="LDAP search options",
     )
+    circuit_breaker: LDAPCircuitBreakerSettings = Field(
+        default_factory=LDAPCircuitBreakerSettings,
+        description="LDAP circuit breaker settings",
+    )
 
 
 class LDAPAuthProviderSettings(BaseModel):
@@ -224,4 +300,12 @@ class LDAPAuthProviderSettings(BaseModel):
     """
 
     access_token: JWTSettings = Field(description="Access-token related settings")
+    refresh_token: RefreshTokenSettings = Field(
+        default_factory=RefreshTokenSettings,
+        description="Refresh-token related settings",
+    )
+    api_key: APIKeySettings = Field(
+        default_factory=APIKeySettings,
+        description="API keys related settings",
+    )
     ldap: LDAPSettings = Field(description="LDAP related settings")
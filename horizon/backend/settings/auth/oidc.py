@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Settings for OIDCAuthProvider class.
+"""
+
+import json
+import textwrap
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Field, validator
+
+
+class OIDCJWKSSettings(BaseModel):
+    """Settings of IdP public keys (JWKS) cache.
+
+    Each server process fetches JWKS from IdP and keeps it in memory, so access tokens are validated
+    without calling IdP. Keys are refreshed in background every ``refresh_interval_seconds``,
+    and also if token is signed by unknown key (e.g. after keys rotation in IdP).
+
+    If IdP is not available, previously fetched keys are used.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__OIDC__JWKS__REFRESH_INTERVAL_SECONDS=300
+        HORIZON__AUTH__OIDC__JWKS__MIN_REFRESH_INTERVAL_SECONDS=10
+        HORIZON__AUTH__OIDC__JWKS__CHECK_ON_STARTUP=True
+    """
+
+    refresh_interval_seconds: float = Field(
+        default=5 * 60,
+        gt=0,
+        description="How often JWKS is fetched from IdP, in seconds",
+    )
+    min_refresh_interval_seconds: float = Field(
+        default=10,
+        ge=0,
+        description=textwrap.dedent(
+            """
+            Minimal interval between fetching JWKS, in seconds.
+
+            Prevents calling IdP on every request with token signed by unknown key.
+            """,
+        ),
+    )
+    check_on_startup: bool = Field(
+        default=True,
+        description="If ``True``, and JWKS cannot be fetched during application start, abort application startup",
+    )
+
+
+class OIDCUserCacheSettings(BaseModel):
+    """Settings of users cache.
+
+    Each server process stores ``username`` -> user mapping, so most of requests
+    with access token do not query backend database.
+
+    .. note::
+
+        If user is disabled, or admin role is granted or revoked,
+        this will be detected only after cache item is expired.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__USER_CACHE__TTL_SECONDS=60
+        HORIZON__AUTH__USER_CACHE__MAX_SIZE=10000
+    """
+
+    ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="How long user is stored in cache, in seconds. ``0`` disables cache",
+    )
+    max_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Max number of users stored in cache of each server process. ``0`` disables cache",
+    )
+
+
+class OIDCSettings(BaseModel):
+    """Settings related to OIDC Identity Provider (IdP), like Keycloak.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__OIDC__ISSUER_URL=https://keycloak.domain.com/realms/myrealm
+        HORIZON__AUTH__OIDC__AUDIENCE=horizon
+        HORIZON__AUTH__OIDC__USERNAME_CLAIM=preferred_username
+    """
+
+    issuer_url: str = Field(
+        description=textwrap.dedent(
+            """
+            IdP issuer URL. Should be exactly the same as ``iss`` claim of access tokens.
+
+            JWKS URL is fetched from ``{issuer_url}/.well-known/openid-configuration``, if not set explicitly.
+            """,
+        ),
+    )
+    jwks_url: Optional[str] = Field(
+        default=None,
+        description="IdP JWKS URL. If set, OpenID configuration is not fetched",
+    )
+    audience: Optional[str] = Field(
+        default=None,
+        description=textwrap.dedent(
+            """
+            Expected ``aud`` claim of access tokens, e.g. client id of Horizon in IdP.
+
+            If not set, ``aud`` claim is not checked.
+            """,
+        ),
+    )
+    algorithms: List[str] = Field(
+        default=["RS256"],
+        description="Algorithms allowed for signing access tokens",
+    )
+    username_claim: str = Field(
+        default="preferred_username",
+        description="Access token claim containing username",
+    )
+    leeway_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Allowed clock skew between IdP and Horizon, used for checking ``exp`` and ``nbf`` claims",
+    )
+    timeout_seconds: float = Field(
+        default=10,
+        gt=0,
+        description="IdP request timeout, in seconds",
+    )
+    jwks: OIDCJWKSSettings = Field(
+        default_factory=OIDCJWKSSettings,
+        description="IdP public keys cache settings",
+    )
+
+    @validator("algorithms", pre=True)
+    def _parse_algorithms(cls, value: Any):  # noqa: N805
+        if not isinstance(value, str):
+            return value
+        if "[" in value:
+            return json.loads(value)
+        return [item.strip() for item in value.split(",")]
+
+
+class OIDCAuthProviderSettings(BaseModel):
+    """Settings for OIDCAuthProvider.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__PROVIDER=horizon.backend.providers.auth.oidc.OIDCAuthProvider
+        HORIZON__AUTH__OIDC__ISSUER_URL=https://keycloak.domain.com/realms/myrealm
+        HORIZON__AUTH__OIDC__AUDIENCE=horizon
+    """
+
+    oidc: OIDCSettings = Field(description="OIDC IdP related settings")
+    user_cache: OIDCUserCacheSettings = Field(
+        default_factory=OIDCUserCacheSettings,
+        description="Users cache settings",
+    )
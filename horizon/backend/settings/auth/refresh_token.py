@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+import textwrap
+
+from pydantic import BaseModel, Field
+
+
+class RefreshTokenSettings(BaseModel):
+    """Settings related to refresh tokens.
+
+    Refresh token is returned along with access token, and can be exchanged for a new pair of tokens
+    using ``grant_type=refresh_token``, without checking user credentials again.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__AUTH__REFRESH_TOKEN__ENABLED=True
+        HORIZON__AUTH__REFRESH_TOKEN__EXPIRE_SECONDS=604800  # 7 days
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Set to ``True`` to issue refresh tokens",
+    )
+    expire_seconds: int = Field(
+        default=7 * 24 * 60 * 60,
+        gt=0,
+        description=textwrap.dedent(
+            """
+            Refresh token expiration time, in seconds.
+
+            Each refresh token can be used only once, and a new refresh token has the same expiration time.
+            So this is the maximum time a client can renew access tokens without sending its credentials again.
+            """,
+        ),
+    )
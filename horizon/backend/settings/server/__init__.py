@@ -5,15 +5,20 @@ import textwrap
 
 from pydantic import BaseModel, Field
 
+from horizon.backend.settings.server.admission_control import AdmissionControlSettings
 from horizon.backend.settings.server.application_version import (
     ApplicationVersionSettings,
 )
 from horizon.backend.settings.server.cors import CORSSettings
+from horizon.backend.settings.server.history_writer import HistoryWriterSettings
+from horizon.backend.settings.server.idempotency import IdempotencySettings
 from horizon.backend.settings.server.log import LoggingSettings
 from horizon.backend.settings.server.monitoring import MonitoringSettings
+from horizon.backend.settings.server.namespace_stats import NamespaceStatsSettings
 from horizon.backend.settings.server.openapi import OpenAPISettings
 from horizon.backend.settings.server.request_id import RequestIDSettings
 from horizon.backend.settings.server.static_files import StaticFilesSettings
+from horizon.backend.settings.server.warmup import WarmupSettings
 
 
 class ServerSettings(BaseModel):
@@ -32,6 +37,11 @@ class ServerSettings(BaseModel):
         HORIZON__SERVER__OPENAPI__ENABLED=True
         HORIZON__SERVER__OPENAPI__SWAGGER__ENABLED=True
         HORIZON__SERVER__OPENAPI__REDOC__ENABLED=True
+        HORIZON__SERVER__HISTORY_WRITER__ENABLED=True
+        HORIZON__SERVER__IDEMPOTENCY__ENABLED=True
+        HORIZON__SERVER__ADMISSION_CONTROL__ENABLED=True
+        HORIZON__SERVER__WARMUP__DATABASE_CONNECTIONS=5
+        HORIZON__SERVER__NAMESPACE_STATS__FOLD_INTERVAL=10
     """
 
     debug: bool = Field(
@@ -71,3 +81,23 @@ class ServerSettings(BaseModel):
         default_factory=OpenAPISettings,
         description=":ref:`OpenAPI.json settings <backend-configuration-openapi>`",
     )
+    history_writer: HistoryWriterSettings = Field(
+        default_factory=HistoryWriterSettings,
+        description=":ref:`HWM history writer settings <backend-configuration-history-writer>`",
+    )
+    idempotency: IdempotencySettings = Field(
+        default_factory=IdempotencySettings,
+        description=":ref:`Idempotency-Key settings <backend-configuration-idempotency>`",
+    )
+    admission_control: AdmissionControlSettings = Field(
+        default_factory=AdmissionControlSettings,
+        description=":ref:`Admission control settings <backend-configuration-admission-control>`",
+    )
+    warmup: WarmupSettings = Field(
+        default_factory=WarmupSettings,
+        description=":ref:`Warm-up settings <backend-configuration-warmup>`",
+    )
+    namespace_stats: NamespaceStatsSettings = Field(
+        default_factory=NamespaceStatsSettings,
+        description=":ref:`Namespace statistics settings <backend-configuration-namespace-stats>`",
+    )
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+import textwrap
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class AdmissionControlGroupSettings(BaseModel):
+    """Limits for a group of routes."""
+
+    max_concurrent: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Max number of requests processed simultaneously. ``None`` means no limit",
+    )
+    max_concurrent_per_user: Optional[int] = Field(
+        default=10,
+        ge=1,
+        description="Max number of requests of the same user processed simultaneously. ``None`` means no limit",
+    )
+    max_queue_size: int = Field(
+        default=100,
+        ge=0,
+        description="Max number of requests waiting for a free slot. If queue is full, request is rejected immediately",
+    )
+    queue_timeout: float = Field(
+        default=5,
+        ge=0,
+        description="Max time (in seconds) request can wait in the queue before being rejected",
+    )
+
+
+class AdmissionControlSettings(BaseModel):
+    """Admission control settings.
+
+    Limits number of requests processed simultaneously, to prevent one user from exhausting
+    database connection pool. Limits are configured separately for each group of routes.
+
+    Request exceeding the limit waits in a queue. If queue is full or request waited for too long,
+    it is rejected with ``Retry-After`` header:
+
+    * ``429 Too Many Requests`` if user exceeded per-user limit,
+    * ``503 Service Unavailable`` if global limit is exceeded.
+
+    Users are distinguished by ``user_id`` (or ``sub``) claim of access token, or by API key,
+    without calling database. All access tokens of the same user share the same limit.
+    Anonymous requests and requests with unknown token format are distinguished by client address.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__SERVER__ADMISSION_CONTROL__ENABLED=True
+        HORIZON__SERVER__ADMISSION_CONTROL__HWM_READ__MAX_CONCURRENT=20
+        HORIZON__SERVER__ADMISSION_CONTROL__HWM_READ__MAX_CONCURRENT_PER_USER=5
+        HORIZON__SERVER__ADMISSION_CONTROL__HISTORY__QUEUE_TIMEOUT=1
+    """
+
+    enabled: bool = Field(default=False, description="Set to ``True`` to enable middleware")
+    retry_after: int = Field(
+        default=1,
+        ge=0,
+        description="Value of ``Retry-After`` response header (in seconds) for rejected requests",
+    )
+    auth: AdmissionControlGroupSettings = Field(
+        default_factory=AdmissionControlGroupSettings,
+        description="Limits for ``/v1/auth`` routes",
+    )
+    hwm_read: AdmissionControlGroupSettings = Field(
+        default_factory=AdmissionControlGroupSettings,
+        description=textwrap.dedent(
+            """
+            Limits for ``GET`` requests to ``/v1/hwm``, ``/v1/namespaces`` and ``/v1/users`` routes
+            """,
+        ),
+    )
+    hwm_write: AdmissionControlGroupSettings = Field(
+        default_factory=AdmissionControlGroupSettings,
+        description=textwrap.dedent(
+            """
+            Limits for ``POST``, ``PUT``, ``PATCH`` and ``DELETE`` requests
+            to ``/v1/hwm``, ``/v1/namespaces`` and ``/v1/users`` routes
+            """,
+        ),
+    )
+    history: AdmissionControlGroupSettings = Field(
+        default_factory=AdmissionControlGroupSettings,
+        description="Limits for ``/v1/hwm-history`` and ``/v1/namespace-history`` routes",
+    )
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from pydantic import BaseModel, Field
+
+
+class HistoryWriterSettings(BaseModel):
+    """HWM history writer settings.
+
+    By default, each HWM history record is inserted into the database as soon as it is created,
+    using a separate round trip.
+
+    If writer is enabled, history records created while handling a request are collected in memory,
+    and then saved right before the transaction is committed, using one multi-row ``INSERT`` per batch.
+    This reduces number of database round trips for requests changing a lot of HWMs at once,
+    e.g. bulk delete or copying HWMs to another namespace.
+
+    History records are always committed in the same transaction as HWM changes,
+    so if a record cannot be saved, the HWM change is rolled back as well.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__SERVER__HISTORY_WRITER__ENABLED=True
+        HORIZON__SERVER__HISTORY_WRITER__MAX_BATCH_SIZE=100
+    """
+
+    enabled: bool = Field(default=False, description="Set to ``True`` to enable batching of HWM history records")
+    max_batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Max number of records saved by one ``INSERT`` statement",
+    )
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+import textwrap
+
+from pydantic import BaseModel, Field
+
+
+class IdempotencySettings(BaseModel):
+    """Settings for ``Idempotency-Key`` header support.
+
+    If write request (``POST``, ``PATCH``, ``PUT``, ``DELETE``) contains ``Idempotency-Key`` header,
+    server stores request fingerprint and response in the database. Retries of the same request
+    with the same key return stored response without executing request again.
+
+    Keys are scoped to the authenticated user, so different users can use the same key independently.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__SERVER__IDEMPOTENCY__ENABLED=True
+        HORIZON__SERVER__IDEMPOTENCY__TTL=86400
+        HORIZON__SERVER__IDEMPOTENCY__WAIT_TIMEOUT=10
+    """
+
+    enabled: bool = Field(default=True, description="Set to ``True`` to enable ``Idempotency-Key`` header support")
+    ttl: int = Field(
+        default=24 * 60 * 60,
+        gt=0,
+        description="Time (in seconds) to keep stored responses. After this time the key can be reused",
+    )
+    wait_timeout: float = Field(
+        default=10,
+        ge=0,
+        description=textwrap.dedent(
+            """
+            If request with the same key is still being processed, wait up to this time (in seconds)
+            for its response. After that, ``409 Conflict`` is returned.
+            """,
+        ),
+    )
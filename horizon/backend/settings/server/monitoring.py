@@ -36,6 +36,18 @@ class MonitoringSettings(BaseModel):
         default_factory=set,
         description="Custom paths should be skipped from metrics, like ``/some/endpoint``",
     )
+    event_loop_lag_interval: float = Field(
+        default=1,
+        ge=0,
+        description=textwrap.dedent(
+            """
+            How often (in seconds) to measure event loop lag, reported as ``horizon_event_loop_lag_seconds`` metric.
+            High lag means that some requests block event loop, slowing down all other requests.
+
+            ``0`` means that lag is not measured.
+            """,
+        ),
+    )
     skip_methods: Set[str] = Field(
         default={"OPTIONS"},
         description="HTTP methods which should be excluded from metrics",
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+import textwrap
+
+from pydantic import BaseModel, Field
+
+
+class NamespaceStatsSettings(BaseModel):
+    """Namespace statistics settings.
+
+    Each transaction changing HWMs or HWM history does not update ``namespace_stats`` row directly,
+    but inserts a small delta record instead. So concurrent writers to the same namespace
+    do not wait for each other on a row lock.
+
+    Deltas are added to statistics on read, and periodically folded into ``namespace_stats`` rows
+    by a background task of the backend. If multiple backend instances are running, only one of them
+    folds deltas at a time.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__SERVER__NAMESPACE_STATS__FOLD_ENABLED=True
+        HORIZON__SERVER__NAMESPACE_STATS__FOLD_INTERVAL=10
+    """
+
+    fold_enabled: bool = Field(
+        default=True,
+        description=textwrap.dedent(
+            """
+            Set to ``False`` to disable folding deltas by this backend instance.
+
+            At least one instance should fold deltas, otherwise reading statistics becomes slower over time.
+            """,
+        ),
+    )
+    fold_interval: float = Field(
+        default=10,
+        gt=0,
+        description="Interval (in seconds) between folding deltas into ``namespace_stats`` rows",
+    )
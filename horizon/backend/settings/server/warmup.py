@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+import textwrap
+
+from pydantic import BaseModel, Field
+
+
+class WarmupSettings(BaseModel):
+    """Application warm-up settings.
+
+    During application startup, before accepting any requests, server opens database connections
+    and executes a set of representative queries. This moves connection establishment
+    and SQL statement compilation out of first user requests.
+
+    ``GET /monitoring/ready`` endpoint returns ``200 OK`` only after warm-up is finished,
+    so it can be used as Kubernetes readiness probe.
+
+    Examples
+    --------
+
+    .. code-block:: bash
+
+        HORIZON__SERVER__WARMUP__ENABLED=True
+        HORIZON__SERVER__WARMUP__DATABASE_CONNECTIONS=5
+        HORIZON__SERVER__WARMUP__QUERIES=True
+    """
+
+    enabled: bool = Field(default=True, description="Set to ``False`` to disable warm-up")
+    database_connections: int = Field(
+        default=5,
+        ge=0,
+        description=textwrap.dedent(
+            """
+            Number of database connections opened in parallel during startup.
+
+            Should not be greater than ``pool_size`` option of :ref:`database settings <backend-configuration-database>`
+            (``5`` by default), otherwise extra connections will be closed right after warm-up.
+            """,
+        ),
+    )
+    queries: bool = Field(
+        default=True,
+        description="If ``True``, execute representative queries to fill SQLAlchemy compiled statements cache",
+    )
@@ -1,22 +1,39 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
 
-from authlib.jose import JsonWebToken
-from authlib.jose.errors import ExpiredTokenError, JoseError
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Union
+
+from authlib.jose import JsonWebKey, JsonWebToken
+from authlib.jose.errors import DecodeError, ExpiredTokenError, JoseError
 
 from horizon.commons.exceptions import AuthorizationError
 
+if TYPE_CHECKING:
+    from authlib.jose import Key
+
+    from horizon.backend.settings.auth.jwt import JWTSettings
+
+# algorithm prefix -> key type
+_KEY_TYPES = {
+    "RS": "RSA",
+    "PS": "RSA",
+    "ES": "EC",
+    "EdDSA": "OKP",
+}
 
-def sign_jwt(payload: dict, secret_key: str, security_algorithm: str) -> str:
+
+def sign_jwt(payload: dict, secret_key: Union[str, Key], security_algorithm: str, header: dict | None = None) -> str:
     jwt = JsonWebToken([security_algorithm])
     return jwt.encode(
-        header={"alg": security_algorithm},
+        header={**(header or {}), "alg": security_algorithm},
         payload=payload,
         key=secret_key,
     ).decode("utf-8")
 
 
-def decode_jwt(token: str, secret_key: str, security_algorithm: str) -> dict:
+def decode_jwt(token: str, secret_key: Union[str, Callable[[dict, dict], Key]], security_algorithm: str) -> dict:
     try:
         result = JsonWebToken([security_algorithm]).decode(token, key=secret_key)
         if "exp" not in result:
@@ -30,3 +47,83 @@ def decode_jwt(token: str, secret_key: str, security_algorithm: str) -> dict:
         raise AuthorizationError(msg) from e
     else:
         return result
+
+
+class JWTKeys:
+    """Keys used for signing and validating access tokens.
+
+    For ``HS*`` algorithms the same ``secret_key`` is used for both.
+
+    For asymmetric algorithms (``RS*``, ``PS*``, ``ES*``, ``EdDSA``) tokens are signed using the first private key,
+    and validated using public part of any key, selected by ``kid`` token header.
+    Public keys are published as JWKS, so other services can validate tokens without calling Horizon.
+    """
+
+    def __init__(self, security_algorithm: str, secret_key: str, private_keys: List[Key], jwks_max_age: int) -> None:
+        self.security_algorithm = security_algorithm
+        self.jwks_max_age = jwks_max_age
+        self._secret_key = secret_key
+        self._signing_key = private_keys[0] if private_keys else None
+        # kid -> public key
+        self._public_keys: Dict[str, Key] = {
+            key.thumbprint(): JsonWebKey.import_key(key.as_dict(is_private=False)) for key in private_keys
+        }
+
+    @classmethod
+    def from_settings(cls, settings: JWTSettings) -> JWTKeys:
+        private_keys = [_load_key(item.get_secret_value()) for item in settings.private_keys]
+        expected_key_type = _get_key_type(settings.security_algorithm)
+        for key in private_keys:
+            if key.kty != expected_key_type:
+                msg = (
+                    f"Algorithm {settings.security_algorithm!r} requires {expected_key_type} key, "
+                    f"got {key.kty} key with kid={key.thumbprint()!r}"
+                )
+                raise ValueError(msg)
+
+        return cls(
+            security_algorithm=settings.security_algorithm,
+            secret_key=settings.secret_key.get_secret_value(),
+            private_keys=private_keys,
+            jwks_max_age=settings.jwks_max_age_seconds,
+        )
+
+    def sign(self, payload: dict) -> str:
+        if self._signing_key is None:
+            return sign_jwt(payload, self._secret_key, self.security_algorithm)
+
+        header = {"kid": self._signing_key.thumbprint(), "typ": "JWT"}
+        return sign_jwt(payload, self._signing_key, self.security_algorithm, header=header)
+
+    def decode(self, token: str) -> dict:
+        if self._signing_key is None:
+            return decode_jwt(token, self._secret_key, self.security_algorithm)
+        return decode_jwt(token, self._find_public_key, self.security_algorithm)
+
+    def get_jwks(self) -> Dict[str, Any]:
+        """Return public keys in JWKS format. Empty for ``HS*`` algorithms"""
+        keys = []
+        for kid, key in self._public_keys.items():
+            keys.append({**key.as_dict(), "kid": kid, "use": "sig", "alg": self.security_algorithm})
+        return {"keys": keys}
+
+    def _find_public_key(self, header: dict, payload: dict) -> Key:
+        key = self._public_keys.get(header.get("kid", ""))
+        if key is None:
+            msg = "Unknown key id"
+            raise DecodeError(msg)
+        return key
+
+
+def _get_key_type(security_algorithm: str) -> str:
+    for prefix, key_type in _KEY_TYPES.items():
+        if security_algorithm.startswith(prefix):
+            return key_type
+    return "oct"
+
+
+def _load_key(value: str) -> Key:
+    # key can be passed as PEM content, or as path to PEM file
+    if not value.lstrip().startswith("-----BEGIN"):
+        value = Path(value).read_text()
+    return JsonWebKey.import_key(value)
@@ -0,0 +1,952 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from contextlib import suppress
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
+from uuid import uuid4
+
+from pydantic import BaseModel, Field, PrivateAttr, root_validator, validator
+from typing_extensions import Literal
+
+from horizon import __version__ as horizon_version
+from horizon.client.base import (
+    TOKEN_EXPIRATION_LEEWAY,
+    WRITE_METHODS,
+    BaseClient,
+    RetryConfig,
+    TimeoutConfig,
+    get_next_page_and_items,
+)
+from horizon.commons.schemas import PingResponse, v1
+
+if TYPE_CHECKING:
+    import httpx
+    from authlib.integrations.httpx_client import AsyncOAuth2Client
+
+    from horizon.commons.schemas.v1 import (
+        HWMBulkCopyRequestV1,
+        HWMCreateRequestV1,
+        HWMHistoryPaginateQueryV1,
+        HWMHistoryResponseV1,
+        HWMListResponseV1,
+        HWMPaginateQueryV1,
+        HWMResponseV1,
+        HWMSearchQueryV1,
+        HWMUpdateRequestV1,
+        NamespaceCreateRequestV1,
+        NamespaceHistoryPaginateQueryV1,
+        NamespaceHistoryResponseV1,
+        NamespacePaginateQueryV1,
+        NamespaceResponseV1,
+        NamespaceStatsListResponseV1,
+        NamespaceUpdateRequestV1,
+        PageResponseV1,
+        PermissionsResponseV1,
+        PermissionsUpdateRequestV1,
+        UserResponseV1,
+        UserResponseV1WithAdmin,
+    )
+
+logger = logging.getLogger(__name__)
+
+ResponseSchema = TypeVar("ResponseSchema", bound=BaseModel)
+QuerySchema = TypeVar("QuerySchema", bound=BaseModel)
+
+# same as urllib3.util.Retry.DEFAULT_BACKOFF_MAX
+MAX_BACKOFF = 120
+
+
+class ConnectionConfig(BaseModel):
+    """
+    Configuration for connection pool used by async client.
+    `httpx resource limits documentation <https://www.python-httpx.org/advanced/resource-limits/>`_.
+
+    Parameters
+    ----------
+    max_connections : int, default: ``100``
+        Maximum number of connections opened simultaneously.
+        Requests exceeding this limit wait for a free connection.
+
+    max_keepalive_connections : int, default: ``20``
+        Maximum number of idle connections kept in the pool.
+
+    keepalive_expiry : float, default: ``5``
+        Time (in seconds) after which idle connection is closed.
+
+    http2 : bool, default: ``False``
+        If ``True``, use HTTP/2 if server supports it. Multiple requests are sent over the same connection.
+
+        .. note::
+
+            Requires ``h2`` package, which can be installed with ``pip install httpx[http2]``
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5
+    http2: bool = False
+
+
+def _get_backoff(retry: RetryConfig, attempt: int) -> float:
+    # same formula as urllib3.util.Retry.get_backoff_time
+    if attempt <= 1:
+        return 0
+    backoff = retry.backoff_factor * (2 ** (attempt - 1))
+    if retry.backoff_jitter:
+        backoff += random.random() * retry.backoff_jitter  # noqa: S311
+    return min(MAX_BACKOFF, backoff)
+
+
+def _create_retry_transport(connection: ConnectionConfig, retry: RetryConfig) -> httpx.AsyncBaseTransport:
+    import httpx
+
+    class RetryTransport(httpx.AsyncBaseTransport):
+        """Retry requests failed with network error or specific status code, like ``urllib3.util.Retry``"""
+
+        def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+            self._transport = transport
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    response = await self._transport.handle_async_request(request)
+                except httpx.TransportError:
+                    if attempt > retry.total:
+                        raise
+                else:
+                    if response.status_code not in retry.status_forcelist or attempt > retry.total:
+                        return response
+                    await response.aclose()
+
+                await asyncio.sleep(_get_backoff(retry, attempt))
+
+        async def aclose(self) -> None:
+            await self._transport.aclose()
+
+    transport = httpx.AsyncHTTPTransport(
+        http2=connection.http2,
+        limits=httpx.Limits(
+            max_connections=connection.max_connections,
+            max_keepalive_connections=connection.max_keepalive_connections,
+            keepalive_expiry=connection.keepalive_expiry,
+        ),
+    )
+    return RetryTransport(transport)
+
+
+class HorizonClientAsync(BaseClient[Any]):
+    """Async Horizon client implementation, based on ``authlib`` and ``httpx``.
+
+    Client can be shared between coroutines, requests are sent over a connection pool.
+    If access token is expired, it is fetched only once, even if there are a lot of concurrent requests.
+
+    Parameters
+    ----------
+
+    base_url : str
+        URL of Horizon API, e.g. ``https://some.domain.com/api``
+
+    auth : :obj:`BaseAuth <horizon.client.auth.base.BaseAuth>`
+        Authentication class
+
+    retry : :obj:`RetryConfig <horizon.client.base.RetryConfig>`
+        Configuration for request retries.
+
+    timeout : :obj:`TimeoutConfig <horizon.client.base.TimeoutConfig>`
+        Configuration for request timeouts.
+
+    connection : :obj:`ConnectionConfig <horizon.client.asyncio.ConnectionConfig>`
+        Configuration for connection pool.
+
+    token_refresh_before : float, default: ``300``
+        If access token expires in less than this number of seconds, new token is fetched in background task,
+        and requests are sent using the current token in the meantime. ``0`` means that new token is fetched
+        only after current one is expired, blocking the request.
+
+    session : :obj:`authlib.integrations.httpx_client.AsyncOAuth2Client`
+        Custom session object. Inherited from :obj:`httpx.AsyncClient`, so you can pass custom
+        session options.
+
+        .. note::
+
+            ``retry``, ``timeout`` and ``connection`` options are applied only to session created by client.
+
+    Examples
+    --------
+
+    Using default parameters:
+
+    >>> from horizon.client.auth import LoginPassword
+    >>> from horizon.client.asyncio import HorizonClientAsync
+    >>> client = HorizonClientAsync(
+    ...     base_url="https://some.domain.com/api",
+    ...     auth=LoginPassword(login="me", password="12345"),
+    ... )
+
+    Customize retry, timeout and connection pool:
+
+    >>> from horizon.client.auth import LoginPassword
+    >>> from horizon.client.asyncio import ConnectionConfig, HorizonClientAsync, RetryConfig, TimeoutConfig
+    >>> client = HorizonClientAsync(
+    ...     base_url="https://some.domain.com/api",
+    ...     auth=LoginPassword(login="me", password="12345"),
+    ...     retry=RetryConfig(total=2, backoff_factor=10, status_forcelist=[500, 503]),
+    ...     timeout=TimeoutConfig(request_timeout=3.5),
+    ...     connection=ConnectionConfig(max_connections=200, http2=True),
+    ... )
+    """
+
+    retry: RetryConfig = Field(default_factory=RetryConfig)
+    timeout: TimeoutConfig = Field(default_factory=TimeoutConfig)
+    connection: ConnectionConfig = Field(default_factory=ConnectionConfig)
+
+    _authorize_lock: Optional[asyncio.Lock] = PrivateAttr(default=None)
+    _refresh_task: Optional[asyncio.Future] = PrivateAttr(default=None)
+
+    @classmethod
+    def session_class(cls) -> type[AsyncOAuth2Client]:
+        # authlib and httpx are imported only then client is created
+        from authlib.integrations.httpx_client import AsyncOAuth2Client
+
+        return AsyncOAuth2Client
+
+    async def authorize(self) -> None:
+        """Fetch and set access token (if required).
+
+        If ``auth`` has token cache, token is taken from it, and fetched only if it is missing or expired.
+
+        Raises
+        ------
+        :obj:`horizon.commons.exceptions.AuthorizationError`
+            Authorization failed
+
+        Examples
+        --------
+
+        >>> await client.authorize()
+        """
+
+        session: AsyncOAuth2Client = self.session  # type: ignore[assignment]
+        token_kwargs = self.auth.fetch_token_kwargs(self.base_url)
+        if token_kwargs:
+            session.token = await self._fetch_token(token_kwargs)
+
+        # token will not be verified until we call any endpoint
+        # do not call ``self.whoami`` here to avoid recursion
+        response = await session.request("GET", f"{self.base_url}/v1/users/me")
+        self._handle_response(response, v1.UserResponseV1)
+
+    async def close(self) -> None:
+        """Close session and all its connections.
+
+        Examples
+        --------
+
+        >>> await client.close()
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._refresh_task
+
+        session: AsyncOAuth2Client = self.session  # type: ignore[assignment]
+        await session.aclose()
+
+    async def __aenter__(self):
+        """Enter session as async context manager. Similar to :obj:`httpx.AsyncClient` behavior.
+
+        Exiting context manager closes opened session.
+
+        Examples
+        --------
+
+        >>> async with client:
+        ...    ...
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def ping(self) -> PingResponse:
+        """Ping Horizon server.
+
+        Examples
+        --------
+
+        >>> await client.ping()
+        PingResponse(status="ok")
+        """
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/monitoring/ping",
+            response_class=PingResponse,
+        )
+
+    async def whoami(self) -> Union[UserResponseV1WithAdmin, UserResponseV1]:
+        """Get current user info.
+        Same as :obj:`HorizonClientSync.whoami <horizon.client.sync.HorizonClientSync.whoami>`.
+
+        Examples
+        --------
+
+        >>> await client.whoami()
+        UserResponseV1(
+            id=1,
+            username="me",
+        )
+        """
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/users/me",
+            response_class=Union[v1.UserResponseV1WithAdmin, v1.UserResponseV1],  # type: ignore[arg-type]
+        )
+
+    async def paginate_namespaces(
+        self,
+        query: NamespacePaginateQueryV1 | None = None,
+    ) -> PageResponseV1[NamespaceResponseV1]:
+        """Get page with namespaces.
+        Same as :obj:`HorizonClientSync.paginate_namespaces <horizon.client.sync.HorizonClientSync.paginate_namespaces>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import NamespacePaginateQueryV1
+        >>> await client.paginate_namespaces(query=NamespacePaginateQueryV1(page=2, page_size=20))
+        PageResponseV1[NamespaceResponseV1](
+            meta=PageMetaResponseV1(...),
+            items=[NamespaceResponseV1(...), ...],
+        )
+        """  # noqa: E501
+        query = query or v1.NamespacePaginateQueryV1()
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/namespaces/",
+            response_class=v1.PageResponseV1[v1.NamespaceResponseV1],
+            params=query.dict(),
+        )
+
+    async def get_namespace(self, namespace_id: int, with_stats: bool = False) -> NamespaceResponseV1:  # noqa: FBT001, FBT002
+        """Get namespace by id.
+        Same as :obj:`HorizonClientSync.get_namespace <horizon.client.sync.HorizonClientSync.get_namespace>`.
+
+        Examples
+        --------
+
+        >>> await client.get_namespace(123)
+        NamespaceResponseV1(
+            id=123,
+            name="my_namespace",
+            description="",
+        )
+        """
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/namespaces/{namespace_id}",
+            response_class=v1.NamespaceResponseV1,
+            params={"with_stats": True} if with_stats else None,
+        )
+
+    async def get_namespaces_stats(self, namespace_ids: List[int]) -> NamespaceStatsListResponseV1:
+        """Get statistics for multiple namespaces.
+        Same as :obj:`HorizonClientSync.get_namespaces_stats <horizon.client.sync.HorizonClientSync.get_namespaces_stats>`.
+
+        Examples
+        --------
+
+        >>> await client.get_namespaces_stats([123, 234])
+        NamespaceStatsListResponseV1(items=[NamespaceStatsResponseV1(...), ...])
+        """  # noqa: E501
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/namespaces/stats",
+            response_class=v1.NamespaceStatsListResponseV1,
+            params={"namespace_ids": namespace_ids},
+        )
+
+    async def create_namespace(self, data: NamespaceCreateRequestV1) -> NamespaceResponseV1:
+        """Create new namespace.
+        Same as :obj:`HorizonClientSync.create_namespace <horizon.client.sync.HorizonClientSync.create_namespace>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import NamespaceCreateRequestV1
+        >>> await client.create_namespace(NamespaceCreateRequestV1(name="my_namespace"))
+        NamespaceResponseV1(
+            id=123,
+            name="my_namespace",
+            description="",
+        )
+        """
+        return await self._request(  # type: ignore[return-value]
+            "POST",
+            f"{self.base_url}/v1/namespaces/",
+            json=data.dict(),
+            response_class=v1.NamespaceResponseV1,
+        )
+
+    async def update_namespace(self, namespace_id: int, changes: NamespaceUpdateRequestV1) -> NamespaceResponseV1:
+        """Update existing namespace.
+        Same as :obj:`HorizonClientSync.update_namespace <horizon.client.sync.HorizonClientSync.update_namespace>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import NamespaceUpdateRequestV1
+        >>> await client.update_namespace(123, NamespaceUpdateRequestV1(name="new_namespace_name"))
+        NamespaceResponseV1(
+            id=123,
+            name="new_namespace_name",
+            description="",
+        )
+        """
+        return await self._request(  # type: ignore[return-value]
+            "PATCH",
+            f"{self.base_url}/v1/namespaces/{namespace_id}",
+            json=changes.dict(exclude_unset=True),
+            response_class=v1.NamespaceResponseV1,
+        )
+
+    async def delete_namespace(self, namespace_id: int) -> None:
+        """Delete namespace.
+        Same as :obj:`HorizonClientSync.delete_namespace <horizon.client.sync.HorizonClientSync.delete_namespace>`.
+
+        Examples
+        --------
+
+        >>> await client.delete_namespace(123)
+        """
+        await self._request(
+            "DELETE",
+            f"{self.base_url}/v1/namespaces/{namespace_id}",
+        )
+
+    async def paginate_namespace_history(
+        self,
+        query: NamespaceHistoryPaginateQueryV1,
+    ) -> PageResponseV1[NamespaceHistoryResponseV1]:
+        """Get page with namespace changes history.
+        Same as :obj:`HorizonClientSync.paginate_namespace_history <horizon.client.sync.HorizonClientSync.paginate_namespace_history>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import NamespaceHistoryPaginateQueryV1
+        >>> await client.paginate_namespace_history(query=NamespaceHistoryPaginateQueryV1(namespace_id=123))
+        PageResponseV1[NamespaceHistoryResponseV1](
+            meta=PageMetaResponseV1(...),
+            items=[NamespaceHistoryResponseV1(...), ...],
+        )
+        """  # noqa: E501
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/namespace-history/",
+            response_class=v1.PageResponseV1[v1.NamespaceHistoryResponseV1],
+            params=query.dict(exclude_unset=True),
+        )
+
+    @overload
+    async def paginate_hwm(
+        self,
+        query: HWMPaginateQueryV1,
+        *,
+        raw: Literal[False] = False,
+    ) -> PageResponseV1[HWMResponseV1]: ...
+
+    @overload
+    async def paginate_hwm(self, query: HWMPaginateQueryV1, *, raw: Literal[True]) -> Dict[str, Any]: ...
+
+    async def paginate_hwm(
+        self,
+        query: HWMPaginateQueryV1,
+        *,
+        raw: bool = False,
+    ) -> PageResponseV1[HWMResponseV1] | Dict[str, Any]:
+        """Get page with HWMs.
+        Same as :obj:`HorizonClientSync.paginate_hwm <horizon.client.sync.HorizonClientSync.paginate_hwm>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMPaginateQueryV1
+        >>> await client.paginate_hwm(query=HWMPaginateQueryV1(namespace_id=123))
+        PageResponseV1[HWMResponseV1](
+            meta=PageMetaResponseV1(...),
+            items=[HWMResponseV1(...), ...],
+        )
+        """
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/hwm/",
+            response_class=v1.PageResponseV1[v1.HWMResponseV1],
+            params=query.dict(exclude_unset=True),
+            raw=raw,
+        )
+
+    async def search_hwm(self, query: HWMSearchQueryV1) -> PageResponseV1[HWMResponseV1]:
+        """Search HWMs across all namespaces.
+        Same as :obj:`HorizonClientSync.search_hwm <horizon.client.sync.HorizonClientSync.search_hwm>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMSearchQueryV1
+        >>> await client.search_hwm(query=HWMSearchQueryV1(name_contains="orders"))
+        PageResponseV1[HWMResponseV1](
+            meta=PageMetaResponseV1(...),
+            items=[HWMResponseV1(...), ...],
+        )
+        """
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/hwm/search",
+            response_class=v1.PageResponseV1[v1.HWMResponseV1],
+            params=query.dict(exclude_unset=True),
+        )
+
+    async def get_hwm(self, hwm_id: int) -> HWMResponseV1:
+        """Get HWM by id.
+        Same as :obj:`HorizonClientSync.get_hwm <horizon.client.sync.HorizonClientSync.get_hwm>`.
+
+        Examples
+        --------
+
+        >>> await client.get_hwm(234)
+        HWMResponseV1(
+            id=234,
+            namespace_id=123,
+            name="my_hwm",
+            type="column_int",
+            value=123,
+            ...
+        )
+        """
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/hwm/{hwm_id}",
+            response_class=v1.HWMResponseV1,
+        )
+
+    async def create_hwm(self, data: HWMCreateRequestV1) -> HWMResponseV1:
+        """Create new HWM.
+        Same as :obj:`HorizonClientSync.create_hwm <horizon.client.sync.HorizonClientSync.create_hwm>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMCreateRequestV1
+        >>> hwm = HWMCreateRequestV1(namespace_id=123, name="my_hwm", type="column_int", value=123)
+        >>> await client.create_hwm(hwm)
+        HWMResponseV1(
+            id=234,
+            namespace_id=123,
+            name="my_hwm",
+            type="column_int",
+            value=123,
+            ...
+        )
+        """
+        return await self._request(  # type: ignore[return-value]
+            "POST",
+            f"{self.base_url}/v1/hwm/",
+            json=data.dict(exclude_unset=True),
+            response_class=v1.HWMResponseV1,
+        )
+
+    async def update_hwm(self, hwm_id: int, changes: HWMUpdateRequestV1) -> HWMResponseV1:
+        """Update existing HWM.
+        Same as :obj:`HorizonClientSync.update_hwm <horizon.client.sync.HorizonClientSync.update_hwm>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMUpdateRequestV1
+        >>> await client.update_hwm(234, HWMUpdateRequestV1(value=234))
+        HWMResponseV1(
+            id=234,
+            namespace_id=123,
+            name="my_hwm",
+            type="column_int",
+            value=234,
+            ...
+        )
+        """
+        return await self._request(  # type: ignore[return-value]
+            "PATCH",
+            f"{self.base_url}/v1/hwm/{hwm_id}",
+            json=changes.dict(exclude_unset=True),
+            response_class=v1.HWMResponseV1,
+        )
+
+    async def delete_hwm(self, hwm_id: int) -> None:
+        """Delete HWM.
+        Same as :obj:`HorizonClientSync.delete_hwm <horizon.client.sync.HorizonClientSync.delete_hwm>`.
+
+        Examples
+        --------
+
+        >>> await client.delete_hwm(234)
+        """
+        await self._request(
+            "DELETE",
+            f"{self.base_url}/v1/hwm/{hwm_id}",
+        )
+
+    async def bulk_copy_hwm(self, data: HWMBulkCopyRequestV1) -> HWMListResponseV1:
+        """Copy HWMs from one namespace to another.
+        Same as :obj:`HorizonClientSync.bulk_copy_hwm <horizon.client.sync.HorizonClientSync.bulk_copy_hwm>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMBulkCopyRequestV1
+        >>> data = HWMBulkCopyRequestV1(source_namespace_id=123, target_namespace_id=456, hwm_ids=[1, 2, 3])
+        >>> await client.bulk_copy_hwm(data)
+        HWMListResponseV1(items=[HWMResponseV1(...), ...])
+        """
+        return await self._request(  # type: ignore[return-value]
+            "POST",
+            f"{self.base_url}/v1/hwm/copy",
+            json=data.dict(),
+            response_class=v1.HWMListResponseV1,
+        )
+
+    async def bulk_delete_hwm(self, namespace_id: int, hwm_ids: List[int]) -> None:
+        """Bulk delete HWMs.
+        Same as :obj:`HorizonClientSync.bulk_delete_hwm <horizon.client.sync.HorizonClientSync.bulk_delete_hwm>`.
+
+        Examples
+        --------
+
+        >>> await client.bulk_delete_hwm(namespace_id=123, hwm_ids=[234, 345, 456])
+        """
+        data = v1.HWMBulkDeleteRequestV1(namespace_id=namespace_id, hwm_ids=hwm_ids)
+        await self._request(
+            "DELETE",
+            f"{self.base_url}/v1/hwm/",
+            json=data.dict(),
+        )
+
+    async def get_namespace_permissions(self, namespace_id: int) -> PermissionsResponseV1:
+        """Get namespace permissions.
+        Same as :obj:`HorizonClientSync.get_namespace_permissions <horizon.client.sync.HorizonClientSync.get_namespace_permissions>`.
+
+        Examples
+        --------
+
+        >>> await client.get_namespace_permissions(123)
+        PermissionsResponseV1(permissions=[PermissionResponseItemV1(username="me", role="OWNER"), ...])
+        """  # noqa: E501
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/namespaces/{namespace_id}/permissions",
+            response_class=v1.PermissionsResponseV1,
+        )
+
+    async def update_namespace_permissions(
+        self,
+        namespace_id: int,
+        changes: PermissionsUpdateRequestV1,
+    ) -> PermissionsResponseV1:
+        """Update namespace permissions.
+        Same as :obj:`HorizonClientSync.update_namespace_permissions <horizon.client.sync.HorizonClientSync.update_namespace_permissions>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import PermissionsUpdateRequestV1, PermissionUpdateRequestItemV1
+        >>> changes = PermissionsUpdateRequestV1(
+        ...     permissions=[PermissionUpdateRequestItemV1(username="someone", role="DEVELOPER")],
+        ... )
+        >>> await client.update_namespace_permissions(123, changes)
+        PermissionsResponseV1(permissions=[PermissionResponseItemV1(username="someone", role="DEVELOPER"), ...])
+        """  # noqa: E501
+        return await self._request(  # type: ignore[return-value]
+            "PATCH",
+            f"{self.base_url}/v1/namespaces/{namespace_id}/permissions",
+            json=changes.dict(exclude_unset=True),
+            response_class=v1.PermissionsResponseV1,
+        )
+
+    @overload
+    async def paginate_hwm_history(
+        self,
+        query: HWMHistoryPaginateQueryV1,
+        *,
+        raw: Literal[False] = False,
+    ) -> PageResponseV1[HWMHistoryResponseV1]: ...
+
+    @overload
+    async def paginate_hwm_history(self, query: HWMHistoryPaginateQueryV1, *, raw: Literal[True]) -> Dict[str, Any]: ...
+
+    async def paginate_hwm_history(
+        self,
+        query: HWMHistoryPaginateQueryV1,
+        *,
+        raw: bool = False,
+    ) -> PageResponseV1[HWMHistoryResponseV1] | Dict[str, Any]:
+        """Get page with HWM changes history.
+        Same as :obj:`HorizonClientSync.paginate_hwm_history <horizon.client.sync.HorizonClientSync.paginate_hwm_history>`.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMHistoryPaginateQueryV1
+        >>> await client.paginate_hwm_history(query=HWMHistoryPaginateQueryV1(hwm_id=234))
+        PageResponseV1[HWMHistoryResponseV1](
+            meta=PageMetaResponseV1(...),
+            items=[HWMHistoryResponseV1(...), ...],
+        )
+        """  # noqa: E501
+        return await self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/hwm-history/",
+            response_class=v1.PageResponseV1[v1.HWMHistoryResponseV1],
+            params=query.dict(exclude_unset=True),
+            raw=raw,
+        )
+
+    def iter_namespaces(self, query: NamespacePaginateQueryV1 | None = None) -> AsyncIterator[NamespaceResponseV1]:
+        """Iterate over all namespaces matching the query, page by page.
+        Same as :obj:`HorizonClientSync.iter_namespaces <horizon.client.sync.HorizonClientSync.iter_namespaces>`,
+        but next page is fetched in a background task.
+
+        Examples
+        --------
+
+        >>> async for namespace in client.iter_namespaces():
+        ...     print(namespace.name)
+        my_namespace
+        other_namespace
+        """
+        return self._iter_pages(self.paginate_namespaces, query or v1.NamespacePaginateQueryV1())
+
+    @overload
+    def iter_hwm(self, query: HWMPaginateQueryV1, *, raw: Literal[False] = False) -> AsyncIterator[HWMResponseV1]: ...
+
+    @overload
+    def iter_hwm(self, query: HWMPaginateQueryV1, *, raw: Literal[True]) -> AsyncIterator[Dict[str, Any]]: ...
+
+    def iter_hwm(
+        self,
+        query: HWMPaginateQueryV1,
+        *,
+        raw: bool = False,
+    ) -> AsyncIterator[HWMResponseV1] | AsyncIterator[Dict[str, Any]]:
+        """Iterate over all HWMs matching the query, page by page.
+        Same as :obj:`HorizonClientSync.iter_hwm <horizon.client.sync.HorizonClientSync.iter_hwm>`,
+        but next page is fetched in a background task.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMPaginateQueryV1
+        >>> async for hwm in client.iter_hwm(HWMPaginateQueryV1(namespace_id=123)):
+        ...     print(hwm.name, hwm.value)
+        my_hwm 123
+        other_hwm 234
+        """
+        return self._iter_pages(partial(self.paginate_hwm, raw=raw), query)
+
+    @overload
+    def iter_hwm_history(
+        self, query: HWMHistoryPaginateQueryV1, *, raw: Literal[False] = False
+    ) -> AsyncIterator[HWMHistoryResponseV1]: ...
+
+    @overload
+    def iter_hwm_history(
+        self, query: HWMHistoryPaginateQueryV1, *, raw: Literal[True]
+    ) -> AsyncIterator[Dict[str, Any]]: ...
+
+    def iter_hwm_history(
+        self,
+        query: HWMHistoryPaginateQueryV1,
+        *,
+        raw: bool = False,
+    ) -> AsyncIterator[HWMHistoryResponseV1] | AsyncIterator[Dict[str, Any]]:
+        """Iterate over all HWM history items matching the query, page by page.
+        Same as :obj:`HorizonClientSync.iter_hwm_history <horizon.client.sync.HorizonClientSync.iter_hwm_history>`,
+        but next page is fetched in a background task.
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMHistoryPaginateQueryV1
+        >>> async for item in client.iter_hwm_history(HWMHistoryPaginateQueryV1(hwm_id=234)):
+        ...     print(item.action, item.value)
+        Updated 234
+        Created 123
+        """
+        return self._iter_pages(partial(self.paginate_hwm_history, raw=raw), query)
+
+    # called before field validators, because session should be created with connection pool options
+    @root_validator(pre=True)
+    def _create_session(cls, values):  # noqa: N805
+        if values.get("session") is not None:
+            return values
+
+        import httpx
+
+        retry = cls._parse_config(RetryConfig, values.get("retry"))
+        timeout = cls._parse_config(TimeoutConfig, values.get("timeout"))
+        connection = cls._parse_config(ConnectionConfig, values.get("connection"))
+
+        session_class = cls.session_class()
+        values["session"] = session_class(
+            transport=_create_retry_transport(connection, retry),
+            # requests waiting for a free connection should not fail
+            timeout=httpx.Timeout(timeout.request_timeout, connect=timeout.connection_timeout, pool=None),
+        )
+        return values
+
+    @validator("session", always=True)
+    def _set_client_info(cls, session: AsyncOAuth2Client):  # noqa: N805
+        session.headers["X-Client-Name"] = "python-horizon[async]"
+        session.headers["X-Client-Version"] = horizon_version
+        return session
+
+    @staticmethod
+    def _parse_config(config_class: type[ResponseSchema], value: Any) -> ResponseSchema:
+        if value is None:
+            return config_class()
+        if isinstance(value, config_class):
+            return value
+        return config_class.parse_obj(value)
+
+    async def _iter_pages(
+        self,
+        paginate: Callable[[QuerySchema], Awaitable[PageResponseV1[ResponseSchema] | Dict[str, Any]]],
+        query: QuerySchema,
+    ) -> AsyncIterator[Any]:
+        task: asyncio.Future | None = asyncio.ensure_future(paginate(query))
+        try:
+            while task is not None:
+                next_page, items = get_next_page_and_items(await task)
+                task = None
+                if next_page:
+                    task = asyncio.ensure_future(paginate(query.copy(update={"page": next_page})))
+                for item in items:
+                    yield item
+        finally:
+            # iteration was stopped, next page is not needed anymore
+            if task is not None:
+                task.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await task
+
+    async def _ensure_token(self) -> None:
+        session: AsyncOAuth2Client = self.session  # type: ignore[assignment]
+        if session.token and not session.token.is_expired():
+            if self._should_refresh_token(session.token) and (self._refresh_task is None or self._refresh_task.done()):
+                # current token is still valid, so fetching new one should not block the request
+                self._refresh_task = asyncio.ensure_future(self._refresh_token())
+            return
+
+        async with self._get_authorize_lock():
+            # token could be already fetched by concurrent request
+            if not session.token or session.token.is_expired():
+                await self.authorize()
+
+    def _get_authorize_lock(self) -> asyncio.Lock:
+        if self._authorize_lock is None:
+            # in Python 3.9 and below Lock should be created within running event loop
+            self._authorize_lock = asyncio.Lock()
+        return self._authorize_lock
+
+    async def _fetch_token(self, token_kwargs: dict, min_ttl: float = TOKEN_EXPIRATION_LEEWAY) -> dict:
+        session: AsyncOAuth2Client = self.session  # type: ignore[assignment]
+        token_cache = self.auth.get_token_cache()
+        if not token_cache:
+            refresh_token = session.token.get("refresh_token") if session.token else None
+            return await self._fetch_new_token(token_kwargs, refresh_token)
+
+        base_url, login = str(self.base_url), token_kwargs["username"]
+        token = token_cache.get(base_url, login, min_ttl=min_ttl)
+        if token:
+            return token
+
+        async with token_cache.lock_async(base_url, login):
+            # token could be already fetched by another process while we were waiting for the lock
+            token = token_cache.get(base_url, login, min_ttl=min_ttl)
+            if not token:
+                # refresh token can be used only once, so take the one stored by the last process
+                refresh_token = token_cache.get_refresh_token(base_url, login)
+                token = dict(await self._fetch_new_token(token_kwargs, refresh_token))
+                token_cache.set(base_url, login, token)
+        return token
+
+    async def _fetch_new_token(self, token_kwargs: dict, refresh_token: str | None) -> dict:
+        from authlib.integrations.base_client import OAuthError
+
+        session: AsyncOAuth2Client = self.session  # type: ignore[assignment]
+        refresh_kwargs = self.auth.refresh_token_kwargs(self.base_url, refresh_token) if refresh_token else {}
+        if refresh_kwargs:
+            try:
+                return await session.fetch_token(**refresh_kwargs)
+            except OAuthError:
+                # refresh token is expired or revoked
+                logger.debug("Failed to refresh access token, fetching new one", exc_info=True)
+        return await session.fetch_token(**token_kwargs)
+
+    async def _refresh_token(self) -> None:
+        session: AsyncOAuth2Client = self.session  # type: ignore[assignment]
+        token = session.token
+        # refresh token can be used only once, so it should not be sent by concurrent authorize() simultaneously
+        async with self._get_authorize_lock():
+            if session.token is not token:
+                # token was already replaced while we were waiting for the lock
+                return
+
+            token_kwargs = self.auth.fetch_token_kwargs(self.base_url)
+            try:
+                session.token = await self._fetch_token(token_kwargs, min_ttl=self.token_refresh_before)
+            except Exception:  # noqa: BLE001
+                # if token will expire, it will be fetched again before sending the request
+                logger.warning("Failed to refresh access token in background", exc_info=True)
+
+    async def _request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        response_class: type[ResponseSchema] | None = None,
+        json: dict | None = None,
+        params: dict | None = None,
+        raw: bool = False,  # noqa: FBT001, FBT002
+    ) -> ResponseSchema | None:
+        """Send request to backend and return ``response_class``, ``None`` or raise an exception."""
+
+        await self._ensure_token()
+
+        headers = None
+        if method in WRITE_METHODS:
+            # the same key is sent on retries, so server can return stored response instead of executing request again
+            headers = {"Idempotency-Key": str(uuid4())}
+
+        if params:
+            # unlike requests, httpx sends None values as empty strings
+            params = {key: value for key, value in params.items() if value is not None}
+
+        session: AsyncOAuth2Client = self.session  # type: ignore[assignment]
+        response = await session.request(method, url, json=json, params=params, headers=headers)
+        return self._handle_response(response, response_class, raw=raw)
@@ -1,12 +1,44 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
 
-from horizon.client.auth.access_token import AccessToken
-from horizon.client.auth.base import BaseAuth
-from horizon.client.auth.login_password import LoginPassword
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from horizon.client.auth.access_token import AccessToken
+    from horizon.client.auth.api_key import APIKey
+    from horizon.client.auth.base import BaseAuth
+    from horizon.client.auth.login_password import LoginPassword
+    from horizon.client.auth.token_cache import TokenCache
 
 __all__ = [
+    "APIKey",
     "AccessToken",
     "BaseAuth",
     "LoginPassword",
+    "TokenCache",
 ]
+
+# AccessToken requires authlib.jose, which is not used by other auth methods
+_LAZY_IMPORTS = {
+    "APIKey": "api_key",
+    "AccessToken": "access_token",
+    "BaseAuth": "base",
+    "LoginPassword": "login_password",
+    "TokenCache": "token_cache",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if not module_name:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
-from authlib.jose import JWTClaims, jwt
-from authlib.jose.errors import BadSignatureError, ExpiredTokenError
+from authlib.jose import JWTClaims
+from authlib.jose.errors import DecodeError, ExpiredTokenError
+from authlib.jose.util import ensure_dict, extract_header, extract_segment
 from authlib.oauth2.auth import OAuth2Token as AuthlibToken  # type: ignore[attr-defined]
 from pydantic import AnyHttpUrl, BaseModel, validator
 from typing_extensions import Literal
@@ -55,16 +56,18 @@ class AccessToken(BaseAuth, BaseModel):
 
     @classmethod
     def _parse_token(cls, token) -> JWTClaims:
-        try:
-            # As client don't have private key used for signing JWT, this call will always raise this exception
-            # https://github.com/lepture/authlib/issues/600
-            jwt.decode(token, key="")
-        except BadSignatureError as e:
-            token_decoded = e.result.payload
-            claims = JWTClaims(
-                header=token_decoded,
-                payload=token_decoded,
-            )
+        # Client don't have a key used for signing JWT (it may be either secret or private key),
+        # so signature is not checked. Server does this anyway.
+        segments = token.encode("utf-8").split(b".")
+        if len(segments) != 3:  # noqa: PLR2004
+            msg = "Not enough segments"
+            raise DecodeError(msg)
+
+        header_segment, payload_segment, _ = segments
+        claims = JWTClaims(
+            header=extract_header(header_segment, DecodeError),
+            payload=ensure_dict(extract_segment(payload_segment, DecodeError), "payload"),
+        )
 
         if "exp" not in claims:
             msg = "Missing expiration time in token"
@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from authlib.oauth2.auth import OAuth2Token as AuthlibToken  # type: ignore[attr-defined]
+from pydantic import AnyHttpUrl, BaseModel, SecretStr
+from typing_extensions import Literal
+
+from horizon.client.auth.base import BaseAuth, Session
+
+
+class APIKey(BaseAuth, BaseModel):
+    """Authorization using API key of a service account.
+
+    Key is passed in ``Authorization: Bearer ${key}`` header.
+    It does not expire on client side, and is not exchanged for an access token.
+
+    Parameters
+    ----------
+    key: str
+        API key, created using ``manage_api_keys`` script
+
+    Examples
+    --------
+
+    >>> from horizon.client.auth import APIKey
+    >>> auth = APIKey(key="hzn_...")
+    """
+
+    key: SecretStr
+
+    type: Literal["api_key"] = "api_key"
+
+    def patch_session(self, session: Session) -> Session:
+        if session.token:
+            return session
+
+        session.token = AuthlibToken.from_dict(
+            {
+                "access_token": self.key.get_secret_value(),
+                "token_type": "Bearer",
+            },
+        )
+        return session
+
+    def fetch_token_kwargs(self, base_url: AnyHttpUrl) -> dict[str, str]:
+        return {}
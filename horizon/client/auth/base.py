@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, Any, TypeVar
 if TYPE_CHECKING:
     from pydantic import AnyHttpUrl
 
+    from horizon.client.auth.token_cache import TokenCache
+
 Session = TypeVar("Session", bound=Any)
 
 
@@ -31,3 +33,15 @@ class BaseAuth(ABC):
         Empty dict means that this method should not be called.
         """
         ...
+
+    def refresh_token_kwargs(self, base_url: AnyHttpUrl, refresh_token: str) -> dict[str, Any]:
+        """Return key-values arguments for ``client.fetch_token(...)`` method,
+        used to exchange refresh token for a new access token.
+
+        Empty dict means that refresh tokens are not supported.
+        """
+        return {}
+
+    def get_token_cache(self) -> TokenCache | None:
+        """Return cache for tokens fetched using ``fetch_token_kwargs``, if any."""
+        return None
@@ -3,19 +3,22 @@
 
 from __future__ import annotations
 
+from typing import Optional
 from urllib.parse import urlparse
 
 from pydantic import AnyHttpUrl, BaseModel, SecretStr
 from typing_extensions import Literal
 
 from horizon.client.auth.base import BaseAuth
+from horizon.client.auth.token_cache import TokenCache  # noqa: TC001
 
 
 class LoginPassword(BaseAuth, BaseModel):
     """Authorization using OAuth2 + ``grant_type=password``.
 
     Resulting access is passed in ``Authorization: Bearer ${token}`` header.
-    Tokens can be refreshed.
+    Tokens can be refreshed. If server returned refresh token, it is used to get a new access token
+    instead of sending login and password again.
 
     Parameters
     ----------
@@ -25,15 +28,25 @@ class LoginPassword(BaseAuth, BaseModel):
     password : str
         User password
 
+    token_cache : :obj:`TokenCache <horizon.client.auth.token_cache.TokenCache>`, optional
+        Share access token between all clients on the same host, instead of fetching new token
+        for each client. By default, token is fetched by each client.
+
     Examples
     --------
 
     >>> from horizon.client.auth import LoginPassword
     >>> auth = LoginPassword(login="me", password="12345")
+
+    Reuse token between processes, e.g. parallel tasks of the same job:
+
+    >>> from horizon.client.auth import LoginPassword, TokenCache
+    >>> auth = LoginPassword(login="me", password="12345", token_cache=TokenCache(path="/tmp/horizon/tokens"))
     """
 
     login: str
     password: SecretStr
+    token_cache: Optional[TokenCache] = None
 
     type: Literal["login_password"] = "login_password"
 
@@ -41,13 +54,24 @@ class LoginPassword(BaseAuth, BaseModel):
         return session
 
     def fetch_token_kwargs(self, base_url: AnyHttpUrl) -> dict[str, str]:
-        # default path for token
-        parsed_url = urlparse(str(base_url))
-        token_url = parsed_url._replace(path=parsed_url.path + "/v1/auth/token")
-        url = token_url.geturl()
-
         return {
-            "url": str(url),
+            "url": self._get_token_url(base_url),
             "username": self.login,
             "password": self.password.get_secret_value(),
         }
+
+    def refresh_token_kwargs(self, base_url: AnyHttpUrl, refresh_token: str) -> dict[str, str]:
+        return {
+            "url": self._get_token_url(base_url),
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+        }
+
+    def get_token_cache(self) -> TokenCache | None:
+        return self.token_cache
+
+    def _get_token_url(self, base_url: AnyHttpUrl) -> str:
+        # default path for token
+        parsed_url = urlparse(str(base_url))
+        token_url = parsed_url._replace(path=parsed_url.path + "/v1/auth/token")
+        return str(token_url.geturl())
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager, contextmanager, suppress
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator
+
+from pydantic import BaseModel, Field
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows
+    fcntl = None  # type: ignore[assignment]
+
+# how often async client checks if lock is released by another process
+LOCK_POLL_INTERVAL = 0.05
+
+
+def _default_path() -> Path:
+    return Path("~/.cache/horizon/tokens").expanduser()
+
+
+class TokenCache(BaseModel):
+    """Store access tokens in local directory, shared between processes on the same host.
+
+    Token is stored separately for each pair of ``base_url`` and ``login``.
+    If token is missing or about to expire, only one process fetches the new one,
+    others are waiting for it (on POSIX systems).
+
+    .. warning::
+
+        Anyone who can read cache files can use tokens. Files are created with ``0600`` permissions,
+        but do not use directory shared with other users.
+
+    Parameters
+    ----------
+    path : str or :obj:`pathlib.Path`, default: ``~/.cache/horizon/tokens``
+        Path to directory with token files. Created if not exists.
+
+    Examples
+    --------
+
+    >>> from horizon.client.auth import LoginPassword, TokenCache
+    >>> auth = LoginPassword(login="me", password="12345", token_cache=TokenCache())
+    """
+
+    path: Path = Field(default_factory=_default_path)
+
+    def get(self, base_url: str, login: str, min_ttl: float = 0) -> Dict[str, Any] | None:
+        """Return token which expires not earlier than ``min_ttl`` seconds from now, or ``None``."""
+        token = self._read(base_url, login)
+        if not token:
+            return None
+
+        try:
+            expires_at = float(token["expires_at"])
+        except (ValueError, TypeError, KeyError):
+            # corrupted file
+            return None
+
+        if expires_at - time.time() <= min_ttl:
+            return None
+        return token
+
+    def get_refresh_token(self, base_url: str, login: str) -> str | None:
+        """Return refresh token stored along with access token, even if access token is already expired."""
+        token = self._read(base_url, login)
+        if not token:
+            return None
+        return token.get("refresh_token")
+
+    def set(self, base_url: str, login: str, token: Dict[str, Any]) -> None:
+        path = self._get_path(base_url, login, ".json")
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(token, file)
+            Path(tmp_path).replace(path)
+        except BaseException:
+            with suppress(OSError):
+                Path(tmp_path).unlink()
+            raise
+
+    def delete(self, base_url: str, login: str) -> None:
+        with suppress(FileNotFoundError):
+            self._get_path(base_url, login, ".json").unlink()
+
+    @contextmanager
+    def lock(self, base_url: str, login: str) -> Iterator[None]:
+        """Exclusive lock for fetching token, held by one process at a time."""
+        path = self._get_path(base_url, login, ".lock")
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+
+        with path.open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @asynccontextmanager
+    async def lock_async(self, base_url: str, login: str) -> AsyncIterator[None]:
+        """Same as :obj:`lock`, but waiting for the lock does not block event loop."""
+        path = self._get_path(base_url, login, ".lock")
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+
+        with path.open("a") as lock_file:
+            while True:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self, base_url: str, login: str) -> Dict[str, Any] | None:
+        # files are replaced atomically, so reading does not require a lock
+        try:
+            token = json.loads(self._get_path(base_url, login, ".json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # missing or corrupted file
+            return None
+        return token if isinstance(token, dict) else None
+
+    def _get_path(self, base_url: str, login: str, suffix: str) -> Path:
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        key = f"{base_url}\n{login}"
+        return self.path / (hashlib.sha256(key.encode("utf-8")).hexdigest() + suffix)
@@ -3,32 +3,103 @@
 from __future__ import annotations
 
 import http
+import json
 import logging
 import pprint
+import time
 import warnings
-from typing import Any, Generic, Optional, Tuple, TypeVar
+from functools import lru_cache
+from typing import Any, Generic, List, Mapping, Optional, Tuple, TypeVar
 from urllib.parse import urlparse
 
-from pydantic import AnyHttpUrl, BaseModel, PrivateAttr, ValidationError, parse_obj_as, validator
+from pydantic import AnyHttpUrl, BaseModel, Field, PrivateAttr, ValidationError, parse_obj_as, validator
 from pydantic import __version__ as pydantic_version
 
 if pydantic_version >= "2":
     from pydantic import BaseModel as GenericModel
+    from pydantic import TypeAdapter
 else:
+    from pydantic import parse_raw_as
     from pydantic.generics import GenericModel  # type: ignore[no-redef]
 
+try:
+    # Rust-based JSON parser, faster than stdlib one
+    from pydantic_core import from_json as json_loads
+except ImportError:
+    json_loads = json.loads  # type: ignore[assignment]
+
 from typing_extensions import Protocol
 
 import horizon
 from horizon.client.auth.base import BaseAuth  # noqa: TC001
-from horizon.commons.errors import get_response_for_status_code
-from horizon.commons.errors.base import APIErrorSchema
 
 logger = logging.getLogger(__name__)
 
 SessionClass = TypeVar("SessionClass")
 ResponseSchema = TypeVar("ResponseSchema", bound=BaseModel)
 
+WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+# the same as default ``leeway`` of ``OAuth2Token.is_expired()``
+TOKEN_EXPIRATION_LEEWAY = 60
+
+
+class RetryConfig(BaseModel):
+    """
+    Configuration for request retries in case of network errors or specific status codes.
+    If provided, it customizes the retry behavior for requests made by the client.
+    See `urllib3 retry documentation <https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html>`_.
+
+    Parameters
+    ----------
+    total : int, default: ``3``
+        The maximum number of retry attempts to make.
+
+    backoff_factor : float, default: ``0.1``
+        A backoff factor to apply between attempts after the second try.
+
+    status_forcelist : list[int], default: ``[502, 503, 504]``
+        A set of HTTP status codes that we should force a retry on.
+
+        .. note::
+
+            Write requests are sent with auto-generated ``Idempotency-Key`` header,
+            so retrying them does not lead to executing the same operation twice.
+
+    backoff_jitter : float, default: ``None``
+        A random jitter amount (between 0 and 1) to add to the backoff delay.
+        Helps to avoid "thundering herd" issues by randomizing the delay
+        times between retries.
+
+        .. note::
+
+            Sync client requires ``urllib>2.0``
+    """
+
+    total: int = 3
+    backoff_factor: float = 0.1
+    status_forcelist: List[int] = [502, 503, 504]
+    backoff_jitter: Optional[float] = None
+
+
+class TimeoutConfig(BaseModel):
+    """
+    Configuration for connection and request timeouts.
+    If provided, it customizes the timeout behavior for requests made by the client.
+    See `requests timeout documentation <https://requests.readthedocs.io/en/latest/user/advanced/#timeouts>`_.
+
+    Parameters
+    ----------
+    connection_timeout : float, default: ``3``
+        The maximum number of seconds to wait for a connection to the server.
+
+    request_timeout : float, default: ``5``
+        The maximum number of seconds to wait for a response from the server.
+    """
+
+    connection_timeout: float = 3
+    request_timeout: float = 5
+
 
 class BaseResponse(Protocol):
     """Response-like object. Same interface is shared between requests.Response and httpx.Response"""
@@ -44,7 +115,7 @@ class BaseResponse(Protocol):
     def raise_for_status(self) -> None: ...
 
     @property
-    def headers(self) -> dict[str, str]: ...
+    def headers(self) -> Mapping[str, str]: ...
 
 
 class BaseClient(GenericModel, Generic[SessionClass]):
@@ -53,6 +124,7 @@ class BaseClient(GenericModel, Generic[SessionClass]):
     base_url: AnyHttpUrl
     auth: BaseAuth
     session: Optional[SessionClass] = None
+    token_refresh_before: float = Field(default=300, ge=0)
 
     _backend_version_tuple: Tuple[int, ...] = PrivateAttr(default_factory=tuple)
 
@@ -76,10 +148,13 @@ class BaseClient(GenericModel, Generic[SessionClass]):
     @validator("session", always=True)
     def _default_session(cls, session: SessionClass | None):  # noqa: N805
         """If session is not passed, create it automatically"""
-        if session:
-            return session
         RealSessionClass = cls.session_class()  # noqa: N806
-        return RealSessionClass()
+        if session is None:
+            return RealSessionClass()
+        if not isinstance(session, RealSessionClass):
+            msg = f"session should be an instance of {RealSessionClass.__name__}, got {type(session).__name__}"
+            raise ValueError(msg)  # noqa: TRY004
+        return session
 
     @validator("session", always=True)
     def _patch_session(cls, session: SessionClass, values: dict):  # noqa: N805
@@ -87,14 +162,38 @@ class BaseClient(GenericModel, Generic[SessionClass]):
         auth: BaseAuth = values.get("auth")  # type: ignore[assignment]
         return auth.patch_session(session)
 
+    def _should_refresh_token(self, token: dict) -> bool:
+        """Token is still valid, but expires soon, so it can be refreshed in background"""
+        expires_at = token.get("expires_at")
+        if not expires_at or expires_at - time.time() >= self.token_refresh_before:
+            return False
+        # e.g. AccessToken cannot be refreshed
+        return bool(self.auth.fetch_token_kwargs(self.base_url))
+
     def _parse_body(self, body: dict, response_class: type[ResponseSchema]) -> ResponseSchema:
         try:
+            if pydantic_version >= "2":
+                return _get_type_adapter(response_class).validate_python(body)
             return parse_obj_as(response_class, body)
         except ValidationError as e:
             # Response does not match expected schema. Probably API was changed.
             # ValidationError does not contain body, so we attaching it to response.
             raise e from ValueError(body)
 
+    def _parse_content(self, content: bytes, response_class: type[ResponseSchema]) -> ResponseSchema:
+        try:
+            # validate JSON directly, without creating intermediate dict
+            if pydantic_version >= "2":
+                return _get_type_adapter(response_class).validate_json(content)
+            return parse_raw_as(response_class, content)  # type: ignore[operator]
+        except ValidationError as e:
+            # keep the same cause as _parse_body, if content is a valid JSON
+            try:
+                body = json_loads(content)
+            except ValueError:
+                body = content
+            raise e from ValueError(body)
+
     def _handle_backend_version(self, backend_version: str | None):
         if self._backend_version_tuple or not backend_version:
             return
@@ -111,8 +210,12 @@ class BaseClient(GenericModel, Generic[SessionClass]):
         self,
         response: BaseResponse,
         response_class: type[ResponseSchema] | None,
+        raw: bool = False,  # noqa: FBT001, FBT002
     ) -> ResponseSchema | None:
-        """Convert Response object to expected response class, or raise an exception matching the status code"""
+        """Convert Response object to expected response class, or raise an exception matching the status code.
+
+        If ``raw=True``, response body is returned as is, without validation.
+        """
         request_id: str | None = response.headers.get("X-Request-ID", None)
         if request_id:
             logger.debug("Request ID: %r", request_id)
@@ -124,7 +227,7 @@ class BaseClient(GenericModel, Generic[SessionClass]):
             return None
 
         if response.status_code < http.HTTPStatus.BAD_REQUEST.value and response_class:
-            return self._parse_body(response.json(), response_class)
+            return json_loads(response.content) if raw else self._parse_content(response.content, response_class)
 
         # raise_for_exception will definitely raise something, but mypy does not know that
         # so we create some exception to be bypass it
@@ -152,6 +255,10 @@ class BaseClient(GenericModel, Generic[SessionClass]):
 
             raise format_err from http_exception
 
+        # error schemas are imported only then they are needed
+        from horizon.commons.errors import get_response_for_status_code
+        from horizon.commons.errors.base import APIErrorSchema
+
         error_response = get_response_for_status_code(response.status_code)
         if not error_response:
             # cannot handle this status code
@@ -168,3 +275,17 @@ class BaseClient(GenericModel, Generic[SessionClass]):
             raise get_exception() from http_exception
 
         raise http_exception
+
+
+@lru_cache(maxsize=None)  # noqa: UP033
+def _get_type_adapter(response_class: type[ResponseSchema]) -> TypeAdapter[ResponseSchema]:
+    # creating TypeAdapter means building a new validator, which is expensive, especially for Union
+    return TypeAdapter(response_class)
+
+
+def get_next_page_and_items(page: Any) -> tuple[int | None, list]:
+    """Get next page number (if any) and page items, from either parsed or raw response"""
+    if isinstance(page, dict):
+        meta = page["meta"]
+        return (meta["next_page"] if meta["has_next"] else None), page["items"]
+    return (page.meta.next_page if page.meta.has_next else None), page.items
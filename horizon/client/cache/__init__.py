@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from horizon.client.cache.base import BaseCache, CacheEntry, CacheStats
+    from horizon.client.cache.file import FileCache
+    from horizon.client.cache.memory import MemoryCache
+
+__all__ = [
+    "BaseCache",
+    "CacheEntry",
+    "CacheStats",
+    "FileCache",
+    "MemoryCache",
+]
+
+# client imports only base classes, implementations are imported on first use
+_LAZY_IMPORTS = {
+    "BaseCache": "base",
+    "CacheEntry": "base",
+    "CacheStats": "base",
+    "FileCache": "file",
+    "MemoryCache": "memory",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if not module_name:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
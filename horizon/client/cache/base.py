@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class CacheEntry:
+    """Cached response body."""
+
+    body: Dict[str, Any]
+    etag: Optional[str]
+    stored_at: float
+
+
+@dataclass
+class CacheStats:
+    """Cache usage counters.
+
+    Parameters
+    ----------
+    hits : int
+        Number of responses returned from cache without sending any request
+
+    misses : int
+        Number of responses fetched from server, because there were no fresh entry in cache
+
+    revalidated : int
+        Number of expired entries which are confirmed by server to be not changed (``304 Not Modified``)
+
+    stale : int
+        Number of expired entries returned because server was not available
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stale: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+class BaseCache(ABC):
+    """
+    Base class for client-side cache of HWM responses.
+    """
+
+    ttl: float
+    stale_if_error: float
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Cache usage counters"""
+        ...
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Get entry by key, or ``None`` if there is no entry"""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Save entry with specific key"""
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove entry with specific key, if any"""
+        ...
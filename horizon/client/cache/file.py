@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager, suppress
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterator
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from horizon.client.cache.base import BaseCache, CacheEntry, CacheStats
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class FileCache(BaseCache, BaseModel):
+    """Cache HWM responses in local directory, shared between processes on the same host.
+
+    Each entry is stored in a separate file. Files are replaced atomically,
+    and writes are serialized using a lock file (on POSIX systems).
+
+    Parameters
+    ----------
+    path : str or :obj:`pathlib.Path`
+        Path to directory with cache files. Created if not exists.
+
+    ttl : float, default: ``60``
+        Time (in seconds) entry is returned without sending any request.
+        After that entry is revalidated using ``If-None-Match`` header.
+
+    stale_if_error : float, default: ``0``
+        Time (in seconds) after ``ttl`` expiration, during which entry can be returned
+        if server is not available. ``0`` means never return expired entries.
+
+    Examples
+    --------
+
+    >>> from horizon.client.cache import FileCache
+    >>> cache = FileCache(path="/var/cache/horizon", ttl=30, stale_if_error=600)
+    """
+
+    path: Path
+    ttl: float = Field(default=60, ge=0)
+    stale_if_error: float = Field(default=0, ge=0)
+
+    _stats: CacheStats = PrivateAttr(default_factory=CacheStats)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def get(self, key: str) -> CacheEntry | None:
+        # files are replaced atomically, so reading does not require a lock
+        try:
+            data = json.loads(self._get_path(key).read_text(encoding="utf-8"))
+            return CacheEntry(**data)
+        except (OSError, ValueError, TypeError):
+            # missing or corrupted file
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        path = self._get_path(key)
+        with self._lock():
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump(asdict(entry), file)
+                Path(tmp_path).replace(path)
+            except BaseException:
+                with suppress(OSError):
+                    Path(tmp_path).unlink()
+                raise
+
+    def delete(self, key: str) -> None:
+        with self._lock(), suppress(FileNotFoundError):
+            self._get_path(key).unlink()
+
+    def _get_path(self, key: str) -> Path:
+        return self.path / (hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+
+        with (self.path / ".lock").open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
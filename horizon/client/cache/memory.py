@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2023-2025 MTS PJSC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from horizon.client.cache.base import BaseCache, CacheEntry, CacheStats
+
+
+class MemoryCache(BaseCache, BaseModel):
+    """Cache HWM responses in memory of current process.
+
+    Parameters
+    ----------
+    ttl : float, default: ``60``
+        Time (in seconds) entry is returned without sending any request.
+        After that entry is revalidated using ``If-None-Match`` header.
+
+    stale_if_error : float, default: ``0``
+        Time (in seconds) after ``ttl`` expiration, during which entry can be returned
+        if server is not available. ``0`` means never return expired entries.
+
+    max_size : int, default: ``1000``
+        Max number of entries. Least recently used entries are removed first.
+
+    Examples
+    --------
+
+    >>> from horizon.client.cache import MemoryCache
+    >>> cache = MemoryCache(ttl=30, stale_if_error=600)
+    """
+
+    ttl: float = Field(default=60, ge=0)
+    stale_if_error: float = Field(default=0, ge=0)
+    max_size: int = Field(default=1000, gt=0)
+
+    _entries: OrderedDict = PrivateAttr(default_factory=OrderedDict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _stats: CacheStats = PrivateAttr(default_factory=CacheStats)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
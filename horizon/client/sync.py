@@ -2,95 +2,66 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-from typing import List, Optional, TypeVar, Union
-
-from authlib.integrations.requests_client import OAuth2Session
-from pydantic import BaseModel, Field, root_validator, validator
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
+import http
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union, overload
+from uuid import uuid4
+
+from pydantic import BaseModel, Field, PrivateAttr, root_validator, validator
+from typing_extensions import Literal
 
 from horizon import __version__ as horizon_version
-from horizon.client.base import BaseClient
-from horizon.commons.schemas import PingResponse
-from horizon.commons.schemas.v1 import (
-    HWMBulkCopyRequestV1,
-    HWMBulkDeleteRequestV1,
-    HWMCreateRequestV1,
-    HWMHistoryPaginateQueryV1,
-    HWMHistoryResponseV1,
-    HWMListResponseV1,
-    HWMPaginateQueryV1,
-    HWMResponseV1,
-    HWMUpdateRequestV1,
-    NamespaceCreateRequestV1,
-    NamespaceHistoryPaginateQueryV1,
-    NamespaceHistoryResponseV1,
-    NamespacePaginateQueryV1,
-    NamespaceResponseV1,
-    NamespaceUpdateRequestV1,
-    PageResponseV1,
-    PermissionsResponseV1,
-    PermissionsUpdateRequestV1,
-    UserResponseV1,
-    UserResponseV1WithAdmin,
+from horizon.client.base import (
+    TOKEN_EXPIRATION_LEEWAY,
+    WRITE_METHODS,
+    BaseClient,
+    RetryConfig,
+    TimeoutConfig,
+    get_next_page_and_items,
 )
+from horizon.client.cache.base import BaseCache, CacheEntry
+from horizon.commons.exceptions.entity import EntityNotFoundError
+from horizon.commons.schemas import PingResponse, v1
+
+if TYPE_CHECKING:
+    import requests
+    from authlib.integrations.requests_client import OAuth2Session
+
+    from horizon.commons.schemas.v1 import (
+        HWMBulkCopyRequestV1,
+        HWMCreateRequestV1,
+        HWMHistoryPaginateQueryV1,
+        HWMHistoryResponseV1,
+        HWMListResponseV1,
+        HWMPaginateQueryV1,
+        HWMResponseV1,
+        HWMSearchQueryV1,
+        HWMUpdateRequestV1,
+        NamespaceCreateRequestV1,
+        NamespaceHistoryPaginateQueryV1,
+        NamespaceHistoryResponseV1,
+        NamespacePaginateQueryV1,
+        NamespaceResponseV1,
+        NamespaceStatsListResponseV1,
+        NamespaceUpdateRequestV1,
+        PageResponseV1,
+        PermissionsResponseV1,
+        PermissionsUpdateRequestV1,
+        UserResponseV1,
+        UserResponseV1WithAdmin,
+    )
+
+logger = logging.getLogger(__name__)
 
 ResponseSchema = TypeVar("ResponseSchema", bound=BaseModel)
+QuerySchema = TypeVar("QuerySchema", bound=BaseModel)
 
 
-class RetryConfig(BaseModel):
-    """
-    Configuration for request retries in case of network errors or specific status codes.
-    If provided, it customizes the retry behavior for requests made by the client.
-    `urllib3 retry documentation <https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html>`_.
-
-    Parameters
-    ----------
-    total : int, default: ``3``
-        The maximum number of retry attempts to make.
-
-    backoff_factor : float, default: ``0.1``
-        A backoff factor to apply between attempts after the second try.
-
-    status_forcelist : list[int], default: ``[502, 503, 504]``
-        A set of HTTP status codes that we should force a retry on.
-
-    backoff_jitter : float, default: ``None``
-        A random jitter amount (between 0 and 1) to add to the backoff delay.
-        Helps to avoid "thundering herd" issues by randomizing the delay
-        times between retries.
-
-        .. note::
-
-            Requires ``urllib>2.0``
-    """
-
-    total: int = 3
-    backoff_factor: float = 0.1
-    status_forcelist: List[int] = [502, 503, 504]
-    backoff_jitter: Optional[float] = None
-
-
-class TimeoutConfig(BaseModel):
-    """
-    Configuration for connection and request timeouts.
-    If provided, it customizes the timeout behavior for requests made by the client.
-    `requests timeout documentation <https://requests.readthedocs.io/en/latest/user/advanced/#timeouts>`_.
-
-    Parameters
-    ----------
-    connection_timeout : float, default: ``3``
-        The maximum number of seconds to wait for a connection to the server.
-
-    request_timeout : float, default: ``5``
-        The maximum number of seconds to wait for a response from the server.
-    """
-
-    connection_timeout: float = 3
-    request_timeout: float = 5
-
-
-class HorizonClientSync(BaseClient[OAuth2Session]):
+class HorizonClientSync(BaseClient[Any]):
     """Sync Horizon client implementation, based on ``authlib`` and ``requests``.
 
     Parameters
@@ -108,6 +79,21 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
     timeout : :obj:`TimeoutConfig <horizon.client.sync.TimeoutConfig>`
         Configuration for request timeouts.
 
+    cache : :obj:`BaseCache <horizon.client.cache.base.BaseCache>`, optional
+        Cache for :obj:`get_hwm` responses, e.g. :obj:`MemoryCache <horizon.client.cache.memory.MemoryCache>`
+        or :obj:`FileCache <horizon.client.cache.file.FileCache>`. By default, responses are not cached.
+
+        Cached HWM is returned without sending any request until ``cache.ttl`` expires.
+        After that, client sends a conditional request, and server returns HWM only if it was changed.
+        If server is not available, expired HWM can be returned within ``cache.stale_if_error`` seconds.
+
+        HWMs updated or deleted using the same client are removed from cache.
+
+    token_refresh_before : float, default: ``300``
+        If access token expires in less than this number of seconds, new token is fetched in background thread,
+        and requests are sent using the current token in the meantime. ``0`` means that new token is fetched
+        only after current one is expired, blocking the request.
+
     session : :obj:`authlib.integrations.requests_client.OAuth2Session`
         Custom session object. Inherited from :obj:`requests.Session`, so you can pass custom
         session options.
@@ -124,6 +110,20 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
     ...     auth=LoginPassword(login="me", password="12345"),
     ... )
 
+    Cache HWMs in a local directory shared between all jobs on the same host:
+
+    >>> from horizon.client.auth import LoginPassword
+    >>> from horizon.client.cache import FileCache
+    >>> from horizon.client.sync import HorizonClientSync
+    >>> client = HorizonClientSync(
+    ...     base_url="https://some.domain.com/api",
+    ...     auth=LoginPassword(login="me", password="12345"),
+    ...     cache=FileCache(path="/var/cache/horizon", ttl=30, stale_if_error=600),
+    ... )
+    >>> client.get_hwm(123)
+    >>> client.cache.stats
+    CacheStats(hits=0, misses=1, revalidated=0, stale=0)
+
     Customize retry and timeout:
 
     >>> from horizon.client.auth import LoginPassword
@@ -139,9 +139,24 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
     retry: RetryConfig = Field(default_factory=RetryConfig)
     timeout: TimeoutConfig = Field(default_factory=TimeoutConfig)
 
+    cache: Optional[BaseCache] = None
+
+    _authorize_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _refresh_thread: Optional[threading.Thread] = PrivateAttr(default=None)
+
+    @classmethod
+    def session_class(cls) -> type[OAuth2Session]:
+        # authlib and requests are imported only then client is created,
+        # so importing this module (e.g. while parsing Airflow DAGs) is cheap
+        from authlib.integrations.requests_client import OAuth2Session
+
+        return OAuth2Session
+
     def authorize(self) -> None:
         """Fetch and set access token (if required).
 
+        If ``auth`` has token cache, token is taken from it, and fetched only if it is missing or expired.
+
         Raises
         ------
         :obj:`horizon.commons.exceptions.AuthorizationError`
@@ -156,13 +171,13 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         session: OAuth2Session = self.session  # type: ignore[assignment]
         token_kwargs = self.auth.fetch_token_kwargs(self.base_url)
         if token_kwargs:
-            session.token = session.fetch_token(**token_kwargs)
+            session.token = self._fetch_token(token_kwargs)
 
         # token will not be verified until we call any endpoint
         # do not call ``self.whoami`` here to avoid recursion
         timeout = (self.timeout.connection_timeout, self.timeout.request_timeout)
         response = session.request("GET", f"{self.base_url}/v1/users/me", timeout=timeout)
-        self._handle_response(response, UserResponseV1)
+        self._handle_response(response, v1.UserResponseV1)
 
     def close(self) -> None:
         """Close session.
@@ -229,7 +244,7 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         return self._request(  # type: ignore[return-value]
             "GET",
             f"{self.base_url}/v1/users/me",
-            response_class=Union[UserResponseV1WithAdmin, UserResponseV1],  # type: ignore[arg-type]
+            response_class=Union[v1.UserResponseV1WithAdmin, v1.UserResponseV1],  # type: ignore[arg-type]
         )
 
     def paginate_namespaces(
@@ -308,15 +323,15 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
             ],
         )
         """  # noqa: E501
-        query = query or NamespacePaginateQueryV1()
+        query = query or v1.NamespacePaginateQueryV1()
         return self._request(  # type: ignore[return-value]
             "GET",
             f"{self.base_url}/v1/namespaces/",
-            response_class=PageResponseV1[NamespaceResponseV1],
+            response_class=v1.PageResponseV1[v1.NamespaceResponseV1],
             params=query.dict(),
         )
 
-    def get_namespace(self, namespace_id: int) -> NamespaceResponseV1:
+    def get_namespace(self, namespace_id: int, with_stats: bool = False) -> NamespaceResponseV1:  # noqa: FBT001, FBT002
         """Get namespace by name.
 
         Parameters
@@ -324,6 +339,9 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         namespace_id : int
             Namespace name to get
 
+        with_stats : bool, default ``False``
+            If ``True``, response includes namespace statistics
+
         Returns
         -------
         :obj:`NamespaceResponseV1 <horizon.commons.schemas.v1.namespace.NamespaceResponseV1>`
@@ -343,11 +361,51 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
             name="my_namespace",
             ...
         )
+
+        >>> client.get_namespace(namespace_id=123, with_stats=True)
+        NamespaceResponseV1(
+            id=123,
+            name="my_namespace",
+            ...,
+            stats=NamespaceStatsResponseV1(namespace_id=123, hwm_count=10, history_count=50, ...),
+        )
         """
         return self._request(  # type: ignore[return-value]
             "GET",
             f"{self.base_url}/v1/namespaces/{namespace_id}",
-            response_class=NamespaceResponseV1,
+            response_class=v1.NamespaceResponseV1,
+            params={"with_stats": True} if with_stats else None,
+        )
+
+    def get_namespaces_stats(self, namespace_ids: List[int]) -> NamespaceStatsListResponseV1:
+        """Get statistics of multiple namespaces at once.
+
+        Parameters
+        ----------
+        namespace_ids : List[int]
+            Namespace ids to get statistics for. Missing namespaces are skipped
+
+        Returns
+        -------
+        :obj:`NamespaceStatsListResponseV1 <horizon.commons.schemas.v1.namespace.NamespaceStatsListResponseV1>`
+            Statistics of namespaces, in the same order as ``namespace_ids``
+
+        Examples
+        --------
+
+        >>> client.get_namespaces_stats(namespace_ids=[123, 234])
+        NamespaceStatsListResponseV1(
+            stats=[
+                NamespaceStatsResponseV1(namespace_id=123, hwm_count=10, history_count=50, last_changed_at=...),
+                NamespaceStatsResponseV1(namespace_id=234, hwm_count=0, history_count=0, last_changed_at=None),
+            ],
+        )
+        """
+        return self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/namespaces/stats",
+            response_class=v1.NamespaceStatsListResponseV1,
+            params={"namespace_ids": namespace_ids},
         )
 
     def create_namespace(self, data: NamespaceCreateRequestV1) -> NamespaceResponseV1:
@@ -384,7 +442,7 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
             "POST",
             f"{self.base_url}/v1/namespaces/",
             json=data.dict(),
-            response_class=NamespaceResponseV1,
+            response_class=v1.NamespaceResponseV1,
         )
 
     def update_namespace(self, namespace_id: int, changes: NamespaceUpdateRequestV1) -> NamespaceResponseV1:
@@ -428,7 +486,7 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
             "PATCH",
             f"{self.base_url}/v1/namespaces/{namespace_id}",
             json=changes.dict(exclude_unset=True),
-            response_class=NamespaceResponseV1,
+            response_class=v1.NamespaceResponseV1,
         )
 
     def delete_namespace(self, namespace_id: int) -> None:
@@ -516,14 +574,32 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         return self._request(  # type: ignore[return-value]
             "GET",
             f"{self.base_url}/v1/namespace-history/",
-            response_class=PageResponseV1[NamespaceHistoryResponseV1],
+            response_class=v1.PageResponseV1[v1.NamespaceHistoryResponseV1],
             params=query.dict(exclude_unset=True),
         )
 
+    @overload
     def paginate_hwm(
         self,
         query: HWMPaginateQueryV1,
-    ) -> PageResponseV1[HWMResponseV1]:
+        *,
+        raw: Literal[False] = False,
+    ) -> PageResponseV1[HWMResponseV1]: ...
+
+    @overload
+    def paginate_hwm(
+        self,
+        query: HWMPaginateQueryV1,
+        *,
+        raw: Literal[True],
+    ) -> Dict[str, Any]: ...
+
+    def paginate_hwm(
+        self,
+        query: HWMPaginateQueryV1,
+        *,
+        raw: bool = False,
+    ) -> PageResponseV1[HWMResponseV1] | Dict[str, Any]:
         """Get page with HWMs.
 
         Parameters
@@ -531,6 +607,10 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         query : :obj:`HWMPaginateQueryV1 <horizon.commons.schemas.v1.hwm.HWMPaginateQueryV1>`
             HWM query parameters
 
+        raw : bool, default: ``False``
+            If ``True``, return response body as plain ``dict``, without validation.
+            This is a lot faster for large number of items.
+
         Returns
         -------
         :obj:`PageResponseV1 <horizon.commons.schemas.v1.pagination.PageResponseV1>` of :obj:`HWMResponseV1 <horizon.commons.schemas.v1.hwm.HWMResponseV1>`
@@ -597,11 +677,70 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
                 HWMResponseV1(namespace_id=123, name="my_hwm", ...),
             ],
         )
+
+        Search for HWM with specific type and value greater than some number:
+
+        >>> from horizon.commons.schemas.v1 import HWMPaginateQueryV1
+        >>> hwm_query = HWMPaginateQueryV1(namespace_id=123, type="column_int", value_gt="1000")
+        >>> client.paginate_hwm(query=hwm_query)
+        PageResponseV1[HWMResponseV1](
+            meta=PageMetaResponseV1(...),
+            items=[
+                HWMResponseV1(namespace_id=123, type="column_int", value=1234, ...),
+            ],
+        )
         """  # noqa: E501
         return self._request(  # type: ignore[return-value]
             "GET",
             f"{self.base_url}/v1/hwm/",
-            response_class=PageResponseV1[HWMResponseV1],
+            response_class=v1.PageResponseV1[v1.HWMResponseV1],
+            params=query.dict(exclude_unset=True),
+            raw=raw,
+        )
+
+    def search_hwm(
+        self,
+        query: HWMSearchQueryV1,
+    ) -> PageResponseV1[HWMResponseV1]:
+        """Search for HWMs by name, in all namespaces or in a specific one.
+
+        Results are sorted by similarity of HWM name to the search string.
+
+        Parameters
+        ----------
+        query : :obj:`HWMSearchQueryV1 <horizon.commons.schemas.v1.hwm.HWMSearchQueryV1>`
+            HWM search parameters
+
+        Returns
+        -------
+        :obj:`PageResponseV1 <horizon.commons.schemas.v1.pagination.PageResponseV1>` of :obj:`HWMResponseV1 <horizon.commons.schemas.v1.hwm.HWMResponseV1>`
+            List of HWM, limited and filtered by query parameters.
+
+        Raises
+        ------
+        :obj:`BadRequestError <horizon.commons.exceptions.bad_request.BadRequestError>`
+            Neither ``name_contains`` nor ``name_prefix`` is set.
+
+        Examples
+        --------
+
+        Search for HWMs with name containing "orders":
+
+        >>> from horizon.commons.schemas.v1 import HWMSearchQueryV1
+        >>> hwm_query = HWMSearchQueryV1(name_contains="orders")
+        >>> client.search_hwm(query=hwm_query)
+        PageResponseV1[HWMResponseV1](
+            meta=PageMetaResponseV1(...),
+            items=[
+                HWMResponseV1(namespace_id=123, name="orders", ...),
+                HWMResponseV1(namespace_id=234, name="orders_archive", ...),
+            ],
+        )
+        """  # noqa: E501
+        return self._request(  # type: ignore[return-value]
+            "GET",
+            f"{self.base_url}/v1/hwm/search",
+            response_class=v1.PageResponseV1[v1.HWMResponseV1],
             params=query.dict(exclude_unset=True),
         )
 
@@ -634,10 +773,14 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
             ...
         )
         """
+        url = f"{self.base_url}/v1/hwm/{hwm_id}"
+        if self.cache:
+            return self._get_cached(url, v1.HWMResponseV1)
+
         return self._request(  # type: ignore[return-value]
             "GET",
-            f"{self.base_url}/v1/hwm/{hwm_id}",
-            response_class=HWMResponseV1,
+            url,
+            response_class=v1.HWMResponseV1,
         )
 
     def create_hwm(self, data: HWMCreateRequestV1) -> HWMResponseV1:
@@ -686,7 +829,7 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
             "POST",
             f"{self.base_url}/v1/hwm/",
             json=data.dict(exclude_unset=True),
-            response_class=HWMResponseV1,
+            response_class=v1.HWMResponseV1,
         )
 
     def update_hwm(self, hwm_id: int, changes: HWMUpdateRequestV1) -> HWMResponseV1:
@@ -728,12 +871,15 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
             ...,
         )
         """
-        return self._request(  # type: ignore[return-value]
-            "PATCH",
-            f"{self.base_url}/v1/hwm/{hwm_id}",
-            json=changes.dict(exclude_unset=True),
-            response_class=HWMResponseV1,
-        )
+        try:
+            return self._request(  # type: ignore[return-value]
+                "PATCH",
+                f"{self.base_url}/v1/hwm/{hwm_id}",
+                json=changes.dict(exclude_unset=True),
+                response_class=v1.HWMResponseV1,
+            )
+        finally:
+            self._invalidate_cache([hwm_id])
 
     def delete_hwm(self, hwm_id: int) -> None:
         """Delete existing HWM.
@@ -755,10 +901,13 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
 
         >>> client.delete_hwm(hwm_id=234)
         """
-        self._request(
-            "DELETE",
-            f"{self.base_url}/v1/hwm/{hwm_id}",
-        )
+        try:
+            self._request(
+                "DELETE",
+                f"{self.base_url}/v1/hwm/{hwm_id}",
+            )
+        finally:
+            self._invalidate_cache([hwm_id])
 
     def bulk_copy_hwm(self, data: HWMBulkCopyRequestV1) -> HWMListResponseV1:
         """Copy HWMs from one namespace to another.
@@ -800,7 +949,7 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
             "POST",
             f"{self.base_url}/v1/hwm/copy",
             json=data.dict(),
-            response_class=HWMListResponseV1,
+            response_class=v1.HWMListResponseV1,
         )
 
     def bulk_delete_hwm(self, namespace_id: int, hwm_ids: List[int]) -> None:
@@ -831,12 +980,15 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         ... )
         """
 
-        data = HWMBulkDeleteRequestV1(namespace_id=namespace_id, hwm_ids=hwm_ids)
-        self._request(
-            "DELETE",
-            f"{self.base_url}/v1/hwm/",
-            json=data.dict(),
-        )
+        data = v1.HWMBulkDeleteRequestV1(namespace_id=namespace_id, hwm_ids=hwm_ids)
+        try:
+            self._request(
+                "DELETE",
+                f"{self.base_url}/v1/hwm/",
+                json=data.dict(),
+            )
+        finally:
+            self._invalidate_cache(hwm_ids)
 
     def get_namespace_permissions(self, namespace_id: int) -> PermissionsResponseV1:
         """Get permissions for a namespace.
@@ -867,7 +1019,7 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         return self._request(  # type: ignore[return-value]
             "GET",
             f"{self.base_url}/v1/namespaces/{namespace_id}/permissions",
-            response_class=PermissionsResponseV1,
+            response_class=v1.PermissionsResponseV1,
         )
 
     def update_namespace_permissions(
@@ -915,13 +1067,31 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
             "PATCH",
             f"{self.base_url}/v1/namespaces/{namespace_id}/permissions",
             json=changes.dict(exclude_unset=True),
-            response_class=PermissionsResponseV1,
+            response_class=v1.PermissionsResponseV1,
         )
 
+    @overload
     def paginate_hwm_history(
         self,
         query: HWMHistoryPaginateQueryV1,
-    ) -> PageResponseV1[HWMHistoryResponseV1]:
+        *,
+        raw: Literal[False] = False,
+    ) -> PageResponseV1[HWMHistoryResponseV1]: ...
+
+    @overload
+    def paginate_hwm_history(
+        self,
+        query: HWMHistoryPaginateQueryV1,
+        *,
+        raw: Literal[True],
+    ) -> Dict[str, Any]: ...
+
+    def paginate_hwm_history(
+        self,
+        query: HWMHistoryPaginateQueryV1,
+        *,
+        raw: bool = False,
+    ) -> PageResponseV1[HWMHistoryResponseV1] | Dict[str, Any]:
         """Get page with HWM changes history.
 
         Parameters
@@ -929,6 +1099,10 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         query : :obj:`HWMHistoryPaginateQueryV1 <horizon.commons.schemas.v1.hwm_history.HWMHistoryPaginateQueryV1>`
             HWM history query parameters
 
+        raw : bool, default: ``False``
+            If ``True``, return response body as plain ``dict``, without validation.
+            This is a lot faster for large number of items.
+
         Returns
         -------
         :obj:`PageResponseV1 <horizon.commons.schemas.v1.pagination.PageResponseV1>` of :obj:`HWMHistoryResponseV1 <horizon.commons.schemas.v1.hwm_history.HWMHistoryResponseV1>`
@@ -978,16 +1152,127 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         return self._request(  # type: ignore[return-value]
             "GET",
             f"{self.base_url}/v1/hwm-history/",
-            response_class=PageResponseV1[HWMHistoryResponseV1],
+            response_class=v1.PageResponseV1[v1.HWMHistoryResponseV1],
             params=query.dict(exclude_unset=True),
+            raw=raw,
         )
 
+    def iter_namespaces(self, query: NamespacePaginateQueryV1 | None = None) -> Iterator[NamespaceResponseV1]:
+        """Iterate over all namespaces matching the query, page by page.
+
+        Next page is fetched in a background thread while current one is being consumed.
+        Stopping the iteration (e.g. with ``break``) cancels prefetching.
+
+        .. note::
+
+            Pages are fetched using page number, so items created or deleted during the iteration
+            may be skipped or returned twice.
+
+        Parameters
+        ----------
+        query : :obj:`NamespacePaginateQueryV1 <horizon.commons.schemas.v1.namespace.NamespacePaginateQueryV1>`
+            Namespace query parameters. Iteration starts from ``query.page``.
+
+        Returns
+        -------
+        Iterator of :obj:`NamespaceResponseV1 <horizon.commons.schemas.v1.namespace.NamespaceResponseV1>`
+
+        Examples
+        --------
+
+        >>> for namespace in client.iter_namespaces():
+        ...     print(namespace.name)
+        my_namespace
+        other_namespace
+        """
+        return self._iter_pages(self.paginate_namespaces, query or v1.NamespacePaginateQueryV1())
+
+    @overload
+    def iter_hwm(self, query: HWMPaginateQueryV1, *, raw: Literal[False] = False) -> Iterator[HWMResponseV1]: ...
+
+    @overload
+    def iter_hwm(self, query: HWMPaginateQueryV1, *, raw: Literal[True]) -> Iterator[Dict[str, Any]]: ...
+
+    def iter_hwm(
+        self, query: HWMPaginateQueryV1, *, raw: bool = False
+    ) -> Iterator[HWMResponseV1] | Iterator[Dict[str, Any]]:
+        """Iterate over all HWMs matching the query, page by page.
+
+        Same as :obj:`iter_namespaces`, but for :obj:`paginate_hwm`.
+
+        Parameters
+        ----------
+        query : :obj:`HWMPaginateQueryV1 <horizon.commons.schemas.v1.hwm.HWMPaginateQueryV1>`
+            HWM query parameters. Iteration starts from ``query.page``.
+
+        raw : bool, default: ``False``
+            If ``True``, return items as plain ``dict``, without validation.
+            This is a lot faster for large number of items.
+
+        Returns
+        -------
+        Iterator of :obj:`HWMResponseV1 <horizon.commons.schemas.v1.hwm.HWMResponseV1>`
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMPaginateQueryV1
+        >>> hwm_query = HWMPaginateQueryV1(namespace_id=123, page_size=50)
+        >>> for hwm in client.iter_hwm(hwm_query):
+        ...     print(hwm.name, hwm.value)
+        my_hwm 123
+        other_hwm 234
+        """
+        return self._iter_pages(partial(self.paginate_hwm, raw=raw), query)
+
+    @overload
+    def iter_hwm_history(
+        self, query: HWMHistoryPaginateQueryV1, *, raw: Literal[False] = False
+    ) -> Iterator[HWMHistoryResponseV1]: ...
+
+    @overload
+    def iter_hwm_history(self, query: HWMHistoryPaginateQueryV1, *, raw: Literal[True]) -> Iterator[Dict[str, Any]]: ...
+
+    def iter_hwm_history(
+        self, query: HWMHistoryPaginateQueryV1, *, raw: bool = False
+    ) -> Iterator[HWMHistoryResponseV1] | Iterator[Dict[str, Any]]:
+        """Iterate over all HWM history items matching the query, page by page.
+
+        Same as :obj:`iter_namespaces`, but for :obj:`paginate_hwm_history`.
+
+        Parameters
+        ----------
+        query : :obj:`HWMHistoryPaginateQueryV1 <horizon.commons.schemas.v1.hwm_history.HWMHistoryPaginateQueryV1>`
+            HWM history query parameters. Iteration starts from ``query.page``.
+
+        raw : bool, default: ``False``
+            If ``True``, return items as plain ``dict``, without validation.
+            This is a lot faster for large number of items.
+
+        Returns
+        -------
+        Iterator of :obj:`HWMHistoryResponseV1 <horizon.commons.schemas.v1.hwm_history.HWMHistoryResponseV1>`
+
+        Examples
+        --------
+
+        >>> from horizon.commons.schemas.v1 import HWMHistoryPaginateQueryV1
+        >>> for item in client.iter_hwm_history(HWMHistoryPaginateQueryV1(hwm_id=234)):
+        ...     print(item.action, item.value)
+        Updated 234
+        Created 123
+        """
+        return self._iter_pages(partial(self.paginate_hwm_history, raw=raw), query)
+
     # retry validator is called after "session" validators, when session already created by default or passed directly
     @root_validator(pre=False, skip_on_failure=True)
     def _configure_retries(cls, values):  # noqa: N805
         session = values.get("session")
         retry_config = values.get("retry")
 
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
         optional_retry_args = {}
         if retry_config.backoff_jitter is not None:
             # added to Retry class only in urllib3 2.0+
@@ -1012,20 +1297,168 @@ class HorizonClientSync(BaseClient[OAuth2Session]):
         session.headers["X-Client-Version"] = horizon_version
         return session
 
-    def _request(
+    def _iter_pages(
+        self,
+        paginate: Callable[[QuerySchema], PageResponseV1[ResponseSchema] | Dict[str, Any]],
+        query: QuerySchema,
+    ) -> Iterator[Any]:
+        # executor is created on first next() call, not then iterator is created
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="horizon-prefetch") as executor:
+            future: Future | None = executor.submit(paginate, query)
+            try:
+                while future is not None:
+                    next_page, items = get_next_page_and_items(future.result())
+                    future = None
+                    if next_page:
+                        future = executor.submit(paginate, query.copy(update={"page": next_page}))
+                    yield from items
+            finally:
+                # iteration was stopped, do not send request for the next page.
+                # if request is already sent, executor waits for it, so no threads are left behind.
+                if future is not None:
+                    future.cancel()
+
+    def _request(  # noqa: PLR0913
         self,
         method: str,
         url: str,
         response_class: type[ResponseSchema] | None = None,
         json: dict | None = None,
         params: dict | None = None,
+        raw: bool = False,  # noqa: FBT001, FBT002
     ) -> ResponseSchema | None:
         """Send request to backend and return ``response_class``, ``None`` or raise an exception."""
 
+        response = self._send(method, url, json=json, params=params)
+        return self._handle_response(response, response_class, raw=raw)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        json: dict | None = None,
+        params: dict | None = None,
+        headers: dict | None = None,
+    ) -> requests.Response:
         session: OAuth2Session = self.session  # type: ignore[assignment]
         if not session.token or session.token.is_expired():
-            self.authorize()
+            # session can be used by prefetching thread, fetch token only once
+            with self._authorize_lock:
+                if not session.token or session.token.is_expired():
+                    self.authorize()
+        elif self._should_refresh_token(session.token):
+            self._refresh_token_in_background()
+
+        if method in WRITE_METHODS:
+            # the same key is sent on retries, so server can return stored response instead of executing request again
+            headers = {**(headers or {}), "Idempotency-Key": str(uuid4())}
 
         timeout = (self.timeout.connection_timeout, self.timeout.request_timeout)
-        response = session.request(method, url, json=json, params=params, timeout=timeout)
-        return self._handle_response(response, response_class)
+        return session.request(method, url, json=json, params=params, headers=headers, timeout=timeout)
+
+    def _fetch_token(self, token_kwargs: dict, min_ttl: float = TOKEN_EXPIRATION_LEEWAY) -> dict:
+        session: OAuth2Session = self.session  # type: ignore[assignment]
+        token_cache = self.auth.get_token_cache()
+        if not token_cache:
+            refresh_token = session.token.get("refresh_token") if session.token else None
+            return self._fetch_new_token(token_kwargs, refresh_token)
+
+        base_url, login = str(self.base_url), token_kwargs["username"]
+        token = token_cache.get(base_url, login, min_ttl=min_ttl)
+        if token:
+            return token
+
+        with token_cache.lock(base_url, login):
+            # token could be already fetched by another process while we were waiting for the lock
+            token = token_cache.get(base_url, login, min_ttl=min_ttl)
+            if not token:
+                # refresh token can be used only once, so take the one stored by the last process
+                refresh_token = token_cache.get_refresh_token(base_url, login)
+                token = dict(self._fetch_new_token(token_kwargs, refresh_token))
+                token_cache.set(base_url, login, token)
+        return token
+
+    def _fetch_new_token(self, token_kwargs: dict, refresh_token: str | None) -> dict:
+        from authlib.integrations.base_client import OAuthError
+
+        session: OAuth2Session = self.session  # type: ignore[assignment]
+        refresh_kwargs = self.auth.refresh_token_kwargs(self.base_url, refresh_token) if refresh_token else {}
+        if refresh_kwargs:
+            try:
+                return session.fetch_token(**refresh_kwargs)
+            except OAuthError:
+                # refresh token is expired or revoked
+                logger.debug("Failed to refresh access token, fetching new one", exc_info=True)
+        return session.fetch_token(**token_kwargs)
+
+    def _refresh_token_in_background(self) -> None:
+        with self._authorize_lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return
+
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_token,
+                name="horizon-token-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def _refresh_token(self) -> None:
+        session: OAuth2Session = self.session  # type: ignore[assignment]
+        token = session.token
+        # refresh token can be used only once, so it should not be sent by authorize() in another thread simultaneously
+        with self._authorize_lock:
+            if session.token is not token:
+                # token was already replaced while we were waiting for the lock
+                return
+
+            token_kwargs = self.auth.fetch_token_kwargs(self.base_url)
+            try:
+                session.token = self._fetch_token(token_kwargs, min_ttl=self.token_refresh_before)
+            except Exception:  # noqa: BLE001
+                # current token is still valid, so do not interrupt the caller.
+                # if token will expire, it will be fetched again before sending the request
+                logger.warning("Failed to refresh access token in background", exc_info=True)
+
+    def _invalidate_cache(self, hwm_ids: List[int]) -> None:
+        if not self.cache:
+            return
+
+        for hwm_id in hwm_ids:
+            self.cache.delete(f"{self.base_url}/v1/hwm/{hwm_id}")
+
+    def _get_cached(self, url: str, response_class: type[ResponseSchema]) -> ResponseSchema:
+        """Return response from cache, revalidating it if necessary."""
+        import requests
+
+        cache: BaseCache = self.cache  # type: ignore[assignment]
+        entry = cache.get(url)
+        now = time.time()
+        if entry and now - entry.stored_at < cache.ttl:
+            cache.stats.increment("hits")
+            return self._parse_body(entry.body, response_class)
+
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else None
+        try:
+            response = self._send("GET", url, headers=headers)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.RetryError):
+            if entry and now - entry.stored_at < cache.ttl + cache.stale_if_error:
+                logger.warning("Horizon is not available, using cached response for %r", url, exc_info=True)
+                cache.stats.increment("stale")
+                return self._parse_body(entry.body, response_class)
+            raise
+
+        if entry and response.status_code == http.HTTPStatus.NOT_MODIFIED:
+            cache.set(url, CacheEntry(body=entry.body, etag=response.headers.get("ETag", entry.etag), stored_at=now))
+            cache.stats.increment("revalidated")
+            return self._parse_body(entry.body, response_class)
+
+        try:
+            body = self._handle_response(response, response_class, raw=True)
+        except EntityNotFoundError:
+            cache.delete(url)
+            raise
+
+        cache.set(url, CacheEntry(body=body, etag=response.headers.get("ETag"), stored_at=now))  # type: ignore[arg-type]
+        cache.stats.increment("misses")
+        return self._parse_body(body, response_class)  # type: ignore[arg-type]
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
 import http
+from typing import Any
 
 from typing_extensions import Literal
 
@@ -15,3 +16,7 @@ from horizon.commons.exceptions import BadRequestError
 )
 class BadRequestSchema(BaseErrorSchema):
     code: Literal["bad_request"] = "bad_request"
+    details: Any = None
+
+    def to_exception(self) -> BadRequestError:
+        return BadRequestError(reason=self.message)
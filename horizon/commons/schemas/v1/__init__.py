@@ -1,42 +1,50 @@
 # SPDX-FileCopyrightText: 2023-2025 MTS PJSC
 # SPDX-License-Identifier: Apache-2.0
-from horizon.commons.schemas.v1.auth import AuthTokenResponseV1
-from horizon.commons.schemas.v1.hwm import (
-    HWMBulkCopyRequestV1,
-    HWMBulkDeleteRequestV1,
-    HWMCreateRequestV1,
-    HWMListResponseV1,
-    HWMPaginateQueryV1,
-    HWMResponseV1,
-    HWMUpdateRequestV1,
-)
-from horizon.commons.schemas.v1.hwm_history import (
-    HWMHistoryPaginateQueryV1,
-    HWMHistoryResponseV1,
-)
-from horizon.commons.schemas.v1.namespace import (
-    NamespaceCreateRequestV1,
-    NamespacePaginateQueryV1,
-    NamespaceResponseV1,
-    NamespaceUpdateRequestV1,
-    NamespaceUserRole,
-)
-from horizon.commons.schemas.v1.namespace_history import (
-    NamespaceHistoryPaginateQueryV1,
-    NamespaceHistoryResponseV1,
-)
-from horizon.commons.schemas.v1.pagination import (
-    PageMetaResponseV1,
-    PageResponseV1,
-    PaginateQueryV1,
-)
-from horizon.commons.schemas.v1.permission import (
-    PermissionResponseItemV1,
-    PermissionsResponseV1,
-    PermissionsUpdateRequestV1,
-    PermissionUpdateRequestItemV1,
-)
-from horizon.commons.schemas.v1.user import UserResponseV1, UserResponseV1WithAdmin
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from horizon.commons.schemas.v1.auth import AuthTokenResponseV1
+    from horizon.commons.schemas.v1.hwm import (
+        HWMBulkCopyRequestV1,
+        HWMBulkDeleteRequestV1,
+        HWMCreateRequestV1,
+        HWMListResponseV1,
+        HWMPaginateQueryV1,
+        HWMResponseV1,
+        HWMSearchQueryV1,
+        HWMUpdateRequestV1,
+    )
+    from horizon.commons.schemas.v1.hwm_history import (
+        HWMHistoryPaginateQueryV1,
+        HWMHistoryResponseV1,
+    )
+    from horizon.commons.schemas.v1.namespace import (
+        NamespaceCreateRequestV1,
+        NamespacePaginateQueryV1,
+        NamespaceResponseV1,
+        NamespaceStatsListResponseV1,
+        NamespaceStatsResponseV1,
+        NamespaceUpdateRequestV1,
+        NamespaceUserRole,
+    )
+    from horizon.commons.schemas.v1.namespace_history import (
+        NamespaceHistoryPaginateQueryV1,
+        NamespaceHistoryResponseV1,
+    )
+    from horizon.commons.schemas.v1.pagination import (
+        PageMetaResponseV1,
+        PageResponseV1,
+        PaginateQueryV1,
+    )
+    from horizon.commons.schemas.v1.permission import (
+        PermissionResponseItemV1,
+        PermissionsResponseV1,
+        PermissionsUpdateRequestV1,
+        PermissionUpdateRequestItemV1,
+    )
+    from horizon.commons.schemas.v1.user import UserResponseV1, UserResponseV1WithAdmin
 
 __all__ = [
     "AuthTokenResponseV1",
@@ -48,12 +56,15 @@ __all__ = [
     "HWMListResponseV1",
     "HWMPaginateQueryV1",
     "HWMResponseV1",
+    "HWMSearchQueryV1",
     "HWMUpdateRequestV1",
     "NamespaceCreateRequestV1",
     "NamespaceHistoryPaginateQueryV1",
     "NamespaceHistoryResponseV1",
     "NamespacePaginateQueryV1",
     "NamespaceResponseV1",
+    "NamespaceStatsListResponseV1",
+    "NamespaceStatsResponseV1",
     "NamespaceUpdateRequestV1",
     "NamespaceUserRole",
     "PageMetaResponseV1",
@@ -66,3 +77,51 @@ __all__ = [
     "UserResponseV1",
     "UserResponseV1WithAdmin",
 ]
+
+# schemas are imported on first access, so client does not import modules it does not use
+_LAZY_IMPORTS = {
+    "AuthTokenResponseV1": "auth",
+    "HWMBulkCopyRequestV1": "hwm",
+    "HWMBulkDeleteRequestV1": "hwm",
+    "HWMCreateRequestV1": "hwm",
+    "HWMHistoryPaginateQueryV1": "hwm_history",
+    "HWMHistoryResponseV1": "hwm_history",
+    "HWMListResponseV1": "hwm",
+    "HWMPaginateQueryV1": "hwm",
+    "HWMResponseV1": "hwm",
+    "HWMSearchQueryV1": "hwm",
+    "HWMUpdateRequestV1": "hwm",
+    "NamespaceCreateRequestV1": "namespace",
+    "NamespaceHistoryPaginateQueryV1": "namespace_history",
+    "NamespaceHistoryResponseV1": "namespace_history",
+    "NamespacePaginateQueryV1": "namespace",
+    "NamespaceResponseV1": "namespace",
+    "NamespaceStatsListResponseV1": "namespace",
+    "NamespaceStatsResponseV1": "namespace",
+    "NamespaceUpdateRequestV1": "namespace",
+    "NamespaceUserRole": "namespace",
+    "PageMetaResponseV1": "pagination",
+    "PageResponseV1": "pagination",
+    "PaginateQueryV1": "pagination",
+    "PermissionResponseItemV1": "permission",
+    "PermissionUpdateRequestItemV1": "permission",
+    "PermissionsResponseV1": "permission",
+    "PermissionsUpdateRequestV1": "permission",
+    "UserResponseV1": "user",
+    "UserResponseV1WithAdmin": "user",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if not module_name:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -11,3 +13,4 @@ class AuthTokenResponseV1(BaseModel):
     access_token: str
     token_type: str
     expires_at: float
+    refresh_token: Optional[str] = None
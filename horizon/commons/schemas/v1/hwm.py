@@ -42,12 +42,62 @@ class HWMListResponseV1(BaseModel):
 
 
 class HWMPaginateQueryV1(PaginateQueryV1):
-    """Query params for HWM pagination request."""
+    """Query params for HWM pagination request.
+
+    Value filters accept JSON, e.g. ``123``, ``"abc"`` or ``["file1"]``.
+    If value is not a valid JSON, it is treated as a string.
+    Comparison filters (``value_gt``, ``value_lt`` and so on) match only values of the same JSON type.
+    """
 
     namespace_id: int
     name: Optional[str] = Field(default=None, min_length=1, max_length=MAX_NAME_LENGTH)
+    name_contains: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_NAME_LENGTH,
+        description="HWM name contains substring (case insensitive). Results are sorted by similarity",
+    )
+    name_prefix: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_NAME_LENGTH,
+        description="HWM name starts with prefix (case insensitive). Results are sorted by similarity",
+    )
+    type: Optional[str] = Field(default=None, min_length=1, max_length=MAX_TYPE_LENGTH, description="HWM type")
+    entity: Optional[str] = Field(default=None, min_length=1, description="Entity associated with the HWM")
+    changed_by: Optional[str] = Field(default=None, min_length=1, description="Username of latest user changed the HWM")
+    changed_since: Optional[datetime] = Field(default=None, description="HWM was changed at or after this timestamp")
+    changed_until: Optional[datetime] = Field(default=None, description="HWM was changed before this timestamp")
+    value: Optional[str] = Field(default=None, description="HWM value is equal to")
+    value_gt: Optional[str] = Field(default=None, description="HWM value is greater than")
+    value_gte: Optional[str] = Field(default=None, description="HWM value is greater than or equal to")
+    value_lt: Optional[str] = Field(default=None, description="HWM value is less than")
+    value_lte: Optional[str] = Field(default=None, description="HWM value is less than or equal to")
+    value_contains: Optional[str] = Field(
+        default=None,
+        description="HWM value contains, e.g. list of files contains specific file",
+    )
 
-    # more arguments can be added in future
+
+class HWMSearchQueryV1(PaginateQueryV1):
+    """Query params for HWM search request.
+
+    At least one of ``name_contains``, ``name_prefix`` should be set.
+    """
+
+    namespace_id: Optional[int] = Field(default=None, description="Search only in specific namespace")
+    name_contains: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_NAME_LENGTH,
+        description="HWM name contains substring (case insensitive). Results are sorted by similarity",
+    )
+    name_prefix: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_NAME_LENGTH,
+        description="HWM name starts with prefix (case insensitive). Results are sorted by similarity",
+    )
 
 
 class HWMCreateRequestV1(BaseModel):
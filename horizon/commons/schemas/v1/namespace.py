@@ -3,7 +3,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, root_validator
 from pydantic import __version__ as pydantic_version
@@ -20,6 +20,28 @@ class NamespaceUserRole(str, Enum):
     OWNER = "OWNER"
 
 
+class NamespaceStatsResponseV1(BaseModel):
+    """Namespace statistics response."""
+
+    namespace_id: int = Field(description="Namespace id")
+    hwm_count: int = Field(description="Number of HWMs in the namespace")
+    history_count: int = Field(description="Number of HWM history records in the namespace")
+    last_changed_at: Optional[datetime] = Field(
+        default=None,
+        description="Timestamp of last change of any HWM in the namespace, if any",
+    )
+
+    class Config:
+        if pydantic_version >= "2":
+            from_attributes = True
+        else:
+            orm_mode = True
+
+
+class NamespaceStatsListResponseV1(BaseModel):
+    stats: List[NamespaceStatsResponseV1]
+
+
 class NamespaceResponseV1(BaseModel):
     """Namespace response."""
 
@@ -29,6 +51,10 @@ class NamespaceResponseV1(BaseModel):
     owned_by: str = Field(description="The namespace owner")
     changed_at: datetime = Field(description="Timestamp of last change of the namespace data")
     changed_by: Optional[str] = Field(default=None, description="Latest user who changed the namespace data")
+    stats: Optional[NamespaceStatsResponseV1] = Field(
+        default=None,
+        description="Namespace statistics, returned only if requested with ``with_stats=true``",
+    )
 
     class Config:
         if pydantic_version >= "2":
@@ -41,6 +67,19 @@ class NamespacePaginateQueryV1(PaginateQueryV1):
     """Query params for namespace pagination request."""
 
     name: Optional[str] = Field(default=None, min_length=1, max_length=MAX_NAME_LENGTH)
+    name_contains: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_NAME_LENGTH,
+        description="Namespace name contains substring (case insensitive). Results are sorted by similarity",
+    )
+    name_prefix: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_NAME_LENGTH,
+        description="Namespace name starts with prefix (case insensitive). Results are sorted by similarity",
+    )
+    with_stats: bool = Field(default=False, description="Include namespace statistics into response")
 
     # more arguments can be added in future
 
@@ -5,7 +5,7 @@ from typing import List, Optional, Set
 
 from pydantic import BaseModel, Field, validator
 
-from horizon.commons.schemas.v1 import NamespaceUserRole
+from horizon.commons.schemas.v1.namespace import NamespaceUserRole
 
 
 class PermissionResponseItemV1(BaseModel):
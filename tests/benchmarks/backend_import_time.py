@@ -0,0 +1,40 @@
+"""Show modules which take most of import time of backend application.
+
+Usage::
+
+    python -m tests.benchmarks.backend_import_time
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+CODE = "from horizon.backend import get_application"
+LIMIT = 15
+
+
+def get_import_time_report(code: str, limit: int) -> str:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        rows.append((int(cumulative), module.strip()))
+
+    rows.sort(reverse=True)
+    return "\n".join(f"{cumulative / 1000:10.1f}ms  {module}" for cumulative, module in rows[:limit])
+
+
+def main() -> None:
+    print(f"Import time of {CODE!r}:", get_import_time_report(CODE, LIMIT), sep="\n")
+
+
+if __name__ == "__main__":
+    main()
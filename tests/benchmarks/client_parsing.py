@@ -0,0 +1,81 @@
+"""Compare time of parsing a page of HWMs by different methods.
+
+Usage::
+
+    python -m tests.benchmarks.client_parsing
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from datetime import datetime, timezone
+
+from pydantic import parse_obj_as
+
+from horizon.client.auth import LoginPassword
+from horizon.client.base import json_loads
+from horizon.client.sync import HorizonClientSync
+from horizon.commons.schemas.v1 import HWMResponseV1, PageResponseV1
+
+PAGE_SIZE = 50
+NUMBER = 200
+
+
+def get_page_content() -> bytes:
+    changed_at = datetime.now(tz=timezone.utc).isoformat()
+    items = [
+        {
+            "id": i,
+            "namespace_id": 1,
+            "name": f"hwm_{i}",
+            "description": "",
+            "type": "column_int",
+            "value": i,
+            "entity": "some_table",
+            "expression": "some_column",
+            "changed_at": changed_at,
+            "changed_by": "someuser",
+        }
+        for i in range(PAGE_SIZE)
+    ]
+    meta = {
+        "page": 1,
+        "pages_count": 1,
+        "total_count": PAGE_SIZE,
+        "page_size": PAGE_SIZE,
+        "has_next": False,
+        "has_previous": False,
+        "next_page": None,
+        "previous_page": None,
+    }
+    return json.dumps({"meta": meta, "items": items}).encode()
+
+
+def main() -> None:
+    page_content = get_page_content()
+    # does not send any requests
+    client = HorizonClientSync(base_url="http://localhost", auth=LoginPassword(login="user", password="password"))
+    response_class = PageResponseV1[HWMResponseV1]
+
+    def parse_old():
+        return parse_obj_as(response_class, json.loads(page_content))
+
+    def parse_new():
+        return client._parse_content(page_content, response_class)
+
+    def parse_raw():
+        return json_loads(page_content)
+
+    results = {
+        name: min(timeit.repeat(func, number=NUMBER, repeat=3)) / NUMBER
+        for name, func in (("parse_obj_as", parse_old), ("validate_json", parse_new), ("raw", parse_raw))
+    }
+    print(
+        f"Parsing page of {PAGE_SIZE} HWMs: "
+        + ", ".join(f"{name}: {seconds * 1_000_000:.0f}us" for name, seconds in results.items()),
+    )
+
+
+if __name__ == "__main__":
+    main()
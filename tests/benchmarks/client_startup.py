@@ -0,0 +1,76 @@
+"""Measure import time of HorizonClientSync, and time of its first request.
+
+Requires running backend. Usage::
+
+    python -m tests.benchmarks.client_startup --url http://localhost:8000 --access-token ... --hwm-id 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+BENCHMARK_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import os
+    import time
+
+    started_at = time.perf_counter()
+    from horizon.client.sync import HorizonClientSync
+
+    imported_at = time.perf_counter()
+
+    # AccessToken requires authlib.jose, so it is a part of first use
+    from horizon.client.auth import AccessToken
+
+    client = HorizonClientSync(
+        base_url=os.environ["HORIZON_BENCHMARK_SERVER_URL"],
+        auth=AccessToken(token=os.environ["HORIZON_BENCHMARK_ACCESS_TOKEN"]),
+    )
+    client.get_hwm(int(os.environ["HORIZON_BENCHMARK_HWM_ID"]))
+    finished_at = time.perf_counter()
+
+    result = {
+        "import_seconds": imported_at - started_at,
+        "first_get_hwm_seconds": finished_at - imported_at,
+    }
+    print(json.dumps(result))
+    """,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000", help="Backend URL")
+    parser.add_argument("--access-token", required=True, help="Access token of any user")
+    parser.add_argument("--hwm-id", type=int, required=True, help="Id of HWM available to user")
+    args = parser.parse_args()
+
+    env = {
+        **os.environ,
+        "HORIZON_BENCHMARK_SERVER_URL": args.url,
+        "HORIZON_BENCHMARK_ACCESS_TOKEN": args.access_token,
+        "HORIZON_BENCHMARK_HWM_ID": str(args.hwm_id),
+    }
+    # new interpreter is started, so modules are not imported yet
+    process = subprocess.run(
+        [sys.executable, "-c", BENCHMARK_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=env,
+    )
+    result = json.loads(process.stdout)
+    print(
+        f"HorizonClientSync import: {result['import_seconds'] * 1000:.1f}ms, "
+        f"first get_hwm call: {result['first_get_hwm_seconds'] * 1000:.1f}ms",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,15 @@ pytest_plugins = [
     "tests.fixtures.test_client",
     "tests.fixtures.external_app",
     "tests.fixtures.sync_client",
+    "tests.fixtures.async_client",
     "tests.fixtures.alembic",
     "tests.fixtures.async_engine",
     "tests.fixtures.async_session",
     "tests.fixtures.jwt",
+    "tests.fixtures.oidc_issuer",
     "tests.factories.user",
     "tests.factories.credentials_cache",
+    "tests.factories.api_key",
     "tests.factories.namespace",
     "tests.factories.namespace_history",
     "tests.factories.hwm",
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AsyncContextManager, Callable
+
+import pytest  # noqa: TC002
+import pytest_asyncio
+from sqlalchemy import delete
+
+from horizon.backend.db.models import APIKey
+from horizon.backend.services.api_key import generate_api_key, hash_api_key
+from tests.factories.base import random_string
+
+if TYPE_CHECKING:
+    from typing import AsyncGenerator
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from horizon.backend.db.models.user import User
+    from horizon.backend.settings.auth.jwt import JWTSettings
+
+
+@pytest_asyncio.fixture(params=[{}])
+async def api_key(
+    user: User,
+    access_token_settings: JWTSettings,
+    request: pytest.FixtureRequest,
+    async_session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+) -> AsyncGenerator[str, None]:
+    params = request.param
+    result = generate_api_key()
+    item = APIKey(
+        name=random_string(),
+        key_hash=hash_api_key(result, access_token_settings.secret_key.get_secret_value()),
+        user_id=user.id,
+        **params,
+    )
+
+    # do not use the same session in tests and fixture teardown
+    # see https://github.com/MobileTeleSystems/horizon/pull/6
+    async with async_session_factory() as async_session:
+        async_session.add(item)
+        await async_session.commit()
+        item_id = item.id
+
+    yield result
+
+    query = delete(APIKey).where(APIKey.id == item_id)
+    async with async_session_factory() as async_session:
+        await async_session.execute(query)
+        await async_session.commit()
@@ -0,0 +1,12 @@
+from typing import AsyncGenerator
+
+import pytest_asyncio
+
+from horizon.client.asyncio import HorizonClientAsync
+from horizon.client.auth import AccessToken
+
+
+@pytest_asyncio.fixture
+async def async_client(access_token: str, external_app_url: str) -> AsyncGenerator[HorizonClientAsync, None]:
+    async with HorizonClientAsync(base_url=external_app_url, auth=AccessToken(token=access_token)) as client:
+        yield client
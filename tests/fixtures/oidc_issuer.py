@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from authlib.jose import JsonWebKey, JsonWebToken
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from authlib.jose import Key
+
+
+class MockOIDCIssuer:
+    """Minimal OIDC IdP, serving OpenID configuration and JWKS, and issuing access tokens"""
+
+    def __init__(self) -> None:
+        self.url = ""
+        self.available = True
+        self.requests: list[str] = []
+        self.keys: list[Key] = [JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": "key1"})]
+
+    def rotate_keys(self, kid: str) -> Key:
+        key = JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": kid})
+        self.keys.insert(0, key)
+        return key
+
+    def issue_token(self, key: Key | None = None, **claims: Any) -> str:
+        key = key or self.keys[0]
+        payload = {
+            "iss": self.url,
+            "aud": "horizon",
+            "iat": int(time()),
+            "exp": int(time()) + 300,
+            **claims,
+        }
+        return JsonWebToken(["RS256"]).encode({"alg": "RS256", "kid": key.kid}, payload, key).decode("utf-8")
+
+    def handle(self, path: str) -> dict | None:
+        self.requests.append(path)
+        if path.endswith("/.well-known/openid-configuration"):
+            return {"issuer": self.url, "jwks_uri": f"{self.url}/protocol/openid-connect/certs"}
+        if path.endswith("/protocol/openid-connect/certs"):
+            return {"keys": [key.as_dict(is_private=False) for key in self.keys]}
+        return None
+
+
+@pytest.fixture
+def oidc_issuer() -> Generator[MockOIDCIssuer, None, None]:
+    issuer = MockOIDCIssuer()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            result = issuer.handle(self.path) if issuer.available else None
+            status = HTTPStatus.OK if result is not None else HTTPStatus.SERVICE_UNAVAILABLE
+            body = json.dumps(result).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    issuer.url = f"http://127.0.0.1:{server.server_address[1]}/realms/horizon"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield issuer
+    server.shutdown()
+    server.server_close()
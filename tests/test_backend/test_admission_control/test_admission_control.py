@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import secrets
+from http import HTTPStatus
+from time import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from horizon.backend.middlewares.admission_control import (
+    AdmissionControlMiddleware,
+    get_route_group,
+)
+from horizon.backend.services.api_key import generate_api_key
+from horizon.backend.settings.server import AdmissionControlSettings
+from horizon.backend.utils.jwt import sign_jwt
+
+pytestmark = [pytest.mark.backend, pytest.mark.asyncio]
+
+
+def _create_client(settings: AdmissionControlSettings, release: asyncio.Event) -> AsyncClient:
+    async def endpoint(request):
+        await release.wait()
+        return PlainTextResponse("ok")
+
+    app = Starlette(
+        routes=[
+            Route("/v1/hwm/", endpoint, methods=["GET", "POST"]),
+            Route("/monitoring/ping", endpoint),
+        ],
+    )
+    middleware = AdmissionControlMiddleware(app, settings=settings)
+    return AsyncClient(transport=ASGITransport(app=middleware), base_url="http://horizon")
+
+
+API_KEY = generate_api_key()
+
+
+def _auth(user_id: int) -> dict:
+    # each call produces a new token
+    token = sign_jwt({"user_id": user_id, "exp": time() + 1000, "jti": secrets.token_hex(8)}, "secret", "HS256")
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.parametrize(
+    ["method", "path", "expected"],
+    [
+        ("POST", "/v1/auth/token", "auth"),
+        ("GET", "/v1/hwm/", "hwm_read"),
+        ("GET", "/v1/namespaces/1", "hwm_read"),
+        ("PATCH", "/v1/hwm/1", "hwm_write"),
+        ("DELETE", "/v1/namespaces/1", "hwm_write"),
+        ("GET", "/v1/hwm-history/", "history"),
+        ("GET", "/v1/namespace-history/", "history"),
+        ("GET", "/monitoring/ping", None),
+        ("GET", "/docs", None),
+    ],
+)
+def test_admission_control_route_group(method: str, path: str, expected: str | None):
+    assert get_route_group(method, path) == expected
+
+
+async def test_admission_control_per_user_limit():
+    settings = AdmissionControlSettings.parse_obj(
+        {"enabled": True, "retry_after": 3, "hwm_read": {"max_concurrent_per_user": 1, "max_queue_size": 0}},
+    )
+    release = asyncio.Event()
+    rejected_before = REGISTRY.get_sample_value(
+        "horizon_admission_control_rejected_requests_total",
+        {"group": "hwm_read", "status": "429"},
+    )
+
+    async with _create_client(settings, release) as client:
+        first = asyncio.ensure_future(client.get("/v1/hwm/", headers=_auth(1)))
+        await asyncio.sleep(0.05)
+
+        response = await client.get("/v1/hwm/", headers=_auth(1))
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        assert response.headers["Retry-After"] == "3"
+        assert response.json() == {
+            "error": {
+                "code": "too_many_requests",
+                "message": "Too many concurrent requests, please try again later",
+                "details": None,
+            },
+        }
+
+        # other users and other route groups are not affected
+        other_user = asyncio.ensure_future(client.get("/v1/hwm/", headers=_auth(2)))
+        write = asyncio.ensure_future(client.post("/v1/hwm/", headers=_auth(1)))
+        not_limited = asyncio.ensure_future(client.get("/monitoring/ping", headers=_auth(1)))
+        await asyncio.sleep(0.05)
+        release.set()
+
+        responses = await asyncio.gather(first, other_user, write, not_limited)
+        assert [response.status_code for response in responses] == [HTTPStatus.OK] * 4
+
+        # slot is released after response
+        response = await client.get("/v1/hwm/", headers=_auth(1))
+        assert response.status_code == HTTPStatus.OK
+
+    rejected_after = REGISTRY.get_sample_value(
+        "horizon_admission_control_rejected_requests_total",
+        {"group": "hwm_read", "status": "429"},
+    )
+    assert rejected_after == (rejected_before or 0) + 1
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        pytest.param(lambda: _auth(1), id="same_user_different_tokens"),
+        pytest.param(lambda: {"Authorization": f"Bearer {API_KEY}"}, id="api_key"),
+        pytest.param(dict, id="anonymous_same_ip"),
+    ],
+)
+async def test_admission_control_per_user_limit_identity(headers):
+    settings = AdmissionControlSettings.parse_obj(
+        {"enabled": True, "hwm_read": {"max_concurrent_per_user": 1, "max_queue_size": 0}},
+    )
+    release = asyncio.Event()
+
+    async with _create_client(settings, release) as client:
+        first = asyncio.ensure_future(client.get("/v1/hwm/", headers=headers()))
+        await asyncio.sleep(0.05)
+
+        response = await client.get("/v1/hwm/", headers=headers())
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+
+        release.set()
+        assert (await first).status_code == HTTPStatus.OK
+
+
+async def test_admission_control_global_limit_queue():
+    settings = AdmissionControlSettings.parse_obj(
+        {
+            "enabled": True,
+            "hwm_read": {"max_concurrent": 1, "max_concurrent_per_user": None, "max_queue_size": 1},
+        },
+    )
+    release = asyncio.Event()
+    queued_before = REGISTRY.get_sample_value("horizon_admission_control_queued_requests_total", {"group": "hwm_read"})
+
+    async with _create_client(settings, release) as client:
+        first = asyncio.ensure_future(client.get("/v1/hwm/", headers=_auth(1)))
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(client.get("/v1/hwm/", headers=_auth(2)))
+        await asyncio.sleep(0.05)
+
+        # queue is full
+        response = await client.get("/v1/hwm/", headers=_auth(3))
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "1"
+        assert response.json()["error"]["code"] == "service_unavailable"
+
+        release.set()
+        responses = await asyncio.gather(first, queued)
+        assert [response.status_code for response in responses] == [HTTPStatus.OK] * 2
+
+    queued_after = REGISTRY.get_sample_value("horizon_admission_control_queued_requests_total", {"group": "hwm_read"})
+    assert queued_after == (queued_before or 0) + 1
+
+
+async def test_admission_control_queue_timeout():
+    settings = AdmissionControlSettings.parse_obj(
+        {"enabled": True, "hwm_read": {"max_concurrent": 1, "queue_timeout": 0.05}},
+    )
+    release = asyncio.Event()
+
+    async with _create_client(settings, release) as client:
+        first = asyncio.ensure_future(client.get("/v1/hwm/", headers=_auth(1)))
+        await asyncio.sleep(0.05)
+
+        response = await client.get("/v1/hwm/", headers=_auth(2))
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert response.json()["error"]["message"] == "Server is overloaded, please try again later"
+
+        release.set()
+        assert (await first).status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [{"server": {"admission_control": {"enabled": True, "hwm_read": {"max_concurrent": 1}}}}],
+    indirect=True,
+)
+async def test_admission_control_enabled(test_client: AsyncClient, access_token: str):
+    for _ in range(2):
+        response = await test_client.get("v1/users/me", headers={"Authorization": f"Bearer {access_token}"})
+        assert response.status_code == HTTPStatus.OK
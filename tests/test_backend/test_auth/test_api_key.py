@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import secrets
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import delete, select, update
+
+from horizon.backend.db.models import APIKey, Namespace, User
+from horizon.backend.services.api_key import generate_api_key, hash_api_key
+from tests.utils import get_metric
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from horizon.backend.db.models import HWM
+    from horizon.backend.settings.auth.jwt import JWTSettings
+
+DUMMY = "horizon.backend.providers.auth.dummy.DummyAuthProvider"
+pytestmark = [pytest.mark.asyncio, pytest.mark.dummy_auth, pytest.mark.auth, pytest.mark.backend]
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_api_key_auth(
+    test_client: AsyncClient,
+    api_key: str,
+    user: User,
+):
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"id": user.id, "username": user.username}
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_api_key_auth_unknown(test_client: AsyncClient):
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {generate_api_key()}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": "Invalid API key",
+            "details": None,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "api_key",
+    [{"expires_at": datetime.now(tz=timezone.utc) - timedelta(seconds=1)}],
+    indirect=True,
+)
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_api_key_auth_expired(
+    test_client: AsyncClient,
+    api_key: str,
+):
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": "API key is expired",
+            "details": None,
+        },
+    }
+
+
+@pytest.mark.parametrize("user", [{"is_active": False}], indirect=True)
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_api_key_auth_inactive_user(
+    test_client: AsyncClient,
+    api_key: str,
+    user: User,
+):
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": f"User {user.username!r} is disabled",
+            "details": None,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [{"auth": {"provider": DUMMY, "api_key": {"enabled": False}}}],
+    indirect=True,
+)
+async def test_api_key_auth_disabled(
+    test_client: AsyncClient,
+    api_key: str,
+):
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": "API keys are disabled",
+            "details": None,
+        },
+    }
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_api_key_auth_is_cached(
+    test_client: AsyncClient,
+    api_key: str,
+    access_token_settings: JWTSettings,
+    async_session: AsyncSession,
+):
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    # revoked key is accepted until cache item is expired
+    key_hash = hash_api_key(api_key, access_token_settings.secret_key.get_secret_value())
+    await async_session.execute(delete(APIKey).where(APIKey.key_hash == key_hash))
+    await async_session.commit()
+
+    hits_before = get_metric("horizon_ttl_cache_lookups_total", cache="api_key", result="hit")
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert get_metric("horizon_ttl_cache_lookups_total", cache="api_key", result="hit") == hits_before + 1
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [{"auth": {"provider": DUMMY, "api_key": {"cache": {"ttl_seconds": 0}}}}],
+    indirect=True,
+)
+async def test_api_key_auth_without_cache(
+    test_client: AsyncClient,
+    api_key: str,
+    access_token_settings: JWTSettings,
+    async_session: AsyncSession,
+):
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    key_hash = hash_api_key(api_key, access_token_settings.secret_key.get_secret_value())
+    await async_session.execute(delete(APIKey).where(APIKey.key_hash == key_hash))
+    await async_session.commit()
+
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.parametrize("namespaces", [(2, {})], indirect=True)
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_api_key_namespace_scope(
+    test_client: AsyncClient,
+    api_key: str,
+    access_token_settings: JWTSettings,
+    namespaces: list[Namespace],
+    new_hwm: HWM,
+    async_session: AsyncSession,
+):
+    allowed_namespace, other_namespace = namespaces
+    key_hash = hash_api_key(api_key, access_token_settings.secret_key.get_secret_value())
+    await async_session.execute(
+        update(APIKey).where(APIKey.key_hash == key_hash).values(namespace_ids=[allowed_namespace.id]),
+    )
+    await async_session.commit()
+
+    hwm_data = {
+        "name": new_hwm.name,
+        "type": new_hwm.type,
+        "value": new_hwm.value,
+    }
+
+    response = await test_client.post(
+        "v1/hwm/",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={"namespace_id": allowed_namespace.id, **hwm_data},
+    )
+    assert response.status_code == HTTPStatus.CREATED
+
+    # user is an owner of both namespaces, but key is restricted to only one of them
+    response = await test_client.post(
+        "v1/hwm/",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={"namespace_id": other_namespace.id, **hwm_data},
+    )
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json() == {
+        "error": {
+            "code": "permission_denied",
+            "message": "Permission denied. User has role GUEST but action requires at least DEVELOPER.",
+            "details": {
+                "required_role": "DEVELOPER",
+                "actual_role": "GUEST",
+            },
+        },
+    }
+
+    # reading is not restricted
+    response = await test_client.get(
+        f"v1/namespaces/{other_namespace.id}",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_api_key_namespace_scope_create_namespace(
+    test_client: AsyncClient,
+    api_key: str,
+    access_token_settings: JWTSettings,
+    namespace: Namespace,
+    new_namespace: Namespace,
+    async_session: AsyncSession,
+):
+    key_hash = hash_api_key(api_key, access_token_settings.secret_key.get_secret_value())
+    await async_session.execute(
+        update(APIKey).where(APIKey.key_hash == key_hash).values(namespace_ids=[namespace.id]),
+    )
+    await async_session.commit()
+
+    # key restricted to some namespaces cannot be used to create a namespace outside of this scope
+    response = await test_client.post(
+        "v1/namespaces/",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={"name": new_namespace.name, "description": new_namespace.description},
+    )
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json() == {
+        "error": {
+            "code": "permission_denied",
+            "message": "Permission denied. User has role GUEST but action requires at least OWNER.",
+            "details": {
+                "required_role": "OWNER",
+                "actual_role": "GUEST",
+            },
+        },
+    }
+
+    created_namespace = await async_session.scalar(select(Namespace).where(Namespace.name == new_namespace.name))
+    assert created_namespace is None
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_api_key_auth_malformed(test_client: AsyncClient):
+    # API key prefix, but wrong value
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer hzn_{secrets.token_hex(5)}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json()["error"]["message"] == "Invalid API key"
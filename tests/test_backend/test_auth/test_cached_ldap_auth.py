@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import secrets
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -9,12 +10,15 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 from passlib.hash import argon2
+from prometheus_client import REGISTRY
 from pydantic import __version__ as pydantic_version
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy_utils.functions import naturally_equivalent
 
 from horizon.backend.db.models import CredentialsCache, User
 from horizon.backend.providers.auth.cached_ldap import CachedLDAPAuthProvider
+from horizon.backend.providers.auth.ldap import LDAPLookupCache
+from horizon.backend.services.credentials_cache import CredentialsMemoryCache, CredentialsRecheckQueue
 from horizon.backend.utils.jwt import decode_jwt
 
 if TYPE_CHECKING:
@@ -29,6 +33,21 @@ CACHED_LDAP = "horizon.backend.providers.auth.cached_ldap.CachedLDAPAuthProvider
 pytestmark = [pytest.mark.asyncio, pytest.mark.ldap_auth, pytest.mark.auth, pytest.mark.backend]
 
 
+@pytest.fixture(autouse=True)
+def credentials_memory_cache(test_app: FastAPI) -> CredentialsMemoryCache:
+    # application is shared between tests with the same settings, but in-memory cache should not be
+    memory_cache = test_app.dependency_overrides[CredentialsMemoryCache]()
+    memory_cache.clear()
+    return memory_cache
+
+
+@pytest.fixture(autouse=True)
+def ldap_lookup_cache(test_app: FastAPI) -> LDAPLookupCache:
+    lookup_cache = test_app.dependency_overrides[LDAPLookupCache]()
+    lookup_cache.clear()
+    return lookup_cache
+
+
 @pytest.mark.parametrize("new_user", [{"username": "developer1"}], indirect=True)
 @pytest.mark.parametrize("settings", [{"auth": {"provider": CACHED_LDAP}}], indirect=True)
 async def test_cached_ldap_auth_get_token_creates_user(
@@ -749,6 +768,120 @@ async def test_cached_ldap_auth_get_token_ldap_is_unavailable_but_credentials_ca
     assert naturally_equivalent(cache_item, credentials_cache_item)
 
 
+@pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
+@pytest.mark.parametrize(
+    "credentials_cache_item",
+    [{"login": "developer1", "password_hash": argon2.hash("password")}],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {
+            "server": {"debug": False},
+            "auth": {
+                "provider": CACHED_LDAP,
+                "ldap": {
+                    "url": "ldap://unknown.host",
+                    "lookup": {"enabled": False},
+                },
+            },
+        },
+    ],
+    indirect=True,
+)
+async def test_cached_ldap_auth_get_token_ldap_is_unavailable_but_credentials_are_in_memory_cache(
+    test_client: AsyncClient,
+    async_session: AsyncSession,
+    user: User,
+    credentials_cache_item: CredentialsCache,
+):
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": "password",
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    # item was loaded to memory, database is not used anymore
+    await async_session.execute(delete(CredentialsCache).where(CredentialsCache.id == credentials_cache_item.id))
+    await async_session.commit()
+    hits_before = REGISTRY.get_sample_value("horizon_credentials_memory_cache_lookups_total", {"result": "hit"}) or 0
+
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": "password",
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    hits_after = REGISTRY.get_sample_value("horizon_credentials_memory_cache_lookups_total", {"result": "hit"})
+    assert hits_after == hits_before + 1
+
+    # password mismatch means fallback to database and then to LDAP, which is unavailable
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": "wrong_password",
+        },
+    )
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+
+@pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
+@pytest.mark.parametrize(
+    "credentials_cache_item",
+    [{"login": "developer1", "password_hash": argon2.hash("password")}],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {
+            "server": {"debug": False},
+            "auth": {
+                "provider": CACHED_LDAP,
+                "ldap": {
+                    "url": "ldap://unknown.host",
+                    "lookup": {"enabled": False},
+                },
+            },
+        },
+    ],
+    indirect=True,
+)
+async def test_cached_ldap_auth_get_token_concurrent_requests_are_coalesced(
+    test_client: AsyncClient,
+    user: User,
+    credentials_cache_item: CredentialsCache,
+):
+    labels = {"operation": "login", "mode": "executed"}
+    executed_before = REGISTRY.get_sample_value("horizon_single_flight_calls_total", labels) or 0
+
+    responses = await asyncio.gather(
+        *(
+            test_client.post(
+                "v1/auth/token",
+                data={
+                    "username": user.username,
+                    "password": "password",
+                },
+            )
+            for _ in range(5)
+        ),
+    )
+    assert [response.status_code for response in responses] == [HTTPStatus.OK] * 5
+    # credentials were checked once, but each request got its own refresh token
+    assert len({response.json()["refresh_token"] for response in responses}) == 5
+
+    executed_after = REGISTRY.get_sample_value("horizon_single_flight_calls_total", labels)
+    assert executed_after == executed_before + 1
+
+
 @pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
 @pytest.mark.parametrize(
     "credentials_cache_item",
@@ -827,6 +960,114 @@ async def test_cached_ldap_auth_get_token_ldap_is_unavailable_and_credentials_ca
     assert naturally_equivalent(cache_item, credentials_cache_item)
 
 
+@pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
+@pytest.mark.parametrize(
+    "credentials_cache_item",
+    [
+        {
+            "login": "developer1",
+            "password_hash": argon2.hash("password"),
+            "updated_at": datetime.now(tz=timezone.utc) - timedelta(days=1),
+        },
+    ],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {
+            "server": {"debug": False},
+            "auth": {
+                "provider": CACHED_LDAP,
+                "cache": {"grace_seconds": 2 * 24 * 60 * 60},
+                "ldap": {
+                    "url": "ldap://unknown.host",
+                    "lookup": {"enabled": False},
+                },
+            },
+        },
+    ],
+    indirect=True,
+)
+async def test_cached_ldap_auth_get_token_ldap_is_unavailable_and_credentials_cache_is_in_grace_period(
+    test_client: AsyncClient,
+    test_app: FastAPI,
+    async_session: AsyncSession,
+    user: User,
+    credentials_cache_item: CredentialsCache,
+):
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": "wrong_password",
+        },
+    )
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": "password",
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    # credentials cache item is not updated
+    query = select(CredentialsCache).where(CredentialsCache.user_id == user.id)
+    cache = await async_session.scalars(query)
+    cache_item = cache.one_or_none()
+
+    assert naturally_equivalent(cache_item, credentials_cache_item)
+
+    # but credentials will be checked in LDAP when it becomes available
+    recheck_queue: CredentialsRecheckQueue = test_app.dependency_overrides[CredentialsRecheckQueue]()
+    assert recheck_queue.pop_all() == {user.username: "password"}
+
+
+@pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
+@pytest.mark.parametrize(
+    "credentials_cache_item",
+    [
+        {
+            "login": "developer1",
+            "password_hash": argon2.hash("password"),
+            "updated_at": datetime.now(tz=timezone.utc) - timedelta(days=1),
+        },
+    ],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "settings",
+    [{"auth": {"provider": CACHED_LDAP, "cache": {"grace_seconds": 2 * 24 * 60 * 60}}}],
+    indirect=True,
+)
+async def test_cached_ldap_auth_recheck_credentials_accepted_in_grace_period(
+    test_app: FastAPI,
+    async_session: AsyncSession,
+    user: User,
+    credentials_cache_item: CredentialsCache,
+):
+    current_dt = datetime.now(tz=timezone.utc)
+
+    # credentials are valid, cache item is updated
+    await CachedLDAPAuthProvider._recheck_credentials_in_background(test_app, user.username, "password")
+
+    query = select(CredentialsCache).where(CredentialsCache.user_id == user.id)
+    cache = await async_session.scalars(query)
+    cache_item = cache.one()
+    assert cache_item.updated_at >= current_dt
+    assert argon2.verify("password", cache_item.password_hash)
+
+    # password was changed in LDAP, cache item is removed
+    async_session.expunge_all()
+    await CachedLDAPAuthProvider._recheck_credentials_in_background(test_app, user.username, "old_password")
+
+    cache = await async_session.scalars(query)
+    assert cache.one_or_none() is None
+
+
 @pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
 @pytest.mark.parametrize(
     "credentials_cache_item",
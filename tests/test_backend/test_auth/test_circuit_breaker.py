@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from horizon.backend.services.circuit_breaker import CircuitBreaker
+from horizon.commons.exceptions import AuthorizationError, ServiceError
+from tests.utils import get_metric
+
+pytestmark = [pytest.mark.auth, pytest.mark.backend]
+
+
+def _fail(circuit_breaker: CircuitBreaker) -> None:
+    msg = "Failed to connect"
+    with pytest.raises(ServiceError, match=msg), circuit_breaker.protect():
+        raise ServiceError(msg)
+
+
+def test_circuit_breaker_opens_after_consecutive_failures():
+    circuit_breaker = CircuitBreaker(name="test_open", failure_threshold=2, reset_timeout=60)
+
+    _fail(circuit_breaker)
+    assert not circuit_breaker.is_open
+
+    # successful call resets failures counter
+    with circuit_breaker.protect():
+        pass
+
+    _fail(circuit_breaker)
+    assert not circuit_breaker.is_open
+    _fail(circuit_breaker)
+    assert circuit_breaker.is_open
+    assert get_metric("horizon_circuit_breaker_open", name="test_open") == 1
+
+    called = False
+    with pytest.raises(ServiceError, match="Circuit breaker 'test_open' is open"), circuit_breaker.protect():
+        called = True
+
+    assert not called
+    assert get_metric("horizon_circuit_breaker_rejected_calls_total", name="test_open") == 1
+
+
+def test_circuit_breaker_other_exceptions_are_not_failures():
+    circuit_breaker = CircuitBreaker(name="test_other", failure_threshold=1, reset_timeout=60)
+
+    # e.g. wrong credentials, but service is available
+    msg = "Wrong credentials"
+    with pytest.raises(AuthorizationError, match=msg), circuit_breaker.protect():
+        raise AuthorizationError(msg)
+
+    assert not circuit_breaker.is_open
+
+
+def test_circuit_breaker_trial_call():
+    circuit_breaker = CircuitBreaker(name="test_trial", failure_threshold=1, reset_timeout=0.1)
+    _fail(circuit_breaker)
+    assert circuit_breaker.is_open
+
+    time.sleep(0.2)
+    assert not circuit_breaker.is_open
+
+    # failed trial call opens circuit again
+    _fail(circuit_breaker)
+    assert circuit_breaker.is_open
+
+    time.sleep(0.2)
+    trial = circuit_breaker.protect()
+    trial.__enter__()
+    # only one trial call is allowed at a time
+    with pytest.raises(ServiceError, match="Circuit breaker 'test_trial' is open"), circuit_breaker.protect():
+        pass
+    trial.__exit__(None, None, None)
+
+    # successful trial call closes circuit
+    assert get_metric("horizon_circuit_breaker_open", name="test_trial") == 0
+    with circuit_breaker.protect():
+        pass
+
+
+def test_circuit_breaker_disabled():
+    circuit_breaker = CircuitBreaker(name="test_disabled", failure_threshold=0, reset_timeout=60)
+    for _ in range(10):
+        _fail(circuit_breaker)
+    assert not circuit_breaker.is_open
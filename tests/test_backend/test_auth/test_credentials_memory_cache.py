@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from time import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from horizon.backend.services.credentials_cache import (
+    CredentialsMemoryCache,
+    CredentialsRecheckQueue,
+)
+from tests.utils import get_metric
+
+pytestmark = [pytest.mark.auth, pytest.mark.backend]
+
+
+@pytest.fixture
+def memory_cache() -> CredentialsMemoryCache:
+    return CredentialsMemoryCache(max_size=2, min_update_interval=60)
+
+
+def test_credentials_memory_cache_get_username(memory_cache: CredentialsMemoryCache):
+    hits_before = get_metric("horizon_credentials_memory_cache_lookups_total", result="hit")
+    misses_before = get_metric("horizon_credentials_memory_cache_lookups_total", result="miss")
+    mismatches_before = get_metric("horizon_credentials_memory_cache_lookups_total", result="mismatch")
+
+    assert memory_cache.get_username("login", "password") is None
+
+    memory_cache.set("login", "password", user_id=1, username="user", expires_at=time() + 60, persisted_at=time())
+    assert memory_cache.get_username("login", "password") == "user"
+    assert memory_cache.get_username("login", "wrong_password") is None
+
+    assert get_metric("horizon_credentials_memory_cache_lookups_total", result="hit") == hits_before + 1
+    assert get_metric("horizon_credentials_memory_cache_lookups_total", result="miss") == misses_before + 1
+    assert get_metric("horizon_credentials_memory_cache_lookups_total", result="mismatch") == mismatches_before + 1
+
+
+def test_credentials_memory_cache_item_expired(memory_cache: CredentialsMemoryCache):
+    memory_cache.set("login", "password", user_id=1, username="user", expires_at=time() - 1, persisted_at=time())
+    assert memory_cache.get_username("login", "password") is None
+
+
+def test_credentials_memory_cache_evicts_least_recently_used(memory_cache: CredentialsMemoryCache):
+    expires_at = time() + 60
+    memory_cache.set("login1", "password", user_id=1, username="user1", expires_at=expires_at, persisted_at=time())
+    memory_cache.set("login2", "password", user_id=2, username="user2", expires_at=expires_at, persisted_at=time())
+
+    # mark login1 as recently used
+    assert memory_cache.get_username("login1", "password") == "user1"
+
+    memory_cache.set("login3", "password", user_id=3, username="user3", expires_at=expires_at, persisted_at=time())
+    assert memory_cache.get_username("login1", "password") == "user1"
+    assert memory_cache.get_username("login2", "password") is None
+    assert memory_cache.get_username("login3", "password") == "user3"
+
+
+def test_credentials_memory_cache_disabled():
+    memory_cache = CredentialsMemoryCache(max_size=0, min_update_interval=60)
+    memory_cache.set("login", "password", user_id=1, username="user", expires_at=time() + 60, persisted_at=time())
+    assert memory_cache.get_username("login", "password") is None
+    assert memory_cache.get_recently_persisted_at("login", "password", user_id=1) is None
+
+
+def test_credentials_memory_cache_get_recently_persisted_at(memory_cache: CredentialsMemoryCache):
+    skipped_before = get_metric("horizon_credentials_cache_skipped_writes_total")
+
+    persisted_at = time()
+    memory_cache.set("login", "password", user_id=1, username="user", expires_at=time() + 60, persisted_at=persisted_at)
+    assert memory_cache.get_recently_persisted_at("login", "password", user_id=1) == persisted_at
+
+    # password was changed
+    assert memory_cache.get_recently_persisted_at("login", "wrong_password", user_id=1) is None
+    # user was recreated
+    assert memory_cache.get_recently_persisted_at("login", "password", user_id=2) is None
+
+    assert get_metric("horizon_credentials_cache_skipped_writes_total") == skipped_before + 1
+
+    # row was saved too long ago
+    memory_cache.set("login", "password", user_id=1, username="user", expires_at=time() + 60, persisted_at=time() - 61)
+    assert memory_cache.get_recently_persisted_at("login", "password", user_id=1) is None
+
+
+def test_credentials_memory_cache_clear(memory_cache: CredentialsMemoryCache):
+    memory_cache.set("login", "password", user_id=1, username="user", expires_at=time() + 60, persisted_at=time())
+    memory_cache.clear()
+    assert memory_cache.get_username("login", "password") is None
+
+
+def test_credentials_recheck_queue():
+    recheck_queue = CredentialsRecheckQueue(max_size=2)
+    assert not recheck_queue
+
+    recheck_queue.add("login1", "old_password")
+    recheck_queue.add("login2", "password")
+    # only the last password is stored
+    recheck_queue.add("login1", "password")
+    recheck_queue.add("login3", "password")
+
+    assert len(recheck_queue) == 2
+    assert REGISTRY.get_sample_value("horizon_credentials_cache_pending_rechecks") == 2
+
+    assert recheck_queue.pop_all() == {"login1": "password", "login3": "password"}
+    assert not recheck_queue
+    assert REGISTRY.get_sample_value("horizon_credentials_cache_pending_rechecks") == 0
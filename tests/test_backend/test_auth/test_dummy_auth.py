@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import secrets
 from datetime import datetime, timezone
 from http import HTTPStatus
@@ -8,7 +9,7 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 from pydantic import __version__ as pydantic_version
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy_utils.functions import naturally_equivalent
 
 from horizon.backend.db.models import User
@@ -257,3 +258,335 @@ async def test_dummy_auth_check_invalid_token(
             "details": None,
         },
     }
+
+
+async def _get_refresh_token(test_client: AsyncClient, user: User) -> str:
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": secrets.token_hex(16),
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    return response.json()["refresh_token"]
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_dummy_auth_refresh_token(
+    test_client: AsyncClient,
+    user: User,
+    access_token_settings: JWTSettings,
+):
+    refresh_token = await _get_refresh_token(test_client, user)
+
+    before = time()
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    content = response.json()
+    assert content["token_type"] == "bearer"
+    assert before < content["expires_at"] <= time() + access_token_settings.expire_seconds
+    # refresh token is rotated
+    assert content["refresh_token"]
+    assert content["refresh_token"] != refresh_token
+
+    jwt = decode_jwt(
+        content["access_token"],
+        access_token_settings.secret_key.get_secret_value(),
+        access_token_settings.security_algorithm,
+    )
+    assert jwt["user_id"] == user.id
+
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {content['access_token']}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_dummy_auth_refresh_token_reused(
+    test_client: AsyncClient,
+    user: User,
+):
+    refresh_token = await _get_refresh_token(test_client, user)
+    response = await test_client.post(
+        "v1/auth/token",
+        data={"grant_type": "refresh_token", "refresh_token": refresh_token},
+    )
+    assert response.status_code == HTTPStatus.OK
+    new_refresh_token = response.json()["refresh_token"]
+
+    # someone is using stolen token
+    response = await test_client.post(
+        "v1/auth/token",
+        data={"grant_type": "refresh_token", "refresh_token": refresh_token},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": "Invalid refresh token",
+            "details": None,
+        },
+    }
+
+    # all tokens issued after the same login are revoked
+    response = await test_client.post(
+        "v1/auth/token",
+        data={"grant_type": "refresh_token", "refresh_token": new_refresh_token},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    # but tokens issued after another login are still valid
+    another_refresh_token = await _get_refresh_token(test_client, user)
+    response = await test_client.post(
+        "v1/auth/token",
+        data={"grant_type": "refresh_token", "refresh_token": another_refresh_token},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_dummy_auth_refresh_token_unknown(test_client: AsyncClient):
+    response = await test_client.post(
+        "v1/auth/token",
+        data={"grant_type": "refresh_token", "refresh_token": secrets.token_urlsafe(32)},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": "Invalid refresh token",
+            "details": None,
+        },
+    }
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_dummy_auth_refresh_token_for_inactive_user(
+    test_client: AsyncClient,
+    user: User,
+    async_session: AsyncSession,
+):
+    refresh_token = await _get_refresh_token(test_client, user)
+
+    await async_session.execute(update(User).where(User.id == user.id).values(is_active=False))
+    await async_session.commit()
+
+    response = await test_client.post(
+        "v1/auth/token",
+        data={"grant_type": "refresh_token", "refresh_token": refresh_token},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": f"User {user.username!r} is disabled",
+            "details": None,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [{"auth": {"provider": DUMMY, "refresh_token": {"enabled": False}}}],
+    indirect=True,
+)
+async def test_dummy_auth_refresh_token_disabled(
+    test_client: AsyncClient,
+    user: User,
+):
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": secrets.token_hex(16),
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["refresh_token"] is None
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_dummy_auth_refresh_token_with_malformed_input(test_client: AsyncClient):
+    response = await test_client.post(
+        "v1/auth/token",
+        data={"grant_type": "refresh_token"},
+    )
+
+    details: list[dict[str, Any]]
+    if pydantic_version < "2":
+        details = [
+            {
+                "location": ["body", "refresh_token"],
+                "code": "value_error.missing",
+                "message": "field required",
+            },
+        ]
+    else:
+        details = [
+            {
+                "location": ["body", "refresh_token"],
+                "code": "missing",
+                "message": "Field required",
+                "context": {},
+                "input": None,
+            },
+        ]
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.json() == {
+        "error": {
+            "code": "invalid_request",
+            "message": "Invalid request",
+            "details": details,
+        },
+    }
+
+
+SELF_CONTAINED = {
+    "auth": {
+        "provider": DUMMY,
+        "access_token": {"self_contained": True, "revocation_check_interval_seconds": 0.1},
+    },
+}
+
+
+async def _get_access_token(test_client: AsyncClient, user: User) -> str:
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": secrets.token_hex(16),
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    return response.json()["access_token"]
+
+
+@pytest.mark.parametrize("settings", [SELF_CONTAINED], indirect=True)
+async def test_dummy_auth_self_contained_token(
+    test_client: AsyncClient,
+    user: User,
+    access_token_settings: JWTSettings,
+    async_session: AsyncSession,
+):
+    access_token = await _get_access_token(test_client, user)
+
+    jwt = decode_jwt(
+        access_token,
+        access_token_settings.secret_key.get_secret_value(),
+        access_token_settings.security_algorithm,
+    )
+    assert jwt["user_id"] == user.id
+    assert jwt["username"] == user.username
+    assert jwt["is_admin"] is False
+    assert jwt["auth_version"] == 0
+
+    # user is not fetched from database, so changes are not visible until token is reissued
+    await async_session.execute(update(User).where(User.id == user.id).values(username=secrets.token_hex(5)))
+    await async_session.commit()
+
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"id": user.id, "username": user.username}
+
+
+@pytest.mark.parametrize("settings", [SELF_CONTAINED], indirect=True)
+async def test_dummy_auth_self_contained_token_without_claims(
+    test_client: AsyncClient,
+    access_token: str,
+    user: User,
+):
+    # tokens issued before self-contained tokens were enabled are still accepted
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"id": user.id, "username": user.username}
+
+
+@pytest.mark.parametrize("settings", [SELF_CONTAINED], indirect=True)
+async def test_dummy_auth_self_contained_token_revoked(
+    test_client: AsyncClient,
+    user: User,
+    async_session: AsyncSession,
+):
+    access_token = await _get_access_token(test_client, user)
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    # e.g. user role was changed
+    await async_session.execute(update(User).where(User.id == user.id).values(auth_version=User.auth_version + 1))
+    await async_session.commit()
+
+    # wait for revocation list to be reloaded
+    await asyncio.sleep(0.2)
+
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": "Token was revoked",
+            "details": None,
+        },
+    }
+
+    # new token contains actual claims
+    new_access_token = await _get_access_token(test_client, user)
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {new_access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize("settings", [SELF_CONTAINED], indirect=True)
+async def test_dummy_auth_self_contained_token_for_inactive_user(
+    test_client: AsyncClient,
+    user: User,
+    async_session: AsyncSession,
+):
+    access_token = await _get_access_token(test_client, user)
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    await async_session.execute(update(User).where(User.id == user.id).values(is_active=False))
+    await async_session.commit()
+
+    await asyncio.sleep(0.2)
+
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": f"User {user.username!r} is disabled",
+            "details": None,
+        },
+    }
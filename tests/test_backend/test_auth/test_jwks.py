@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import secrets
+from http import HTTPStatus
+from time import time
+from typing import TYPE_CHECKING
+
+import pytest
+from authlib.jose import JsonWebKey, JsonWebToken
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from pydantic import ValidationError
+
+from horizon.backend.settings.auth.jwt import JWTSettings
+from horizon.backend.utils.jwt import JWTKeys, sign_jwt
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+    from horizon.backend.db.models import User
+
+DUMMY = "horizon.backend.providers.auth.dummy.DummyAuthProvider"
+pytestmark = [pytest.mark.asyncio, pytest.mark.dummy_auth, pytest.mark.auth, pytest.mark.backend]
+
+
+def _generate_private_key(security_algorithm: str) -> str:
+    if security_algorithm.startswith("RS"):
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    elif security_algorithm.startswith("ES"):
+        key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        key = ed25519.Ed25519PrivateKey.generate()
+
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+
+
+# generating RSA keys is slow, so they are shared between tests
+PRIVATE_KEYS = {
+    security_algorithm: [_generate_private_key(security_algorithm) for _ in range(2)]
+    for security_algorithm in ("RS256", "ES256", "EdDSA")
+}
+ASYMMETRIC = [
+    {
+        "auth": {
+            "provider": DUMMY,
+            "access_token": {
+                "security_algorithm": security_algorithm,
+                "private_keys": private_keys,
+                "jwks_max_age_seconds": 60,
+            },
+        },
+    }
+    for security_algorithm, private_keys in PRIVATE_KEYS.items()
+]
+
+
+async def _get_access_token(test_client: AsyncClient, user: User) -> str:
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": secrets.token_hex(16),
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    return response.json()["access_token"]
+
+
+@pytest.mark.parametrize("settings", [{"auth": {"provider": DUMMY}}], indirect=True)
+async def test_jwks_symmetric_algorithm(test_client: AsyncClient):
+    # secret key is never published
+    response = await test_client.get(".well-known/jwks.json")
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"keys": []}
+
+
+@pytest.mark.parametrize("settings", ASYMMETRIC, indirect=True)
+async def test_jwks_asymmetric_algorithm(
+    test_client: AsyncClient,
+    access_token_settings: JWTSettings,
+):
+    response = await test_client.get(".well-known/jwks.json")
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+
+    keys = response.json()["keys"]
+    expected_kids = [
+        JsonWebKey.import_key(private_key.get_secret_value()).thumbprint()
+        for private_key in access_token_settings.private_keys
+    ]
+    assert [key["kid"] for key in keys] == expected_kids
+    for key in keys:
+        assert key["alg"] == access_token_settings.security_algorithm
+        assert key["use"] == "sig"
+        # private part of key is not published
+        assert "d" not in key
+
+
+@pytest.mark.parametrize("settings", ASYMMETRIC, indirect=True)
+async def test_jwks_token_can_be_validated_offline(
+    test_client: AsyncClient,
+    user: User,
+    access_token_settings: JWTSettings,
+):
+    access_token = await _get_access_token(test_client, user)
+
+    response = await test_client.get(".well-known/jwks.json")
+    key_set = JsonWebKey.import_key_set(response.json())
+
+    # e.g. API gateway can validate token without calling Horizon
+    claims = JsonWebToken([access_token_settings.security_algorithm]).decode(access_token, key=key_set)
+    claims.validate()
+    assert claims["user_id"] == user.id
+    assert claims.header["kid"] == key_set.keys[0].kid
+
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"id": user.id, "username": user.username}
+
+
+@pytest.mark.parametrize("settings", ASYMMETRIC, indirect=True)
+async def test_jwks_token_signed_by_previous_key(
+    test_client: AsyncClient,
+    user: User,
+    access_token_settings: JWTSettings,
+):
+    # tokens issued before key rotation are still accepted
+    previous_key = JsonWebKey.import_key(access_token_settings.private_keys[1].get_secret_value())
+    access_token = sign_jwt(
+        {"user_id": user.id, "exp": time() + 1000},
+        previous_key,
+        access_token_settings.security_algorithm,
+        header={"kid": previous_key.thumbprint()},
+    )
+
+    response = await test_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"id": user.id, "username": user.username}
+
+
+@pytest.mark.parametrize("settings", ASYMMETRIC, indirect=True)
+async def test_jwks_token_signed_by_unknown_key(
+    test_client: AsyncClient,
+    user: User,
+    access_token_settings: JWTSettings,
+):
+    unknown_key = JsonWebKey.import_key(_generate_private_key(access_token_settings.security_algorithm))
+    valid_kid = JsonWebKey.import_key(access_token_settings.private_keys[0].get_secret_value()).thumbprint()
+
+    for kid in [unknown_key.thumbprint(), valid_kid]:
+        access_token = sign_jwt(
+            {"user_id": user.id, "exp": time() + 1000},
+            unknown_key,
+            access_token_settings.security_algorithm,
+            header={"kid": kid},
+        )
+
+        response = await test_client.get(
+            "v1/users/me",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        assert response.json() == {
+            "error": {
+                "code": "unauthorized",
+                "message": "Invalid token",
+                "details": None,
+            },
+        }
+
+
+async def test_jwks_settings_private_keys_required():
+    with pytest.raises(ValidationError, match="requires at least one item in 'private_keys'"):
+        JWTSettings.parse_obj({"secret_key": "secret", "security_algorithm": "ES256"})
+
+
+async def test_jwks_settings_private_keys_from_env(tmp_path):
+    private_key = PRIVATE_KEYS["ES256"][0]
+    key_path = tmp_path / "key.pem"
+    key_path.write_text(private_key)
+
+    settings = JWTSettings.parse_obj(
+        {
+            "secret_key": "secret",
+            "security_algorithm": "ES256",
+            "private_keys": f'["{key_path}"]',
+        },
+    )
+    jwt_keys = JWTKeys.from_settings(settings)
+    assert jwt_keys.get_jwks()["keys"][0]["kid"] == JsonWebKey.import_key(private_key).thumbprint()
+
+
+async def test_jwks_settings_key_type_mismatch():
+    settings = JWTSettings.parse_obj(
+        {
+            "secret_key": "secret",
+            "security_algorithm": "RS256",
+            "private_keys": PRIVATE_KEYS["ES256"][0],
+        },
+    )
+    with pytest.raises(ValueError, match="Algorithm 'RS256' requires RSA key, got EC key"):
+        JWTKeys.from_settings(settings)
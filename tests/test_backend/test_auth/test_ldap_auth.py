@@ -8,12 +8,13 @@ from time import time
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from prometheus_client import REGISTRY
 from pydantic import __version__ as pydantic_version
 from sqlalchemy import select
 from sqlalchemy_utils.functions import naturally_equivalent
 
 from horizon.backend.db.models import User
-from horizon.backend.providers.auth.ldap import LDAPAuthProvider
+from horizon.backend.providers.auth.ldap import LDAPAuthProvider, LDAPLookupCache
 from horizon.backend.utils.jwt import decode_jwt
 
 if TYPE_CHECKING:
@@ -28,6 +29,14 @@ LDAP = "horizon.backend.providers.auth.ldap.LDAPAuthProvider"
 pytestmark = [pytest.mark.asyncio, pytest.mark.ldap_auth, pytest.mark.auth, pytest.mark.backend]
 
 
+@pytest.fixture(autouse=True)
+def ldap_lookup_cache(test_app: FastAPI) -> LDAPLookupCache:
+    # application is shared between tests with the same settings, but lookup cache should not be
+    lookup_cache = test_app.dependency_overrides[LDAPLookupCache]()
+    lookup_cache.clear()
+    return lookup_cache
+
+
 @pytest.mark.parametrize("new_user", [{"username": "developer1"}], indirect=True)
 @pytest.mark.parametrize("settings", [{"auth": {"provider": LDAP}}], indirect=True)
 async def test_ldap_auth_get_token_creates_user(
@@ -110,6 +119,69 @@ async def test_ldap_auth_get_token_for_existing_user(
     assert naturally_equivalent(user_after, user)
 
 
+@pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
+@pytest.mark.parametrize("settings", [{"auth": {"provider": LDAP}}], indirect=True)
+async def test_ldap_auth_get_token_uses_lookup_cache(
+    test_client: AsyncClient,
+    user: User,
+):
+    labels = {"cache": "ldap_lookup", "result": "hit"}
+    hits_before = REGISTRY.get_sample_value("horizon_ttl_cache_lookups_total", labels) or 0
+
+    for _ in range(2):
+        response = await test_client.post(
+            "v1/auth/token",
+            data={
+                "username": user.username,
+                "password": "password",
+            },
+        )
+        assert response.status_code == HTTPStatus.OK
+
+    # lookup query was performed only once, but password was checked twice
+    assert REGISTRY.get_sample_value("horizon_ttl_cache_lookups_total", labels) == hits_before + 1
+
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": secrets.token_hex(16),
+        },
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
+@pytest.mark.parametrize("settings", [{"auth": {"provider": LDAP}}], indirect=True)
+async def test_ldap_auth_refresh_token_does_not_call_ldap(
+    test_client: AsyncClient,
+    user: User,
+):
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": "password",
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    refresh_token = response.json()["refresh_token"]
+
+    labels = {"operation": "bind"}
+    binds_before = REGISTRY.get_sample_value("horizon_ldap_request_seconds_count", labels)
+
+    response = await test_client.post(
+        "v1/auth/token",
+        data={
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["refresh_token"] != refresh_token
+    assert REGISTRY.get_sample_value("horizon_ldap_request_seconds_count", labels) == binds_before
+
+
 @pytest.mark.parametrize("new_user", [{"username": "developer1"}], indirect=True)
 @pytest.mark.parametrize("settings", [{"auth": {"provider": LDAP}}], indirect=True)
 async def test_ldap_auth_get_token_with_wrong_password(
@@ -480,6 +552,48 @@ async def test_ldap_auth_check_inactive_user(
     }
 
 
+@pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {
+            "server": {"debug": False},
+            "auth": {
+                "provider": LDAP,
+                "ldap": {
+                    "url": "ldap://unknown.host",
+                    "lookup": {"enabled": False},
+                    "circuit_breaker": {"failure_threshold": 1, "reset_timeout_seconds": 60},
+                },
+            },
+        },
+    ],
+    indirect=True,
+)
+async def test_ldap_auth_get_token_ldap_is_unavailable_circuit_breaker(
+    test_client: AsyncClient,
+    test_app: FastAPI,
+    user: User,
+):
+    # circuit breaker state is shared between tests with the same settings
+    LDAPAuthProvider.setup(test_app)
+    rejected_before = REGISTRY.get_sample_value("horizon_circuit_breaker_rejected_calls_total", {"name": "ldap"}) or 0
+
+    for _ in range(3):
+        response = await test_client.post(
+            "v1/auth/token",
+            data={
+                "username": user.username,
+                "password": "password",
+            },
+        )
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+    # only the first request was sent to LDAP
+    rejected_after = REGISTRY.get_sample_value("horizon_circuit_breaker_rejected_calls_total", {"name": "ldap"})
+    assert rejected_after == rejected_before + 2
+
+
 @pytest.mark.parametrize("user", [{"username": "developer1"}], indirect=True)
 @pytest.mark.parametrize(
     "settings",
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+import secrets
+from http import HTTPStatus
+from time import time
+from typing import TYPE_CHECKING
+
+import pytest
+import pytest_asyncio
+from authlib.jose import JsonWebKey
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+
+from horizon.backend import application_factory
+from horizon.backend.db.models import User
+from horizon.backend.settings import Settings
+from horizon.commons.exceptions import ServiceError
+from tests.utils import get_metric
+
+if TYPE_CHECKING:
+    from typing import AsyncGenerator
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from tests.fixtures.oidc_issuer import MockOIDCIssuer
+
+OIDC = "horizon.backend.providers.auth.oidc.OIDCAuthProvider"
+pytestmark = [pytest.mark.asyncio, pytest.mark.oidc_auth, pytest.mark.auth, pytest.mark.backend]
+
+
+def _create_app(oidc_issuer: MockOIDCIssuer, **oidc_settings):
+    oidc = {"issuer_url": oidc_issuer.url, "audience": "horizon", **oidc_settings}
+    return application_factory(Settings.parse_obj({"auth": {"provider": OIDC, "oidc": oidc}}))
+
+
+@pytest_asyncio.fixture(params=[{}])
+async def oidc_client(
+    request: pytest.FixtureRequest,
+    oidc_issuer: MockOIDCIssuer,
+) -> AsyncGenerator[AsyncClient, None]:
+    app = _create_app(oidc_issuer, **request.param)
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://horizon") as client:
+            yield client
+
+
+async def test_oidc_auth_creates_user(
+    oidc_client: AsyncClient,
+    oidc_issuer: MockOIDCIssuer,
+    new_user: User,
+    async_session: AsyncSession,
+):
+    access_token = oidc_issuer.issue_token(preferred_username=new_user.username)
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    created_user = await async_session.scalar(select(User).where(User.username == new_user.username))
+    assert response.json() == {"id": created_user.id, "username": new_user.username}
+
+
+async def test_oidc_auth_does_not_call_issuer(
+    oidc_client: AsyncClient,
+    oidc_issuer: MockOIDCIssuer,
+    user: User,
+):
+    # JWKS is fetched on startup
+    assert oidc_issuer.requests == [
+        "/realms/horizon/.well-known/openid-configuration",
+        "/realms/horizon/protocol/openid-connect/certs",
+    ]
+
+    access_token = oidc_issuer.issue_token(preferred_username=user.username)
+    hits_before = get_metric("horizon_ttl_cache_lookups_total", cache="oidc_user", result="hit")
+    for _ in range(3):
+        response = await oidc_client.get(
+            "v1/users/me",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"id": user.id, "username": user.username}
+
+    # neither IdP nor database is called for each request
+    assert len(oidc_issuer.requests) == 2
+    assert get_metric("horizon_ttl_cache_lookups_total", cache="oidc_user", result="hit") == hits_before + 2
+
+    # keys are cached, so IdP is not required to be available
+    oidc_issuer.available = False
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize("user", [{"is_active": False}], indirect=True)
+async def test_oidc_auth_inactive_user(
+    oidc_client: AsyncClient,
+    oidc_issuer: MockOIDCIssuer,
+    user: User,
+):
+    access_token = oidc_issuer.issue_token(preferred_username=user.username)
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": f"User {user.username!r} is disabled",
+            "details": None,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"iss": "http://other.issuer"},
+        {"aud": "other_client"},
+        {"exp": int(time()) - 60},
+        {"exp": None},
+        {"nbf": int(time()) + 600},
+    ],
+    ids=["wrong_issuer", "wrong_audience", "expired", "missing_expiration", "not_before"],
+)
+async def test_oidc_auth_invalid_token(
+    oidc_client: AsyncClient,
+    oidc_issuer: MockOIDCIssuer,
+    user: User,
+    claims: dict,
+):
+    access_token = oidc_issuer.issue_token(preferred_username=user.username, **claims)
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": "Invalid token",
+            "details": None,
+        },
+    }
+
+
+async def test_oidc_auth_malformed_token(oidc_client: AsyncClient):
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {secrets.token_hex()}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json()["error"]["message"] == "Invalid token"
+
+
+async def test_oidc_auth_missing_username_claim(
+    oidc_client: AsyncClient,
+    oidc_issuer: MockOIDCIssuer,
+):
+    access_token = oidc_issuer.issue_token(sub=secrets.token_hex(8))
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json()["error"]["message"] == "Missing 'preferred_username' claim in token"
+
+
+@pytest.mark.parametrize("oidc_client", [{"username_claim": "email"}], indirect=True)
+async def test_oidc_auth_custom_username_claim(
+    oidc_client: AsyncClient,
+    oidc_issuer: MockOIDCIssuer,
+    user: User,
+):
+    access_token = oidc_issuer.issue_token(preferred_username=secrets.token_hex(8), email=user.username)
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"id": user.id, "username": user.username}
+
+
+@pytest.mark.parametrize("oidc_client", [{"jwks": {"min_refresh_interval_seconds": 0}}], indirect=True)
+async def test_oidc_auth_keys_rotation(
+    oidc_client: AsyncClient,
+    oidc_issuer: MockOIDCIssuer,
+    user: User,
+):
+    new_key = oidc_issuer.rotate_keys(kid="key2")
+    oidc_issuer.requests.clear()
+
+    # token signed by new key is accepted immediately
+    access_token = oidc_issuer.issue_token(key=new_key, preferred_username=user.username)
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert oidc_issuer.requests == ["/realms/horizon/protocol/openid-connect/certs"]
+
+    # token signed by previous key is still accepted
+    access_token = oidc_issuer.issue_token(key=oidc_issuer.keys[1], preferred_username=user.username)
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert len(oidc_issuer.requests) == 1
+
+
+async def test_oidc_auth_unknown_key_does_not_flood_issuer(
+    oidc_client: AsyncClient,
+    oidc_issuer: MockOIDCIssuer,
+    user: User,
+):
+    unknown_key = JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": "unknown"})
+    access_token = oidc_issuer.issue_token(key=unknown_key, preferred_username=user.username)
+    oidc_issuer.requests.clear()
+
+    for _ in range(3):
+        response = await oidc_client.get(
+            "v1/users/me",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        assert response.json()["error"]["message"] == "Invalid token"
+
+    # JWKS was fetched on startup less than min_refresh_interval_seconds ago
+    assert oidc_issuer.requests == []
+
+
+@pytest.mark.parametrize("oidc_client", [{"jwks": {"refresh_interval_seconds": 0.1}}], indirect=True)
+async def test_oidc_auth_keys_refreshed_in_background(
+    oidc_client: AsyncClient,
+    oidc_issuer: MockOIDCIssuer,
+    user: User,
+):
+    new_key = oidc_issuer.rotate_keys(kid="key2")
+    oidc_issuer.requests.clear()
+    await asyncio.sleep(0.3)
+    assert oidc_issuer.requests
+
+    # JWKS is fetched before any token signed by new key is received
+    oidc_issuer.requests.clear()
+    access_token = oidc_issuer.issue_token(key=new_key, preferred_username=user.username)
+    response = await oidc_client.get(
+        "v1/users/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+async def test_oidc_auth_issuer_unavailable_on_startup(oidc_issuer: MockOIDCIssuer):
+    oidc_issuer.available = False
+    app = _create_app(oidc_issuer)
+
+    with pytest.raises(ServiceError, match="Failed to fetch JWKS from OIDC provider"):
+        async with app.router.lifespan_context(app):
+            pass
+
+
+async def test_oidc_auth_issuer_unavailable_on_startup_no_check(oidc_issuer: MockOIDCIssuer, user: User):
+    oidc_issuer.available = False
+    app = _create_app(oidc_issuer, jwks={"check_on_startup": False, "min_refresh_interval_seconds": 0})
+    access_token = oidc_issuer.issue_token(preferred_username=user.username)
+
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://horizon") as client:
+            response = await client.get(
+                "v1/users/me",
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+            assert response.json() == {
+                "error": {
+                    "code": "service_unavailable",
+                    "message": "Service unavailable",
+                    "details": "Failed to fetch JWKS from OIDC provider",
+                },
+            }
+
+            oidc_issuer.available = True
+            response = await client.get(
+                "v1/users/me",
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            assert response.status_code == HTTPStatus.OK
+
+
+async def test_oidc_auth_get_token_is_not_supported(oidc_client: AsyncClient, user: User):
+    response = await oidc_client.post(
+        "v1/auth/token",
+        data={
+            "username": user.username,
+            "password": secrets.token_hex(16),
+        },
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json()["error"]["message"] == "Access token should be obtained from OIDC provider"
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+from passlib.hash import argon2
+
+from horizon.backend.services.password_hasher import PasswordHasher
+from horizon.commons.exceptions import ServiceError
+from tests.utils import get_metric
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.auth, pytest.mark.backend]
+
+
+def _slow_hash(password: str) -> str:
+    time.sleep(0.2)
+    return password
+
+
+@pytest.fixture
+def password_hasher():
+    hasher = PasswordHasher(algorithm="argon2", options={}, max_workers=2, max_queue_size=1)
+    yield hasher
+    hasher.close()
+
+
+async def test_password_hasher_hash_and_verify(password_hasher: PasswordHasher):
+    hashes_before = get_metric("horizon_password_hash_seconds_count", operation="hash")
+    verifies_before = get_metric("horizon_password_hash_seconds_count", operation="verify")
+
+    password_hash = await password_hasher.hash("password")
+    assert argon2.verify("password", password_hash)
+
+    assert await password_hasher.verify("password", password_hash)
+    assert not await password_hasher.verify("wrong_password", password_hash)
+
+    assert get_metric("horizon_password_hash_seconds_count", operation="hash") - hashes_before == 1
+    assert get_metric("horizon_password_hash_seconds_count", operation="verify") - verifies_before == 2
+    assert get_metric("horizon_password_hash_pending_operations") == 0
+
+
+async def test_password_hasher_does_not_block_event_loop(
+    password_hasher: PasswordHasher,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    threads = set()
+
+    def slow_hash(password: str) -> str:
+        threads.add(threading.current_thread().name)
+        time.sleep(0.2)
+        return password
+
+    monkeypatch.setattr(password_hasher._handler, "hash", slow_hash)
+
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.ensure_future(tick())
+    try:
+        assert await asyncio.gather(password_hasher.hash("a"), password_hasher.hash("b")) == ["a", "b"]
+    finally:
+        ticker.cancel()
+
+    # event loop was responsive while hashing is performed
+    assert ticks >= 5
+    assert all(name.startswith("horizon-password-hash") for name in threads)
+
+
+async def test_password_hasher_queue_is_full(password_hasher: PasswordHasher, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(password_hasher._handler, "hash", _slow_hash)
+    rejected_before = get_metric("horizon_password_hash_rejected_operations_total", operation="hash")
+
+    # 2 workers + 1 item in queue
+    results = await asyncio.gather(*(password_hasher.hash(str(i)) for i in range(5)), return_exceptions=True)
+
+    assert results[:3] == ["0", "1", "2"]
+    assert all(isinstance(result, ServiceError) for result in results[3:])
+    assert get_metric("horizon_password_hash_rejected_operations_total", operation="hash") - rejected_before == 2
+
+    # slots are released after operations are finished
+    assert await password_hasher.hash("again") == "again"
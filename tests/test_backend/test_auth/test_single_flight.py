@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from horizon.backend.services.single_flight import SingleFlight
+from horizon.commons.exceptions import AuthorizationError
+from tests.utils import get_metric
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.auth, pytest.mark.backend]
+
+
+async def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight(operation="test_coalesce")
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return {"value": calls}
+
+    results = await asyncio.gather(*(single_flight.run("key", func) for _ in range(5)))
+    assert results == [{"value": 1}] * 5
+    assert calls == 1
+
+    assert get_metric("horizon_single_flight_calls_total", operation="test_coalesce", mode="executed") == 1
+    assert get_metric("horizon_single_flight_calls_total", operation="test_coalesce", mode="coalesced") == 4
+
+    # result is not stored after call is finished
+    assert await single_flight.run("key", func) == {"value": 2}
+
+
+async def test_single_flight_different_keys():
+    single_flight = SingleFlight(operation="test_keys")
+
+    async def func(value: str):
+        await asyncio.sleep(0.1)
+        return value
+
+    results = await asyncio.gather(
+        single_flight.run("a", lambda: func("a")),
+        single_flight.run("b", lambda: func("b")),
+    )
+    assert results == ["a", "b"]
+    assert get_metric("horizon_single_flight_calls_total", operation="test_keys", mode="executed") == 2
+    assert get_metric("horizon_single_flight_calls_total", operation="test_keys", mode="coalesced") == 0
+
+
+async def test_single_flight_exception_is_shared():
+    single_flight = SingleFlight(operation="test_exception")
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        msg = "Wrong credentials"
+        raise AuthorizationError(msg)
+
+    results = await asyncio.gather(*(single_flight.run("key", func) for _ in range(3)), return_exceptions=True)
+    assert calls == 1
+    assert all(isinstance(result, AuthorizationError) for result in results)
+
+
+async def test_single_flight_in_flight_call_cancelled():
+    single_flight = SingleFlight(operation="test_cancel")
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return calls
+
+    first = asyncio.ensure_future(single_flight.run("key", func))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(single_flight.run("key", func))
+    await asyncio.sleep(0)
+
+    # e.g. client of first request has disconnected
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    # waiting call is not cancelled, but performs operation by itself
+    assert await second == 2
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from horizon.backend.services.ttl_cache import TTLCache
+from tests.utils import get_metric
+
+pytestmark = [pytest.mark.auth, pytest.mark.backend]
+
+
+def test_ttl_cache_get_set():
+    cache: TTLCache[str, str] = TTLCache(name="test_get_set", max_size=10, ttl=60)
+    assert cache.get("key") is None
+
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    cache.delete("key")
+    assert cache.get("key") is None
+
+    assert get_metric("horizon_ttl_cache_lookups_total", cache="test_get_set", result="hit") == 1
+    assert get_metric("horizon_ttl_cache_lookups_total", cache="test_get_set", result="miss") == 2
+
+
+def test_ttl_cache_item_expired():
+    cache: TTLCache[str, str] = TTLCache(name="test_expired", max_size=10, ttl=0.1)
+    cache.set("key", "value")
+    time.sleep(0.2)
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[str, str] = TTLCache(name="test_evict", max_size=2, ttl=60)
+    cache.set("key1", "value1")
+    cache.set("key2", "value2")
+
+    # mark key1 as recently used
+    assert cache.get("key1") == "value1"
+
+    cache.set("key3", "value3")
+    assert cache.get("key1") == "value1"
+    assert cache.get("key2") is None
+    assert cache.get("key3") == "value3"
+
+
+@pytest.mark.parametrize(["max_size", "ttl"], [(0, 60), (10, 0)])
+def test_ttl_cache_disabled(max_size: int, ttl: float):
+    cache: TTLCache[str, str] = TTLCache(name="test_disabled", max_size=max_size, ttl=ttl)
+    cache.set("key", "value")
+    assert cache.get("key") is None
@@ -86,3 +86,28 @@ async def test_get_hwm(
         "changed_at": real_hwm.changed_at,
         "changed_by": real_hwm.changed_by_user.username,
     }
+
+
+async def test_get_hwm_not_modified(
+    test_client: AsyncClient,
+    access_token: str,
+    hwm: HWM,
+):
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = await test_client.get(f"v1/hwm/{hwm.id}", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    etag = response.headers["ETag"]
+
+    response = await test_client.get(f"v1/hwm/{hwm.id}", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    # HWM is changed, so ETag is changed too
+    response = await test_client.patch(f"v1/hwm/{hwm.id}", headers=headers, json={"value": 123})
+    assert response.status_code == HTTPStatus.OK
+
+    response = await test_client.get(f"v1/hwm/{hwm.id}", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+    assert response.json()["value"] == 123
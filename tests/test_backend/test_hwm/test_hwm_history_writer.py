@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import secrets
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from horizon.backend.db.models import HWM, HWMHistory, Namespace, User
+from horizon.backend.services.history_writer import HWMHistoryWriter
+from horizon.backend.services.uow import UnitOfWork
+from tests.utils import get_metric
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+pytestmark = [pytest.mark.backend, pytest.mark.asyncio]
+
+HISTORY_WRITER_SETTINGS = {"server": {"history_writer": {"enabled": True, "max_batch_size": 3}}}
+
+
+@pytest.mark.parametrize("settings", [HISTORY_WRITER_SETTINGS], indirect=True)
+@pytest.mark.parametrize("hwms", [(5, {})], indirect=True)
+async def test_hwm_history_writer_concurrent_updates(
+    test_client: AsyncClient,
+    access_token: str,
+    hwms: list[HWM],
+    async_session: AsyncSession,
+):
+    responses = await asyncio.gather(
+        *(
+            test_client.patch(
+                f"v1/hwm/{hwm.id}",
+                headers={"Authorization": f"Bearer {access_token}"},
+                json={"value": index},
+            )
+            for index, hwm in enumerate(hwms)
+        ),
+    )
+    assert [response.status_code for response in responses] == [HTTPStatus.OK] * len(hwms)
+
+    # history is committed together with HWM change
+    query = select(HWMHistory).where(HWMHistory.hwm_id.in_([hwm.id for hwm in hwms]))
+    history = (await async_session.scalars(query)).all()
+    assert {(item.hwm_id, item.value, item.action) for item in history} == {
+        (hwm.id, index, "Updated") for index, hwm in enumerate(hwms)
+    }
+
+
+@pytest.mark.parametrize("settings", [HISTORY_WRITER_SETTINGS], indirect=True)
+@pytest.mark.parametrize("hwms", [(5, {})], indirect=True)
+async def test_hwm_history_writer_batches_bulk_delete(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    hwms: list[HWM],
+    async_session: AsyncSession,
+):
+    batches_before = get_metric("horizon_hwm_history_writer_batch_size_count")
+    records_before = get_metric("horizon_hwm_history_writer_batch_size_sum")
+
+    response = await test_client.request(
+        method="DELETE",
+        url="v1/hwm/",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"namespace_id": namespace.id, "hwm_ids": [hwm.id for hwm in hwms]},
+    )
+    assert response.status_code == HTTPStatus.NO_CONTENT
+
+    query = select(HWMHistory).where(HWMHistory.hwm_id.in_([hwm.id for hwm in hwms]))
+    history = (await async_session.scalars(query)).all()
+    assert {(item.hwm_id, item.action) for item in history} == {(hwm.id, "Deleted") for hwm in hwms}
+
+    # 5 records with max_batch_size=3 are saved by 2 statements
+    assert get_metric("horizon_hwm_history_writer_batch_size_sum") - records_before == len(hwms)
+    assert get_metric("horizon_hwm_history_writer_batch_size_count") - batches_before == 2
+    assert get_metric("horizon_hwm_history_writer_flush_seconds_count") > 0
+
+
+@pytest.mark.parametrize("settings", [HISTORY_WRITER_SETTINGS], indirect=True)
+async def test_hwm_history_writer_create_and_delete(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    async_session: AsyncSession,
+):
+    response = await test_client.post(
+        "v1/hwm/",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={
+            "namespace_id": namespace.id,
+            "name": secrets.token_hex(8),
+            "type": "column_int",
+            "value": 123,
+        },
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    hwm_id = response.json()["id"]
+
+    response = await test_client.delete(
+        f"v1/hwm/{hwm_id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.NO_CONTENT
+
+    query = select(HWMHistory).where(HWMHistory.hwm_id == hwm_id).order_by(HWMHistory.id)
+    history = (await async_session.scalars(query)).all()
+    assert [item.action for item in history] == ["Created", "Deleted"]
+
+
+@pytest.mark.parametrize("settings", [HISTORY_WRITER_SETTINGS], indirect=True)
+async def test_hwm_history_writer_not_used_on_error(
+    test_client: AsyncClient,
+    access_token: str,
+    hwms: list[HWM],
+    async_session: AsyncSession,
+):
+    hwm1, hwm2, *_ = hwms
+
+    response = await test_client.patch(
+        f"v1/hwm/{hwm1.id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"name": hwm2.name},
+    )
+    assert response.status_code == HTTPStatus.CONFLICT
+
+    query = select(HWMHistory).where(HWMHistory.hwm_id == hwm1.id)
+    history = (await async_session.scalars(query)).all()
+    assert not history
+
+
+async def test_hwm_history_writer_failed_record_rolls_back_hwm_change(
+    async_session_factory: async_sessionmaker[AsyncSession],
+    async_session: AsyncSession,
+    hwm: HWM,
+    user: User,
+):
+    writer = HWMHistoryWriter(max_batch_size=2)
+
+    async def update_hwm():
+        async with async_session_factory() as session, UnitOfWork(session=session, history_writer=writer) as uow:
+            updated_hwm = await uow.hwm.update(hwm_id=hwm.id, changes={"value": 123}, user=user)
+            # namespace does not exist, so foreign key is violated
+            await uow.hwm_history.create(
+                hwm_id=hwm.id,
+                data={**updated_hwm.to_dict(exclude={"id"}), "namespace_id": -1, "action": "Updated"},
+            )
+
+    with pytest.raises(IntegrityError):
+        await update_hwm()
+
+    # HWM change and its history are committed or rolled back together
+    current_hwm = await async_session.get(HWM, hwm.id)
+    assert current_hwm.value == hwm.value
+
+    query = select(HWMHistory).where(HWMHistory.hwm_id == hwm.id)
+    assert not (await async_session.scalars(query)).all()
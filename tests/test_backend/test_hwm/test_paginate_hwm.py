@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from copy import copy
-from datetime import datetime
+from datetime import datetime, timedelta
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
@@ -11,7 +11,7 @@ from pydantic import __version__ as pydantic_version
 if TYPE_CHECKING:
     from httpx import AsyncClient
 
-    from horizon.backend.db.models import HWM, Namespace
+    from horizon.backend.db.models import HWM, Namespace, User
 
 pytestmark = [pytest.mark.backend, pytest.mark.asyncio]
 
@@ -246,3 +246,104 @@ async def test_paginate_hwm_filter_by_missing_name(
         },
         "items": [],
     }
+
+
+@pytest.mark.parametrize(
+    "hwm",
+    [{"type": "column_int", "entity": "some.table", "value": 100}],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"type": "column_int"},
+        {"entity": "some.table"},
+        {"value": "100"},
+        {"value_gt": "50"},
+        {"value_gte": "100"},
+        {"value_lt": "150", "value_gt": "99"},
+        {"value_lte": "100", "type": "column_int"},
+    ],
+)
+async def test_paginate_hwm_filter_by_fields(
+    test_client: AsyncClient,
+    namespace: Namespace,
+    access_token: str,
+    hwm: HWM,
+    hwms: list[HWM],
+    filters: dict[str, str],
+):
+    response = await test_client.get(
+        "v1/hwm/",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"namespace_id": namespace.id, **filters},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    # other HWMs have random string values, so they are never matched by numeric comparison
+    response_dict = response.json()
+    assert response_dict["meta"]["total_count"] == 1
+    assert [item["id"] for item in response_dict["items"]] == [hwm.id]
+
+
+@pytest.mark.parametrize(
+    "hwm",
+    [{"type": "file_list", "value": ["file1.csv", "file2.csv"]}],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    ["filters", "matched"],
+    [
+        ({"value_contains": '["file1.csv"]'}, True),
+        ({"value_contains": "file2.csv"}, True),
+        ({"value_contains": '["file3.csv"]'}, False),
+        ({"value": '["file1.csv", "file2.csv"]'}, True),
+        ({"value": '["file1.csv"]'}, False),
+        ({"value_gt": "100"}, False),
+        ({"type": "unknown"}, False),
+        ({"entity": "unknown"}, False),
+        ({"changed_by": "unknown"}, False),
+        ({"changed_since": "2000-01-01T00:00:00+00:00", "changed_until": "2001-01-01T00:00:00+00:00"}, False),
+    ],
+)
+async def test_paginate_hwm_filter_list_value(
+    test_client: AsyncClient,
+    namespace: Namespace,
+    access_token: str,
+    hwm: HWM,
+    filters: dict[str, str],
+    matched: bool,
+):
+    response = await test_client.get(
+        "v1/hwm/",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"namespace_id": namespace.id, **filters},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response_dict = response.json()
+    expected_ids = [hwm.id] if matched else []
+    assert [item["id"] for item in response_dict["items"]] == expected_ids
+
+
+async def test_paginate_hwm_filter_by_changed_by_and_changed_at(
+    test_client: AsyncClient,
+    namespace: Namespace,
+    access_token: str,
+    user: User,
+    hwms: list[HWM],
+):
+    changed_at = [hwm.changed_at for hwm in hwms]
+
+    response = await test_client.get(
+        "v1/hwm/",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={
+            "namespace_id": namespace.id,
+            "changed_by": user.username,
+            "changed_since": min(changed_at).isoformat(),
+            "changed_until": (max(changed_at) + timedelta(seconds=1)).isoformat(),
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["meta"]["total_count"] == len(hwms)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import pytest
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+    from horizon.backend.db.models import HWM, Namespace
+
+pytestmark = [pytest.mark.backend, pytest.mark.asyncio]
+
+SEARCH_TOKEN = uuid4().hex
+
+
+async def test_search_hwm_anonymous_user(
+    test_client: AsyncClient,
+):
+    response = await test_client.get(
+        "v1/hwm/search",
+        params={"name_contains": "abc"},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": "unauthorized",
+            "message": "Not authenticated",
+            "details": None,
+        },
+    }
+
+
+async def test_search_hwm_no_search_arguments(
+    test_client: AsyncClient,
+    access_token: str,
+):
+    response = await test_client.get(
+        "v1/hwm/search",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {
+        "error": {
+            "code": "bad_request",
+            "message": "At least one of 'name_contains', 'name_prefix' should be set",
+            "details": {},
+        },
+    }
+
+
+@pytest.mark.parametrize("search_field", ["name_contains", "name_prefix"])
+async def test_search_hwm_case_insensitive(
+    test_client: AsyncClient,
+    access_token: str,
+    hwms: list[HWM],
+    search_field: str,
+):
+    # random names contain punctuation like % and _, they should not be treated as wildcards
+    hwm = hwms[0]
+    search = hwm.name[:12] if search_field == "name_prefix" else hwm.name[2:12]
+
+    response = await test_client.get(
+        "v1/hwm/search",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={search_field: search.swapcase()},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response_dict = response.json()
+    assert [item["id"] for item in response_dict["items"]] == [hwm.id]
+
+
+@pytest.mark.parametrize(
+    "hwm",
+    [{"name": f"{SEARCH_TOKEN}_orders"}],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "hwms",
+    [(1, {"name": f"{SEARCH_TOKEN}_orders_archive_with_long_suffix"})],
+    indirect=True,
+)
+async def test_search_hwm_sorted_by_similarity(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    hwm: HWM,
+    hwms: list[HWM],
+):
+    response = await test_client.get(
+        "v1/hwm/search",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"name_contains": f"{SEARCH_TOKEN}_orders"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response_dict = response.json()
+    assert response_dict["meta"]["total_count"] == 2
+    assert [item["id"] for item in response_dict["items"]] == [hwm.id, hwms[0].id]
+
+    response = await test_client.get(
+        "v1/hwm/search",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"name_prefix": f"{SEARCH_TOKEN}_orders_archive", "namespace_id": namespace.id},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert [item["id"] for item in response.json()["items"]] == [hwms[0].id]
+
+
+async def test_search_hwm_in_missing_namespace(
+    test_client: AsyncClient,
+    access_token: str,
+    hwm: HWM,
+    new_namespace: Namespace,
+):
+    response = await test_client.get(
+        "v1/hwm/search",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"name_contains": hwm.name, "namespace_id": new_namespace.id},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["items"] == []
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import secrets
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from time import time
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select, update
+
+from horizon.backend.db.models import HWM, HWMHistory, IdempotencyKey, Namespace, User
+from horizon.backend.utils.jwt import sign_jwt
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from horizon.backend.settings.auth.jwt import JWTSettings
+
+pytestmark = [pytest.mark.backend, pytest.mark.asyncio]
+
+
+def _create_hwm_body(namespace: Namespace, hwm: HWM) -> dict:
+    return {
+        "namespace_id": namespace.id,
+        "name": hwm.name,
+        "type": hwm.type,
+        "value": hwm.value,
+    }
+
+
+async def test_idempotency_key_replays_response(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    new_hwm: HWM,
+    async_session: AsyncSession,
+):
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": secrets.token_hex(16)}
+    body = _create_hwm_body(namespace, new_hwm)
+
+    first = await test_client.post("v1/hwm/", headers=headers, json=body)
+    assert first.status_code == HTTPStatus.CREATED
+    assert "Idempotent-Replayed" not in first.headers
+
+    # without key this would be 409 Conflict
+    second = await test_client.post("v1/hwm/", headers=headers, json=body)
+    assert second.status_code == HTTPStatus.CREATED
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.headers["Content-Type"] == first.headers["Content-Type"]
+    assert second.json() == first.json()
+
+    # request was executed only once
+    hwm_id = first.json()["id"]
+    history = (await async_session.scalars(select(HWMHistory).where(HWMHistory.hwm_id == hwm_id))).all()
+    assert len(history) == 1
+
+
+async def test_idempotency_key_concurrent_requests(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    new_hwm: HWM,
+):
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": secrets.token_hex(16)}
+    body = _create_hwm_body(namespace, new_hwm)
+
+    responses = await asyncio.gather(*(test_client.post("v1/hwm/", headers=headers, json=body) for _ in range(3)))
+    assert [response.status_code for response in responses] == [HTTPStatus.CREATED] * 3
+    assert len({response.json()["id"] for response in responses}) == 1
+
+
+async def test_idempotency_key_delete_replayed(
+    test_client: AsyncClient,
+    access_token: str,
+    hwm: HWM,
+):
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": secrets.token_hex(16)}
+
+    first = await test_client.delete(f"v1/hwm/{hwm.id}", headers=headers)
+    assert first.status_code == HTTPStatus.NO_CONTENT
+
+    # without key this would be 404 Not Found
+    second = await test_client.delete(f"v1/hwm/{hwm.id}", headers=headers)
+    assert second.status_code == HTTPStatus.NO_CONTENT
+    assert second.headers["Idempotent-Replayed"] == "true"
+
+
+async def test_idempotency_key_reused_for_different_request(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    new_hwm: HWM,
+):
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": secrets.token_hex(16)}
+    body = _create_hwm_body(namespace, new_hwm)
+
+    response = await test_client.post("v1/hwm/", headers=headers, json=body)
+    assert response.status_code == HTTPStatus.CREATED
+
+    response = await test_client.post("v1/hwm/", headers=headers, json={**body, "value": "other"})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {
+        "error": {
+            "code": "bad_request",
+            "message": "Idempotency-Key was already used for a different request",
+            "details": {},
+        },
+    }
+
+
+async def test_idempotency_key_replayed_after_token_refresh(
+    test_client: AsyncClient,
+    access_token: str,
+    access_token_settings: JWTSettings,
+    user: User,
+    namespace: Namespace,
+    new_hwm: HWM,
+):
+    key = secrets.token_hex(16)
+    body = _create_hwm_body(namespace, new_hwm)
+
+    first = await test_client.post(
+        "v1/hwm/",
+        headers={"Authorization": f"Bearer {access_token}", "Idempotency-Key": key},
+        json=body,
+    )
+    assert first.status_code == HTTPStatus.CREATED
+
+    new_access_token = sign_jwt(
+        {"user_id": user.id, "exp": time() + 2000},
+        access_token_settings.secret_key.get_secret_value(),
+        access_token_settings.security_algorithm,
+    )
+    assert new_access_token != access_token
+
+    second = await test_client.post(
+        "v1/hwm/",
+        headers={"Authorization": f"Bearer {new_access_token}", "Idempotency-Key": key},
+        json=body,
+    )
+    assert second.status_code == HTTPStatus.CREATED
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.json() == first.json()
+
+
+@pytest.mark.parametrize("users", [(1, {"is_admin": True})], indirect=True)
+async def test_idempotency_key_reused_by_another_user(
+    test_client: AsyncClient,
+    access_token: str,
+    access_token_settings: JWTSettings,
+    users: list[User],
+    hwm: HWM,
+    async_session: AsyncSession,
+):
+    key = secrets.token_hex(16)
+
+    response = await test_client.patch(
+        f"v1/hwm/{hwm.id}",
+        headers={"Authorization": f"Bearer {access_token}", "Idempotency-Key": key},
+        json={"value": 1},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    another_user = users[0]
+    another_access_token = sign_jwt(
+        {"user_id": another_user.id, "exp": time() + 1000},
+        access_token_settings.secret_key.get_secret_value(),
+        access_token_settings.security_algorithm,
+    )
+    # keys of different users do not collide, so request is executed
+    response = await test_client.patch(
+        f"v1/hwm/{hwm.id}",
+        headers={"Authorization": f"Bearer {another_access_token}", "Idempotency-Key": key},
+        json={"value": 2},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert "Idempotent-Replayed" not in response.headers
+    assert response.json()["value"] == 2
+    assert response.json()["changed_by"] == another_user.username
+
+    assert await async_session.get(IdempotencyKey, (another_user.id, key)) is not None
+
+
+async def test_idempotency_key_failed_request_is_not_stored(
+    test_client: AsyncClient,
+    access_token: str,
+    user: User,
+    hwms: list[HWM],
+    async_session: AsyncSession,
+):
+    hwm1, hwm2, *_ = hwms
+    key = secrets.token_hex(16)
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": key}
+
+    for _ in range(2):
+        response = await test_client.patch(f"v1/hwm/{hwm1.id}", headers=headers, json={"name": hwm2.name})
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert "Idempotent-Replayed" not in response.headers
+
+    assert await async_session.get(IdempotencyKey, (user.id, key)) is None
+
+
+async def test_idempotency_key_expired(
+    test_client: AsyncClient,
+    access_token: str,
+    hwm: HWM,
+    async_session: AsyncSession,
+):
+    key = secrets.token_hex(16)
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": key}
+
+    response = await test_client.patch(f"v1/hwm/{hwm.id}", headers=headers, json={"value": 1})
+    assert response.status_code == HTTPStatus.OK
+
+    await async_session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == key)
+        .values(created_at=datetime.now(tz=timezone.utc) - timedelta(days=2)),
+    )
+    await async_session.commit()
+
+    # key is expired, so it can be used for another request
+    response = await test_client.patch(f"v1/hwm/{hwm.id}", headers=headers, json={"value": 2})
+    assert response.status_code == HTTPStatus.OK
+    assert "Idempotent-Replayed" not in response.headers
+    assert response.json()["value"] == 2
+
+
+async def test_idempotency_key_too_long(
+    test_client: AsyncClient,
+    access_token: str,
+    hwm: HWM,
+):
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": "a" * 256}
+
+    response = await test_client.patch(f"v1/hwm/{hwm.id}", headers=headers, json={"value": 1})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()["error"]["message"] == "Idempotency-Key should be at most 255 characters long"
+
+
+@pytest.mark.parametrize("settings", [{"server": {"idempotency": {"enabled": False}}}], indirect=True)
+async def test_idempotency_key_disabled(
+    test_client: AsyncClient,
+    access_token: str,
+    hwm: HWM,
+    async_session: AsyncSession,
+):
+    key = secrets.token_hex(16)
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": key}
+
+    for value in (1, 2):
+        response = await test_client.patch(f"v1/hwm/{hwm.id}", headers=headers, json={"value": value})
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["value"] == value
+
+    assert await async_session.scalar(select(IdempotencyKey).where(IdempotencyKey.key == key)) is None
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.backend import application_factory
+from tests.utils import get_metric
+
+if TYPE_CHECKING:
+    from horizon.backend.settings import Settings
+
+pytestmark = [pytest.mark.backend, pytest.mark.asyncio]
+
+
+@pytest.mark.parametrize("settings", [{"server": {"monitoring": {"event_loop_lag_interval": 0.01}}}], indirect=True)
+async def test_event_loop_lag_metric(settings: Settings):
+    app = application_factory(settings=settings)
+
+    async with app.router.lifespan_context(app):
+        count_before = get_metric("horizon_event_loop_lag_seconds_count")
+        sum_before = get_metric("horizon_event_loop_lag_seconds_sum")
+
+        # block event loop
+        time.sleep(0.2)  # noqa: ASYNC251
+        await asyncio.sleep(0.05)
+
+        assert get_metric("horizon_event_loop_lag_seconds_count") > count_before
+        assert get_metric("horizon_event_loop_lag_seconds_sum") - sum_before >= 0.15
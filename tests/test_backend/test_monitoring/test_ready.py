@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from horizon.backend import application_factory
+from horizon.backend.services.warmup import warmup_database
+from horizon.backend.settings.server import WarmupSettings
+
+if TYPE_CHECKING:
+    from horizon.backend.settings import Settings
+
+pytestmark = [pytest.mark.backend, pytest.mark.asyncio]
+
+
+async def test_ready(settings: Settings):
+    app = application_factory(settings=settings)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://horizon") as client:
+        response = await client.get("/monitoring/ready")
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert response.json() == {
+            "error": {
+                "code": "service_unavailable",
+                "message": "Server is not ready yet",
+                "details": None,
+            },
+        }
+
+        async with app.router.lifespan_context(app):
+            response = await client.get("/monitoring/ready")
+            assert response.status_code == HTTPStatus.OK
+            assert response.json() == {"status": "ok"}
+
+        response = await client.get("/monitoring/ready")
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+
+@pytest.mark.parametrize(
+    "warmup_settings",
+    [
+        WarmupSettings(database_connections=3, queries=True),
+        WarmupSettings(database_connections=3, queries=False),
+        WarmupSettings(database_connections=0, queries=True),
+    ],
+)
+async def test_warmup_database(settings: Settings, warmup_settings: WarmupSettings):
+    engine = create_async_engine(settings.database.url)
+    try:
+        await warmup_database(engine, warmup_settings)
+
+        # all connections are returned back to the pool, and can be reused by requests
+        assert engine.pool.checkedout() == 0  # type: ignore[attr-defined]
+        assert engine.pool.checkedin() == max(warmup_settings.database_connections, 1)  # type: ignore[attr-defined]
+    finally:
+        await engine.dispose()
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import func, select
+
+from horizon.backend.db.models import NamespaceStats, NamespaceStatsDelta
+from horizon.backend.services.namespace_stats import fold_namespace_stats
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from horizon.backend.db.models import HWM, HWMHistory, Namespace
+
+pytestmark = [pytest.mark.backend, pytest.mark.asyncio]
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+async def test_get_namespace_with_stats(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    hwm: HWM,
+    hwms: list[HWM],
+    hwm_history_items: list[HWMHistory],
+):
+    all_hwms_changed_at = [item.changed_at for item in [hwm, *hwms]]
+
+    response = await test_client.get(
+        f"v1/namespaces/{namespace.id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"with_stats": True},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    stats = response.json()["stats"]
+    assert stats["namespace_id"] == namespace.id
+    assert stats["hwm_count"] == len(hwms) + 1
+    assert stats["history_count"] == len(hwm_history_items)
+    assert _parse_datetime(stats["last_changed_at"]) >= max(all_hwms_changed_at)
+
+
+async def test_get_namespace_without_stats(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+):
+    response = await test_client.get(
+        f"v1/namespaces/{namespace.id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert "stats" not in response.json()
+
+
+async def test_paginate_namespaces_with_stats(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    hwms: list[HWM],
+):
+    response = await test_client.get(
+        "v1/namespaces/",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"name": namespace.name, "with_stats": True},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    items = response.json()["items"]
+    assert len(items) == 1
+    assert items[0]["stats"] == {
+        "namespace_id": namespace.id,
+        "hwm_count": len(hwms),
+        "history_count": 0,
+        "last_changed_at": items[0]["stats"]["last_changed_at"],
+    }
+    assert _parse_datetime(items[0]["stats"]["last_changed_at"]) == max(hwm.changed_at for hwm in hwms)
+
+
+async def test_get_namespaces_stats(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    namespaces: list[Namespace],
+    new_namespace: Namespace,
+    hwms: list[HWM],
+):
+    empty_namespace = namespaces[0]
+
+    response = await test_client.get(
+        "v1/namespaces/stats",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"namespace_ids": [empty_namespace.id, namespace.id, new_namespace.id, namespace.id]},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    # missing namespace is skipped, duplicates are removed
+    response_dict = response.json()
+    for item in response_dict["stats"]:
+        item["last_changed_at"] = _parse_datetime(item["last_changed_at"])
+
+    assert response_dict == {
+        "stats": [
+            {
+                "namespace_id": empty_namespace.id,
+                "hwm_count": 0,
+                "history_count": 0,
+                "last_changed_at": None,
+            },
+            {
+                "namespace_id": namespace.id,
+                "hwm_count": len(hwms),
+                "history_count": 0,
+                "last_changed_at": max(hwm.changed_at for hwm in hwms),
+            },
+        ],
+    }
+
+
+async def test_get_namespaces_stats_anonymous_user(
+    test_client: AsyncClient,
+    namespace: Namespace,
+):
+    response = await test_client.get(
+        "v1/namespaces/stats",
+        params={"namespace_ids": [namespace.id]},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+async def test_namespace_stats_updated_after_hwm_changes(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    hwms: list[HWM],
+):
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await test_client.patch(f"v1/hwm/{hwms[0].id}", headers=headers, json={"value": 123})
+    assert response.status_code == HTTPStatus.OK
+    updated_at = _parse_datetime(response.json()["changed_at"])
+
+    response = await test_client.delete(f"v1/hwm/{hwms[1].id}", headers=headers)
+    assert response.status_code == HTTPStatus.NO_CONTENT
+
+    response = await test_client.get(f"v1/namespaces/stats?namespace_ids={namespace.id}", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+
+    stats = response.json()["stats"][0]
+    assert stats["hwm_count"] == len(hwms) - 1
+    # each change of HWM creates history record
+    assert stats["history_count"] == 2
+    assert _parse_datetime(stats["last_changed_at"]) == updated_at
+
+
+async def test_namespace_stats_deltas_folded(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    hwms: list[HWM],
+    async_session_factory: async_sessionmaker[AsyncSession],
+):
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = await test_client.delete(f"v1/hwm/{hwms[0].id}", headers=headers)
+    assert response.status_code == HTTPStatus.NO_CONTENT
+
+    response = await test_client.get(f"v1/namespaces/stats?namespace_ids={namespace.id}", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    stats_before = response.json()["stats"]
+
+    assert await fold_namespace_stats(async_session_factory) >= 1
+
+    async with async_session_factory() as session:
+        deltas = await session.scalar(
+            select(func.count()).where(NamespaceStatsDelta.namespace_id == namespace.id),
+        )
+        assert deltas == 0
+
+        stats = await session.get(NamespaceStats, namespace.id)
+        assert stats.hwm_count == len(hwms) - 1
+        assert stats.history_count == 1
+
+    # folding does not change result
+    response = await test_client.get(f"v1/namespaces/stats?namespace_ids={namespace.id}", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["stats"] == stats_before
+
+
+async def test_namespace_stats_row_lock_does_not_block_hwm_changes(
+    test_client: AsyncClient,
+    access_token: str,
+    namespace: Namespace,
+    hwm: HWM,
+    async_session_factory: async_sessionmaker[AsyncSession],
+):
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    async with async_session_factory() as session, session.begin():
+        # e.g. stats are being folded by another backend instance
+        await session.execute(
+            select(NamespaceStats).where(NamespaceStats.namespace_id == namespace.id).with_for_update(),
+        )
+
+        response = await asyncio.wait_for(
+            test_client.patch(f"v1/hwm/{hwm.id}", headers=headers, json={"value": 123}),
+            timeout=5,
+        )
+        assert response.status_code == HTTPStatus.OK
+
+    response = await test_client.get(f"v1/namespaces/stats?namespace_ids={namespace.id}", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["stats"][0]["history_count"] == 1
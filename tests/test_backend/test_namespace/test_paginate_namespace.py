@@ -162,3 +162,25 @@ async def test_paginate_namespaces_filter_by_missing_name(
         },
         "items": [],
     }
+
+
+@pytest.mark.parametrize("search_field", ["name_contains", "name_prefix"])
+async def test_paginate_namespaces_search_by_name(
+    test_client: AsyncClient,
+    access_token: str,
+    namespaces: list[Namespace],
+    search_field: str,
+):
+    # random names contain punctuation like % and _, they should not be treated as wildcards
+    namespace = namespaces[0]
+    search = namespace.name[:12] if search_field == "name_prefix" else namespace.name[2:12]
+
+    response = await test_client.get(
+        "v1/namespaces/",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={search_field: search.swapcase()},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response_dict = response.json()
+    assert [item["id"] for item in response_dict["items"]] == [namespace.id]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = [pytest.mark.backend]
+
+# dependencies of auth providers which are not enabled by default
+HEAVY_MODULES = {"bonsai", "httpx", "passlib", "sqlalchemy_utils"}
+PROVIDER_MODULES = {
+    "horizon.backend.providers.auth.dummy",
+    "horizon.backend.providers.auth.ldap",
+    "horizon.backend.providers.auth.cached_ldap",
+    "horizon.backend.providers.auth.oidc",
+}
+
+
+def _get_imported_modules(code: str) -> set[str]:
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(json.loads(result.stdout))
+
+
+def test_import_application_does_not_import_auth_providers():
+    modules = _get_imported_modules("from horizon.backend import get_application")
+    assert not modules & PROVIDER_MODULES
+    assert not {module.split(".")[0] for module in modules} & HEAVY_MODULES
+
+
+def test_import_settings_does_not_import_application():
+    modules = _get_imported_modules("from horizon.backend.settings import Settings")
+    assert "fastapi" not in modules
+    assert "horizon.backend.main" not in modules
+    assert not modules & PROVIDER_MODULES
+
+
+def test_create_application_imports_only_selected_auth_provider():
+    modules = _get_imported_modules("from horizon.backend import get_application\nget_application()")
+    assert "horizon.backend.providers.auth.dummy" in modules
+    assert "horizon.backend.providers.auth.ldap" not in modules
+    assert not {module.split(".")[0] for module in modules} & HEAVY_MODULES
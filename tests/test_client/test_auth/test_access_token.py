@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from time import time
+
 import pytest
+from authlib.jose import JsonWebKey
 from authlib.jose.errors import ExpiredTokenError, JoseError
 
+from horizon.backend.utils.jwt import sign_jwt
 from horizon.client.auth import AccessToken
 
 pytestmark = [pytest.mark.client_sync, pytest.mark.client]
@@ -21,3 +25,21 @@ def test_access_token_constructor_no_expiration_time(access_token_no_expiration_
 def test_access_token_constructor_malformed(access_token_malformed: AccessToken):
     with pytest.raises(JoseError):
         AccessToken(token=access_token_malformed)
+
+
+@pytest.mark.parametrize(
+    ["security_algorithm", "key_type", "crv_or_size"],
+    [
+        ("RS256", "RSA", 2048),
+        ("ES256", "EC", "P-256"),
+        ("EdDSA", "OKP", "Ed25519"),
+    ],
+)
+def test_access_token_constructor_asymmetric_algorithm(security_algorithm: str, key_type: str, crv_or_size):
+    # client doesn't have a key used for signing token, but still can parse token claims
+    private_key = JsonWebKey.generate_key(key_type, crv_or_size, is_private=True)
+    expires_at = int(time()) + 1000
+    token = sign_jwt({"user_id": 1, "exp": expires_at}, private_key, security_algorithm)
+
+    auth = AccessToken(token=token)
+    assert auth._parse_token(auth.token)["exp"] == expires_at
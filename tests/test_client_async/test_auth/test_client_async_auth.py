@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from authlib.integrations.httpx_client import AsyncOAuth2Client
+from authlib.oauth2.auth import OAuth2Token as AuthlibToken
+from pydantic import ValidationError
+from pytest_lazyfixture import lazy_fixture
+
+from horizon.backend.services.api_key import generate_api_key
+from horizon.client.asyncio import ConnectionConfig, HorizonClientAsync, RetryConfig, TimeoutConfig
+from horizon.client.auth import AccessToken, APIKey, LoginPassword
+from horizon.commons.exceptions.auth import AuthorizationError
+from horizon.commons.schemas.v1 import UserResponseV1
+
+if TYPE_CHECKING:
+    from horizon.backend.db.models import User
+
+pytestmark = [pytest.mark.client_async, pytest.mark.client, pytest.mark.auth, pytest.mark.asyncio]
+
+
+async def test_async_client_authorize_with_login_password(external_app_url: str, user: User):
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+    ) as async_client:
+        await async_client.authorize()
+        assert async_client.session.token
+        assert isinstance(async_client.session.token, AuthlibToken)
+
+
+async def test_async_client_authorize_with_access_token(external_app_url: str, access_token: str):
+    async with HorizonClientAsync(base_url=external_app_url, auth=AccessToken(token=access_token)) as async_client:
+        await async_client.authorize()
+        assert async_client.session.token
+        assert isinstance(async_client.session.token, AuthlibToken)
+
+
+async def test_async_client_authorize_with_api_key(external_app_url: str, api_key: str, user: User):
+    async with HorizonClientAsync(base_url=external_app_url, auth=APIKey(key=api_key)) as async_client:
+        await async_client.authorize()
+        assert await async_client.whoami() == UserResponseV1(id=user.id, username=user.username)
+
+
+async def test_async_client_authorize_with_wrong_api_key(external_app_url: str):
+    async with HorizonClientAsync(base_url=external_app_url, auth=APIKey(key=generate_api_key())) as async_client:
+        with pytest.raises(AuthorizationError, match="Invalid API key"):
+            await async_client.authorize()
+
+
+@pytest.mark.parametrize(
+    "wrong_access_token",
+    [
+        lazy_fixture("access_token_wrong_secret_key"),
+        lazy_fixture("access_token_wrong_algorithm"),
+        lazy_fixture("access_token_without_user_id"),
+        lazy_fixture("access_token_with_wrong_user_id_type"),
+    ],
+)
+async def test_async_client_authorize_with_wrong_access_token(external_app_url: str, wrong_access_token: str):
+    async_client = HorizonClientAsync(base_url=external_app_url, auth=AccessToken(token=wrong_access_token))
+    async with async_client:
+        with pytest.raises(AuthorizationError):
+            await async_client.authorize()
+
+
+async def test_async_client_concurrent_requests_fetch_token_once(external_app_url: str, user: User):
+    token_requests: list[httpx.Request] = []
+
+    async def hook(request: httpx.Request):
+        if request.url.path.endswith("/v1/auth/token"):
+            token_requests.append(request)
+
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+    ) as async_client:
+        async_client.session.event_hooks["request"].append(hook)
+
+        responses = await asyncio.gather(*(async_client.whoami() for _ in range(200)))
+
+    assert responses == [UserResponseV1(id=user.id, username=user.username)] * 200
+    assert len(token_requests) == 1
+
+
+async def test_async_client_custom_session(external_app_url: str, access_token: str):
+    session = AsyncOAuth2Client(headers={"Custom-Header": "HeaderValue"})
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=AccessToken(token=access_token),
+        session=session,
+    ) as async_client:
+        assert async_client.session is session
+        assert session.headers["Custom-Header"] == "HeaderValue"
+        assert session.headers["X-Client-Name"] == "python-horizon[async]"
+        await async_client.ping()
+
+
+async def test_async_client_wrong_session_type(external_app_url: str, access_token: str):
+    with pytest.raises(ValidationError, match="session should be an instance of AsyncOAuth2Client, got AsyncClient"):
+        HorizonClientAsync(
+            base_url=external_app_url,
+            auth=AccessToken(token=access_token),
+            session=httpx.AsyncClient(),
+        )
+
+
+@pytest.mark.parametrize(
+    "retry_config",
+    [
+        RetryConfig(total=4, backoff_factor=0.01, status_forcelist=[503, 504], backoff_jitter=0.01),
+        {"total": 4, "backoff_factor": 0.01, "status_forcelist": [503, 504]},
+        RetryConfig(),  # test default retry
+    ],
+)
+async def test_async_client_retry(
+    external_app_url: str,
+    access_token: str,
+    monkeypatch: pytest.MonkeyPatch,
+    retry_config: RetryConfig | dict,
+):
+    original = httpx.AsyncHTTPTransport.handle_async_request
+    attempts: list[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            msg = "Connection refused"
+            raise httpx.ConnectError(msg, request=request)
+        if len(attempts) < 3:
+            return httpx.Response(503, json={"error": "Server Error"}, request=request)
+        return await original(self, request)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request)
+
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=AccessToken(token=access_token),
+        retry=retry_config,
+    ) as async_client:
+        await async_client.ping()
+
+    assert len(attempts) == 3
+    # retried write requests have the same key, so they are executed only once
+    assert len({request.headers.get("Idempotency-Key") for request in attempts}) == 1
+
+
+async def test_async_client_retry_max_attempts_error(
+    external_app_url: str,
+    access_token: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    attempts: list[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(503, json={"error": "Server Error"}, request=request)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request)
+
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=AccessToken(token=access_token),
+        retry=RetryConfig(total=2, backoff_factor=0.01),
+    ) as async_client:
+        with pytest.raises(httpx.HTTPStatusError, match="503 Service Unavailable"):
+            await async_client.ping()
+
+    # first attempt + 2 retries
+    assert len(attempts) == 3
+
+
+async def test_async_client_retry_unhandled_code_error(
+    external_app_url: str,
+    access_token: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    attempts: list[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(407, json={"error": "Fails with first request"}, request=request)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request)
+
+    async with HorizonClientAsync(base_url=external_app_url, auth=AccessToken(token=access_token)) as async_client:
+        with pytest.raises(httpx.HTTPStatusError, match="407 Proxy Authentication Required"):
+            await async_client.ping()
+
+    assert len(attempts) == 1
+
+
+async def test_async_client_timeout_error(external_app_url: str, user: User):
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+        retry=RetryConfig(total=0),
+        timeout=TimeoutConfig(request_timeout=0.000001),
+    ) as async_client:
+        with pytest.raises(httpx.TimeoutException):
+            await async_client.authorize()
+
+
+async def test_async_client_http2(external_app_url: str, access_token: str):
+    pytest.importorskip("h2")
+
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=AccessToken(token=access_token),
+        connection=ConnectionConfig(http2=True),
+    ) as async_client:
+        # server does not support HTTP/2 over plain HTTP, so client falls back to HTTP/1.1
+        await async_client.ping()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from authlib.integrations.httpx_client import AsyncOAuth2Client
+
+from horizon.client.asyncio import HorizonClientAsync
+from horizon.client.auth import LoginPassword, TokenCache
+from horizon.commons.schemas.v1 import UserResponseV1
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from horizon.backend.db.models import User
+
+pytestmark = [pytest.mark.client_async, pytest.mark.client, pytest.mark.auth, pytest.mark.asyncio]
+
+
+@pytest.fixture
+def fetch_token_calls(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+    original_fetch_token = AsyncOAuth2Client.fetch_token
+
+    async def fetch_token(self, *args, **kwargs):
+        calls.append(kwargs.get("grant_type", "password"))
+        return await original_fetch_token(self, *args, **kwargs)
+
+    monkeypatch.setattr(AsyncOAuth2Client, "fetch_token", fetch_token)
+    return calls
+
+
+async def test_async_client_token_cache_shared_between_clients(
+    external_app_url: str,
+    user: User,
+    tmp_path: Path,
+    fetch_token_calls: list[str],
+):
+    token_cache = TokenCache(path=tmp_path)
+
+    async def authorize() -> str:
+        async with HorizonClientAsync(
+            base_url=external_app_url,
+            auth=LoginPassword(login=user.username, password="test", token_cache=token_cache),
+        ) as async_client:
+            await async_client.authorize()
+            return async_client.session.token["access_token"]
+
+    results = await asyncio.gather(*(authorize() for _ in range(10)))
+
+    # token is fetched once, other clients are waiting for the lock, and then read token from cache
+    assert len(fetch_token_calls) == 1
+    assert len(set(results)) == 1
+    assert token_cache.get(external_app_url, user.username)["access_token"] == results[0]
+
+
+async def test_async_client_refresh_token_in_background(
+    external_app_url: str,
+    user: User,
+    fetch_token_calls: list[str],
+):
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+        # any token is considered expiring soon
+        token_refresh_before=10**9,
+    ) as async_client:
+        await async_client.authorize()
+        assert len(fetch_token_calls) == 1
+
+        # request is sent with current token, and new one is fetched in background
+        assert await async_client.whoami() == UserResponseV1(id=user.id, username=user.username)
+        await async_client._refresh_task
+
+    # new token is fetched using refresh token, without sending password again
+    assert fetch_token_calls == ["password", "refresh_token"]
+
+
+async def test_async_client_refresh_token_in_background_during_authorize(
+    external_app_url: str,
+    user: User,
+    fetch_token_calls: list[str],
+):
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+        token_refresh_before=10**9,
+    ) as async_client:
+        await async_client.authorize()
+
+        # token is expired, and new one is being fetched by concurrent request
+        async with async_client._get_authorize_lock():
+            refresh_task = asyncio.ensure_future(async_client._refresh_token())
+            await asyncio.sleep(0.1)
+            await async_client.authorize()
+        await refresh_task
+
+        # refresh token is not sent twice, so token family is not revoked
+        assert fetch_token_calls == ["password", "refresh_token"]
+        assert await async_client.whoami() == UserResponseV1(id=user.id, username=user.username)
+
+
+async def test_async_client_refresh_token_in_background_error(
+    external_app_url: str,
+    user: User,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+        token_refresh_before=10**9,
+    ) as async_client:
+        await async_client.authorize()
+        token = async_client.session.token
+
+        async def fetch_token(self, *args, **kwargs):
+            msg = "Horizon is not available"
+            raise ConnectionError(msg)
+
+        monkeypatch.setattr(AsyncOAuth2Client, "fetch_token", fetch_token)
+
+        with caplog.at_level(logging.WARNING):
+            assert await async_client.whoami() == UserResponseV1(id=user.id, username=user.username)
+            await async_client._refresh_task
+
+        # current token is still used
+        assert async_client.session.token == token
+        assert "Failed to refresh access token in background" in caplog.text
+
+
+async def test_async_client_refresh_token_invalid(
+    external_app_url: str,
+    user: User,
+    fetch_token_calls: list[str],
+):
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+    ) as async_client:
+        await async_client.authorize()
+        async_client.session.token["refresh_token"] = "invalid"
+
+        await async_client._refresh_token()
+        assert await async_client.whoami() == UserResponseV1(id=user.id, username=user.username)
+
+    # refresh token was rejected, so login and password were sent again
+    assert fetch_token_calls == ["password", "refresh_token", "password"]
+
+
+async def test_async_client_token_cache_refresh_token(
+    external_app_url: str,
+    user: User,
+    tmp_path: Path,
+    fetch_token_calls: list[str],
+):
+    token_cache = TokenCache(path=tmp_path)
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test", token_cache=token_cache),
+    ) as async_client:
+        await async_client.authorize()
+
+    # access token is about to expire, but refresh token is still valid
+    token = token_cache.get(external_app_url, user.username)
+    token_cache.set(external_app_url, user.username, {**token, "expires_at": int(time.time()) + 10})
+
+    async with HorizonClientAsync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test", token_cache=token_cache),
+    ) as async_client:
+        await async_client.authorize()
+        new_refresh_token = async_client.session.token["refresh_token"]
+
+    assert fetch_token_calls == ["password", "refresh_token"]
+    assert new_refresh_token != token["refresh_token"]
+    assert token_cache.get(external_app_url, user.username)["refresh_token"] == new_refresh_token
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.commons.schemas import PingResponse
+
+if TYPE_CHECKING:
+    from horizon.client.asyncio import HorizonClientAsync
+
+pytestmark = [pytest.mark.client_async, pytest.mark.client, pytest.mark.asyncio]
+
+
+async def test_async_client_ping(async_client: HorizonClientAsync):
+    assert await async_client.ping() == PingResponse(status="ok")
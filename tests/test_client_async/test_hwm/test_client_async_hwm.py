@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import re
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from horizon.commons.exceptions.entity import EntityNotFoundError
+from horizon.commons.schemas.v1 import (
+    HWMBulkCopyRequestV1,
+    HWMCreateRequestV1,
+    HWMPaginateQueryV1,
+    HWMResponseV1,
+    HWMSearchQueryV1,
+    HWMUpdateRequestV1,
+    PageMetaResponseV1,
+    PageResponseV1,
+)
+
+if TYPE_CHECKING:
+    from horizon.backend.db.models import HWM, Namespace, User
+    from horizon.client.asyncio import HorizonClientAsync
+
+pytestmark = [pytest.mark.client_async, pytest.mark.client, pytest.mark.asyncio]
+
+
+def _to_response(hwm: HWM) -> HWMResponseV1:
+    return HWMResponseV1(
+        id=hwm.id,
+        namespace_id=hwm.namespace_id,
+        name=hwm.name,
+        type=hwm.type,
+        value=hwm.value,
+        entity=hwm.entity,
+        expression=hwm.expression,
+        description=hwm.description,
+        changed_at=hwm.changed_at,
+        changed_by=hwm.changed_by,
+    )
+
+
+async def test_async_client_get_hwm(hwm: HWM, async_client: HorizonClientAsync):
+    response = await async_client.get_hwm(hwm.id)
+    assert response == _to_response(hwm)
+
+
+async def test_async_client_get_hwm_missing(new_hwm: HWM, async_client: HorizonClientAsync):
+    with pytest.raises(
+        EntityNotFoundError,
+        match=re.escape(f"HWM with id={new_hwm.id!r} not found"),
+    ) as e:
+        await async_client.get_hwm(new_hwm.id)
+
+    assert e.value.details == {
+        "entity_type": "HWM",
+        "field": "id",
+        "value": new_hwm.id,
+    }
+
+    # original HTTP exception is attached as reason
+    assert isinstance(e.value.__cause__, httpx.HTTPStatusError)
+    assert e.value.__cause__.response.status_code == HTTPStatus.NOT_FOUND
+
+
+async def test_async_client_paginate_hwm(namespace: Namespace, hwms: list[HWM], async_client: HorizonClientAsync):
+    items = [_to_response(hwm) for hwm in sorted(hwms, key=lambda item: item.name)]
+
+    response = await async_client.paginate_hwm(HWMPaginateQueryV1(namespace_id=namespace.id))
+    assert response == PageResponseV1[HWMResponseV1](
+        meta=PageMetaResponseV1(
+            page=1,
+            pages_count=1,
+            total_count=len(items),
+            page_size=20,
+            has_next=False,
+            has_previous=False,
+            next_page=None,
+            previous_page=None,
+        ),
+        items=items,
+    )
+
+
+async def test_async_client_search_hwm(hwm: HWM, async_client: HorizonClientAsync):
+    response = await async_client.search_hwm(HWMSearchQueryV1(name_prefix=hwm.name))
+    assert _to_response(hwm) in response.items
+
+
+async def test_async_client_create_update_delete_hwm(
+    namespace: Namespace,
+    new_hwm: HWM,
+    user: User,
+    async_client: HorizonClientAsync,
+):
+    to_create = HWMCreateRequestV1(
+        namespace_id=namespace.id,
+        name=new_hwm.name,
+        type=new_hwm.type,
+        value=new_hwm.value,
+    )
+    created = await async_client.create_hwm(to_create)
+    assert created.dict(include={"namespace_id", "name", "type", "value", "changed_by"}) == {
+        "namespace_id": namespace.id,
+        "name": new_hwm.name,
+        "type": new_hwm.type,
+        "value": new_hwm.value,
+        "changed_by": user.username,
+    }
+
+    updated = await async_client.update_hwm(created.id, HWMUpdateRequestV1(value=123))
+    assert updated.id == created.id
+    assert updated.value == 123
+
+    assert await async_client.delete_hwm(created.id) is None
+    with pytest.raises(EntityNotFoundError):
+        await async_client.get_hwm(created.id)
+
+
+async def test_async_client_bulk_copy_hwm(
+    namespaces: list[Namespace],
+    hwms: list[HWM],
+    async_client: HorizonClientAsync,
+):
+    source_namespace = hwms[0].namespace
+    target_namespace = namespaces[0]
+
+    copy_request = HWMBulkCopyRequestV1(
+        source_namespace_id=source_namespace.id,
+        target_namespace_id=target_namespace.id,
+        hwm_ids=[hwm.id for hwm in hwms],
+        with_history=False,
+    )
+    response = await async_client.bulk_copy_hwm(copy_request)
+
+    assert sorted(hwm.name for hwm in response.hwms) == sorted(hwm.name for hwm in hwms)
+    assert {hwm.namespace_id for hwm in response.hwms} == {target_namespace.id}
+
+
+async def test_async_client_bulk_delete_hwm(namespace: Namespace, hwms: list[HWM], async_client: HorizonClientAsync):
+    hwm_ids = [hwm.id for hwm in hwms]
+    assert await async_client.bulk_delete_hwm(namespace_id=namespace.id, hwm_ids=hwm_ids) is None
+
+    for hwm_id in hwm_ids:
+        with pytest.raises(EntityNotFoundError):
+            await async_client.get_hwm(hwm_id)
+
+
+async def test_async_client_sends_idempotency_key(hwm: HWM, async_client: HorizonClientAsync):
+    requests_sent: list[httpx.Request] = []
+
+    async def hook(request: httpx.Request):
+        requests_sent.append(request)
+
+    async_client.session.event_hooks["request"].append(hook)
+    try:
+        await async_client.get_hwm(hwm.id)
+        await async_client.update_hwm(hwm.id, HWMUpdateRequestV1(value=1))
+        await async_client.update_hwm(hwm.id, HWMUpdateRequestV1(value=2))
+    finally:
+        async_client.session.event_hooks["request"].remove(hook)
+
+    get_request, *update_requests = requests_sent
+    assert "Idempotency-Key" not in get_request.headers
+
+    # each call has its own key
+    keys = {request.headers["Idempotency-Key"] for request in update_requests}
+    assert len(keys) == len(update_requests)
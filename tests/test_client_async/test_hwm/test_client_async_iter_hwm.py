@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.commons.schemas.v1 import (
+    HWMHistoryPaginateQueryV1,
+    HWMPaginateQueryV1,
+    NamespacePaginateQueryV1,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+    from horizon.backend.db.models import HWM, HWMHistory, Namespace
+    from horizon.client.asyncio import HorizonClientAsync
+
+pytestmark = [pytest.mark.client_async, pytest.mark.client, pytest.mark.asyncio]
+
+
+async def test_async_client_iter_hwm(namespace: Namespace, hwms: list[HWM], async_client: HorizonClientAsync):
+    query = HWMPaginateQueryV1(namespace_id=namespace.id, page_size=2)
+    result = [hwm async for hwm in async_client.iter_hwm(query)]
+
+    assert [hwm.id for hwm in result] == [hwm.id for hwm in sorted(hwms, key=lambda item: item.name)]
+
+
+async def test_async_client_iter_hwm_stop_early(
+    namespace: Namespace,
+    hwms: list[HWM],
+    async_client: HorizonClientAsync,
+):
+    requests_sent: list[httpx.Request] = []
+
+    async def hook(request: httpx.Request):
+        requests_sent.append(request)
+
+    async_client.session.event_hooks["request"].append(hook)
+    try:
+        iterator = async_client.iter_hwm(HWMPaginateQueryV1(namespace_id=namespace.id, page_size=1))
+        first = await iterator.__anext__()
+        await iterator.aclose()
+    finally:
+        async_client.session.event_hooks["request"].remove(hook)
+
+    assert first.id == min(hwms, key=lambda item: item.name).id
+
+    # first page, and maybe prefetched second one. nothing after iterator is closed
+    assert 1 <= len(requests_sent) <= 2
+    assert all(request.url.params.get("page") != "3" for request in requests_sent)
+
+
+async def test_async_client_iter_namespaces(namespace: Namespace, async_client: HorizonClientAsync):
+    query = NamespacePaginateQueryV1(name=namespace.name)
+    assert [item.id async for item in async_client.iter_namespaces(query)] == [namespace.id]
+
+
+async def test_async_client_iter_hwm_history(
+    hwm: HWM,
+    hwm_history_items: list[HWMHistory],
+    async_client: HorizonClientAsync,
+):
+    query = HWMHistoryPaginateQueryV1(hwm_id=hwm.id, page_size=2)
+    result = [item async for item in async_client.iter_hwm_history(query)]
+
+    expected = sorted(hwm_history_items, key=lambda item: item.changed_at, reverse=True)
+    assert [item.id for item in result] == [item.id for item in expected]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.commons.schemas.v1 import HWMHistoryPaginateQueryV1
+
+if TYPE_CHECKING:
+    from horizon.backend.db.models import HWM, HWMHistory
+    from horizon.client.asyncio import HorizonClientAsync
+
+pytestmark = [pytest.mark.client_async, pytest.mark.client, pytest.mark.asyncio]
+
+
+async def test_async_client_paginate_hwm_history(
+    hwm: HWM,
+    hwm_history_items: list[HWMHistory],
+    async_client: HorizonClientAsync,
+):
+    hwm_history_items = sorted(hwm_history_items, key=lambda item: item.changed_at, reverse=True)
+
+    response = await async_client.paginate_hwm_history(HWMHistoryPaginateQueryV1(hwm_id=hwm.id))
+    assert response.meta.total_count == len(hwm_history_items)
+    assert [item.id for item in response.items] == [item.id for item in hwm_history_items]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.commons.exceptions import EntityAlreadyExistsError
+from horizon.commons.exceptions.entity import EntityNotFoundError
+from horizon.commons.schemas.v1 import (
+    NamespaceCreateRequestV1,
+    NamespaceHistoryPaginateQueryV1,
+    NamespacePaginateQueryV1,
+    NamespaceResponseV1,
+    NamespaceStatsListResponseV1,
+    NamespaceStatsResponseV1,
+    NamespaceUpdateRequestV1,
+)
+
+if TYPE_CHECKING:
+    from horizon.backend.db.models import HWM, Namespace, NamespaceHistory, User
+    from horizon.client.asyncio import HorizonClientAsync
+
+pytestmark = [pytest.mark.client_async, pytest.mark.client, pytest.mark.asyncio]
+
+
+async def test_async_client_get_namespace(namespace: Namespace, async_client: HorizonClientAsync):
+    response = await async_client.get_namespace(namespace.id)
+    assert response == NamespaceResponseV1(
+        id=namespace.id,
+        name=namespace.name,
+        description=namespace.description,
+        changed_at=namespace.changed_at,
+        changed_by=namespace.changed_by,
+        owned_by=namespace.owned_by,
+    )
+
+
+async def test_async_client_paginate_namespaces(namespace: Namespace, async_client: HorizonClientAsync):
+    response = await async_client.paginate_namespaces(NamespacePaginateQueryV1(name=namespace.name))
+    assert [item.id for item in response.items] == [namespace.id]
+
+
+async def test_async_client_namespaces_stats(
+    namespace: Namespace,
+    hwms: list[HWM],
+    async_client: HorizonClientAsync,
+):
+    expected_stats = NamespaceStatsResponseV1(
+        namespace_id=namespace.id,
+        hwm_count=len(hwms),
+        history_count=0,
+        last_changed_at=max(hwm.changed_at for hwm in hwms),
+    )
+
+    response = await async_client.get_namespace(namespace.id, with_stats=True)
+    assert response.stats == expected_stats
+
+    response = await async_client.get_namespaces_stats([namespace.id])
+    assert response == NamespaceStatsListResponseV1(stats=[expected_stats])
+
+
+async def test_async_client_create_update_delete_namespace(
+    new_namespace: Namespace,
+    user: User,
+    async_client: HorizonClientAsync,
+):
+    to_create = NamespaceCreateRequestV1(name=new_namespace.name, description=new_namespace.description)
+    created = await async_client.create_namespace(to_create)
+    assert created.dict(exclude={"id", "changed_at"}) == {
+        "name": new_namespace.name,
+        "description": new_namespace.description,
+        "changed_by": user.username,
+        "owned_by": user.username,
+        "stats": None,
+    }
+
+    with pytest.raises(EntityAlreadyExistsError):
+        await async_client.create_namespace(to_create)
+
+    updated = await async_client.update_namespace(created.id, NamespaceUpdateRequestV1(description="changed"))
+    assert updated.id == created.id
+    assert updated.description == "changed"
+
+    assert await async_client.delete_namespace(created.id) is None
+    with pytest.raises(EntityNotFoundError):
+        await async_client.get_namespace(created.id)
+
+
+async def test_async_client_paginate_namespace_history(
+    namespace: Namespace,
+    namespace_history_items: list[NamespaceHistory],
+    async_client: HorizonClientAsync,
+):
+    response = await async_client.paginate_namespace_history(
+        NamespaceHistoryPaginateQueryV1(namespace_id=namespace.id),
+    )
+    assert response.meta.total_count == len(namespace_history_items)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.backend.db.models import Namespace, NamespaceUserRoleInt, User
+from horizon.commons.schemas.v1 import (
+    NamespaceUserRole,
+    PermissionResponseItemV1,
+    PermissionsResponseV1,
+    PermissionsUpdateRequestV1,
+    PermissionUpdateRequestItemV1,
+)
+
+if TYPE_CHECKING:
+    from horizon.client.asyncio import HorizonClientAsync
+
+pytestmark = [pytest.mark.client_async, pytest.mark.client, pytest.mark.asyncio]
+
+
+async def test_async_client_get_namespace_permissions(
+    namespace: Namespace,
+    user: User,
+    async_client: HorizonClientAsync,
+):
+    response = await async_client.get_namespace_permissions(namespace.id)
+    assert response == PermissionsResponseV1(
+        permissions=[PermissionResponseItemV1(username=user.username, role=NamespaceUserRoleInt.OWNER.name)],
+    )
+
+
+@pytest.mark.parametrize(
+    "namespace_with_users",
+    [
+        [("new_user", NamespaceUserRoleInt.MAINTAINER)],
+    ],
+    indirect=["namespace_with_users"],
+)
+async def test_async_client_update_namespace_permissions(
+    namespace: Namespace,
+    user: User,
+    async_client: HorizonClientAsync,
+    namespace_with_users: None,
+):
+    changes = PermissionsUpdateRequestV1(
+        permissions=[
+            PermissionUpdateRequestItemV1(username=user.username, role=NamespaceUserRole.DEVELOPER),
+            PermissionUpdateRequestItemV1(username="new_user", role=NamespaceUserRole.OWNER),
+        ],
+    )
+    response = await async_client.update_namespace_permissions(namespace.id, changes)
+
+    assert any(
+        perm.username == user.username and perm.role == NamespaceUserRole.DEVELOPER for perm in response.permissions
+    )
+    assert any(perm.username == "new_user" and perm.role == NamespaceUserRole.OWNER for perm in response.permissions)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.backend.db.models import NamespaceUserRoleInt, User
+from horizon.commons.schemas.v1 import UserResponseV1, UserResponseV1WithAdmin
+
+if TYPE_CHECKING:
+    from horizon.client.asyncio import HorizonClientAsync
+
+pytestmark = [pytest.mark.client_async, pytest.mark.client, pytest.mark.asyncio]
+
+
+async def test_async_client_whoami(async_client: HorizonClientAsync, user: User):
+    assert await async_client.whoami() == UserResponseV1(
+        id=user.id,
+        username=user.username,
+    )
+
+
+@pytest.mark.parametrize(
+    "user_with_role",
+    [
+        NamespaceUserRoleInt.SUPERADMIN,
+    ],
+    indirect=["user_with_role"],
+)
+async def test_async_client_whoami_superadmin(async_client: HorizonClientAsync, user: User, user_with_role: None):
+    assert await async_client.whoami() == UserResponseV1WithAdmin(
+        id=user.id,
+        username=user.username,
+        is_admin=user.is_admin,
+    )
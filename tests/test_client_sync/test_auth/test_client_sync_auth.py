@@ -12,9 +12,11 @@ from requests.exceptions import ConnectionError, RetryError
 from urllib3 import __version__ as urllib3_version
 from urllib3.exceptions import ReadTimeoutError
 
-from horizon.client.auth import AccessToken, LoginPassword
+from horizon.backend.services.api_key import generate_api_key
+from horizon.client.auth import AccessToken, APIKey, LoginPassword
 from horizon.client.sync import HorizonClientSync, RetryConfig, TimeoutConfig
 from horizon.commons.exceptions.auth import AuthorizationError
+from horizon.commons.schemas.v1 import UserResponseV1
 
 if TYPE_CHECKING:
     from horizon.backend.db.models import User
@@ -45,6 +47,18 @@ def test_sync_client_authorize_with_access_token(external_app_url: str, access_t
     assert isinstance(sync_client.session.token, AuthlibToken)
 
 
+def test_sync_client_authorize_with_api_key(external_app_url: str, api_key: str, user: User):
+    sync_client = HorizonClientSync(base_url=external_app_url, auth=APIKey(key=api_key))
+    sync_client.authorize()
+    assert sync_client.whoami() == UserResponseV1(id=user.id, username=user.username)
+
+
+def test_sync_client_authorize_with_wrong_api_key(external_app_url: str):
+    sync_client = HorizonClientSync(base_url=external_app_url, auth=APIKey(key=generate_api_key()))
+    with pytest.raises(AuthorizationError, match="Invalid API key"):
+        sync_client.authorize()
+
+
 @pytest.mark.parametrize(
     "wrong_access_token",
     [
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from authlib.integrations.requests_client import OAuth2Session
+
+from horizon.client.auth import LoginPassword, TokenCache
+from horizon.client.sync import HorizonClientSync
+from horizon.commons.schemas.v1 import UserResponseV1
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from horizon.backend.db.models import User
+
+pytestmark = [pytest.mark.client_sync, pytest.mark.client, pytest.mark.auth]
+
+
+@pytest.fixture
+def fetch_token_calls(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+    original_fetch_token = OAuth2Session.fetch_token
+
+    def fetch_token(self, *args, **kwargs):
+        calls.append(threading.current_thread().name)
+        return original_fetch_token(self, *args, **kwargs)
+
+    monkeypatch.setattr(OAuth2Session, "fetch_token", fetch_token)
+    return calls
+
+
+@pytest.fixture
+def fetch_token_grant_types(monkeypatch: pytest.MonkeyPatch):
+    grant_types: list[str] = []
+    original_fetch_token = OAuth2Session.fetch_token
+
+    def fetch_token(self, *args, **kwargs):
+        grant_types.append(kwargs.get("grant_type", "password"))
+        return original_fetch_token(self, *args, **kwargs)
+
+    monkeypatch.setattr(OAuth2Session, "fetch_token", fetch_token)
+    return grant_types
+
+
+def test_sync_client_token_cache_shared_between_clients(
+    external_app_url: str,
+    user: User,
+    tmp_path: Path,
+    fetch_token_calls: list[str],
+):
+    token_cache = TokenCache(path=tmp_path)
+
+    def authorize(results: list):
+        client = HorizonClientSync(
+            base_url=external_app_url,
+            auth=LoginPassword(login=user.username, password="test", token_cache=token_cache),
+        )
+        client.authorize()
+        results.append(client.session.token["access_token"])
+
+    results: list[str] = []
+    threads = [threading.Thread(target=authorize, args=(results,)) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # token is fetched once, other clients are waiting for the lock, and then read token from cache
+    assert len(fetch_token_calls) == 1
+    assert len(results) == 10
+    assert len(set(results)) == 1
+    assert token_cache.get(external_app_url, user.username)["access_token"] == results[0]
+
+
+def test_sync_client_token_cache_different_users(
+    external_app_url: str,
+    user: User,
+    new_user: User,
+    tmp_path: Path,
+    fetch_token_calls: list[str],
+):
+    token_cache = TokenCache(path=tmp_path)
+    for username in (user.username, new_user.username):
+        client = HorizonClientSync(
+            base_url=external_app_url,
+            auth=LoginPassword(login=username, password="test", token_cache=token_cache),
+        )
+        assert client.whoami().username == username
+
+    assert len(fetch_token_calls) == 2
+
+
+def test_sync_client_token_cache_expired_token(
+    external_app_url: str,
+    user: User,
+    tmp_path: Path,
+    fetch_token_calls: list[str],
+):
+    token_cache = TokenCache(path=tmp_path)
+    # token which is about to expire is not used
+    token_cache.set(
+        external_app_url,
+        user.username,
+        {"access_token": "expired", "token_type": "Bearer", "expires_at": int(time.time()) + 10},
+    )
+
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test", token_cache=token_cache),
+    )
+    client.authorize()
+
+    assert len(fetch_token_calls) == 1
+    assert client.session.token["access_token"] != "expired"
+    assert token_cache.get(external_app_url, user.username)["access_token"] == client.session.token["access_token"]
+
+
+def test_sync_client_token_cache_corrupted_file(external_app_url: str, user: User, tmp_path: Path):
+    token_cache = TokenCache(path=tmp_path)
+    token_cache._get_path(external_app_url, user.username, ".json").write_text("{not a json")
+
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test", token_cache=token_cache),
+    )
+    client.authorize()
+    assert token_cache.get(external_app_url, user.username)
+
+
+def test_sync_client_refresh_token_in_background(
+    external_app_url: str,
+    user: User,
+    fetch_token_calls: list[str],
+):
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+        # any token is considered expiring soon
+        token_refresh_before=10**9,
+    )
+    client.authorize()
+    assert fetch_token_calls == ["MainThread"]
+
+    # request is sent with current token, and new one is fetched in background
+    assert client.whoami() == UserResponseV1(id=user.id, username=user.username)
+    client._refresh_thread.join()
+
+    assert fetch_token_calls == ["MainThread", "horizon-token-refresh"]
+
+
+def test_sync_client_refresh_token_in_background_during_authorize(
+    external_app_url: str,
+    user: User,
+    fetch_token_calls: list[str],
+):
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+        token_refresh_before=10**9,
+    )
+    client.authorize()
+
+    # token is expired, and new one is being fetched by another thread
+    refresh_thread = threading.Thread(target=client._refresh_token, name="horizon-token-refresh")
+    with client._authorize_lock:
+        refresh_thread.start()
+        time.sleep(0.1)
+        client.authorize()
+    refresh_thread.join()
+
+    # refresh token is not sent twice, so token family is not revoked
+    assert fetch_token_calls == ["MainThread", "MainThread"]
+    assert client.whoami() == UserResponseV1(id=user.id, username=user.username)
+
+
+def test_sync_client_refresh_token_in_background_error(
+    external_app_url: str,
+    user: User,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+        token_refresh_before=10**9,
+    )
+    client.authorize()
+    token = client.session.token
+
+    def fetch_token(self, *args, **kwargs):
+        msg = "Horizon is not available"
+        raise ConnectionError(msg)
+
+    monkeypatch.setattr(OAuth2Session, "fetch_token", fetch_token)
+
+    with caplog.at_level(logging.WARNING):
+        assert client.whoami() == UserResponseV1(id=user.id, username=user.username)
+        client._refresh_thread.join()
+
+    # current token is still used
+    assert client.session.token == token
+    assert "Failed to refresh access token in background" in caplog.text
+
+
+def test_sync_client_refresh_token_disabled(
+    external_app_url: str,
+    user: User,
+    fetch_token_calls: list[str],
+):
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+        token_refresh_before=0,
+    )
+    client.whoami()
+    client.whoami()
+
+    assert client._refresh_thread is None
+    assert fetch_token_calls == ["MainThread"]
+
+
+def test_sync_client_refresh_token(
+    external_app_url: str,
+    user: User,
+    fetch_token_grant_types: list[str],
+):
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+    )
+    client.authorize()
+    refresh_token = client.session.token["refresh_token"]
+    assert refresh_token
+
+    client._refresh_token()
+    assert client.session.token["refresh_token"] != refresh_token
+    assert client.whoami() == UserResponseV1(id=user.id, username=user.username)
+
+    # new token is fetched using refresh token, without sending password again
+    assert fetch_token_grant_types == ["password", "refresh_token"]
+
+
+def test_sync_client_refresh_token_invalid(
+    external_app_url: str,
+    user: User,
+    fetch_token_grant_types: list[str],
+):
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test"),
+    )
+    client.authorize()
+    client.session.token["refresh_token"] = "invalid"
+
+    client._refresh_token()
+    assert client.whoami() == UserResponseV1(id=user.id, username=user.username)
+
+    # refresh token was rejected, so login and password were sent again
+    assert fetch_token_grant_types == ["password", "refresh_token", "password"]
+
+
+def test_sync_client_token_cache_refresh_token(
+    external_app_url: str,
+    user: User,
+    tmp_path: Path,
+    fetch_token_grant_types: list[str],
+):
+    token_cache = TokenCache(path=tmp_path)
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test", token_cache=token_cache),
+    )
+    client.authorize()
+
+    # access token is about to expire, but refresh token is still valid
+    token = token_cache.get(external_app_url, user.username)
+    token_cache.set(external_app_url, user.username, {**token, "expires_at": int(time.time()) + 10})
+
+    client = HorizonClientSync(
+        base_url=external_app_url,
+        auth=LoginPassword(login=user.username, password="test", token_cache=token_cache),
+    )
+    client.authorize()
+
+    assert fetch_token_grant_types == ["password", "refresh_token"]
+    assert client.session.token["refresh_token"] != token["refresh_token"]
+    assert token_cache.get(external_app_url, user.username)["refresh_token"] == client.session.token["refresh_token"]
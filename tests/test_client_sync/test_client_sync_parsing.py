@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import parse_obj_as
+
+from horizon.client.auth import LoginPassword
+from horizon.client.base import json_loads
+from horizon.client.sync import HorizonClientSync
+from horizon.commons.schemas.v1 import HWMResponseV1, PageResponseV1
+
+pytestmark = [pytest.mark.client_sync, pytest.mark.client]
+
+PAGE_SIZE = 50
+
+
+@pytest.fixture
+def page_content() -> bytes:
+    changed_at = datetime.now(tz=timezone.utc).isoformat()
+    items = [
+        {
+            "id": i,
+            "namespace_id": 1,
+            "name": f"hwm_{i}",
+            "description": "",
+            "type": "column_int",
+            "value": i,
+            "entity": "some_table",
+            "expression": "some_column",
+            "changed_at": changed_at,
+            "changed_by": "someuser",
+        }
+        for i in range(PAGE_SIZE)
+    ]
+    meta = {
+        "page": 1,
+        "pages_count": 1,
+        "total_count": PAGE_SIZE,
+        "page_size": PAGE_SIZE,
+        "has_next": False,
+        "has_previous": False,
+        "next_page": None,
+        "previous_page": None,
+    }
+    return json.dumps({"meta": meta, "items": items}).encode()
+
+
+def test_sync_client_parsing(page_content: bytes):
+    # does not send any requests
+    client = HorizonClientSync(base_url="http://localhost", auth=LoginPassword(login="user", password="password"))
+    response_class = PageResponseV1[HWMResponseV1]
+
+    result = client._parse_content(page_content, response_class)
+    assert result == parse_obj_as(response_class, json.loads(page_content))
+    assert result == response_class.parse_obj(json_loads(page_content))
+    assert len(result.items) == PAGE_SIZE
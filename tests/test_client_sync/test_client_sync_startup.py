@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from horizon.backend.db.models import HWM
+
+pytestmark = [pytest.mark.client_sync, pytest.mark.client]
+
+# modules which should be imported only on first use
+LAZY_MODULES = {"authlib", "requests", "urllib3", "cryptography"}
+
+SCRIPT = textwrap.dedent(
+    """
+    import json
+    import os
+    import sys
+
+    from horizon.client.sync import HorizonClientSync
+
+    imported_modules = sorted(sys.modules)
+
+    # AccessToken requires authlib.jose, so it is a part of first use
+    from horizon.client.auth import AccessToken
+
+    client = HorizonClientSync(
+        base_url=os.environ["HORIZON_TEST_SERVER_URL"],
+        auth=AccessToken(token=os.environ["HORIZON_TEST_ACCESS_TOKEN"]),
+    )
+    hwm = client.get_hwm(int(os.environ["HORIZON_TEST_HWM_ID"]))
+
+    result = {
+        "hwm_id": hwm.id,
+        "imported_modules": imported_modules,
+    }
+    print(json.dumps(result))
+    """,
+)
+
+
+def test_sync_client_lazy_imports(hwm: HWM, access_token: str, external_app_url: str):
+    env = {
+        **os.environ,
+        "HORIZON_TEST_SERVER_URL": external_app_url,
+        "HORIZON_TEST_ACCESS_TOKEN": access_token,
+        "HORIZON_TEST_HWM_ID": str(hwm.id),
+    }
+    process = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=env,
+    )
+    result = json.loads(process.stdout)
+    assert result["hwm_id"] == hwm.id
+
+    imported_packages = {module.split(".")[0] for module in result["imported_modules"]}
+    assert not imported_packages & LAZY_MODULES
+    assert not [module for module in result["imported_modules"] if module.startswith("horizon.commons.schemas.v1.")]
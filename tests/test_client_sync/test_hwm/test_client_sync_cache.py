@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+
+from horizon.client.auth import AccessToken
+from horizon.client.cache import CacheEntry, CacheStats, FileCache, MemoryCache
+from horizon.client.sync import HorizonClientSync
+from horizon.commons.exceptions.entity import EntityNotFoundError
+from horizon.commons.schemas.v1 import HWMUpdateRequestV1
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from horizon.backend.db.models import HWM
+    from horizon.client.cache import BaseCache
+
+pytestmark = [pytest.mark.client_sync, pytest.mark.client]
+
+
+@pytest.fixture(params=["memory", "file"])
+def cache_factory(request: pytest.FixtureRequest, tmp_path: Path):
+    def factory(**kwargs) -> BaseCache:
+        if request.param == "memory":
+            return MemoryCache(**kwargs)
+        return FileCache(path=tmp_path / "cache", **kwargs)
+
+    return factory
+
+
+@pytest.fixture
+def make_client(access_token: str, external_app_url: str):
+    clients: list[HorizonClientSync] = []
+
+    def factory(cache: BaseCache | None) -> HorizonClientSync:
+        client = HorizonClientSync(base_url=external_app_url, auth=AccessToken(token=access_token), cache=cache)
+        clients.append(client)
+        return client
+
+    yield factory
+
+    for client in clients:
+        client.close()
+
+
+def count_requests(client: HorizonClientSync) -> list[requests.PreparedRequest]:
+    requests_sent: list[requests.PreparedRequest] = []
+
+    def hook(response: requests.Response, *args, **kwargs):
+        requests_sent.append(response.request)
+
+    client.session.hooks["response"].append(hook)
+    return requests_sent
+
+
+def test_sync_client_cache_hit(hwm: HWM, make_client, cache_factory):
+    client = make_client(cache_factory(ttl=60))
+    requests_sent = count_requests(client)
+
+    first = client.get_hwm(hwm.id)
+    second = client.get_hwm(hwm.id)
+
+    assert first == second
+    assert first.value == hwm.value
+    assert len(requests_sent) == 1
+    assert client.cache.stats == CacheStats(hits=1, misses=1, revalidated=0, stale=0)
+
+
+def test_sync_client_cache_revalidate(hwm: HWM, make_client, cache_factory):
+    client = make_client(cache_factory(ttl=0))
+    other_client = make_client(cache=None)
+    requests_sent = count_requests(client)
+
+    client.get_hwm(hwm.id)
+    response = client.get_hwm(hwm.id)
+    assert response.value == hwm.value
+
+    assert "If-None-Match" not in requests_sent[0].headers
+    assert requests_sent[1].headers["If-None-Match"]
+    assert client.cache.stats == CacheStats(hits=0, misses=1, revalidated=1, stale=0)
+
+    # HWM was changed by someone else, new value is returned
+    other_client.update_hwm(hwm.id, HWMUpdateRequestV1(value=123))
+    response = client.get_hwm(hwm.id)
+    assert response.value == 123
+    assert client.cache.stats == CacheStats(hits=0, misses=2, revalidated=1, stale=0)
+
+
+def test_sync_client_cache_stale_if_error(hwm: HWM, make_client, cache_factory, monkeypatch: pytest.MonkeyPatch):
+    client = make_client(cache_factory(ttl=0, stale_if_error=60))
+    client.get_hwm(hwm.id)
+
+    def request(*args, **kwargs):
+        msg = "Connection refused"
+        raise requests.exceptions.ConnectionError(msg)
+
+    monkeypatch.setattr(client.session, "request", request)
+
+    response = client.get_hwm(hwm.id)
+    assert response.value == hwm.value
+    assert client.cache.stats == CacheStats(hits=0, misses=1, revalidated=0, stale=1)
+
+
+def test_sync_client_cache_stale_if_error_disabled(
+    hwm: HWM,
+    make_client,
+    cache_factory,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    client = make_client(cache_factory(ttl=0))
+    client.get_hwm(hwm.id)
+
+    def request(*args, **kwargs):
+        msg = "Connection refused"
+        raise requests.exceptions.ConnectionError(msg)
+
+    monkeypatch.setattr(client.session, "request", request)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get_hwm(hwm.id)
+
+
+def test_sync_client_cache_invalidated_on_change(hwm: HWM, make_client, cache_factory):
+    client = make_client(cache_factory(ttl=60))
+
+    client.get_hwm(hwm.id)
+    client.update_hwm(hwm.id, HWMUpdateRequestV1(value=123))
+    assert client.get_hwm(hwm.id).value == 123
+
+    client.delete_hwm(hwm.id)
+    with pytest.raises(EntityNotFoundError):
+        client.get_hwm(hwm.id)
+
+    assert client.cache.stats == CacheStats(hits=0, misses=2, revalidated=0, stale=0)
+
+
+def test_sync_client_file_cache_shared(hwm: HWM, make_client, tmp_path: Path):
+    client1 = make_client(FileCache(path=tmp_path))
+    client2 = make_client(FileCache(path=tmp_path))
+    requests_sent = count_requests(client2)
+
+    assert client1.get_hwm(hwm.id) == client2.get_hwm(hwm.id)
+    assert not requests_sent
+    assert client2.cache.stats == CacheStats(hits=1, misses=0, revalidated=0, stale=0)
+
+
+def test_file_cache_corrupted(tmp_path: Path):
+    cache = FileCache(path=tmp_path)
+    cache.set("key", CacheEntry(body={"a": 1}, etag='W/"1"', stored_at=1.0))
+    assert cache.get("key") == CacheEntry(body={"a": 1}, etag='W/"1"', stored_at=1.0)
+
+    for path in tmp_path.glob("*.json"):
+        path.write_text("{")
+
+    assert cache.get("key") is None
+    cache.delete("key")
+    cache.delete("key")
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_memory_cache_max_size():
+    cache = MemoryCache(max_size=2)
+    for key in ("a", "b"):
+        cache.set(key, CacheEntry(body={}, etag=None, stored_at=1.0))
+
+    # "a" is used recently, so "b" is removed
+    assert cache.get("a")
+    cache.set("c", CacheEntry(body={}, etag=None, stored_at=1.0))
+
+    assert cache.get("a")
+    assert cache.get("b") is None
+    assert cache.get("c")
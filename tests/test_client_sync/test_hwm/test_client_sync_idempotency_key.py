@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.commons.schemas.v1 import HWMUpdateRequestV1
+
+if TYPE_CHECKING:
+    import requests
+
+    from horizon.backend.db.models import HWM
+    from horizon.client.sync import HorizonClientSync
+
+pytestmark = [pytest.mark.client_sync, pytest.mark.client]
+
+
+def test_sync_client_sends_idempotency_key(hwm: HWM, sync_client: HorizonClientSync):
+    requests_sent: list[requests.PreparedRequest] = []
+
+    def hook(response: requests.Response, *args, **kwargs):
+        requests_sent.append(response.request)
+
+    sync_client.session.hooks["response"].append(hook)
+    try:
+        sync_client.get_hwm(hwm.id)
+        sync_client.update_hwm(hwm.id, HWMUpdateRequestV1(value=1))
+        sync_client.update_hwm(hwm.id, HWMUpdateRequestV1(value=2))
+    finally:
+        sync_client.session.hooks["response"].remove(hook)
+
+    get_request, *update_requests = requests_sent
+    assert "Idempotency-Key" not in get_request.headers
+
+    # each call has its own key
+    keys = {request.headers["Idempotency-Key"] for request in update_requests}
+    assert len(keys) == len(update_requests)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.commons.schemas.v1 import (
+    HWMHistoryPaginateQueryV1,
+    HWMPaginateQueryV1,
+    NamespacePaginateQueryV1,
+)
+
+if TYPE_CHECKING:
+    import requests
+
+    from horizon.backend.db.models import HWM, HWMHistory, Namespace
+    from horizon.client.sync import HorizonClientSync
+
+pytestmark = [pytest.mark.client_sync, pytest.mark.client]
+
+
+@pytest.fixture
+def sent_requests(sync_client: HorizonClientSync):
+    requests_sent: list[tuple[requests.PreparedRequest, str]] = []
+
+    def hook(response: requests.Response, *args, **kwargs):
+        requests_sent.append((response.request, threading.current_thread().name))
+
+    sync_client.session.hooks["response"].append(hook)
+    yield requests_sent
+    sync_client.session.hooks["response"].remove(hook)
+
+
+def test_sync_client_iter_hwm(
+    namespace: Namespace,
+    hwms: list[HWM],
+    sync_client: HorizonClientSync,
+    sent_requests: list,
+):
+    query = HWMPaginateQueryV1(namespace_id=namespace.id, page_size=2)
+    result = list(sync_client.iter_hwm(query))
+
+    assert [hwm.id for hwm in result] == [hwm.id for hwm in sorted(hwms, key=lambda item: item.name)]
+
+    # 5 items, 2 items per page
+    assert len(sent_requests) == 3
+    # pages are fetched in background thread
+    assert {thread_name.split("_")[0] for _, thread_name in sent_requests} == {"horizon-prefetch"}
+
+
+def test_sync_client_iter_hwm_stop_early(
+    namespace: Namespace,
+    hwms: list[HWM],
+    sync_client: HorizonClientSync,
+    sent_requests: list,
+):
+    query = HWMPaginateQueryV1(namespace_id=namespace.id, page_size=1)
+    iterator = sync_client.iter_hwm(query)
+    first = next(iterator)
+    iterator.close()
+
+    assert first.id == min(hwms, key=lambda item: item.name).id
+
+    # first page, and maybe prefetched second one. nothing after iterator is closed
+    assert 1 <= len(sent_requests) <= 2
+    assert all("page=3" not in request.url for request, _ in sent_requests)
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("horizon-prefetch")]
+
+
+def test_sync_client_iter_hwm_empty(new_hwm: HWM, namespace: Namespace, sync_client: HorizonClientSync):
+    query = HWMPaginateQueryV1(namespace_id=namespace.id, name=new_hwm.name)
+    assert list(sync_client.iter_hwm(query)) == []
+
+
+def test_sync_client_iter_namespaces(namespace: Namespace, sync_client: HorizonClientSync):
+    query = NamespacePaginateQueryV1(name=namespace.name)
+    assert [item.id for item in sync_client.iter_namespaces(query)] == [namespace.id]
+
+
+def test_sync_client_iter_hwm_history(
+    hwm: HWM,
+    hwm_history_items: list[HWMHistory],
+    sync_client: HorizonClientSync,
+):
+    query = HWMHistoryPaginateQueryV1(hwm_id=hwm.id, page_size=2)
+    result = list(sync_client.iter_hwm_history(query))
+
+    expected = sorted(hwm_history_items, key=lambda item: item.changed_at, reverse=True)
+    assert [item.id for item in result] == [item.id for item in expected]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.commons.schemas.v1 import (
+    HWMHistoryPaginateQueryV1,
+    HWMPaginateQueryV1,
+    HWMResponseV1,
+    PageResponseV1,
+)
+
+if TYPE_CHECKING:
+    from horizon.backend.db.models import HWM, HWMHistory, Namespace
+    from horizon.client.sync import HorizonClientSync
+
+pytestmark = [pytest.mark.client_sync, pytest.mark.client]
+
+
+def test_sync_client_paginate_hwm_raw(namespace: Namespace, hwms: list[HWM], sync_client: HorizonClientSync):
+    query = HWMPaginateQueryV1(namespace_id=namespace.id)
+    raw_page = sync_client.paginate_hwm(query, raw=True)
+    parsed_page = sync_client.paginate_hwm(query)
+
+    assert isinstance(raw_page, dict)
+    assert isinstance(raw_page["items"][0], dict)
+    # raw response is the same as parsed one, just without validation
+    assert PageResponseV1[HWMResponseV1].parse_obj(raw_page) == parsed_page
+
+
+def test_sync_client_iter_hwm_raw(namespace: Namespace, hwms: list[HWM], sync_client: HorizonClientSync):
+    query = HWMPaginateQueryV1(namespace_id=namespace.id, page_size=2)
+    result = list(sync_client.iter_hwm(query, raw=True))
+
+    assert all(isinstance(item, dict) for item in result)
+    assert [item["id"] for item in result] == [hwm.id for hwm in sorted(hwms, key=lambda item: item.name)]
+
+
+def test_sync_client_iter_hwm_history_raw(
+    hwm: HWM,
+    hwm_history_items: list[HWMHistory],
+    sync_client: HorizonClientSync,
+):
+    query = HWMHistoryPaginateQueryV1(hwm_id=hwm.id, page_size=2)
+    result = list(sync_client.iter_hwm_history(query, raw=True))
+
+    expected = sorted(hwm_history_items, key=lambda item: item.changed_at, reverse=True)
+    assert [item["id"] for item in result] == [item.id for item in expected]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.commons.exceptions import BadRequestError
+from horizon.commons.schemas.v1 import (
+    HWMResponseV1,
+    HWMSearchQueryV1,
+    PageMetaResponseV1,
+    PageResponseV1,
+)
+
+if TYPE_CHECKING:
+    from horizon.backend.db.models import HWM
+    from horizon.client.sync import HorizonClientSync
+
+pytestmark = [pytest.mark.client_sync, pytest.mark.client]
+
+
+def test_sync_client_search_hwm(hwm: HWM, sync_client: HorizonClientSync):
+    response = sync_client.search_hwm(HWMSearchQueryV1(name_contains=hwm.name[2:12].swapcase()))
+    assert response == PageResponseV1[HWMResponseV1](
+        meta=PageMetaResponseV1(
+            page=1,
+            pages_count=1,
+            total_count=1,
+            page_size=20,
+            has_next=False,
+            has_previous=False,
+            next_page=None,
+            previous_page=None,
+        ),
+        items=[
+            HWMResponseV1(
+                id=hwm.id,
+                namespace_id=hwm.namespace_id,
+                name=hwm.name,
+                type=hwm.type,
+                value=hwm.value,
+                entity=hwm.entity,
+                expression=hwm.expression,
+                description=hwm.description,
+                changed_at=hwm.changed_at,
+                changed_by=hwm.changed_by,
+            ),
+        ],
+    )
+
+
+def test_sync_client_search_hwm_no_search_arguments(sync_client: HorizonClientSync):
+    with pytest.raises(BadRequestError, match="At least one of 'name_contains', 'name_prefix' should be set"):
+        sync_client.search_hwm(HWMSearchQueryV1())
@@ -31,6 +31,7 @@ def test_sync_client_create_namespace(new_namespace: Namespace, user: User, sync
         "description": to_create.description,
         "changed_by": user.username,
         "owned_by": user.username,
+        "stats": None,
     }
 
 
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from horizon.commons.schemas.v1 import NamespaceStatsListResponseV1, NamespaceStatsResponseV1
+
+if TYPE_CHECKING:
+    from horizon.backend.db.models import HWM, Namespace
+    from horizon.client.sync import HorizonClientSync
+
+pytestmark = [pytest.mark.client_sync, pytest.mark.client]
+
+
+def test_sync_client_get_namespace_with_stats(namespace: Namespace, hwms: list[HWM], sync_client: HorizonClientSync):
+    expected_stats = NamespaceStatsResponseV1(
+        namespace_id=namespace.id,
+        hwm_count=len(hwms),
+        history_count=0,
+        last_changed_at=max(hwm.changed_at for hwm in hwms),
+    )
+
+    response = sync_client.get_namespace(namespace.id, with_stats=True)
+    assert response.stats == expected_stats
+
+    response = sync_client.get_namespace(namespace.id)
+    assert response.stats is None
+
+
+def test_sync_client_get_namespaces_stats(
+    namespace: Namespace,
+    new_namespace: Namespace,
+    hwms: list[HWM],
+    sync_client: HorizonClientSync,
+):
+    response = sync_client.get_namespaces_stats([namespace.id, new_namespace.id])
+    assert response == NamespaceStatsListResponseV1(
+        stats=[
+            NamespaceStatsResponseV1(
+                namespace_id=namespace.id,
+                hwm_count=len(hwms),
+                history_count=0,
+                last_changed_at=max(hwm.changed_at for hwm in hwms),
+            ),
+        ],
+    )
@@ -33,6 +33,7 @@ def test_sync_client_update_namespace_name(
         "description": namespace.description,
         "changed_by": user.username,
         "owned_by": user.username,
+        "stats": None,
     }
 
 
@@ -52,6 +53,7 @@ def test_sync_client_update_namespace_description(
         "description": new_namespace.description,
         "changed_by": user.username,
         "owned_by": user.username,
+        "stats": None,
     }
 
 
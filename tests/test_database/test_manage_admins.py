@@ -83,6 +83,13 @@ async def test_remove_admins(caplog, async_session: AsyncSession, new_user: User
     for user in not_admins:
         assert not user.is_admin
 
+    # each role change revokes previously issued tokens
+    auth_versions = {user.username: user.auth_version for user in [*admins, *not_admins]}
+    expected_auth_versions = {user.username: 1 for user in users[:2]}
+    expected_auth_versions.update({user.username: 2 for user in users[2:5]})
+    expected_auth_versions.update({user.username: 0 for user in users[5:]})
+    assert auth_versions == expected_auth_versions
+
 
 @pytest.mark.parametrize("users", [(10, {})], indirect=True)
 async def test_list_admins(caplog, async_session: AsyncSession, users: list[User]):
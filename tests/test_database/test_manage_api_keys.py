@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+
+from horizon.backend.db.models import APIKey, Namespace, User
+from horizon.backend.scripts.manage_api_keys import create_api_key, list_api_keys, revoke_api_keys
+from horizon.backend.services.api_key import hash_api_key
+from horizon.commons.exceptions import EntityNotFoundError
+from tests.factories.base import random_string
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+pytestmark = [pytest.mark.asyncio]
+
+SECRET_KEY = "secret"
+
+
+async def test_create_api_key(caplog, async_session: AsyncSession, new_user: User):
+    name = random_string()
+    with caplog.at_level(logging.INFO):
+        api_key = await create_api_key(async_session, SECRET_KEY, name=name, username=new_user.username)
+
+    assert api_key in caplog.text
+
+    query = select(APIKey, User).join(User, User.id == APIKey.user_id).where(APIKey.name == name)
+    item, user = (await async_session.execute(query)).one()
+
+    # service account is created
+    assert user.username == new_user.username
+    assert item.key_hash == hash_api_key(api_key, SECRET_KEY)
+    assert item.namespace_ids is None
+    assert item.expires_at is None
+
+
+@pytest.mark.parametrize("namespaces", [(3, {})], indirect=True)
+async def test_create_api_key_with_scopes(async_session: AsyncSession, user: User, namespaces: list[Namespace]):
+    name = random_string()
+    before = datetime.now(tz=timezone.utc)
+    await create_api_key(
+        async_session,
+        SECRET_KEY,
+        name=name,
+        username=user.username,
+        namespaces=[namespace.name for namespace in namespaces[:2]],
+        expire_days=30,
+    )
+
+    item = await async_session.scalar(select(APIKey).where(APIKey.name == name))
+    assert item.user_id == user.id
+    assert item.namespace_ids == sorted(namespace.id for namespace in namespaces[:2])
+    assert before + timedelta(days=30) <= item.expires_at <= datetime.now(tz=timezone.utc) + timedelta(days=30)
+
+
+async def test_create_api_key_missing_namespace(async_session: AsyncSession, user: User, new_namespace: Namespace):
+    with pytest.raises(EntityNotFoundError):
+        await create_api_key(
+            async_session,
+            SECRET_KEY,
+            name=random_string(),
+            username=user.username,
+            namespaces=[new_namespace.name],
+        )
+
+
+async def test_revoke_api_keys(caplog, async_session: AsyncSession, user: User):
+    names = [random_string() for _ in range(3)]
+    for name in names:
+        await create_api_key(async_session, SECRET_KEY, name=name, username=user.username)
+
+    missing_name = random_string()
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        await revoke_api_keys(async_session, [*names[:2], missing_name])
+
+    assert "Not found" in caplog.text
+    assert repr(missing_name) in caplog.text
+
+    result = await async_session.scalars(select(APIKey.name).where(APIKey.name.in_(names)))
+    assert result.all() == names[2:]
+
+
+async def test_list_api_keys(caplog, async_session: AsyncSession, user: User):
+    names = [random_string() for _ in range(3)]
+    for name in names:
+        await create_api_key(async_session, SECRET_KEY, name=name, username=user.username)
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        await list_api_keys(async_session)
+
+    for name in names:
+        assert repr(name) in caplog.text
+    assert repr(user.username) in caplog.text
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import delete, select
+
+from horizon.backend.db.models import (
+    HWM,
+    HWMHistory,
+    Namespace,
+    NamespaceHistory,
+    NamespaceUser,
+    NamespaceUserRoleInt,
+)
+from horizon.backend.scripts.snapshot_namespaces import (
+    dump_namespaces,
+    restore_namespaces,
+)
+from horizon.commons.exceptions import EntityAlreadyExistsError, EntityNotFoundError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+pytestmark = [pytest.mark.asyncio]
+
+
+async def _delete_namespace(async_session: AsyncSession, name: str) -> None:
+    namespace_id = await async_session.scalar(select(Namespace.id).where(Namespace.name == name))
+    if namespace_id is None:
+        return
+    await async_session.execute(delete(NamespaceHistory).where(NamespaceHistory.namespace_id == namespace_id))
+    await async_session.execute(delete(Namespace).where(Namespace.id == namespace_id))
+    await async_session.commit()
+
+
+@pytest.mark.parametrize(
+    "namespace_with_users",
+    [
+        [
+            ("user1", NamespaceUserRoleInt.DEVELOPER),
+            ("user2", NamespaceUserRoleInt.MAINTAINER),
+        ],
+    ],
+    indirect=["namespace_with_users"],
+)
+@pytest.mark.parametrize("with_history", [False, True])
+async def test_dump_and_restore_namespace(
+    caplog,
+    tmp_path: Path,
+    async_session: AsyncSession,
+    namespace: Namespace,
+    namespace_with_users: None,
+    hwm: HWM,
+    hwms: list[HWM],
+    hwm_history_items: list[HWMHistory],
+    with_history: bool,
+):
+    snapshot = tmp_path / "snapshot.tar.gz"
+    new_name = f"{namespace.name}-restored"
+
+    with caplog.at_level(logging.INFO):
+        await dump_namespaces(async_session, [namespace.name], snapshot, with_history=with_history)
+    await async_session.rollback()
+
+    assert repr(namespace.name) in caplog.text
+    assert snapshot.exists()
+
+    try:
+        with caplog.at_level(logging.INFO):
+            await restore_namespaces(async_session, snapshot, {namespace.name: new_name})
+
+        assert repr(new_name) in caplog.text
+
+        restored = await async_session.scalar(select(Namespace).where(Namespace.name == new_name))
+        assert restored is not None
+        assert restored.id != namespace.id
+        assert restored.description == namespace.description
+        assert restored.owner_id == namespace.owner_id
+
+        restored_users = await async_session.execute(
+            select(NamespaceUser.user_id, NamespaceUser.role).where(NamespaceUser.namespace_id == restored.id),
+        )
+        original_users = await async_session.execute(
+            select(NamespaceUser.user_id, NamespaceUser.role).where(NamespaceUser.namespace_id == namespace.id),
+        )
+        assert sorted(restored_users.all()) == sorted(original_users.all())
+
+        restored_hwms = (
+            (await async_session.execute(select(HWM).where(HWM.namespace_id == restored.id))).scalars().all()
+        )
+        expected_hwms = (
+            (await async_session.execute(select(HWM).where(HWM.namespace_id == namespace.id))).scalars().all()
+        )
+        assert len(restored_hwms) == len(expected_hwms)
+        restored_by_name = {item.name: item for item in restored_hwms}
+        for item in expected_hwms:
+            restored_hwm = restored_by_name[item.name]
+            assert restored_hwm.id != item.id
+            assert restored_hwm.to_dict(exclude={"id", "namespace_id"}) == item.to_dict(exclude={"id", "namespace_id"})
+
+        restored_history = (
+            (await async_session.execute(select(HWMHistory).where(HWMHistory.namespace_id == restored.id)))
+            .scalars()
+            .all()
+        )
+        if with_history:
+            assert len(restored_history) == len(hwm_history_items)
+            new_hwm_id = restored_by_name[hwm.name].id
+            assert {item.hwm_id for item in restored_history} == {new_hwm_id}
+        else:
+            assert not restored_history
+
+        namespace_history = (
+            (
+                await async_session.execute(
+                    select(NamespaceHistory)
+                    .where(NamespaceHistory.namespace_id == restored.id)
+                    .order_by(NamespaceHistory.id),
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert namespace_history[-1].action.startswith("Restored from snapshot")
+
+        # restoring the same namespace twice is not allowed
+        with pytest.raises(EntityAlreadyExistsError):
+            await restore_namespaces(async_session, snapshot, {namespace.name: new_name})
+        await async_session.rollback()
+    finally:
+        await _delete_namespace(async_session, new_name)
+
+
+async def test_dump_namespace_not_found(tmp_path: Path, async_session: AsyncSession):
+    with pytest.raises(EntityNotFoundError):
+        await dump_namespaces(async_session, ["unknown"], tmp_path / "snapshot.tar.gz")
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from prometheus_client import REGISTRY
+
+
+def get_metric(metric: str, **labels) -> float:
+    """Current value of Prometheus metric sample, or 0 if there is no such sample yet"""
+    return REGISTRY.get_sample_value(metric, labels) or 0